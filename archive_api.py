@@ -97,6 +97,7 @@ class QueryResponse(BaseModel):
     evidence_count: int
     cached: bool
     model_used: str
+    cache_provenance: Optional[dict] = None
 
 
 class SearchResponse(BaseModel):
@@ -125,6 +126,8 @@ class InsightAgentResponse(BaseModel):
     insight_id: Optional[int] = None
     remaining_quota: int
     model_used: str
+    cached: bool = False
+    cache_provenance: Optional[dict] = None
 
 
 class FeedbackRequest(BaseModel):
@@ -162,6 +165,8 @@ async def stats(_key: str = Depends(_verify_key)):
     try:
         import aiosqlite
         from cores.archive.archive_db import init_db
+        from cores.archive import semantic_cache
+        from cores.archive.embedding import get_cache_stats
         await init_db(db_path)
 
         async with aiosqlite.connect(db_path) as conn:
@@ -170,6 +175,8 @@ async def stats(_key: str = Depends(_verify_key)):
             us    = (await (await conn.execute("SELECT COUNT(*) FROM report_archive WHERE market='us'")).fetchone())[0]
             enriched = (await (await conn.execute("SELECT COUNT(*) FROM report_enrichment")).fetchone())[0]
             cached   = (await (await conn.execute("SELECT COUNT(*) FROM insights")).fetchone())[0]
+            embeddings = (await (await conn.execute("SELECT COUNT(*) FROM embedding_cache")).fetchone())[0]
+            answers = (await (await conn.execute("SELECT COUNT(*) FROM semantic_answer_cache")).fetchone())[0]
             date_row = await (await conn.execute(
                 "SELECT MIN(report_date), MAX(report_date) FROM report_archive"
             )).fetchone()
@@ -180,6 +187,8 @@ async def stats(_key: str = Depends(_verify_key)):
             "us_reports": us,
             "enriched": enriched,
             "cached_insights": cached,
+            "embedding_cache": {"rows": embeddings, **get_cache_stats()},
+            "semantic_cache": {"rows": answers, **semantic_cache.get_stats()},
             "date_range": {
                 "from": date_row[0] if date_row else None,
                 "to": date_row[1] if date_row else None,
@@ -247,6 +256,7 @@ async def query(req: QueryRequest, _key: str = Depends(_verify_key)):
             evidence_count=len(result.evidence_ids),
             cached=result.cached,
             model_used=result.model_used,
+            cache_provenance=result.cache_provenance,
         )
     except Exception as e:
         logger.error(f"/query error: {e}", exc_info=True)
@@ -282,6 +292,8 @@ async def insight_agent_endpoint(
             insight_id=result.insight_id,
             remaining_quota=result.remaining_quota,
             model_used=result.model_used,
+            cached=result.cached,
+            cache_provenance=result.cache_provenance,
         )
     except HTTPException:
         raise
@@ -1,7 +1,35 @@
+import asyncio
+import importlib.util
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence
+
 from mcp_agent.agents.agent import Agent
 
 from cores.openai_error_logging import log_openai_error
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSLATION_MODEL = "gpt-5.6-luna"
+
+
+def _load_translation_service():
+    """Load cores/translation_service.py by path, once per process.
+
+    prism-us loads this module by file path while its own ``cores`` package
+    shadows the root one, so a plain ``from cores...`` import is not safe here.
+    """
+    module = sys.modules.get("prism_translation_service")
+    if module is None:
+        path = Path(__file__).resolve().parents[1] / "translation_service.py"
+        spec = importlib.util.spec_from_file_location("prism_translation_service", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["prism_translation_service"] = module
+        spec.loader.exec_module(module)
+    return module
+
 
 def create_telegram_translator_agent(from_lang: str = "ko", to_lang: str = "en"):
     """
@@ -82,14 +110,15 @@ Your task is to translate {from_lang_name} telegram messages to {to_lang_name}.
 - Maintain visual hierarchy with emojis
 
 ### 7. Placeholders - CRITICAL
-- NEVER modify, translate, or remove placeholder tokens such as <<<__BASE64_IMAGE_0__>>>, <<<__BASE64_IMAGE_1__>>>, etc.
+- NEVER modify, translate, or remove placeholder tokens such as <<<__BASE64_IMAGE_0__>>>, <<<__BASE64_IMAGE_1__>>>, <<<__VAR_0__>>>, <<<__VAR_1__>>>, etc.
+- <<<__VAR_N__>>> tokens stand for numbers, prices, percentages or dates; keep each one where its value belongs in the translated sentence.
 - These tokens MUST appear in the translated output EXACTLY as they appear in the input, character-for-character.
 - Do not add spaces, change angle brackets, or wrap them in markdown formatting.
 
 ## Instructions
 Translate the following {from_lang_name} telegram message to {to_lang_name} following all guidelines above.
 **CRITICAL**: Make sure to translate ALL company names to {to_lang_name}. Do not leave them in {from_lang_name}.
-**CRITICAL**: Preserve all <<<__BASE64_IMAGE_N__>>> placeholders exactly as-is. Do not translate or modify them.
+**CRITICAL**: Preserve all <<<__BASE64_IMAGE_N__>>> and <<<__VAR_N__>>> placeholders exactly as-is. Do not translate or modify them.
 Only return the translated text without any explanations or metadata.
 """
 
@@ -102,15 +131,61 @@ Only return the translated text without any explanations or metadata.
     return agent
 
 
+async def _translate_with_llm(message: str, model: str, from_lang: str, to_lang: str) -> str:
+    """Run one translation through the translator agent (raises on failure)."""
+    from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+    from mcp_agent.workflows.llm.augmented_llm import RequestParams
+
+    # Sanitize: strip control characters that break JSON serialization
+    # (NUL bytes and other ASCII control chars except \t \n \r are invalid in JSON strings)
+    message = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', message)
+
+    # Create translator agent
+    translator = create_telegram_translator_agent(from_lang=from_lang, to_lang=to_lang)
+
+    # Attach LLM to the agent
+    llm = await translator.attach_llm(OpenAIAugmentedLLM)
+
+    # Generate translation
+    translated = await llm.generate_str(
+        message=message,
+        request_params=RequestParams(
+            model=model,
+            maxTokens=100000,
+            temperature=0.3,  # Lower temperature for more consistent translations
+            max_iterations=1  # Single pass translation, no complex reasoning needed
+        )
+    )
+
+    return translated.strip()
+
+
+_translation_service = None
+
+
+def get_translation_service():
+    """Shared TranslationService (translation memory + concurrency limit) for this process."""
+    global _translation_service
+    if _translation_service is None:
+        service_module = _load_translation_service()
+        _translation_service = service_module.TranslationService(
+            _translate_with_llm, memory=service_module.TranslationMemory()
+        )
+    return _translation_service
+
+
 async def translate_telegram_message(
     message: str,
-    model: str = "gpt-5.6-luna",
+    model: str = DEFAULT_TRANSLATION_MODEL,
     from_lang: str = "ko",
     to_lang: str = "en"
 ) -> str:
     """
     Translate a telegram message from source language to target language
 
+    Served from the translation memory when the same message (or the same
+    template with different numbers) was translated before.
+
     Args:
         message: Telegram message to translate
         model: OpenAI model to use (default: gpt-5.6-luna for cost efficiency)
@@ -120,38 +195,35 @@ async def translate_telegram_message(
     Returns:
         str: Translated message
     """
-    from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
-    from mcp_agent.workflows.llm.augmented_llm import RequestParams
-
     try:
-        # Sanitize: strip control characters that break JSON serialization
-        # (NUL bytes and other ASCII control chars except \t \n \r are invalid in JSON strings)
-        import re as _re
-        message = _re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', message)
-
-        # Create translator agent
-        translator = create_telegram_translator_agent(from_lang=from_lang, to_lang=to_lang)
-
-        # Attach LLM to the agent
-        llm = await translator.attach_llm(OpenAIAugmentedLLM)
-
-        # Generate translation
-        translated = await llm.generate_str(
-            message=message,
-            request_params=RequestParams(
-                model=model,
-                maxTokens=100000,
-                temperature=0.3,  # Lower temperature for more consistent translations
-                max_iterations=1  # Single pass translation, no complex reasoning needed
-            )
-        )
-
-        return translated.strip()
-
+        return await get_translation_service().translate(message, model, from_lang, to_lang)
     except Exception as e:
-        # If translation fails, return original message with error note
-        import logging
-        logger = logging.getLogger(__name__)
+        # If translation fails, return original message
         log_openai_error(logger, e, "telegram translation")
         logger.error(f"Translation failed: {str(e)}")
         return message  # Fallback to original message
+
+
+def schedule_telegram_translations(
+    messages: Sequence[str],
+    to_langs: Sequence[str],
+    model: str = DEFAULT_TRANSLATION_MODEL,
+    from_lang: str = "ko",
+) -> Dict[str, List[asyncio.Task]]:
+    """Start all (message x language) translations concurrently.
+
+    Must be called from a running event loop. Returns language -> tasks in
+    message order; each resolves to the translation (original on failure).
+    """
+    return get_translation_service().schedule(messages, to_langs, model, from_lang)
+
+
+async def translate_telegram_messages(
+    messages: Sequence[str],
+    to_lang: str = "en",
+    model: str = DEFAULT_TRANSLATION_MODEL,
+    from_lang: str = "ko",
+) -> List[str]:
+    """Translate several messages into one language concurrently (originals on failure)."""
+    translated = await get_translation_service().translate_many(messages, [to_lang], model, from_lang)
+    return translated[to_lang]
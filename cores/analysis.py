@@ -25,6 +25,7 @@ class _ReportRunContext:
         return False
 
 from cores.agents import get_agent_directory
+from cores.llm import telemetry as llm_telemetry
 from cores.report_generation import generate_report, generate_summary, generate_investment_strategy, get_disclaimer, generate_market_report
 
 # Load environment variables
@@ -96,7 +97,8 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
             ref_date_obj = datetime.strptime(reference_date, "%Y%m%d")
             max_years_calc = 1
             max_years_ago_calc = (ref_date_obj - timedelta(days=365*max_years_calc)).strftime("%Y%m%d")
-            prefetched = prefetch_kr_analysis_data(company_code, reference_date, max_years_ago_calc)
+            with llm_telemetry.stage("prefetch"):
+                prefetched = prefetch_kr_analysis_data(company_code, reference_date, max_years_ago_calc)
         except Exception as e:
             logger.warning(f"Data prefetch failed, falling back to MCP: {e}")
             prefetched = {}
@@ -150,8 +152,13 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                         return section, f"Analysis failed: {section}"
 
             async def process_section(section):
-                async with parallel_semaphore:
-                    return await process_section_unbounded(section)
+                with llm_telemetry.section(section):
+                    with llm_telemetry.stage("report_slot_wait"):
+                        await parallel_semaphore.acquire()
+                    try:
+                        return await process_section_unbounded(section)
+                    finally:
+                        parallel_semaphore.release()
 
             # Execute all sections in parallel (each with its own logger context).
             results = await asyncio.gather(*[process_section(section) for section in base_sections])
@@ -165,24 +172,25 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                 if section in agents:
                     logger.info(f"Processing {section} for {company_name}...")
 
-                    try:
-                        agent = agents[section]
-                        if section == "market_index_analysis":
-                            # Check if data exists in cache
-                            if "report" in _market_analysis_cache:
-                                logger.info("Using cached market analysis")
-                                report = _market_analysis_cache["report"]
+                    with llm_telemetry.section(section):
+                        try:
+                            agent = agents[section]
+                            if section == "market_index_analysis":
+                                # Check if data exists in cache
+                                if "report" in _market_analysis_cache:
+                                    logger.info("Using cached market analysis")
+                                    report = _market_analysis_cache["report"]
+                                else:
+                                    logger.info("Generating new market analysis")
+                                    report = await generate_market_report(agent, section, reference_date, logger, language)
+                                    # Save to cache
+                                    _market_analysis_cache["report"] = report
                             else:
-                                logger.info("Generating new market analysis")
-                                report = await generate_market_report(agent, section, reference_date, logger, language)
-                                # Save to cache
-                                _market_analysis_cache["report"] = report
-                        else:
-                            report = await generate_report(agent, section, company_name, company_code, reference_date, logger, language)
-                        section_reports[section] = report
-                    except Exception as e:
-                        logger.error(f"Final failure processing {section}: {e}")
-                        section_reports[section] = f"Analysis failed: {section}"
+                                report = await generate_report(agent, section, company_name, company_code, reference_date, logger, language)
+                            section_reports[section] = report
+                        except Exception as e:
+                            logger.error(f"Final failure processing {section}: {e}")
+                            section_reports[section] = f"Analysis failed: {section}"
 
         # 6. Integrate content from other reports
         combined_reports = ""
@@ -195,9 +203,10 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
         try:
             logger.info(f"Processing investment_strategy for {company_name}...")
 
-            investment_strategy = await generate_investment_strategy(
-                section_reports, combined_reports, company_name, company_code, reference_date, logger, language
-            )
+            with llm_telemetry.section("investment_strategy"):
+                investment_strategy = await generate_investment_strategy(
+                    section_reports, combined_reports, company_name, company_code, reference_date, logger, language
+                )
             section_reports["investment_strategy"] = investment_strategy.lstrip('\n')
             logger.info(f"Completed investment_strategy - {len(investment_strategy)} characters")
         except Exception as e:
@@ -213,9 +222,10 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
 
         # 9. Generate summary
         try:
-            executive_summary = await generate_summary(
-                section_reports, company_name, company_code, reference_date, logger, language
-            )
+            with llm_telemetry.section("executive_summary"):
+                executive_summary = await generate_summary(
+                    section_reports, company_name, company_code, reference_date, logger, language
+                )
             # Remove duplicate title/date if the agent added them
             import re
             executive_summary = executive_summary.lstrip('\n')
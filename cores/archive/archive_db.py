@@ -13,7 +13,7 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiosqlite
 
@@ -70,6 +70,7 @@ CREATE TABLE IF NOT EXISTS report_archive (
     content         TEXT NOT NULL,
     content_length  INTEGER,
     created_at      TEXT DEFAULT (datetime('now', 'localtime')),
+    updated_at      TEXT,                       -- set when re-ingest refreshes content
     UNIQUE(ticker, report_date, mode, market, language)
 )
 """
@@ -152,6 +153,40 @@ CREATE TABLE IF NOT EXISTS ticker_price_history (
 )
 """
 
+# Embedding cache keyed by (model, sha256 of normalized input text)
+_DDL_EMBEDDING_CACHE = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model        TEXT NOT NULL,
+    text_hash    TEXT NOT NULL,
+    dim          INTEGER NOT NULL,
+    embedding    BLOB NOT NULL,
+    created_at   TEXT DEFAULT (datetime('now', 'localtime')),
+    last_used_at TEXT DEFAULT (datetime('now', 'localtime')),
+    PRIMARY KEY (model, text_hash)
+)
+"""
+
+# Semantic answer cache for /insight and /query (near-duplicate questions)
+_DDL_SEMANTIC_ANSWER_CACHE = """
+CREATE TABLE IF NOT EXISTS semantic_answer_cache (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind            TEXT NOT NULL,
+    scope_key       TEXT NOT NULL,
+    market          TEXT,
+    question        TEXT NOT NULL,
+    normalized      TEXT NOT NULL,
+    embedding       BLOB,
+    payload         TEXT NOT NULL,
+    tickers         TEXT,
+    model_used      TEXT,
+    latency_ms      REAL,
+    hit_count       INTEGER DEFAULT 0,
+    last_hit_at     TEXT,
+    created_at      TEXT DEFAULT (datetime('now', 'localtime')),
+    expires_at      TEXT NOT NULL
+)
+"""
+
 # ---------------------------------------------------------------------------
 # Persistent insight layer (accumulated /insight Q&A, weekly summaries, quotas)
 # ---------------------------------------------------------------------------
@@ -334,6 +369,14 @@ _ENRICHMENT_PERF_COLUMNS = [
 _initialized_paths: set = set()
 
 
+async def _migrate_report_archive_columns(db) -> None:
+    """Add updated_at to report_archive if missing."""
+    try:
+        await db.execute("ALTER TABLE report_archive ADD COLUMN updated_at TEXT")
+    except Exception:
+        pass  # Column already exists
+
+
 async def _migrate_enrichment_columns(db) -> None:
     """Add long-term performance columns to report_enrichment if missing."""
     for col_name, col_type in _ENRICHMENT_PERF_COLUMNS:
@@ -357,6 +400,8 @@ async def init_db(db_path: Optional[str] = None) -> None:
         await db.execute(_DDL_MARKET_TIMELINE)
         await db.execute(_DDL_INSIGHTS)
         await db.execute(_DDL_TICKER_PRICE_HISTORY)
+        await db.execute(_DDL_EMBEDDING_CACHE)
+        await db.execute(_DDL_SEMANTIC_ANSWER_CACHE)
         # Persistent insight layer
         await db.execute(_DDL_PERSISTENT_INSIGHTS)
         await db.execute(_DDL_PERSISTENT_INSIGHTS_FTS)
@@ -376,12 +421,14 @@ async def init_db(db_path: Optional[str] = None) -> None:
         await db.execute("CREATE INDEX IF NOT EXISTS idx_ra_date ON report_archive(report_date)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_ra_market ON report_archive(market)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_tph_ticker_date ON ticker_price_history(ticker, price_date)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_sac_scope ON semantic_answer_cache(kind, scope_key, expires_at)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_pi_chat ON persistent_insights(chat_id, created_at DESC)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_pi_created ON persistent_insights(created_at DESC)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_wis_week ON weekly_insight_summary(week_start DESC)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_itu_insight ON insight_tool_usage(insight_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_if_insight ON insight_feedback(insight_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_tsf_ticker ON ticker_semantic_facts(ticker, last_validated_at DESC)")
+        await _migrate_report_archive_columns(db)
         await _migrate_enrichment_columns(db)
         await _migrate_persistent_insights_columns(db)
         await db.commit()
@@ -451,6 +498,105 @@ async def insert_report(
         return report_id
 
 
+ReportKey = Tuple[str, str, str, str, str]  # (ticker, report_date, mode, market, language)
+
+
+async def get_report_hashes(
+    keys: List[ReportKey],
+    db_path: Optional[str] = None,
+) -> Dict[ReportKey, Tuple[int, str, str]]:
+    """
+    Look up existing archive rows for many reports in one query.
+
+    keys: (ticker, report_date, mode, market, language) tuples.
+    Returns {key: (report_id, file_hash, file_path)} for keys already archived.
+    """
+    if not keys:
+        return {}
+    path = db_path or str(ARCHIVE_DB_PATH)
+    wanted = set(keys)
+    dates = sorted({k[1] for k in wanted})
+    found: Dict[ReportKey, Tuple[int, str, str]] = {}
+    async with aiosqlite.connect(path) as db:
+        for i in range(0, len(dates), 500):
+            chunk = dates[i:i + 500]
+            cur = await db.execute(
+                f"""
+                SELECT id, ticker, report_date, mode, market, language, file_hash, file_path
+                FROM report_archive
+                WHERE report_date IN ({", ".join("?" for _ in chunk)})
+                """,
+                chunk,
+            )
+            for row in await cur.fetchall():
+                key = (row[1], row[2], row[3], row[4], row[5])
+                if key in wanted:
+                    found[key] = (row[0], row[6], row[7])
+    return found
+
+
+async def bulk_upsert_reports(
+    rows: List[Dict[str, Any]],
+    db_path: Optional[str] = None,
+) -> Dict[ReportKey, int]:
+    """
+    Insert new reports and refresh changed ones (content + FTS) in one transaction.
+
+    Each row dict: {ticker, company_name, report_date, mode, model, market,
+    language, file_path, content} plus `report_id` when the row already exists
+    and its content changed.
+    Returns {(ticker, report_date, mode, market, language): report_id}.
+    """
+    if not rows:
+        return {}
+    path = db_path or str(ARCHIVE_DB_PATH)
+    ids: Dict[ReportKey, int] = {}
+    async with aiosqlite.connect(path) as db:
+        await db.execute("PRAGMA foreign_keys=ON")
+        for row in rows:
+            language = row.get("language") or "ko"
+            key = (row["ticker"], row["report_date"], row["mode"], row["market"], language)
+            content = row["content"]
+            report_id = row.get("report_id")
+            if report_id is None:
+                cur = await db.execute(
+                    """
+                    INSERT OR IGNORE INTO report_archive
+                        (ticker, company_name, report_date, mode, model, market,
+                         language, file_path, file_hash, content, content_length)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (row["ticker"], row["company_name"], row["report_date"], row["mode"],
+                     row["model"], row["market"], language, row["file_path"],
+                     _sha256_short(content), content, len(content)),
+                )
+                if not cur.rowcount:
+                    # Another writer archived the same key first
+                    continue
+                report_id = cur.lastrowid
+            else:
+                await db.execute(
+                    """
+                    UPDATE report_archive
+                    SET company_name=?, model=?, file_path=?, file_hash=?,
+                        content=?, content_length=?,
+                        updated_at=datetime('now', 'localtime')
+                    WHERE id=?
+                    """,
+                    (row["company_name"], row["model"], row["file_path"],
+                     _sha256_short(content), content, len(content), report_id),
+                )
+                await db.execute("DELETE FROM report_archive_fts WHERE rowid=?", (report_id,))
+            await db.execute(
+                "INSERT INTO report_archive_fts(rowid, ticker, company_name, content) VALUES (?, ?, ?, ?)",
+                (report_id, row["ticker"], row["company_name"], content),
+            )
+            ids[key] = report_id
+        await db.commit()
+    logger.info(f"Archived {len(ids)} reports in one transaction")
+    return ids
+
+
 async def get_report_ids(
     ticker: Optional[str] = None,
     market: Optional[str] = None,
@@ -606,6 +752,38 @@ async def update_enrichment_performance(
         await db.commit()
 
 
+async def bulk_update_enrichment_performance(
+    perfs: Dict[int, Dict[str, Any]],
+    db_path: Optional[str] = None,
+) -> int:
+    """
+    Update long-term performance columns for many reports in one transaction.
+
+    perfs: {report_id: perf} with the same keys as update_enrichment_performance.
+    Reports sharing a column set are written with a single executemany.
+    Returns count of reports updated.
+    """
+    if not perfs:
+        return 0
+    path = db_path or str(ARCHIVE_DB_PATH)
+    grouped: Dict[tuple, List[List[Any]]] = {}
+    for report_id, perf in perfs.items():
+        cols = tuple(c for c, _ in _ENRICHMENT_PERF_COLUMNS if c in perf)
+        if cols:
+            grouped.setdefault(cols, []).append([perf[c] for c in cols] + [report_id])
+    if not grouped:
+        return 0
+    async with aiosqlite.connect(path) as db:
+        for cols, values in grouped.items():
+            set_clause = ", ".join(f"{c} = ?" for c in cols)
+            await db.executemany(
+                f"UPDATE report_enrichment SET {set_clause} WHERE report_id = ?",
+                values,
+            )
+        await db.commit()
+    return sum(len(v) for v in grouped.values())
+
+
 async def bulk_upsert_price_history(
     rows: List[Dict[str, Any]],
     db_path: Optional[str] = None,
@@ -709,6 +887,79 @@ async def upsert_market_timeline(
         await db.commit()
 
 
+# ---------------------------------------------------------------------------
+# embedding cache
+# ---------------------------------------------------------------------------
+
+# last_used_at is a recency hint, not an access log: a hit only rewrites it
+# once it is this old, so warm lookups stay read-only.
+EMBEDDING_TOUCH_HOURS = 24
+
+
+async def get_cached_embeddings(
+    model: str,
+    text_hashes: List[str],
+    db_path: Optional[str] = None,
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    Look up cached embeddings for many text hashes of one model.
+    Returns {text_hash: (dim, blob)} for hits. A hit's last_used_at is bumped
+    only when older than EMBEDDING_TOUCH_HOURS.
+    """
+    if not text_hashes:
+        return {}
+    path = db_path or str(ARCHIVE_DB_PATH)
+    await init_db(path)
+    found: Dict[str, Tuple[int, bytes]] = {}
+    stale: List[str] = []
+    unique = sorted(set(text_hashes))
+    cutoff = f"-{EMBEDDING_TOUCH_HOURS} hours"
+    async with aiosqlite.connect(path) as db:
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            cur = await db.execute(
+                f"SELECT text_hash, dim, embedding, "
+                f"COALESCE(last_used_at < datetime('now', 'localtime', ?), 1) "
+                f"FROM embedding_cache WHERE model = ? AND text_hash IN ({marks})",
+                [cutoff, model, *chunk],
+            )
+            for text_hash, dim, blob, is_stale in await cur.fetchall():
+                found[text_hash] = (dim, blob)
+                if is_stale:
+                    stale.append(text_hash)
+        if stale:
+            await db.executemany(
+                "UPDATE embedding_cache SET last_used_at = datetime('now', 'localtime') "
+                "WHERE model = ? AND text_hash = ?",
+                [(model, h) for h in stale],
+            )
+            await db.commit()
+    return found
+
+
+async def store_embeddings(
+    model: str,
+    items: Dict[str, Tuple[int, bytes]],
+    db_path: Optional[str] = None,
+) -> int:
+    """Insert or replace embeddings {text_hash: (dim, blob)} in one transaction."""
+    if not items:
+        return 0
+    path = db_path or str(ARCHIVE_DB_PATH)
+    await init_db(path)
+    async with aiosqlite.connect(path) as db:
+        await db.executemany(
+            """
+            INSERT OR REPLACE INTO embedding_cache (model, text_hash, dim, embedding)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(model, h, dim, blob) for h, (dim, blob) in items.items()],
+        )
+        await db.commit()
+    return len(items)
+
+
 # ---------------------------------------------------------------------------
 # insights cache
 # ---------------------------------------------------------------------------
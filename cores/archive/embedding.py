@@ -3,12 +3,18 @@ embedding.py — OpenAI 임베딩 생성 + SQLite BLOB 직렬화.
 
 text-embedding-3-small (1536 dim float32) 사용.
 BLOB은 numpy float32 배열의 바이트 표현.
+
+캐시: (model, 정규화 텍스트 sha256) 키로 프로세스 내 LRU → archive.db
+embedding_cache 테이블 순으로 조회하고, miss만 embed_many로 묶어 API 호출.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Optional
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -18,6 +24,24 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIM = 1536
 _MAX_INPUT_CHARS = 8000
 
+# 한 번의 embeddings.create 요청에 담는 최대 입력 수
+EMBED_BATCH_SIZE = 100
+
+# 프로세스 내 LRU 용량 (1536 * 4B ≈ 6KB/항목)
+_MEMORY_CACHE_SIZE = 2048
+
+_WS_RE = re.compile(r"\s+")
+
+_memory_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_stats: Dict[str, int] = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "api_calls": 0,
+    "api_inputs": 0,
+    "errors": 0,
+}
+
 
 def _get_openai_client(api_key: str):
     """Lazy import to avoid cost when module is loaded but not used."""
@@ -25,7 +49,153 @@ def _get_openai_client(api_key: str):
     return openai.AsyncOpenAI(api_key=api_key)
 
 
-async def embed_text(text: str, api_key: str) -> Optional[bytes]:
+def normalize_text(text: str) -> str:
+    """공백 정규화 + 길이 제한. API 입력과 캐시 키 모두 이 값을 사용."""
+    return _WS_RE.sub(" ", text or "").strip()[:_MAX_INPUT_CHARS]
+
+
+def text_hash(text: str) -> str:
+    """정규화된 텍스트의 sha256 (캐시 키)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def get_cache_stats() -> Dict[str, object]:
+    """캐시 hit/miss 카운터 스냅샷."""
+    lookups = _stats["memory_hits"] + _stats["db_hits"] + _stats["misses"]
+    hits = _stats["memory_hits"] + _stats["db_hits"]
+    return {
+        **_stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+        "memory_size": len(_memory_cache),
+    }
+
+
+def reset_cache(clear_stats: bool = True) -> None:
+    """프로세스 내 LRU (및 카운터) 초기화. 영구 캐시는 유지."""
+    _memory_cache.clear()
+    if clear_stats:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def _memory_get(key: tuple) -> Optional[bytes]:
+    blob = _memory_cache.get(key)
+    if blob is not None:
+        _memory_cache.move_to_end(key)
+    return blob
+
+
+def _memory_put(key: tuple, blob: bytes) -> None:
+    _memory_cache[key] = blob
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _to_blob(embedding: Sequence[float]) -> Optional[bytes]:
+    vec = np.asarray(embedding, dtype=np.float32)
+    if vec.shape != (EMBEDDING_DIM,):
+        logger.warning(f"Unexpected embedding shape {vec.shape}")
+        return None
+    return vec.tobytes()
+
+
+async def _request_embeddings(texts: List[str], api_key: str) -> List[Optional[bytes]]:
+    """정규화된 텍스트들을 EMBED_BATCH_SIZE 단위로 묶어 API 호출."""
+    client = _get_openai_client(api_key)
+    out: List[Optional[bytes]] = []
+    for i in range(0, len(texts), EMBED_BATCH_SIZE):
+        chunk = texts[i:i + EMBED_BATCH_SIZE]
+        _stats["api_calls"] += 1
+        _stats["api_inputs"] += len(chunk)
+        try:
+            resp = await client.embeddings.create(model=EMBEDDING_MODEL, input=chunk)
+            by_index = {d.index: d.embedding for d in resp.data}
+            out.extend(
+                _to_blob(by_index[j]) if j in by_index else None
+                for j in range(len(chunk))
+            )
+        except Exception as e:
+            _stats["errors"] += 1
+            logger.warning(f"embed_many request failed ({len(chunk)} inputs): {e}")
+            out.extend([None] * len(chunk))
+    return out
+
+
+async def embed_many(
+    texts: Sequence[str],
+    api_key: str,
+    db_path: Optional[str] = None,
+) -> List[Optional[bytes]]:
+    """
+    Embed many texts into 1536-dim float32 BLOBs, in input order.
+
+    중복 텍스트는 한 번만 조회하며, 캐시 miss만 배치 API 요청으로 보낸다.
+    빈 입력이나 실패한 항목은 None (caller stores NULL).
+    """
+    normalized = [normalize_text(t) for t in texts]
+    results: List[Optional[bytes]] = [None] * len(texts)
+    if not api_key:
+        return results
+
+    pending: Dict[str, List[int]] = {}
+    for i, text in enumerate(normalized):
+        if not text:
+            continue
+        h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        blob = _memory_get((EMBEDDING_MODEL, h))
+        if blob is not None:
+            _stats["memory_hits"] += 1
+            results[i] = blob
+            continue
+        pending.setdefault(h, []).append(i)
+    if not pending:
+        return results
+
+    try:
+        from .archive_db import get_cached_embeddings  # type: ignore[import]
+        cached = await get_cached_embeddings(EMBEDDING_MODEL, list(pending), db_path=db_path)
+    except Exception as e:
+        logger.debug(f"Embedding cache lookup failed: {e}")
+        cached = {}
+
+    for h, (dim, blob) in cached.items():
+        if dim != EMBEDDING_DIM or len(blob) != EMBEDDING_DIM * 4:
+            continue
+        _stats["db_hits"] += 1
+        _memory_put((EMBEDDING_MODEL, h), blob)
+        for i in pending.pop(h):
+            results[i] = blob
+    if not pending:
+        return results
+
+    hashes = list(pending)
+    _stats["misses"] += len(hashes)
+    blobs = await _request_embeddings([normalized[pending[h][0]] for h in hashes], api_key)
+
+    fresh: Dict[str, tuple] = {}
+    for h, blob in zip(hashes, blobs):
+        if blob is None:
+            continue
+        fresh[h] = (EMBEDDING_DIM, blob)
+        _memory_put((EMBEDDING_MODEL, h), blob)
+        for i in pending[h]:
+            results[i] = blob
+
+    if fresh:
+        try:
+            from .archive_db import store_embeddings  # type: ignore[import]
+            await store_embeddings(EMBEDDING_MODEL, fresh, db_path=db_path)
+        except Exception as e:
+            logger.debug(f"Embedding cache store failed: {e}")
+    return results
+
+
+async def embed_text(
+    text: str,
+    api_key: str,
+    db_path: Optional[str] = None,
+) -> Optional[bytes]:
     """
     Embed a single text into a 1536-dim float32 BLOB.
     Returns None on empty input or failure (caller stores NULL).
@@ -33,16 +203,7 @@ async def embed_text(text: str, api_key: str) -> Optional[bytes]:
     if not text or not text.strip() or not api_key:
         return None
     try:
-        client = _get_openai_client(api_key)
-        resp = await client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text[:_MAX_INPUT_CHARS],
-        )
-        vec = np.asarray(resp.data[0].embedding, dtype=np.float32)
-        if vec.shape != (EMBEDDING_DIM,):
-            logger.warning(f"Unexpected embedding shape {vec.shape}")
-            return None
-        return vec.tobytes()
+        return (await embed_many([text], api_key, db_path=db_path))[0]
     except Exception as e:
         logger.warning(f"embed_text failed: {e}")
         return None
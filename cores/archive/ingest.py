@@ -6,16 +6,31 @@ Entry points:
   ingest_directory(dir_path, market, ...) — batch ingest (async)
 
 Called fire-and-forget from orchestrators after generate_reports() completes.
+
+Batch ingest runs in staged chunks: files are read `batch_size` at a time,
+unchanged content (same file_hash) is skipped before any DB write, inserts and
+FTS updates for a chunk are committed in one transaction, tracker rows are
+read/updated through one connection per market, and only new or changed
+reports go through enrichment.  Per-stage counters are logged and returned.
 """
 
 import asyncio
 import logging
 import re
 import sqlite3
+import time
 from pathlib import Path
-from typing import Optional
-
-from .archive_db import init_db, insert_report, upsert_enrichment, upsert_market_timeline  # type: ignore[import]
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .archive_db import (  # type: ignore[import]
+    _sha256_short,
+    bulk_upsert_reports,
+    get_report_hashes,
+    init_db,
+    insert_report,
+    upsert_enrichment,
+    upsert_market_timeline,
+)
 from .data_enricher import get_enricher  # type: ignore[import]
 
 logger = logging.getLogger(__name__)
@@ -28,6 +43,12 @@ SEASON2_START = "2025-09-29"
 # Module-level sentinel: avoid calling init_db() on every report in a batch
 _db_initialized: bool = False
 
+# Reports read, hashed and committed per transaction in batch ingest
+DEFAULT_BATCH_SIZE = 200
+
+# Concurrent enrichment calls (KIS / yfinance) in batch ingest
+ENRICH_CONCURRENCY = 5
+
 
 # ---------------------------------------------------------------------------
 # Filename parser
@@ -163,6 +184,87 @@ def _update_report_path(ticker: str, report_date: str, market: str, file_path: s
         logger.debug(f"report_path update failed for {ticker} {report_date}: {e}")
 
 
+def _load_tracker_index(market: str) -> Dict[Tuple[str, str], dict]:
+    """
+    Load stop_loss/target_price for every tracker row of a market in one query.
+    Returns {(ticker, YYYY-MM-DD): {"stop_loss", "target_price"}}; first row wins,
+    matching _get_tracker_data's LIMIT 1.
+    """
+    cfg = _TRACKER_CONFIG.get(market)
+    if not cfg:
+        return {}
+    db_path, table, date_col = cfg
+    index: Dict[Tuple[str, str], dict] = {}
+    try:
+        if not db_path.exists():
+            return {}
+        with sqlite3.connect(str(db_path)) as conn:
+            # table and date_col are from _TRACKER_CONFIG whitelist
+            cur = conn.execute(
+                f"SELECT ticker, {date_col}, stop_loss, target_price FROM {table} ORDER BY rowid"
+            )
+            for ticker, date_value, stop_loss, target_price in cur:
+                key = (ticker, str(date_value or "")[:10])
+                if key not in index:
+                    index[key] = {"stop_loss": stop_loss, "target_price": target_price}
+    except Exception as e:
+        logger.debug(f"Tracker index load failed for {market}: {e}")
+    return index
+
+
+def _update_report_paths(market: str, entries: List[Tuple[str, str, str]]) -> None:
+    """Write report_path back into performance_tracker rows in one transaction.
+
+    entries: (ticker, report_date, file_path) tuples.
+    """
+    cfg = _TRACKER_CONFIG.get(market)
+    if not cfg or not entries:
+        return
+    db_path, table, date_col = cfg
+    try:
+        if not db_path.exists():
+            return
+        with sqlite3.connect(str(db_path)) as conn:
+            # table and date_col are from _TRACKER_CONFIG whitelist
+            conn.executemany(
+                f"UPDATE {table} SET report_path=? WHERE ticker=? AND {date_col} LIKE ?",
+                [(fp, ticker, f"{report_date}%") for ticker, report_date, fp in entries],
+            )
+            conn.commit()
+    except Exception as e:
+        logger.debug(f"report_path bulk update failed for {market}: {e}")
+
+
+class IngestCounters:
+    """Per-stage item counts and wall time for a batch ingest run."""
+
+    STAGES = ("scan", "read", "hash_skip", "insert", "tracker", "enrich")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {stage: 0 for stage in self.STAGES}
+        self.seconds: Dict[str, float] = {stage: 0.0 for stage in self.STAGES}
+
+    def add(self, stage: str, count: int, started: float) -> None:
+        self.counts[stage] += count
+        self.seconds[stage] += time.monotonic() - started
+
+    def summary(self) -> Dict[str, dict]:
+        return {
+            stage: {
+                "count": self.counts[stage],
+                "seconds": round(self.seconds[stage], 3),
+                "per_sec": round(self.counts[stage] / self.seconds[stage], 1)
+                if self.seconds[stage] > 0 else None,
+            }
+            for stage in self.STAGES
+        }
+
+    def log(self) -> None:
+        for stage, s in self.summary().items():
+            logger.info(f"  [{stage:<9}] {s['count']:>6} items in {s['seconds']:.2f}s"
+                        + (f" ({s['per_sec']}/s)" if s["per_sec"] else ""))
+
+
 # ---------------------------------------------------------------------------
 # Core ingest logic
 # ---------------------------------------------------------------------------
@@ -274,6 +376,212 @@ async def ingest_report(
     return report_id
 
 
+def _chunked(items: Iterable[Path], size: int) -> Iterator[List[Path]]:
+    chunk: List[Path] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _read_reports(entries: List[Tuple[Path, dict]]) -> List[Tuple[Path, dict, Optional[str]]]:
+    """Read a chunk of report files (runs in a worker thread)."""
+    out = []
+    for fp, meta in entries:
+        try:
+            out.append((fp, meta, fp.read_text(encoding="utf-8")))
+        except Exception as e:
+            logger.error(f"Failed to read {fp}: {e}")
+            out.append((fp, meta, None))
+    return out
+
+
+def _relative_path(path: Path) -> str:
+    """Store path relative to PROJECT_ROOT for portability."""
+    try:
+        return str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+async def _enrich_and_record(meta: dict, report_id: int, tracker: dict, is_new: bool,
+                             db_path: Optional[str]) -> bool:
+    """Fetch enrichment data and save it with the market timeline. Returns success."""
+    try:
+        enricher = get_enricher(meta["market"])
+        result = await enricher.enrich(
+            ticker=meta["ticker"],
+            analysis_date=meta["report_date"],
+            stop_loss=tracker.get("stop_loss"),
+            target_1=tracker.get("target_price"),
+        )
+        enrich_data = result.to_dict()
+        enrich_data["analysis_date"] = meta["report_date"]
+        await upsert_enrichment(report_id, enrich_data, db_path=db_path)
+
+        await upsert_market_timeline(
+            date=meta["report_date"],
+            market=meta["market"],
+            index_close=enrich_data.get("index_at_analysis"),
+            index_change=enrich_data.get("index_change_20d"),
+            market_phase=enrich_data.get("market_phase"),
+            increment_report_count=is_new,
+            db_path=db_path,
+        )
+        return True
+    except Exception as e:
+        logger.warning(f"Enrichment failed for {meta['ticker']} {meta['report_date']}: {e}")
+        return False
+
+
+async def ingest_batch(
+    files: Iterable[Path],
+    market: Optional[str] = None,
+    dry_run: bool = False,
+    force: bool = False,
+    backfill: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    db_path: Optional[str] = None,
+) -> dict:
+    """
+    Staged batch ingest over an iterable of report files.
+
+    Args:
+        files: Report paths, consumed `batch_size` at a time
+        market: 'kr' or 'us' (auto-detected from filename if None)
+        dry_run: Log what would be ingested but skip DB writes
+        force: Re-run enrichment for reports whose content is unchanged
+        backfill: Also write report_path for unchanged reports
+        batch_size: Reports per read/insert transaction
+        db_path: Archive DB path (default archive.db)
+
+    Returns:
+        Summary dict: {total, ingested, skipped, errors, stages}
+    """
+    counters = IngestCounters()
+    counts = {"total": 0, "ingested": 0, "skipped": 0, "errors": 0}
+    tracker_indexes: Dict[str, Dict[Tuple[str, str], dict]] = {}
+    semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+    initialized = dry_run
+
+    for chunk in _chunked(files, max(1, batch_size)):
+        # Stage 1: parse filenames
+        started = time.monotonic()
+        parsed: List[Tuple[Path, dict]] = []
+        for fp in chunk:
+            counts["total"] += 1
+            meta = parse_report_filename(str(fp))
+            if not meta:
+                logger.warning(f"Cannot parse filename: {fp.name}")
+                counts["skipped"] += 1
+                continue
+            if market:
+                meta["market"] = market
+            if meta["report_date"] < SEASON2_START:
+                logger.debug(f"Skipping pre-Season2 report: {fp.name}")
+                counts["skipped"] += 1
+                continue
+            if dry_run:
+                logger.info(f"[DRY-RUN] Would ingest: {fp.name} "
+                            f"({meta['market'].upper()} {meta['ticker']} {meta['report_date']})")
+                counts["skipped"] += 1
+                continue
+            parsed.append((fp, meta))
+        counters.add("scan", len(chunk), started)
+        if not parsed:
+            continue
+
+        if not initialized:
+            await init_db(db_path)
+            initialized = True
+
+        # Stage 2: read content
+        started = time.monotonic()
+        loaded = await asyncio.to_thread(_read_reports, parsed)
+        counters.add("read", len(loaded), started)
+
+        # Stage 3: hash-skip unchanged content
+        started = time.monotonic()
+        keys = [(m["ticker"], m["report_date"], m["mode"], m["market"], "ko") for _, m, _ in loaded]
+        existing = await get_report_hashes(keys, db_path=db_path)
+        rows: List[dict] = []
+        unchanged: List[Tuple[dict, int]] = []
+        seen = set()
+        for (fp, meta, content), key in zip(loaded, keys):
+            if content is None:
+                counts["errors"] += 1
+                continue
+            if key in seen:
+                # Same archive key from another file (e.g. another model) — first wins
+                counts["skipped"] += 1
+                continue
+            seen.add(key)
+            rel_path = _relative_path(fp)
+            row = {**meta, "language": "ko", "file_path": rel_path, "content": content}
+            if key in existing:
+                report_id, file_hash, stored_path = existing[key]
+                if file_hash == _sha256_short(content) and stored_path == rel_path:
+                    unchanged.append((row, report_id))
+                    continue
+                row["report_id"] = report_id
+            rows.append(row)
+        counters.add("hash_skip", len(unchanged), started)
+
+        # Stage 4: insert / refresh content + FTS in one transaction
+        started = time.monotonic()
+        ids = await bulk_upsert_reports(rows, db_path=db_path)
+        counters.add("insert", len(ids), started)
+
+        todo: List[Tuple[dict, int, bool]] = []
+        for row in rows:
+            key = (row["ticker"], row["report_date"], row["mode"], row["market"], "ko")
+            if key in ids:
+                todo.append((row, ids[key], "report_id" not in row))
+            else:
+                counts["skipped"] += 1
+        if force:
+            todo.extend((row, report_id, False) for row, report_id in unchanged)
+        else:
+            counts["skipped"] += len(unchanged)
+
+        # Stage 5: tracker report_path + stop/target lookup (one connection per market)
+        started = time.monotonic()
+        path_rows = [row for row, _, _ in todo] + ([row for row, _ in unchanged] if backfill else [])
+        by_market: Dict[str, List[Tuple[str, str, str]]] = {}
+        for row in path_rows:
+            by_market.setdefault(row["market"], []).append(
+                (row["ticker"], row["report_date"], row["file_path"])
+            )
+        for mkt, entries in by_market.items():
+            await asyncio.to_thread(_update_report_paths, mkt, entries)
+        for mkt in {row["market"] for row, _, _ in todo} - tracker_indexes.keys():
+            tracker_indexes[mkt] = await asyncio.to_thread(_load_tracker_index, mkt)
+        counters.add("tracker", len(path_rows), started)
+
+        # Stage 6: enrichment for new/changed reports only
+        started = time.monotonic()
+
+        async def _bounded(row: dict, report_id: int, is_new: bool) -> bool:
+            tracker = tracker_indexes.get(row["market"], {}).get((row["ticker"], row["report_date"]), {})
+            async with semaphore:
+                return await _enrich_and_record(row, report_id, tracker, is_new, db_path)
+
+        enriched = await asyncio.gather(*[_bounded(*item) for item in todo])
+        counters.add("enrich", sum(1 for ok in enriched if ok), started)
+        counts["ingested"] += len(todo)
+
+    logger.info(
+        f"Ingest complete: {counts['ingested']} ingested, "
+        f"{counts['skipped']} skipped, {counts['errors']} errors"
+    )
+    counters.log()
+    counts["stages"] = counters.summary()
+    return counts
+
+
 async def ingest_reports_async(
     report_paths: list,
     market: Optional[str] = None,
@@ -281,20 +589,15 @@ async def ingest_reports_async(
 ) -> None:
     """
     Fire-and-forget batch ingest called from orchestrators.
-    Processes up to 5 reports concurrently.
+    Runs the staged batch pipeline (up to 5 concurrent enrichments).
     """
     if not report_paths:
         return
-    semaphore = asyncio.Semaphore(5)
-
-    async def _bounded(fp: str):
-        async with semaphore:
-            try:
-                await ingest_report(fp, market=market, dry_run=dry_run)
-            except Exception as e:
-                logger.warning(f"Ingest failed for {fp}: {e}")
-
-    await asyncio.gather(*[_bounded(fp) for fp in report_paths])
+    try:
+        await ingest_batch([Path(fp) for fp in report_paths], market=market, dry_run=dry_run)
+    except Exception as e:
+        logger.warning(f"Ingest failed for {len(report_paths)} reports: {e}")
+        return
     logger.info(f"Archive ingest complete: {len(report_paths)} reports processed")
 
 
@@ -304,12 +607,15 @@ async def ingest_directory(
     pattern: str = "*.md",
     dry_run: bool = False,
     backfill: bool = False,
+    force: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    db_path: Optional[str] = None,
 ) -> dict:
     """
     Batch ingest all reports in a directory.
 
     Returns:
-        Summary dict: {total, ingested, skipped, errors}
+        Summary dict: {total, ingested, skipped, errors, stages}
     """
     dir_ = Path(dir_path)
     if not dir_.exists():
@@ -321,30 +627,10 @@ async def ingest_directory(
         logger.info("Backfill mode: report_path will be updated for all matched tracker rows")
     logger.info(f"Found {len(files)} files in {dir_path}")
 
-    semaphore = asyncio.Semaphore(5)
-
-    async def _process(fp: Path) -> str:
-        """Returns 'ingested', 'skipped', or 'error'."""
-        async with semaphore:
-            try:
-                rid = await ingest_report(str(fp), market=market, dry_run=dry_run)
-                return "ingested" if rid is not None else "skipped"
-            except Exception as e:
-                logger.error(f"Ingest error for {fp.name}: {e}")
-                return "error"
-
-    results = await asyncio.gather(*[_process(f) for f in files])
-    counts = {
-        "total": len(files),
-        "ingested": results.count("ingested"),
-        "skipped": results.count("skipped"),
-        "errors": results.count("error"),
-    }
-    logger.info(
-        f"Ingest complete: {counts['ingested']} ingested, "
-        f"{counts['skipped']} skipped, {counts['errors']} errors"
+    return await ingest_batch(
+        files, market=market, dry_run=dry_run, force=force,
+        backfill=backfill, batch_size=batch_size, db_path=db_path,
     )
-    return counts
 
 
 # ---------------------------------------------------------------------------
@@ -362,6 +648,10 @@ if __name__ == "__main__":
     parser.add_argument("--market", choices=["kr", "us"], help="Market (auto-detected if omitted)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be ingested without writing")
     parser.add_argument("--backfill", action="store_true", help="Also fill report_path in performance_tracker")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run enrichment for reports whose content is unchanged")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Reports per insert transaction (default {DEFAULT_BATCH_SIZE})")
     args = parser.parse_args()
 
     async def _main():
@@ -370,7 +660,8 @@ if __name__ == "__main__":
             print(f"Ingested: report_id={rid}")
         elif args.dir:
             summary = await ingest_directory(
-                args.dir, market=args.market, dry_run=args.dry_run, backfill=args.backfill
+                args.dir, market=args.market, dry_run=args.dry_run, backfill=args.backfill,
+                force=args.force, batch_size=args.batch_size,
             )
             print(f"Summary: {summary}")
         else:
@@ -21,6 +21,7 @@ import json
 import logging
 import os
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
@@ -31,6 +32,7 @@ from mcp_agent.workflows.llm.augmented_llm_anthropic import AnthropicAugmentedLL
 from pydantic import BaseModel, Field
 
 from . import persistent_insights as pi_store
+from . import semantic_cache
 from .archive_db import ARCHIVE_DB_PATH
 from .embedding import embed_text
 from .insight_prompts import INSIGHT_SYSTEM_PROMPT
@@ -239,6 +241,8 @@ class InsightResult:
     insight_id: Optional[int] = None
     remaining_quota: int = -1
     model_used: str = DEFAULT_MODEL
+    cached: bool = False
+    cache_provenance: Optional[Dict[str, Any]] = None
 
 
 class InsightAgent:
@@ -300,7 +304,7 @@ class InsightAgent:
                 "outcomes": {}, "semantic_facts": {}, "q_emb": None,
             }
 
-        q_emb = await embed_text(question, api_key) if api_key else None
+        q_emb = await embed_text(question, api_key, db_path=self.db_path) if api_key else None
 
         insights_task = pi_store.search_insights(
             question, q_emb, limit=5, exclude_superseded=True, db_path=self.db_path,
@@ -612,7 +616,58 @@ class InsightAgent:
                 evidence_report_ids=[], remaining_quota=0, model_used=self.model,
             )
 
+        # 1b. Semantic cache — follow-ups depend on the thread, so only
+        #     standalone questions are served from it.
+        hints = parse_query_hints(question)
+        scope = semantic_cache.scope_key(
+            hints["market"], hints["ticker"],
+            date_from=hints["date_from"], date_to=hints["date_to"],
+            day=datetime.now(_KST).strftime("%Y-%m-%d"),
+        )
+        q_emb: Optional[bytes] = None
+        use_cache = previous_insight_id is None and semantic_cache.ENABLED
+        if use_cache:
+            api_key = self._api_key or load_api_key()
+            self._api_key = api_key
+            if api_key:
+                q_emb = await embed_text(question, api_key, db_path=self.db_path)
+            hit = await semantic_cache.lookup(
+                "insight", question, q_emb, scope,
+                market=hints["market"], db_path=self.db_path,
+            )
+            if hit:
+                cached = hit.payload
+                # The cached row belongs to whoever asked first; feedback and
+                # follow-up threading need this user's own insight row.
+                cached_id: Optional[int] = None
+                try:
+                    cached_id = await pi_store.save_insight(
+                        user_id=user_id, chat_id=chat_id,
+                        question=question, answer=cached["answer"],
+                        key_takeaways=cached.get("key_takeaways", []),
+                        tools_used=[],
+                        tickers_mentioned=cached.get("tickers_mentioned", []),
+                        evidence_report_ids=cached.get("evidence_report_ids", []),
+                        model_used=cached.get("model_used", self.model),
+                        db_path=self.db_path,
+                    )
+                except Exception as save_err:
+                    logger.error(f"save_insight (cache hit) failed: {save_err}", exc_info=True)
+                return InsightResult(
+                    answer=cached["answer"],
+                    key_takeaways=cached.get("key_takeaways", []),
+                    tickers_mentioned=cached.get("tickers_mentioned", []),
+                    tools_used=[],
+                    evidence_report_ids=cached.get("evidence_report_ids", []),
+                    insight_id=cached_id,
+                    remaining_quota=remaining,
+                    model_used=cached.get("model_used", self.model),
+                    cached=True,
+                    cache_provenance=hit.provenance(),
+                )
+
         # 2. Retrieval
+        started = time.monotonic()
         ctx = await self._build_retrieval_context(question)
         context_str = self._format_context(ctx)
 
@@ -745,6 +800,7 @@ class InsightAgent:
                 )
 
         parsed = self._ground_response_metadata(parsed, ctx, response_text)
+        latency_ms = (time.monotonic() - started) * 1000
 
         # 5. Embedding for key_takeaways (fire-and-forget 성격)
         api_key = self._api_key or load_api_key()
@@ -752,7 +808,7 @@ class InsightAgent:
             " \n".join(parsed["key_takeaways"])
             or parsed["answer"][:500]
         )
-        emb_blob = await embed_text(takeaway_text, api_key) if api_key else None
+        emb_blob = await embed_text(takeaway_text, api_key, db_path=self.db_path) if api_key else None
 
         # 6. Save
         insight_id: Optional[int] = None
@@ -771,6 +827,23 @@ class InsightAgent:
         except Exception as save_err:
             logger.error(f"save_insight failed: {save_err}", exc_info=True)
 
+        if use_cache:
+            await semantic_cache.store(
+                "insight", question, q_emb, scope,
+                {
+                    "answer": parsed["answer"],
+                    "key_takeaways": parsed["key_takeaways"],
+                    "tickers_mentioned": parsed["tickers_mentioned"],
+                    "evidence_report_ids": parsed["evidence_report_ids"],
+                    "model_used": self.model,
+                },
+                market=hints["market"],
+                tickers=parsed["tickers_mentioned"],
+                model_used=self.model,
+                latency_ms=latency_ms,
+                db_path=self.db_path,
+            )
+
         # 7. Cost tracking (fire-and-forget)
         try:
             perp = parsed["tools_used"].count("perplexity") + sum(
@@ -2,7 +2,10 @@
 price_tracker.py — Long-term price history tracker for PRISM archived tickers.
 
 Fetches daily closes from report_date to today, stores in ticker_price_history,
-and computes performance aggregates in report_enrichment:
+and computes performance aggregates in report_enrichment.  Reports are grouped
+by ticker: each ticker's history is fetched once (thread pool bounded by
+--concurrency) and the aggregates for all of its reports are computed from
+that single series:
   - return_180d, return_365d, return_current
   - max_return_since / max_return_date  (best return ever achieved since report)
   - max_drawdown / max_drawdown_date    (worst drawdown from entry price)
@@ -18,15 +21,20 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Flush accumulated ticker_price_history rows once this many are pending
+WRITE_BATCH_ROWS = 20000
+
 
 # ---------------------------------------------------------------------------
 # Aggregate computation
@@ -122,6 +130,95 @@ def _compute_aggregates(
     return agg
 
 
+class _CloseSeries:
+    """
+    One ticker's daily closes prepared for answering many reports at once.
+
+    Suffix max/min tables let every report's max return / max drawdown be read
+    in O(1) after an O(log n) bisect to its first post-report session, instead
+    of rescanning the series for each report.
+    """
+
+    def __init__(self, closes: Dict[str, float]) -> None:
+        self.closes = {d: p for d, p in closes.items() if p > 0}
+        self.dates = sorted(self.closes)
+        self.prices = [self.closes[d] for d in self.dates]
+        n = len(self.dates)
+        # Earliest index of the max / min close in dates[i:]
+        self.suffix_max = [0] * n
+        self.suffix_min = [0] * n
+        for i in range(n - 1, -1, -1):
+            if i == n - 1:
+                self.suffix_max[i] = self.suffix_min[i] = i
+                continue
+            hi, lo = self.suffix_max[i + 1], self.suffix_min[i + 1]
+            self.suffix_max[i] = i if self.prices[i] >= self.prices[hi] else hi
+            self.suffix_min[i] = i if self.prices[i] <= self.prices[lo] else lo
+
+    def aggregates(self, base_date: str, base_price: float) -> Dict[str, Any]:
+        """Same result as _compute_aggregates(closes, base_date, base_price)."""
+        agg: Dict[str, Any] = {
+            "return_current": None,
+            "price_current": None,
+            "return_180d": None,
+            "return_365d": None,
+            "max_return_since": None,
+            "max_return_date": None,
+            "max_drawdown": None,
+            "max_drawdown_date": None,
+            "drawdown_from_peak": None,
+        }
+        start = bisect.bisect_right(self.dates, base_date)
+        if start >= len(self.dates) or base_price <= 0:
+            return agg
+
+        def _ret(price: float) -> float:
+            return (price - base_price) / base_price * 100
+
+        latest_close = self.prices[-1]
+        agg["price_current"] = round(latest_close, 4)
+        agg["return_current"] = round(_ret(latest_close), 4)
+
+        # Fixed-window returns (search ±5 trading days)
+        base_dt = datetime.strptime(base_date, "%Y-%m-%d")
+        for days, key in [(180, "return_180d"), (365, "return_365d")]:
+            target_dt = base_dt + timedelta(days=days)
+            price = None
+            for offset in range(6):
+                for sign in (-1, 1):
+                    candidate = (target_dt + timedelta(days=offset * sign)).strftime("%Y-%m-%d")
+                    if candidate in self.closes and candidate > base_date:
+                        price = self.closes[candidate]
+                        break
+                if price is not None:
+                    break
+            if price is not None:
+                agg[key] = round(_ret(price), 4)
+
+        hi = self.suffix_max[start]
+        lo = self.suffix_min[start]
+        agg["max_return_since"] = round(_ret(self.prices[hi]), 4)
+        agg["max_return_date"] = self.dates[hi]
+        agg["max_drawdown"] = round(_ret(self.prices[lo]), 4)
+        agg["max_drawdown_date"] = self.dates[lo]
+        agg["drawdown_from_peak"] = round(
+            (latest_close - self.prices[hi]) / self.prices[hi] * 100, 4
+        )
+        return agg
+
+
+def _compute_aggregates_many(
+    closes: Dict[str, float],
+    reports: List[Tuple[str, float]],
+) -> List[Dict[str, Any]]:
+    """
+    Compute _compute_aggregates for every (base_date, base_price) in reports
+    from one shared series. Returns aggregates in the same order as reports.
+    """
+    series = _CloseSeries(closes)
+    return [series.aggregates(base_date, base_price) for base_date, base_price in reports]
+
+
 # ---------------------------------------------------------------------------
 # Price fetcher helpers (reuse enricher sync methods)
 # ---------------------------------------------------------------------------
@@ -152,6 +249,13 @@ def _fetch_us_daily(ticker: str, start_date: str, end_date: str) -> Dict[str, fl
         return {}
 
 
+def _fetch_daily(market: str, ticker: str, start_date: str, end_date: str) -> Dict[str, float]:
+    """Dispatch to the market's daily close fetcher. Returns {date: close}."""
+    if market == "kr":
+        return _fetch_kr_daily(ticker, start_date, end_date)
+    return _fetch_us_daily(ticker, start_date, end_date)
+
+
 # ---------------------------------------------------------------------------
 # PriceTracker
 # ---------------------------------------------------------------------------
@@ -247,6 +351,11 @@ class PriceTracker:
         """
         Update price history for all eligible reports.
 
+        Reports are deduplicated by (market, ticker): each ticker's closes are
+        fetched once from its oldest report_date on a thread pool of
+        `concurrency` workers, aggregates for all of its reports are computed
+        from that series, and rows are written in large transactions.
+
         Returns summary: {processed, skipped, errors, results}
         """
         from cores.archive.archive_db import (  # type: ignore[import]
@@ -262,39 +371,114 @@ class PriceTracker:
             logger.info("No reports need price update.")
             return {"processed": 0, "skipped": 0, "errors": 0, "results": []}
 
-        logger.info(f"Updating price history for {len(reports)} reports "
-                    f"(concurrency={concurrency}, dry_run={dry_run})")
+        groups: Dict[Tuple[str, str], List[Dict]] = {}
+        for r in reports:
+            groups.setdefault((r["market"], r["ticker"]), []).append(r)
+
+        logger.info(f"Updating price history for {len(reports)} reports across "
+                    f"{len(groups)} tickers (concurrency={concurrency}, dry_run={dry_run})")
 
-        sem = asyncio.Semaphore(concurrency)
+        today = datetime.today().strftime("%Y-%m-%d")
+        loop = asyncio.get_running_loop()
         processed = 0
         errors = 0
-        results = []
+        results: List[Dict[str, Any]] = []
+        pending_rows: List[Dict[str, Any]] = []
+        pending_perf: Dict[int, Dict[str, Any]] = {}
+
+        async def _flush() -> None:
+            if dry_run or (not pending_rows and not pending_perf):
+                pending_rows.clear()
+                pending_perf.clear()
+                return
+            from cores.archive.archive_db import (  # type: ignore[import]
+                bulk_update_enrichment_performance,
+                bulk_upsert_price_history,
+            )
+            await bulk_upsert_price_history(pending_rows, self.db_path)
+            await bulk_update_enrichment_performance(pending_perf, self.db_path)
+            pending_rows.clear()
+            pending_perf.clear()
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
 
-        async def _update_one(r: Dict) -> None:
-            nonlocal processed, errors
-            async with sem:
+            async def _fetch_group(key: Tuple[str, str]) -> Tuple[Tuple[str, str], Dict[str, float]]:
+                mkt, tkr = key
+                start = min(r["report_date"] for r in groups[key])
                 try:
-                    result = await self.update_report(
-                        report_id=r["id"],
-                        ticker=r["ticker"],
-                        market=r["market"],
-                        report_date=r["report_date"],
-                        price_at_report=r["price_at_analysis"],
-                        dry_run=dry_run,
+                    closes = await loop.run_in_executor(
+                        pool, _fetch_daily, mkt, tkr, start, today
                     )
-                    results.append(result)
+                except Exception as e:
+                    logger.warning(f"[{mkt.upper()}] Price fetch failed for {tkr}: {e}")
+                    closes = {}
+                return key, closes
+
+            for fut in asyncio.as_completed([_fetch_group(key) for key in groups]):
+                (mkt, tkr), closes = await fut
+                group = groups[(mkt, tkr)]
+
+                if not closes:
+                    logger.warning(f"[{mkt.upper()}] No price data for {tkr} "
+                                   f"({len(group)} reports)")
+                    for r in group:
+                        results.append({"report_id": r["id"], "ticker": tkr,
+                                        "rows_written": 0, "aggregates": {}})
+                    continue
+
+                try:
+                    series = _CloseSeries(closes)
+                except Exception as e:
+                    errors += len(group)
+                    logger.error(f"Failed to prepare closes for {tkr}: {e}", exc_info=True)
+                    continue
+
+                updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                prefix = "[DRY-RUN] " if dry_run else f"[{mkt.upper()}] "
+                for r in group:
+                    base_price = r["price_at_analysis"]
+                    if not base_price or base_price <= 0:
+                        logger.warning(f"{prefix}{tkr} {r['report_date']}: "
+                                       f"no usable price_at_analysis ({base_price!r}), skipped")
+                        continue
+                    try:
+                        aggregates = series.aggregates(r["report_date"], base_price)
+                        history_rows = [
+                            {
+                                "report_id": r["id"],
+                                "ticker": tkr,
+                                "market": mkt,
+                                "price_date": d,
+                                "close": p,
+                                "return_pct": round((p - base_price) / base_price * 100, 4),
+                            }
+                            for d, p in closes.items()
+                            if d > r["report_date"]
+                        ]
+                    except Exception as e:
+                        errors += 1
+                        logger.error(f"Failed to update {tkr} {r['report_date']}: {e}",
+                                     exc_info=True)
+                        continue
+                    aggregates["last_price_update"] = updated_at
+                    pending_rows.extend(history_rows)
+                    pending_perf[r["id"]] = aggregates
                     processed += 1
+                    results.append({
+                        "report_id": r["id"],
+                        "ticker": tkr,
+                        "rows_written": len(history_rows),
+                        "aggregates": aggregates,
+                    })
                     logger.info(
-                        f"[{r['market'].upper()}] {r['ticker']} {r['report_date']}: "
-                        f"{result['rows_written']} rows, "
-                        f"return_current={result['aggregates'].get('return_current')}%"
+                        f"{prefix}{tkr} {r['report_date']}: {len(history_rows)} rows, "
+                        f"return_current={aggregates.get('return_current')}%"
                     )
-                except Exception as e:
-                    errors += 1
-                    logger.error(f"Failed to update {r['ticker']} {r['report_date']}: {e}",
-                                 exc_info=True)
 
-        await asyncio.gather(*[_update_one(r) for r in reports])
+                if len(pending_rows) >= WRITE_BATCH_ROWS:
+                    await _flush()
+
+            await _flush()
 
         summary = {
             "processed": processed,
@@ -302,7 +486,8 @@ class PriceTracker:
             "errors": errors,
             "results": results,
         }
-        logger.info(f"Price update complete: {summary}")
+        logger.info(f"Price update complete: processed={processed}, "
+                    f"skipped={summary['skipped']}, errors={errors}, tickers={len(groups)}")
         return summary
 
 
@@ -2,7 +2,8 @@
 query_engine.py — Natural language query engine over the PRISM report archive.
 
 Pipeline:
-  1. Check insight cache (24-hour TTL for recent queries)
+  1. Check insight cache (24-hour TTL for recent queries), then the semantic
+     answer cache (paraphrased questions in the same scope)
   2. Parse NL query for ticker / date / market hints
   3. FTS5 retrieval + optional structured filter
   4. Enrich each hit with performance data (return_7d…90d, stop_loss)
@@ -18,6 +19,7 @@ import hashlib
 import json
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -34,6 +36,8 @@ from .archive_db import (  # type: ignore[import]
     init_db,
     search_fts,
 )
+from . import semantic_cache  # type: ignore[import]
+from .embedding import embed_text  # type: ignore[import]
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +79,7 @@ class QueryResult:
     query_hash: str
     cached: bool = False
     model_used: str = _DEFAULT_MODEL
+    cache_provenance: Optional[Dict[str, Any]] = None
 
 
 # ---------------------------------------------------------------------------
@@ -527,6 +532,32 @@ class QueryEngine:
                 except (json.JSONDecodeError, KeyError) as e:
                     logger.warning(f"Corrupted cache entry for {q_hash}, regenerating: {e}")
 
+        # 1b. Semantic cache — paraphrases of an answered question in the same scope
+        scope = semantic_cache.scope_key(
+            effective_market, effective_ticker,
+            date_from=effective_date_from, date_to=effective_date_to,
+            outcome=json.dumps(outcome_filter, sort_keys=True) if outcome_filter else None,
+        )
+        api_key = self._api_key or load_api_key()
+        q_emb: Optional[bytes] = None
+        if not skip_cache and semantic_cache.ENABLED:
+            if api_key:
+                q_emb = await embed_text(text, api_key, db_path=self.db_path)
+            hit = await semantic_cache.lookup(
+                "query", text, q_emb, scope,
+                market=effective_market, db_path=self.db_path,
+            )
+            if hit:
+                return QueryResult(
+                    answer=hit.payload["answer"],
+                    sources=[],
+                    evidence_ids=hit.payload.get("evidence_ids", []),
+                    query_hash=q_hash,
+                    cached=True,
+                    model_used=hit.payload.get("model_used", self.model),
+                    cache_provenance=hit.provenance(),
+                )
+
         # 2. Retrieval — branch on outcome filter
         if outcome_filter:
             logger.info(f"Outcome filter detected: {outcome_filter}")
@@ -561,7 +592,8 @@ class QueryEngine:
         context = _build_context(snippets)
 
         # 4. Synthesize
-        api_key = self._api_key or load_api_key()
+        synthesized = False
+        started = time.monotonic()
         if not api_key:
             answer = (
                 "[API 키 없음] 컨텍스트만 반환합니다:\n\n"
@@ -570,6 +602,8 @@ class QueryEngine:
         else:
             self._api_key = api_key
             answer = await synthesize(text, context, api_key, self.model)
+            synthesized = bool(answer) and not answer.startswith("[LLM 합성 실패]")
+        latency_ms = (time.monotonic() - started) * 1000
 
         evidence_ids = [s.report_id for s in snippets]
 
@@ -591,6 +625,17 @@ class QueryEngine:
             expires_at=expires_at,
             db_path=self.db_path,
         )
+        if synthesized:
+            await semantic_cache.store(
+                "query", text, q_emb, scope,
+                {"answer": answer, "evidence_ids": evidence_ids, "model_used": self.model},
+                market=effective_market,
+                tickers=[s.ticker for s in snippets],
+                model_used=self.model,
+                latency_ms=latency_ms,
+                ttl_hours=self.cache_ttl_hours,
+                db_path=self.db_path,
+            )
 
         return QueryResult(
             answer=answer,
@@ -0,0 +1,302 @@
+"""
+semantic_cache.py — /insight · /query 의미 기반 응답 캐시.
+
+같은 질문을 다른 표현으로 반복해도 LLM 합성을 다시 돌리지 않도록,
+정규화 질문의 임베딩으로 같은 범위(kind + market/ticker/기간)의 기존 답변 중
+코사인 유사도가 임계값 이상인 것을 찾아 재사용한다.
+
+무효화:
+  - expires_at (freshness window) 경과
+  - 답변이 참조한 티커에 새 리포트(report_archive) 또는 가격 갱신
+    (report_enrichment.last_price_update)이 캐시 생성 이후 들어온 경우.
+    참조 티커가 없는 시장 전반 답변은 같은 시장에 새 리포트가 들어오면 무효.
+
+핵심 API:
+  lookup(kind, question, q_emb, scope, …) → SemanticHit | None
+  store(kind, question, q_emb, scope, payload, …)
+  get_stats()                             → hit rate / 절약 지연 시간
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiosqlite
+import numpy as np
+
+from .archive_db import ARCHIVE_DB_PATH, init_db
+from .embedding import decode_embedding
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("ARCHIVE_SEMANTIC_CACHE", "1").lower() not in ("0", "false", "no")
+SIMILARITY_THRESHOLD = float(os.getenv("ARCHIVE_SEMANTIC_CACHE_THRESHOLD", "0.93"))
+DEFAULT_TTL_HOURS = float(os.getenv("ARCHIVE_SEMANTIC_CACHE_TTL_HOURS", "24"))
+
+# 범위별로 비교하는 최근 후보 수 상한
+_MAX_CANDIDATES = 500
+
+_TRAILING_PUNCT_RE = re.compile(r"[\s?？!！.。~]+$")
+_WS_RE = re.compile(r"\s+")
+
+_stats: Dict[str, float] = {
+    "lookups": 0,
+    "hits": 0,
+    "misses": 0,
+    "stale": 0,
+    "saved_latency_ms": 0.0,
+}
+
+
+@dataclass
+class SemanticHit:
+    entry_id: int
+    payload: Dict[str, Any]
+    cached_question: str
+    similarity: float
+    created_at: str
+    saved_latency_ms: Optional[float]
+    tickers: List[str] = field(default_factory=list)
+
+    def provenance(self) -> Dict[str, Any]:
+        """응답에 붙이는 캐시 출처 정보."""
+        return {
+            "source": "semantic_cache",
+            "entry_id": self.entry_id,
+            "cached_question": self.cached_question,
+            "similarity": round(self.similarity, 4),
+            "created_at": self.created_at,
+        }
+
+
+def normalize_question(question: str) -> str:
+    """소문자 + 공백 정규화 + 끝 문장부호 제거."""
+    text = _WS_RE.sub(" ", (question or "").lower()).strip()
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+def scope_key(
+    market: Optional[str] = None,
+    ticker: Optional[str] = None,
+    **extra: Any,
+) -> str:
+    """같은 범위의 질문끼리만 비교하도록 market/ticker/기타 필터를 키로 묶는다."""
+    parts = [f"market={market or ''}", f"ticker={ticker or ''}"]
+    parts += [f"{k}={extra[k] if extra[k] is not None else ''}" for k in sorted(extra)]
+    return "|".join(parts)
+
+
+def get_stats() -> Dict[str, Any]:
+    """프로세스 내 hit rate / 절약 지연 시간."""
+    lookups = _stats["lookups"]
+    return {
+        **_stats,
+        "saved_latency_ms": round(_stats["saved_latency_ms"], 1),
+        "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else None,
+    }
+
+
+def reset_stats() -> None:
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+async def _is_stale(
+    db: aiosqlite.Connection,
+    tickers: Sequence[str],
+    market: Optional[str],
+    created_at: str,
+) -> bool:
+    """캐시 생성 이후 참조 티커(없으면 시장)에 새/수정 리포트나 가격 갱신이 있었는지."""
+    if tickers:
+        marks = ", ".join("?" for _ in tickers)
+        cur = await db.execute(
+            f"SELECT 1 FROM report_archive WHERE ticker IN ({marks}) "
+            f"AND COALESCE(updated_at, created_at) > ? LIMIT 1",
+            [*tickers, created_at],
+        )
+        if await cur.fetchone():
+            return True
+        cur = await db.execute(
+            f"SELECT 1 FROM report_enrichment WHERE ticker IN ({marks}) "
+            f"AND last_price_update > ? LIMIT 1",
+            [*tickers, created_at],
+        )
+        return await cur.fetchone() is not None
+    clauses = ["COALESCE(updated_at, created_at) > ?"]
+    params: List[Any] = [created_at]
+    if market:
+        clauses.append("market = ?")
+        params.append(market)
+    cur = await db.execute(
+        f"SELECT 1 FROM report_archive WHERE {' AND '.join(clauses)} LIMIT 1", params,
+    )
+    return await cur.fetchone() is not None
+
+
+async def lookup(
+    kind: str,
+    question: str,
+    q_emb: Optional[bytes],
+    scope: str,
+    market: Optional[str] = None,
+    threshold: Optional[float] = None,
+    db_path: Optional[str] = None,
+) -> Optional[SemanticHit]:
+    """
+    같은 kind/scope 안에서 가장 유사한 유효 답변을 찾는다.
+
+    q_emb 가 없으면 정규화 질문이 정확히 같은 항목만 매칭한다.
+    실패하면 miss 로 취급해 호출 경로가 정상 생성으로 넘어가게 한다.
+    """
+    if not ENABLED:
+        return None
+    path = db_path or str(ARCHIVE_DB_PATH)
+    threshold = SIMILARITY_THRESHOLD if threshold is None else threshold
+    _stats["lookups"] += 1
+    try:
+        return await _lookup(kind, question, q_emb, scope, market, threshold, path)
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+        _stats["misses"] += 1
+        return None
+
+
+async def _lookup(
+    kind: str,
+    question: str,
+    q_emb: Optional[bytes],
+    scope: str,
+    market: Optional[str],
+    threshold: float,
+    path: str,
+) -> Optional[SemanticHit]:
+    normalized = normalize_question(question)
+    await init_db(path)
+    async with aiosqlite.connect(path) as db:
+        db.row_factory = aiosqlite.Row
+        cur = await db.execute(
+            """
+            SELECT id, question, normalized, embedding, payload, tickers,
+                   latency_ms, created_at
+            FROM semantic_answer_cache
+            WHERE kind = ? AND scope_key = ? AND expires_at > ?
+            ORDER BY id DESC LIMIT ?
+            """,
+            (kind, scope, _now(), _MAX_CANDIDATES),
+        )
+        rows = await cur.fetchall()
+        if not rows:
+            _stats["misses"] += 1
+            return None
+
+        scores = np.zeros(len(rows), dtype=np.float32)
+        q_vec = decode_embedding(q_emb)
+        if q_vec is not None:
+            q_norm = float(np.linalg.norm(q_vec))
+            vecs = [decode_embedding(r["embedding"]) for r in rows]
+            idx = [i for i, v in enumerate(vecs) if v is not None]
+            if idx and q_norm > 0:
+                mat = np.stack([vecs[i] for i in idx])
+                norms = np.linalg.norm(mat, axis=1)
+                norms[norms == 0] = np.inf
+                scores[idx] = mat @ q_vec / (norms * q_norm)
+        for i, r in enumerate(rows):
+            if r["normalized"] == normalized:
+                scores[i] = 1.0
+
+        for i in np.argsort(-scores, kind="stable"):
+            similarity = float(scores[i])
+            if similarity < threshold:
+                break
+            r = rows[int(i)]
+            tickers = json.loads(r["tickers"] or "[]")
+            if await _is_stale(db, tickers, market, r["created_at"]):
+                _stats["stale"] += 1
+                await db.execute(
+                    "UPDATE semantic_answer_cache SET expires_at = ? WHERE id = ?",
+                    (r["created_at"], r["id"]),
+                )
+                await db.commit()
+                continue
+            try:
+                payload = json.loads(r["payload"])
+            except json.JSONDecodeError:
+                continue
+            await db.execute(
+                "UPDATE semantic_answer_cache SET hit_count = hit_count + 1, last_hit_at = ? "
+                "WHERE id = ?",
+                (_now(), r["id"]),
+            )
+            await db.commit()
+            _stats["hits"] += 1
+            _stats["saved_latency_ms"] += r["latency_ms"] or 0.0
+            logger.info(
+                f"Semantic cache hit ({kind}, sim={similarity:.3f}): "
+                f"'{question[:40]}' ≈ '{r['question'][:40]}'"
+            )
+            return SemanticHit(
+                entry_id=r["id"],
+                payload=payload,
+                cached_question=r["question"],
+                similarity=similarity,
+                created_at=r["created_at"],
+                saved_latency_ms=r["latency_ms"],
+                tickers=tickers,
+            )
+
+    _stats["misses"] += 1
+    return None
+
+
+async def store(
+    kind: str,
+    question: str,
+    q_emb: Optional[bytes],
+    scope: str,
+    payload: Dict[str, Any],
+    market: Optional[str] = None,
+    tickers: Optional[Sequence[str]] = None,
+    model_used: Optional[str] = None,
+    latency_ms: Optional[float] = None,
+    ttl_hours: Optional[float] = None,
+    db_path: Optional[str] = None,
+) -> Optional[int]:
+    """답변을 캐시에 저장한다. 실패해도 호출 경로를 막지 않는다."""
+    if not ENABLED:
+        return None
+    path = db_path or str(ARCHIVE_DB_PATH)
+    ttl = DEFAULT_TTL_HOURS if ttl_hours is None else ttl_hours
+    expires_at = (datetime.now() + timedelta(hours=ttl)).strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        await init_db(path)
+        async with aiosqlite.connect(path) as db:
+            cur = await db.execute(
+                """
+                INSERT INTO semantic_answer_cache
+                    (kind, scope_key, market, question, normalized, embedding,
+                     payload, tickers, model_used, latency_ms, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    kind, scope, market, question, normalize_question(question), q_emb,
+                    json.dumps(payload, ensure_ascii=False),
+                    json.dumps(sorted(set(tickers or [])), ensure_ascii=False),
+                    model_used, latency_ms, _now(), expires_at,
+                ),
+            )
+            await db.commit()
+            return cur.lastrowid
+    except Exception as e:
+        logger.warning(f"Semantic cache store failed: {e}")
+        return None
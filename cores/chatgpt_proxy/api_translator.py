@@ -1,6 +1,7 @@
 """Chat Completions <-> Responses API bidirectional translator.
 
-Pure functions with no I/O or state. Fully unit-testable.
+No I/O: pure functions plus small incremental stream parsers. Fully
+unit-testable.
 """
 
 import json
@@ -294,82 +295,264 @@ def translate_error(error_body: dict, status_code: int) -> tuple[dict, int]:
     }, status_code
 
 
-def collect_sse_to_response(sse_text: str) -> dict:
-    """Parse SSE stream text and extract the final Responses API object.
+class SSEParser:
+    """Incremental Server-Sent Events parser.
+
+    Feed decoded text as it arrives (chunks may split lines or events);
+    complete ``(event, data)`` pairs are returned as soon as they are
+    terminated by a blank line or the next ``event:`` line.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._event = ""
+        self._data_lines: list[str] = []
+
+    def _dispatch(self) -> list[tuple[str, str]]:
+        out = []
+        if self._data_lines and self._event:
+            out.append((self._event, "\n".join(self._data_lines)))
+        self._data_lines = []
+        return out
+
+    def _line(self, line: str) -> list[tuple[str, str]]:
+        line = line.rstrip("\r")
+        if line.startswith("event: "):
+            out = self._dispatch()
+            self._event = line[7:].strip()
+            return out
+        if line.startswith("data: "):
+            self._data_lines.append(line[6:])
+        elif line == "":
+            return self._dispatch()
+        return []
+
+    def feed(self, text: str) -> list[tuple[str, str]]:
+        """Consume a chunk of stream text and return the events it completed."""
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        events: list[tuple[str, str]] = []
+        for line in lines:
+            events.extend(self._line(line))
+        return events
+
+    def flush(self) -> list[tuple[str, str]]:
+        """Return any event left unterminated at end of stream."""
+        events = self._line(self._buffer) if self._buffer else []
+        self._buffer = ""
+        return events + self._dispatch()
+
+
+class SSEResponseCollector:
+    """Assemble the final Responses API object from stream events.
 
     The ChatGPT Codex SSE stream sends output items via separate events
     (response.output_item.done) and the final response.completed event may
     arrive with an empty output array. We collect output items from the
     .done events and merge them into the final response.
     """
-    lines = sse_text.split("\n")
-    current_event = ""
-    data_lines: list[str] = []
-    completed_data: dict | None = None
-    failed_data: dict | None = None
-    output_items: list[dict] = []
-    text_chunks: list[str] = []
-
-    def _process(event: str, raw: str) -> None:
-        nonlocal completed_data, failed_data
+
+    def __init__(self):
+        self._completed: dict | None = None
+        self._failed: dict | None = None
+        self._output_items: list[dict] = []
+        self._text_chunks: list[str] = []
+
+    def add(self, event: str, raw: str) -> None:
         try:
             parsed = json.loads(raw)
         except json.JSONDecodeError:
             return
         if event == "response.completed":
-            completed_data = parsed
+            self._completed = parsed
         elif event == "response.failed":
-            failed_data = parsed
+            self._failed = parsed
         elif event == "response.output_text.delta":
             delta = parsed.get("delta", "")
             if delta:
-                text_chunks.append(delta)
+                self._text_chunks.append(delta)
         elif event == "response.output_item.done":
             item = parsed.get("item")
             if isinstance(item, dict):
-                output_items.append(item)
+                self._output_items.append(item)
 
-    for line in lines:
-        if line.startswith("event: "):
-            if data_lines and current_event:
-                _process(current_event, "\n".join(data_lines))
-            current_event = line[7:].strip()
-            data_lines = []
-        elif line.startswith("data: "):
-            data_lines.append(line[6:])
-        elif line == "" and data_lines and current_event:
-            _process(current_event, "\n".join(data_lines))
-            data_lines = []
-
-    # Process any remaining data
-    if data_lines and current_event:
-        _process(current_event, "\n".join(data_lines))
-
-    def _ensure_output(response_obj: dict) -> dict:
+    def _ensure_output(self, response_obj: dict) -> dict:
         """Fill in output array from collected items/deltas if completed event lacks it."""
         if response_obj.get("output"):
             return response_obj
-        if output_items:
-            response_obj["output"] = output_items
-        elif text_chunks:
+        if self._output_items:
+            response_obj["output"] = self._output_items
+        elif self._text_chunks:
             response_obj["output"] = [
                 {
                     "type": "message",
                     "role": "assistant",
-                    "content": [{"type": "output_text", "text": "".join(text_chunks)}],
+                    "content": [{"type": "output_text", "text": "".join(self._text_chunks)}],
                 }
             ]
         return response_obj
 
-    if completed_data:
-        return _ensure_output(completed_data.get("response", completed_data))
+    def result(self) -> dict:
+        """Final Responses API object; raises ValueError if the stream had none."""
+        if self._completed:
+            return self._ensure_output(self._completed.get("response", self._completed))
+
+        if self._failed:
+            return self._failed.get("response", self._failed)
+
+        # No completed event — synthesize from collected items/deltas
+        if self._output_items or self._text_chunks:
+            synthesized: dict = {"id": "resp_reconstructed", "usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}}
+            return self._ensure_output(synthesized)
+
+        raise ValueError("No response.completed or response.failed event found in SSE stream")
 
-    if failed_data:
-        return failed_data.get("response", failed_data)
 
-    # No completed event — synthesize from collected items/deltas
-    if output_items or text_chunks:
-        synthesized: dict = {"id": "resp_reconstructed", "usage": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}}
-        return _ensure_output(synthesized)
+def collect_sse_to_response(sse_text: str) -> dict:
+    """Parse SSE stream text and extract the final Responses API object.
+
+    See ``SSEResponseCollector`` for how output items are merged.
+    """
+    parser = SSEParser()
+    collector = SSEResponseCollector()
+    for event, raw in parser.feed(sse_text) + parser.flush():
+        collector.add(event, raw)
+    return collector.result()
 
-    raise ValueError("No response.completed or response.failed event found in SSE stream")
+
+class ChatCompletionStreamTranslator:
+    """Translate Responses API stream events to Chat Completions chunks.
+
+    Text and function-call argument deltas are forwarded as they arrive.
+    Anything the upstream only reports in ``output_item.done`` or
+    ``response.completed`` (no deltas) is emitted from there, so the chunks
+    always add up to what ``translate_response`` would return.
+    """
+
+    def __init__(self, model: str, include_usage: bool = False):
+        self.model = model
+        self.include_usage = include_usage
+        self.done = False
+        self._id = "chatcmpl-resp_unknown"
+        self._created = int(time.time())
+        self._role_sent = False
+        self._text_sent = False
+        # upstream item id / call_id -> [chunk tool index, arguments streamed?]
+        self._tools: dict[str, list] = {}
+
+    def _chunk(self, delta: dict, finish_reason: str | None = None) -> dict:
+        if not self._role_sent:
+            delta = {"role": "assistant", **delta}
+            self._role_sent = True
+        return {
+            "id": self._id,
+            "object": "chat.completion.chunk",
+            "created": self._created,
+            "model": self.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+    def _tool_key(self, item: dict) -> str:
+        return item.get("id") or item.get("call_id") or item.get("item_id") or ""
+
+    def _announce_tool(self, item: dict, arguments: str = "") -> dict:
+        index = len(self._tools)
+        self._tools[self._tool_key(item)] = [index, bool(arguments)]
+        return self._chunk({"tool_calls": [{
+            "index": index,
+            "id": item.get("call_id", ""),
+            "type": "function",
+            "function": {"name": item.get("name", ""), "arguments": arguments},
+        }]})
+
+    def _item_done(self, item: dict) -> list[dict]:
+        if item.get("type") == "function_call":
+            state = self._tools.get(self._tool_key(item))
+            if state is None:
+                return [self._announce_tool(item, item.get("arguments", "{}"))]
+            if not state[1]:
+                state[1] = True
+                return [self._chunk({"tool_calls": [{
+                    "index": state[0], "function": {"arguments": item.get("arguments", "{}")},
+                }]})]
+        elif item.get("type") == "message" and not self._text_sent:
+            text = "\n".join(
+                c.get("text", "") for c in item.get("content", []) if c.get("type") == "output_text"
+            )
+            if text:
+                self._text_sent = True
+                return [self._chunk({"content": text})]
+        return []
+
+    def finish(self, usage: dict | None = None) -> list[dict]:
+        """Closing chunk(s); idempotent."""
+        if self.done:
+            return []
+        self.done = True
+        chunks = [self._chunk({}, "tool_calls" if self._tools else "stop")]
+        if self.include_usage:
+            usage = usage or {}
+            chunks.append({
+                "id": self._id,
+                "object": "chat.completion.chunk",
+                "created": self._created,
+                "model": self.model,
+                "choices": [],
+                "usage": {
+                    "prompt_tokens": usage.get("input_tokens", 0),
+                    "completion_tokens": usage.get("output_tokens", 0),
+                    "total_tokens": usage.get("total_tokens", 0),
+                },
+            })
+        return chunks
+
+    def feed(self, event: str, raw: str) -> list[dict]:
+        """Translate one upstream event into zero or more chunk dicts.
+
+        A ``response.failed``/``error`` event yields a single Chat
+        Completions error payload and ends the stream.
+        """
+        if self.done:
+            return []
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return []
+
+        if event == "response.created":
+            response = data.get("response", data)
+            if response.get("id"):
+                self._id = f"chatcmpl-{response['id']}"
+        elif event == "response.output_text.delta":
+            delta = data.get("delta", "")
+            if delta:
+                self._text_sent = True
+                return [self._chunk({"content": delta})]
+        elif event == "response.output_item.added":
+            item = data.get("item") or {}
+            if item.get("type") == "function_call":
+                return [self._announce_tool(item)]
+        elif event == "response.function_call_arguments.delta":
+            state = self._tools.get(data.get("item_id", ""))
+            delta = data.get("delta", "")
+            if state is not None and delta:
+                state[1] = True
+                return [self._chunk({"tool_calls": [{"index": state[0], "function": {"arguments": delta}}]})]
+        elif event == "response.output_item.done":
+            item = data.get("item")
+            if isinstance(item, dict):
+                return self._item_done(item)
+        elif event == "response.completed":
+            response = data.get("response", data)
+            chunks = []
+            for item in response.get("output") or []:
+                if item.get("type") == "function_call" and self._tool_key(item) in self._tools:
+                    continue
+                chunks.extend(self._item_done(item))
+            return chunks + self.finish(response.get("usage"))
+        elif event in ("response.failed", "error"):
+            self.done = True
+            response = data.get("response", data)
+            error, status = translate_error(response if "error" in response else {"error": response}, 502)
+            return [error]
+        return []
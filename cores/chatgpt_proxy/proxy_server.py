@@ -2,10 +2,18 @@
 
 Lightweight aiohttp web server that translates Chat Completions API
 requests to ChatGPT Responses API format and back.
+
+Upstream calls share one pooled ``aiohttp.ClientSession``. Requests with
+``"stream": true`` are relayed to the client as upstream events arrive
+(Chat Completions chunks, or the raw Responses event stream); other requests
+get a single JSON body.
 """
 
+import asyncio
+import codecs
 import json
 import logging
+from typing import AsyncIterator
 
 import aiohttp
 from aiohttp import web
@@ -17,6 +25,11 @@ from .token_manager import TokenManager
 logger = logging.getLogger(__name__)
 
 _token_manager: TokenManager | None = None
+_upstream_session: aiohttp.ClientSession | None = None
+
+# Upstream connection pool
+UPSTREAM_POOL_SIZE = 32
+UPSTREAM_KEEPALIVE_SECONDS = 120
 
 
 def create_app(token_manager: TokenManager) -> web.Application:
@@ -28,6 +41,7 @@ def create_app(token_manager: TokenManager) -> web.Application:
     app.router.add_post("/v1/chat/completions", handle_chat_completions)
     app.router.add_post("/v1/responses", handle_responses)
     app.router.add_get("/health", handle_health)
+    app.on_cleanup.append(close_upstream_session)
     return app
 
 
@@ -44,15 +58,37 @@ async def handle_health(request: web.Request) -> web.Response:
     return web.json_response({"status": "ok", "token_valid": token_valid})
 
 
-async def _forward_to_codex(
+async def _get_upstream_session() -> aiohttp.ClientSession:
+    """Long-lived pooled session to the Codex upstream (keeps TLS connections warm)."""
+    global _upstream_session
+    if _upstream_session is None or _upstream_session.closed:
+        _upstream_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=UPSTREAM_POOL_SIZE,
+                keepalive_timeout=UPSTREAM_KEEPALIVE_SECONDS,
+            ),
+        )
+    return _upstream_session
+
+
+async def close_upstream_session(app: web.Application | None = None) -> None:
+    """Close the pooled upstream session (registered as an app cleanup hook)."""
+    global _upstream_session
+    if _upstream_session is not None and not _upstream_session.closed:
+        await _upstream_session.close()
+    _upstream_session = None
+
+
+async def _open_upstream(
     translated_request: dict,
-) -> "tuple[dict | None, web.Response | None]":
-    """Forward a pre-translated Responses API request to the Codex upstream.
+) -> "tuple[aiohttp.ClientResponse | None, web.Response | None]":
+    """POST a Responses API request upstream and return the open response.
 
-    Handles token retrieval, HTTP POST, SSE/JSON parsing, and error translation.
+    Handles token retrieval, the HTTP POST and error translation. The body
+    is not read on success; the caller streams it and must ``release()`` it.
 
     Returns:
-        (api_response, None)  on success — api_response is a Responses API dict.
+        (response, None)      on HTTP 200.
         (None, error_response) on any failure — error_response is a web.Response.
     """
     if not _token_manager:
@@ -82,62 +118,200 @@ async def _forward_to_codex(
         headers["chatgpt-account-id"] = account_id
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                CHATGPT_RESPONSES_URL,
-                json=translated_request,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=300),
-            ) as resp:
+        session = await _get_upstream_session()
+        resp = await session.post(
+            CHATGPT_RESPONSES_URL,
+            json=translated_request,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=300),
+        )
+        if resp.status != 200:
+            try:
                 raw_body = await resp.text()
-
-                if resp.status != 200:
-                    try:
-                        error_body = json.loads(raw_body)
-                    except json.JSONDecodeError:
-                        error_body = {"error": {"message": raw_body}}
-
-                    translated_error, status = api_translator.translate_error(error_body, resp.status)
-                    logger.warning("ChatGPT API error (%d): %s", resp.status, raw_body[:200])
-                    return None, web.json_response(translated_error, status=status)
-
-                # Parse response (may be SSE or JSON)
-                # Always request stream=true, so check both Content-Type and body format
-                content_type = resp.headers.get("Content-Type", "")
-                is_sse = "text/event-stream" in content_type or raw_body.lstrip().startswith("event:")
-                if is_sse:
-                    try:
-                        api_response = api_translator.collect_sse_to_response(raw_body)
-                        logger.debug("SSE parsed: output_items=%s status=%s",
-                                     [i.get("type") for i in api_response.get("output", [])],
-                                     api_response.get("status"))
-                    except ValueError as e:
-                        logger.error("SSE parsing failed: %s (Content-Type: %s, body[:200]: %s)", e, content_type, raw_body[:200])
-                        return None, web.json_response(
-                            {"error": {"message": f"SSE parsing error: {e}", "type": "server_error"}},
-                            status=502,
-                        )
-                else:
-                    try:
-                        api_response = json.loads(raw_body)
-                    except json.JSONDecodeError:
-                        logger.error("Invalid JSON response from ChatGPT (Content-Type: %s, body[:200]: %s)", content_type, raw_body[:200])
-                        return None, web.json_response(
-                            {"error": {"message": "Invalid response from upstream", "type": "server_error"}},
-                            status=502,
-                        )
-
-    except aiohttp.ClientError as e:
+            finally:
+                resp.release()
+            try:
+                error_body = json.loads(raw_body)
+            except json.JSONDecodeError:
+                error_body = {"error": {"message": raw_body}}
+
+            translated_error, status = api_translator.translate_error(error_body, resp.status)
+            logger.warning("ChatGPT API error (%d): %s", resp.status, raw_body[:200])
+            return None, web.json_response(translated_error, status=status)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error("Connection to ChatGPT failed: %s", e)
         return None, web.json_response(
             {"error": {"message": f"Upstream connection error: {e}", "type": "server_error"}},
             status=502,
         )
 
-    return api_response, None
+    return resp, None
+
+
+def _is_event_stream(resp: aiohttp.ClientResponse) -> bool:
+    return "text/event-stream" in resp.headers.get("Content-Type", "")
+
+
+async def _iter_sse_events(resp: aiohttp.ClientResponse) -> AsyncIterator[tuple[str, str]]:
+    """Yield ``(event, data)`` pairs from an upstream SSE body as chunks arrive."""
+    parser = api_translator.SSEParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in resp.content.iter_any():
+        for event in parser.feed(decoder.decode(chunk)):
+            yield event
+    for event in parser.feed(decoder.decode(b"", final=True)) + parser.flush():
+        yield event
+
+
+async def _read_upstream_response(
+    resp: aiohttp.ClientResponse,
+) -> "tuple[dict | None, web.Response | None]":
+    """Read an upstream body (SSE or JSON) into a single Responses API dict."""
+    content_type = resp.headers.get("Content-Type", "")
+    try:
+        if _is_event_stream(resp):
+            collector = api_translator.SSEResponseCollector()
+            async for event, raw in _iter_sse_events(resp):
+                collector.add(event, raw)
+            try:
+                api_response = collector.result()
+            except ValueError as e:
+                logger.error("SSE parsing failed: %s (Content-Type: %s)", e, content_type)
+                return None, web.json_response(
+                    {"error": {"message": f"SSE parsing error: {e}", "type": "server_error"}},
+                    status=502,
+                )
+            logger.debug("SSE parsed: output_items=%s status=%s",
+                         [i.get("type") for i in api_response.get("output", [])],
+                         api_response.get("status"))
+            return api_response, None
+
+        raw_body = await resp.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Upstream stream from ChatGPT failed: %s", e)
+        return None, web.json_response(
+            {"error": {"message": f"Upstream connection error: {e}", "type": "server_error"}},
+            status=502,
+        )
+
+    # Some upstream responses are SSE without the event-stream Content-Type
+    if raw_body.lstrip().startswith("event:"):
+        try:
+            return api_translator.collect_sse_to_response(raw_body), None
+        except ValueError as e:
+            logger.error("SSE parsing failed: %s (Content-Type: %s, body[:200]: %s)", e, content_type, raw_body[:200])
+            return None, web.json_response(
+                {"error": {"message": f"SSE parsing error: {e}", "type": "server_error"}},
+                status=502,
+            )
+    try:
+        return json.loads(raw_body), None
+    except json.JSONDecodeError:
+        logger.error("Invalid JSON response from ChatGPT (Content-Type: %s, body[:200]: %s)", content_type, raw_body[:200])
+        return None, web.json_response(
+            {"error": {"message": "Invalid response from upstream", "type": "server_error"}},
+            status=502,
+        )
+
+
+async def _forward_to_codex(
+    translated_request: dict,
+) -> "tuple[dict | None, web.Response | None]":
+    """Forward a pre-translated Responses API request and wait for the full result.
+
+    Non-streaming mode: the upstream SSE stream is parsed incrementally and
+    assembled into one Responses API object.
+
+    Returns:
+        (api_response, None)  on success — api_response is a Responses API dict.
+        (None, error_response) on any failure — error_response is a web.Response.
+    """
+    resp, err = await _open_upstream(translated_request)
+    if err is not None:
+        return None, err
+    try:
+        return await _read_upstream_response(resp)
+    finally:
+        resp.release()
+
+
+async def _prepare_event_stream(request: web.Request) -> web.StreamResponse:
+    stream = web.StreamResponse(
+        status=200,
+        headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+    )
+    await stream.prepare(request)
+    return stream
+
 
+def _sse_data(payload: dict) -> bytes:
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8")
 
-async def handle_chat_completions(request: web.Request) -> web.Response:
+
+async def _stream_chat_completions(
+    request: web.Request,
+    translated_request: dict,
+    original_model: str,
+    include_usage: bool,
+) -> web.StreamResponse:
+    """Stream Chat Completions chunks to the client as upstream events arrive."""
+    resp, err = await _open_upstream(translated_request)
+    if err is not None:
+        return err
+
+    translator = api_translator.ChatCompletionStreamTranslator(original_model, include_usage)
+    stream = await _prepare_event_stream(request)
+    try:
+        if _is_event_stream(resp):
+            async for event, raw in _iter_sse_events(resp):
+                for chunk in translator.feed(event, raw):
+                    await stream.write(_sse_data(chunk))
+        else:
+            api_response, err = await _read_upstream_response(resp)
+            if api_response is not None:
+                for chunk in translator.feed("response.completed", json.dumps({"response": api_response})):
+                    await stream.write(_sse_data(chunk))
+            else:
+                await stream.write(_sse_data(json.loads(err.body)))
+                translator.done = True
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Upstream stream from ChatGPT failed: %s", e)
+        await stream.write(_sse_data(
+            {"error": {"message": f"Upstream connection error: {e}", "type": "server_error"}}
+        ))
+        translator.done = True
+    finally:
+        resp.release()
+
+    for chunk in translator.finish():
+        await stream.write(_sse_data(chunk))
+    await stream.write(b"data: [DONE]\n\n")
+    await stream.write_eof()
+    return stream
+
+
+async def _stream_responses(request: web.Request, translated_request: dict) -> web.StreamResponse:
+    """Relay the upstream Responses API event stream to the client byte-for-byte."""
+    resp, err = await _open_upstream(translated_request)
+    if err is not None:
+        return err
+
+    stream = await _prepare_event_stream(request)
+    try:
+        async for chunk in resp.content.iter_any():
+            await stream.write(chunk)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Upstream stream from ChatGPT failed: %s", e)
+        await stream.write(
+            b"event: error\n" + _sse_data({"type": "error", "message": f"Upstream connection error: {e}"})
+        )
+    finally:
+        resp.release()
+    await stream.write_eof()
+    return stream
+
+
+async def handle_chat_completions(request: web.Request) -> web.StreamResponse:
     """Translate and proxy a Chat Completions request to ChatGPT Responses API."""
     if not _token_manager:
         return web.json_response(
@@ -170,6 +344,10 @@ async def handle_chat_completions(request: web.Request) -> web.Response:
                  original_model, translated_request.get("model"),
                  len(body.get("tools") or []), len(body.get("messages") or []))
 
+    if body.get("stream"):
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        return await _stream_chat_completions(request, translated_request, original_model, include_usage)
+
     api_response, err = await _forward_to_codex(translated_request)
     if err is not None:
         return err
@@ -187,12 +365,13 @@ async def handle_chat_completions(request: web.Request) -> web.Response:
     return web.json_response(result)
 
 
-async def handle_responses(request: web.Request) -> web.Response:
+async def handle_responses(request: web.Request) -> web.StreamResponse:
     """Proxy a Responses API request directly to the ChatGPT Codex backend.
 
     The openai-agents Runner already emits a Responses-shaped body, so no
     format translation is needed.  The response is returned to the caller
-    as-is (no back-translation to Chat Completions format).
+    as-is (no back-translation to Chat Completions format): relayed as an
+    event stream when the caller asked for ``stream``, else as one JSON body.
     """
     try:
         body = await request.json()
@@ -208,6 +387,9 @@ async def handle_responses(request: web.Request) -> web.Response:
                  body.get("model"), translated.get("model"),
                  len(body.get("tools") or []))
 
+    if body.get("stream"):
+        return await _stream_responses(request, translated)
+
     api_response, err = await _forward_to_codex(translated)
     if err is not None:
         return err
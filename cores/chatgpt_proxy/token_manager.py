@@ -1,7 +1,8 @@
 """ChatGPT OAuth Token Manager.
 
 Handles token loading, caching, and automatic refresh.
-Thread/async-safe with asyncio.Lock.
+Async-safe: a valid cached token is returned without waiting, and an expired
+one is refreshed by a single in-flight task that concurrent callers share.
 """
 
 import asyncio
@@ -78,6 +79,7 @@ class TokenManager:
     def __init__(self):
         self._lock = asyncio.Lock()
         self._auth_data: dict | None = None
+        self._refresh_task: asyncio.Task | None = None
 
     def _load_from_disk(self) -> dict:
         """Load auth data from disk."""
@@ -149,23 +151,38 @@ class TokenManager:
         logger.info("ChatGPT OAuth token refreshed (expires %s)", time.ctime(auth_data["expires_at"]))
         return auth_data
 
+    async def _ensure_loaded(self) -> dict:
+        if self._auth_data is None:
+            async with self._lock:
+                if self._auth_data is None:
+                    self._auth_data = self._load_from_disk()
+        return self._auth_data
+
+    async def _run_refresh(self, auth_data: dict) -> dict:
+        try:
+            self._auth_data = await self._refresh_token(auth_data)
+            return self._auth_data
+        finally:
+            self._refresh_task = None
+
     async def get_token(self) -> str:
         """Get a valid access token, refreshing if necessary.
 
+        Concurrent callers that find the token expired await the same
+        refresh; a caller being cancelled does not cancel the refresh.
+
         Returns the access_token string.
         """
-        async with self._lock:
-            if self._auth_data is None:
-                self._auth_data = self._load_from_disk()
-
-            if self._is_expired(self._auth_data):
-                self._auth_data = await self._refresh_token(self._auth_data)
+        auth_data = await self._ensure_loaded()
+        if not self._is_expired(auth_data):
+            return auth_data["access_token"]
 
-            return self._auth_data["access_token"]
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._run_refresh(auth_data))
+        auth_data = await asyncio.shield(self._refresh_task)
+        return auth_data["access_token"]
 
     async def get_account_id(self) -> str:
         """Get the account ID."""
-        async with self._lock:
-            if self._auth_data is None:
-                self._auth_data = self._load_from_disk()
-            return self._auth_data.get("account_id", "")
+        auth_data = await self._ensure_loaded()
+        return auth_data.get("account_id", "")
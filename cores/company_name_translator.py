@@ -2,20 +2,28 @@
 Company Name Translator Utility
 
 Translates Korean company names to English for filename generation.
-Supports caching to avoid duplicate API calls.
+Supports caching to avoid duplicate API calls: in memory per process, and in
+the persistent translation memory across runs.
 """
 
+import asyncio
 import logging
 import re
 from typing import Any, Dict
 
 from cores.openai_error_logging import log_openai_error
+from cores.translation_service import TranslationMemory
 
 logger = logging.getLogger(__name__)
 
 # In-memory cache: {korean_name: english_name}
 _translation_cache: Dict[str, str] = {}
 
+# Translation memory key for this prompt (bump when the prompt/model changes)
+_MEMORY_MODEL_KEY = "company_name:gpt-5.4-mini"
+
+_memory = TranslationMemory()
+
 
 def _romanize_korean_name(korean_name: str) -> str:
     """
@@ -82,6 +90,15 @@ async def translate_company_name(korean_name: str) -> str:
         logger.debug(f"Cache hit for company name: {korean_name}")
         return _translation_cache[korean_name]
 
+    try:
+        remembered = await asyncio.to_thread(_memory.get, korean_name, "ko", "en", _MEMORY_MODEL_KEY)
+    except Exception as e:
+        logger.debug(f"Translation memory unavailable: {e}")
+        remembered = None
+    if remembered:
+        _translation_cache[korean_name] = remembered
+        return remembered
+
     try:
         from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
         from mcp_agent.workflows.llm.augmented_llm import RequestParams
@@ -139,14 +156,22 @@ Return ONLY the English company name, nothing else. No quotes, no explanation.
         # Use ascii_only=True to ensure English-only filename (no Korean characters)
         english_name = english_name.strip().strip('"\'')
         sanitized_name = _sanitize_for_filename(english_name, ascii_only=True)
+        translated = bool(sanitized_name)
 
         # Fallback: extract ASCII parts from original name
-        if not sanitized_name:
+        if not translated:
             sanitized_name = _romanize_korean_name(korean_name)
             logger.warning(f"Translation returned empty for '{korean_name}', fallback: {sanitized_name}")
 
         # Cache the result
         _translation_cache[korean_name] = sanitized_name
+        if translated:
+            try:
+                await asyncio.to_thread(
+                    _memory.put, korean_name, "ko", "en", _MEMORY_MODEL_KEY, sanitized_name
+                )
+            except Exception as e:
+                logger.debug(f"Translation memory write failed: {e}")
         logger.info(f"Translated company name: {korean_name} → {sanitized_name}")
 
         return sanitized_name
@@ -9,15 +9,83 @@ Architecture:
 - MCP fallback: if import fails, agents use MCP tool calls as before (no prefetch)
 
 This mirrors the US module's pattern (us_data_client.py direct import).
+
+Shared artifacts:
+- Index series, their rendered markdown, the sector map and the computed regime
+  depend only on the date range, not on the ticker. They are built once per
+  process (single-flight) and reused by every ticker of a batch.
+- Per-ticker artifacts (OHLCV, investor flows) are fetched concurrently.
 """
 
+import copy
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 
+from cores.prompt_table_encoder import encode_time_series, render_for_prompt, table_format
+
 logger = logging.getLogger(__name__)
 
+# Date-keyed shared artifacts. Keys always carry their date range, so a new
+# reference date simply misses; the bound keeps long-lived processes small.
+_SHARED_CACHE_SIZE = 64
+_shared_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_shared_lock = threading.Lock()
+_shared_key_locks: dict = {}
+_shared_stats = {"hits": 0, "builds": 0}
+
+# Per-ticker fetches run concurrently on this many threads
+KR_PREFETCH_WORKERS = 4
+
+
+def _shared(key: tuple, build):
+    """Return the cached artifact for ``key``, building it at most once at a time.
+
+    Concurrent callers for the same key wait for the first build. Empty results
+    (failed fetches) are not cached so the next caller retries.
+    """
+    with _shared_lock:
+        if key in _shared_cache:
+            _shared_cache.move_to_end(key)
+            _shared_stats["hits"] += 1
+            return _shared_cache[key]
+        key_lock = _shared_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _shared_lock:
+            if key in _shared_cache:
+                _shared_cache.move_to_end(key)
+                _shared_stats["hits"] += 1
+                return _shared_cache[key]
+        value = build()
+        with _shared_lock:
+            _shared_stats["builds"] += 1
+            if value:
+                _shared_cache[key] = value
+                while len(_shared_cache) > _SHARED_CACHE_SIZE:
+                    _shared_cache.popitem(last=False)
+            _shared_key_locks.pop(key, None)
+        return value
+
+
+def get_shared_cache_stats() -> dict:
+    """Shared artifact cache counters (hits, builds, size)."""
+    with _shared_lock:
+        return {**_shared_stats, "size": len(_shared_cache)}
+
+
+def clear_shared_cache() -> None:
+    """Drop all shared artifacts (e.g. between test runs or trading days)."""
+    with _shared_lock:
+        _shared_cache.clear()
+        for k in _shared_stats:
+            _shared_stats[k] = 0
+
 
 def _dict_to_markdown(data: dict, title: str = "") -> str:
     """Convert MCP server's dict response to markdown table string.
@@ -54,6 +122,25 @@ def _dict_to_markdown(data: dict, title: str = "") -> str:
     return result
 
 
+def _render_prefetched(data: dict, title: str) -> str:
+    """Render a date-keyed server dict for an agent prompt.
+
+    Uses the compact encoding unless PRISM_PROMPT_TABLE_FORMAT=markdown,
+    logging the token cost of both (see cores/prompt_table_encoder.py).
+    """
+    if not data or "error" in data:
+        return ""
+
+    def _compact():
+        metadata = data.get("__meta__") or {}
+        rows = {key: value for key, value in data.items() if key != "__meta__"}
+        return encode_time_series(
+            pd.DataFrame.from_dict(rows, orient='index'), title, note=metadata.get("note"),
+        )
+
+    return render_for_prompt(title, lambda: _dict_to_markdown(data, title), _compact)
+
+
 def _get_mcp_server_module():
     """Import kospi_kosdaq_stock_server module for direct library calls.
 
@@ -86,7 +173,7 @@ def prefetch_stock_ohlcv(company_code: str, start_date: str, end_date: str) -> s
 
         data = server.get_stock_ohlcv(start_date, end_date, company_code)
 
-        return _dict_to_markdown(data, f"Stock OHLCV: {company_code} ({start_date}~{end_date})")
+        return _render_prefetched(data, f"Stock OHLCV: {company_code} ({start_date}~{end_date})")
     except Exception as e:
         logger.error(f"Error prefetching OHLCV for {company_code}: {e}")
         return ""
@@ -110,15 +197,29 @@ def prefetch_stock_trading_volume(company_code: str, start_date: str, end_date:
 
         data = server.get_stock_trading_volume(start_date, end_date, company_code)
 
-        return _dict_to_markdown(data, f"Investor Trading Volume: {company_code} ({start_date}~{end_date})")
+        return _render_prefetched(data, f"Investor Trading Volume: {company_code} ({start_date}~{end_date})")
     except Exception as e:
         logger.error(f"Error prefetching trading volume for {company_code}: {e}")
         return ""
 
 
+def _index_ohlcv_raw(server, index_ticker: str, start_date: str, end_date: str) -> dict:
+    """Date-keyed index OHLCV dict, shared across tickers for the same range."""
+    def _fetch():
+        data = server.get_index_ohlcv(start_date, end_date, index_ticker)
+        if not data or (isinstance(data, dict) and "error" in data):
+            logger.warning(f"No index OHLCV for {index_ticker} ({start_date}~{end_date})")
+            return {}
+        return data
+
+    return _shared(("index_raw", index_ticker, start_date, end_date), _fetch)
+
+
 def prefetch_index_ohlcv(index_ticker: str, start_date: str, end_date: str) -> str:
     """Prefetch market index OHLCV data via kospi_kosdaq MCP server library.
 
+    The raw series and its rendered text are cached per date range (shared artifact).
+
     Args:
         index_ticker: Index ticker ("1001" for KOSPI, "2001" for KOSDAQ)
         start_date: Start date (YYYYMMDD)
@@ -134,9 +235,13 @@ def prefetch_index_ohlcv(index_ticker: str, start_date: str, end_date: str) -> s
 
         index_name = "KOSPI" if index_ticker == "1001" else "KOSDAQ" if index_ticker == "2001" else index_ticker
 
-        data = server.get_index_ohlcv(start_date, end_date, index_ticker)
-
-        return _dict_to_markdown(data, f"{index_name} Index ({start_date}~{end_date})")
+        return _shared(
+            ("index_md", index_ticker, start_date, end_date, table_format()),
+            lambda: _render_prefetched(
+                _index_ohlcv_raw(server, index_ticker, start_date, end_date),
+                f"{index_name} Index ({start_date}~{end_date})",
+            ),
+        )
     except Exception as e:
         logger.error(f"Error prefetching index OHLCV for {index_ticker}: {e}")
         return ""
@@ -217,7 +322,7 @@ def prefetch_macro_intelligence_data(reference_date: str) -> dict:
         result["kosdaq_ohlcv_md"] = kosdaq_md
 
     # 3. Sector map (ticker → sector name) via get_sector_info
-    try:
+    def _fetch_sector_map():
         import json as _json
         # Fetch KOSPI + KOSDAQ sector classifications
         kospi_sectors = server.get_sector_info("KOSPI")
@@ -228,20 +333,34 @@ def prefetch_macro_intelligence_data(reference_date: str) -> dict:
             if isinstance(parsed, dict) and "error" not in parsed:
                 sector_data.update(parsed)
         if sector_data:
-            result["sector_map"] = sector_data
             logger.info(f"Prefetched sector_map: {len(sector_data)} tickers")
         else:
             logger.warning("Sector map not available from get_sector_info")
+        return sector_data
+
+    try:
+        sector_data = _shared(("sector_map", reference_date), _fetch_sector_map)
+        if sector_data:
+            result["sector_map"] = sector_data
     except Exception as e:
         logger.error(f"Error fetching sector map: {e}")
 
-    # 4. Compute regime from raw KOSPI data
+    # 4. Compute regime from raw KOSPI data (once per reference date and override mode)
+    def _build_regime():
+        kospi_raw = _index_ohlcv_raw(server, "1001", regime_start_date, reference_date)
+        kosdaq_raw = _index_ohlcv_raw(server, "2001", regime_start_date, reference_date)
+        if not kospi_raw:
+            return {}
+        computed = _compute_kr_regime(kospi_raw, kosdaq_raw)
+        _log_regime_snapshot("KR", computed)
+        return computed
+
     try:
-        kospi_raw = server.get_index_ohlcv(regime_start_date, reference_date, "1001")
-        kosdaq_raw = server.get_index_ohlcv(regime_start_date, reference_date, "2001")
-        if kospi_raw:
-            result["computed_regime"] = _compute_kr_regime(kospi_raw, kosdaq_raw)
-            _log_regime_snapshot("KR", result["computed_regime"])
+        mode = os.environ.get("REGIME_HIVOL_OVERRIDE", "active").strip().lower()
+        computed = _shared(("kr_regime", regime_start_date, reference_date, mode), _build_regime)
+        if computed:
+            # Callers may annotate the dict; keep the cached copy pristine
+            result["computed_regime"] = copy.deepcopy(computed)
     except Exception as e:
         logger.error(f"Error computing regime: {e}")
 
@@ -599,28 +718,26 @@ def prefetch_kr_analysis_data(company_code: str, reference_date: str, max_years_
         - "kospi_index": KOSPI index data as markdown
         - "kosdaq_index": KOSDAQ index data as markdown
         Returns empty dict on total failure.
+
+    The index sections are shared artifacts: after the first ticker of a batch
+    they come from the per-process cache. All four fetches run concurrently.
     """
-    result = {}
+    fetches = {
+        # Per-ticker artifacts
+        "stock_ohlcv": (prefetch_stock_ohlcv, company_code),
+        "trading_volume": (prefetch_stock_trading_volume, company_code),
+        # Shared per-date artifacts
+        "kospi_index": (prefetch_index_ohlcv, "1001"),
+        "kosdaq_index": (prefetch_index_ohlcv, "2001"),
+    }
 
-    # 1. Stock OHLCV data
-    stock_ohlcv = prefetch_stock_ohlcv(company_code, max_years_ago, reference_date)
-    if stock_ohlcv:
-        result["stock_ohlcv"] = stock_ohlcv
-
-    # 2. Investor trading volume data
-    trading_volume = prefetch_stock_trading_volume(company_code, max_years_ago, reference_date)
-    if trading_volume:
-        result["trading_volume"] = trading_volume
-
-    # 3. KOSPI index data
-    kospi_index = prefetch_index_ohlcv("1001", max_years_ago, reference_date)
-    if kospi_index:
-        result["kospi_index"] = kospi_index
-
-    # 4. KOSDAQ index data
-    kosdaq_index = prefetch_index_ohlcv("2001", max_years_ago, reference_date)
-    if kosdaq_index:
-        result["kosdaq_index"] = kosdaq_index
+    with ThreadPoolExecutor(max_workers=KR_PREFETCH_WORKERS) as executor:
+        futures = {
+            key: executor.submit(fn, code, max_years_ago, reference_date)
+            for key, (fn, code) in fetches.items()
+        }
+        result = {key: futures[key].result() for key in fetches}
+    result = {key: value for key, value in result.items() if value}
 
     if result:
         logger.info(f"Prefetched KR data for {company_code}: {list(result.keys())}")
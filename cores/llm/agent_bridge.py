@@ -117,7 +117,7 @@ def get_llm_backend(registry: "McpServerRegistry") -> LLMBackend:
     """Return the active LLMBackend based on the LLM_BACKEND environment variable.
 
     Supported values:
-    - ``"openai_agents"`` → OpenAIAgentsBackend(registry)
+    - ``"openai_agents"`` → OpenAIAgentsBackend(registry), wrapped for telemetry
     - anything else       → NotImplementedError (mcp_agent stays inline in callers)
 
     Args:
@@ -132,8 +132,9 @@ def get_llm_backend(registry: "McpServerRegistry") -> LLMBackend:
     backend_name = os.environ.get("LLM_BACKEND", "mcp_agent")
     if backend_name == "openai_agents":
         from cores.llm.backends.openai_agents_backend import OpenAIAgentsBackend
+        from cores.llm.telemetry import instrument
 
-        return OpenAIAgentsBackend(registry)
+        return instrument(OpenAIAgentsBackend(registry))
     raise NotImplementedError(
         f"get_llm_backend: LLM_BACKEND={backend_name!r} is not handled here. "
         "The mcp_agent default path remains inline in the calling module."
@@ -9,14 +9,16 @@ A clear RuntimeError is raised at *call time* rather than at import time.
 """
 
 import contextlib
+import time
 from typing import Any, Optional
 
+from cores.llm import telemetry
 from cores.llm.mcp_registry import McpServerRegistry
 from cores.llm.ports import AgentSpec, LLMBackend, LLMParams, LLMResult
 
 # --- SDK import guard ---------------------------------------------------
 try:
-    from agents import Agent, ModelSettings, Runner
+    from agents import Agent, ModelSettings, RunHooks, Runner
     from agents import (
         set_default_openai_api,
         set_default_openai_client,
@@ -32,6 +34,7 @@ except ImportError:
     Agent = None  # type: ignore[assignment,misc]
     ModelSettings = None  # type: ignore[assignment]
     Runner = None  # type: ignore[assignment]
+    RunHooks = object  # type: ignore[assignment,misc]
     MCPServerStdio = None  # type: ignore[assignment]
     MCPServerStdioParams = None  # type: ignore[assignment]
     Reasoning = None  # type: ignore[assignment]
@@ -163,6 +166,67 @@ def build_agent(spec: AgentSpec, mcp_servers: list) -> "Agent":
     )
 
 
+class _TelemetryHooks(RunHooks):
+    """Feeds model turns and tool calls of one run into its telemetry span."""
+
+    def __init__(self, span: "telemetry.CallSpan", tool_servers: dict) -> None:
+        self._span = span
+        self._tool_servers = tool_servers
+        self._llm_started: list = []
+        self._tool_started: dict = {}
+
+    async def on_llm_start(self, context, agent, system_prompt, input_items) -> None:
+        self._span.mark_request_start()
+        self._llm_started.append(time.monotonic())
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        started = self._llm_started.pop(0) if self._llm_started else time.monotonic()
+        usage = getattr(response, "usage", None)
+        self._span.record_request(
+            (time.monotonic() - started) * 1000.0,
+            getattr(usage, "input_tokens", None),
+            getattr(usage, "output_tokens", None),
+        )
+
+    async def on_tool_start(self, context, agent, tool) -> None:
+        self._tool_started.setdefault(tool.name, []).append(time.monotonic())
+
+    async def on_tool_end(self, context, agent, tool, result) -> None:
+        starts = self._tool_started.get(tool.name)
+        started = starts.pop(0) if starts else time.monotonic()
+        self._span.record_tool(
+            tool.name,
+            (time.monotonic() - started) * 1000.0,
+            server=self._tool_servers.get(tool.name),
+        )
+
+
+async def _tool_server_map(servers: list) -> dict:
+    """Map tool name -> MCP server name (tool lists are cached by the servers)."""
+    mapping: dict = {}
+    for server in servers:
+        try:
+            tools = await server.list_tools()
+        except Exception:  # noqa: BLE001 - telemetry only; the run lists tools itself
+            continue
+        for tool in tools:
+            mapping.setdefault(tool.name, server.name)
+    return mapping
+
+
+def _usage_dict(result: Any) -> Optional[dict]:
+    """Run-total token usage from a RunResult, if the SDK reported it."""
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    if usage is None:
+        return None
+    return {
+        "requests": getattr(usage, "requests", None),
+        "input_tokens": getattr(usage, "input_tokens", None),
+        "output_tokens": getattr(usage, "output_tokens", None),
+        "total_tokens": getattr(usage, "total_tokens", None),
+    }
+
+
 class OpenAIAgentsBackend(LLMBackend):
     """LLMBackend adapter that delegates to the openai-agents 0.7.x SDK.
 
@@ -210,11 +274,12 @@ class OpenAIAgentsBackend(LLMBackend):
 
             agent = build_agent(spec, servers)
 
-            result = await self._runner.run(
-                agent,
-                user_input,
-                max_turns=spec.params.max_iterations,
-            )
+            run_kwargs: dict[str, Any] = {"max_turns": spec.params.max_iterations}
+            span = telemetry.current_span()
+            if span is not None:
+                run_kwargs["hooks"] = _TelemetryHooks(span, await _tool_server_map(servers))
+
+            result = await self._runner.run(agent, user_input, **run_kwargs)
 
         text = result.final_output if isinstance(result.final_output, str) else ""
         structured = result.final_output if spec.output_schema is not None else None
@@ -223,5 +288,6 @@ class OpenAIAgentsBackend(LLMBackend):
             text=text,
             structured=structured,
             response_id=getattr(result, "last_response_id", None),
+            usage=_usage_dict(result),
             raw=result,
         )
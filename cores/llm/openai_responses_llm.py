@@ -19,6 +19,7 @@ Drop-in replacement: swap attach_llm(OpenAIAugmentedLLM) →
                                attach_llm(OpenAIResponsesLLM)
 """
 import json
+import time
 from typing import List, Optional
 
 from openai import AsyncOpenAI
@@ -33,6 +34,8 @@ from mcp.types import (
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 
+from cores.llm import telemetry
+
 
 class OpenAIResponsesLLM(OpenAIAugmentedLLM):
     """
@@ -48,9 +51,26 @@ class OpenAIResponsesLLM(OpenAIAugmentedLLM):
         self,
         message,
         request_params: Optional[RequestParams] = None,
+    ) -> str:
+        # Tracking agents call this LLM directly, not through an instrumented
+        # LLMBackend; give those calls their own span
+        async with telemetry.llm_call(
+            "mcp_agent",
+            agent=getattr(self.agent, "name", None),
+            mcp_servers=getattr(self.agent, "server_names", None) or (),
+        ):
+            return await self._generate_str(message, request_params)
+
+    async def _generate_str(
+        self,
+        message,
+        request_params: Optional[RequestParams] = None,
     ) -> str:
         params = self.get_request_params(request_params)
         model = await self.select_model(params)
+        span = telemetry.current_span()
+        if span is not None and span.model is None:
+            span.model = model
 
         # Collect MCP tools in Responses API format (flat, no "function" wrapper)
         tools_result = await self.agent.list_tools(tool_filter=params.tool_filter)
@@ -118,7 +138,18 @@ class OpenAIResponsesLLM(OpenAIAugmentedLLM):
                 # function_call must accompany its function_call_output.
                 call_kwargs = {**base_kwargs, "input": input_items}
 
+                span = telemetry.current_span()
+                if span is not None:
+                    span.mark_request_start()
+                started = time.monotonic()
                 response = await client.responses.create(**call_kwargs)  # type: ignore[attr-defined]
+                if span is not None:
+                    usage = getattr(response, "usage", None)
+                    span.record_request(
+                        (time.monotonic() - started) * 1000.0,
+                        getattr(usage, "input_tokens", None),
+                        getattr(usage, "output_tokens", None),
+                    )
 
                 # Separate text content and function calls from output items
                 text_parts: List[str] = []
@@ -176,7 +207,15 @@ class OpenAIResponsesLLM(OpenAIAugmentedLLM):
             method="tools/call",
             params=CallToolRequestParams(name=name, arguments=args),
         )
+        started = time.monotonic()
         result = await self.call_tool(request=request, tool_call_id=call_id)
+        span = telemetry.current_span()
+        if span is not None:
+            span.record_tool(
+                name,
+                (time.monotonic() - started) * 1000.0,
+                ok=not getattr(result, "isError", False),
+            )
 
         parts = []
         for content in result.content:
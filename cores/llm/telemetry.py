@@ -0,0 +1,396 @@
+"""
+LLM call telemetry at the LLMBackend port.
+
+Every ``LLMBackend.run()`` made through :func:`instrument` becomes one span:
+backend, agent, model, section, queueing time (run entry -> first model
+request), model time, MCP tool calls with durations, input/output tokens and
+the retry number. Spans go to a local SQLite sink; ``tools/llm_telemetry_report.py``
+turns them into p50/p95 tables by section, agent, model and tool.
+
+Backends feed the active span through :func:`current_span` (openai-agents run
+hooks, the Responses API loop); code that drives an LLM without a backend
+opens its span with :func:`llm_call`. Callers label work with :func:`section` and
+time non-LLM stages such as prefetch with :func:`stage`. Only stdlib imports,
+same as ports.py — no SDK coupling.
+
+Disable with ``PRISM_LLM_TELEMETRY=off``; telemetry failures never reach the
+LLM call, and spans are written on a worker thread so a busy sink never
+stalls the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence
+
+from cores.llm.ports import AgentSpec, LLMBackend, LLMResult
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+TELEMETRY_DB_PATH = Path(os.getenv("PRISM_LLM_TELEMETRY_DB", str(PROJECT_ROOT / "llm_telemetry.sqlite")))
+
+_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS llm_calls (
+        span_id       TEXT PRIMARY KEY,
+        kind          TEXT NOT NULL,
+        backend       TEXT,
+        agent         TEXT,
+        model         TEXT,
+        section       TEXT,
+        started_at    TEXT NOT NULL,
+        duration_ms   REAL NOT NULL,
+        queue_ms      REAL,
+        model_ms      REAL,
+        llm_requests  INTEGER NOT NULL DEFAULT 0,
+        input_tokens  INTEGER,
+        output_tokens INTEGER,
+        total_tokens  INTEGER,
+        retry         INTEGER NOT NULL DEFAULT 0,
+        status        TEXT NOT NULL,
+        error_type    TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS llm_tool_calls (
+        span_id     TEXT NOT NULL,
+        tool        TEXT NOT NULL,
+        server      TEXT,
+        started_at  TEXT NOT NULL,
+        duration_ms REAL NOT NULL,
+        ok          INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_llm_calls_started ON llm_calls (started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_llm_tool_calls_span ON llm_tool_calls (span_id)",
+)
+
+
+def telemetry_enabled() -> bool:
+    """Return False when PRISM_LLM_TELEMETRY is 0/false/no/off. Default ON."""
+    return os.getenv("PRISM_LLM_TELEMETRY", "on").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat(timespec="milliseconds")
+
+
+@dataclass
+class ToolCallSpan:
+    tool: str
+    server: Optional[str]
+    started_at: str
+    duration_ms: float
+    ok: bool = True
+
+
+@dataclass
+class CallSpan:
+    """One LLM call (kind "llm") or one timed non-LLM stage (kind "stage")."""
+
+    kind: str
+    backend: Optional[str] = None
+    agent: Optional[str] = None
+    model: Optional[str] = None
+    section: Optional[str] = None
+    mcp_servers: tuple = ()
+    retry: int = 0
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: str = field(default_factory=_now_iso)
+    duration_ms: float = 0.0
+    queue_ms: Optional[float] = None
+    model_ms: Optional[float] = None
+    llm_requests: int = 0
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    status: str = "ok"
+    error_type: Optional[str] = None
+    tool_calls: List[ToolCallSpan] = field(default_factory=list)
+    _t0: float = field(default_factory=time.monotonic, repr=False)
+
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self._t0) * 1000.0
+
+    def mark_request_start(self) -> None:
+        """Called when a model request is sent; the first one ends queueing time."""
+        if self.queue_ms is None:
+            self.queue_ms = self.elapsed_ms()
+
+    def record_request(
+        self,
+        duration_ms: float,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        """Add one model request (a turn of the agent loop)."""
+        if self.queue_ms is None:
+            self.queue_ms = max(0.0, self.elapsed_ms() - duration_ms)
+        self.llm_requests += 1
+        self.model_ms = (self.model_ms or 0.0) + duration_ms
+        if input_tokens is not None:
+            self.input_tokens = (self.input_tokens or 0) + int(input_tokens)
+        if output_tokens is not None:
+            self.output_tokens = (self.output_tokens or 0) + int(output_tokens)
+
+    def record_tool(
+        self,
+        tool: str,
+        duration_ms: float,
+        ok: bool = True,
+        server: Optional[str] = None,
+    ) -> None:
+        if server is None:
+            # mcp_agent namespaces tools as "<server>_<tool>"
+            server = next((s for s in self.mcp_servers if tool.startswith(f"{s}_")), None)
+        started = datetime.fromtimestamp(time.time() - duration_ms / 1000.0)
+        self.tool_calls.append(ToolCallSpan(
+            tool=tool,
+            server=server,
+            started_at=started.isoformat(timespec="milliseconds"),
+            duration_ms=duration_ms,
+            ok=ok,
+        ))
+
+    def finish(self, error: Optional[BaseException] = None, usage: Optional[dict] = None) -> None:
+        self.duration_ms = self.elapsed_ms()
+        if error is not None:
+            self.status = "cancelled" if isinstance(error, asyncio.CancelledError) else "error"
+            self.error_type = type(error).__name__
+        if usage and self.input_tokens is None and self.output_tokens is None:
+            # Backends without per-request hooks report the run total only
+            self.input_tokens = usage.get("input_tokens", usage.get("prompt_tokens"))
+            self.output_tokens = usage.get("output_tokens", usage.get("completion_tokens"))
+            self.total_tokens = usage.get("total_tokens")
+        if self.total_tokens is None and (self.input_tokens is not None or self.output_tokens is not None):
+            self.total_tokens = (self.input_tokens or 0) + (self.output_tokens or 0)
+
+
+class _SectionScope:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Runs per agent in this scope; a re-run of the same agent is a retry
+        self.attempts: Counter = Counter()
+
+
+_current_section: contextvars.ContextVar[Optional[_SectionScope]] = contextvars.ContextVar(
+    "llm_telemetry_section", default=None
+)
+_current_span: contextvars.ContextVar[Optional[CallSpan]] = contextvars.ContextVar(
+    "llm_telemetry_span", default=None
+)
+
+
+def current_span() -> Optional[CallSpan]:
+    """The span of the LLM call running in this context, if any."""
+    return _current_span.get()
+
+
+def current_section() -> Optional[str]:
+    scope = _current_section.get()
+    return scope.name if scope is not None else None
+
+
+@contextlib.contextmanager
+def section(name: str) -> Iterator[None]:
+    """Label every LLM call in the block (and its tasks) with ``name``.
+
+    Open it outside any retry loop: repeated runs of the same agent inside one
+    scope are counted as retries.
+    """
+    token = _current_section.set(_SectionScope(name))
+    try:
+        yield
+    finally:
+        _current_section.reset(token)
+
+
+class TelemetrySink:
+    """SQLite span sink (one connection per write; safe across processes).
+
+    The schema is created once per sink, on the first write.
+    """
+
+    busy_timeout = 5.0
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or TELEMETRY_DB_PATH)
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout)
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    for ddl in _DDL:
+                        conn.execute(ddl)
+                    conn.commit()
+                    self._schema_ready = True
+        return conn
+
+    def write(self, span: CallSpan) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO llm_calls (span_id, kind, backend, agent, model, section, started_at, "
+                "duration_ms, queue_ms, model_ms, llm_requests, input_tokens, output_tokens, "
+                "total_tokens, retry, status, error_type) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (span.span_id, span.kind, span.backend, span.agent, span.model, span.section,
+                 span.started_at, span.duration_ms, span.queue_ms, span.model_ms,
+                 span.llm_requests, span.input_tokens, span.output_tokens, span.total_tokens,
+                 span.retry, span.status, span.error_type),
+            )
+            conn.executemany(
+                "INSERT INTO llm_tool_calls (span_id, tool, server, started_at, duration_ms, ok) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(span.span_id, t.tool, t.server, t.started_at, t.duration_ms, int(t.ok))
+                 for t in span.tool_calls],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+_default_sink: Optional[TelemetrySink] = None
+
+
+def get_sink() -> TelemetrySink:
+    global _default_sink
+    if _default_sink is None:
+        _default_sink = TelemetrySink()
+    return _default_sink
+
+
+def _write(span: CallSpan, sink: Optional[TelemetrySink]) -> None:
+    try:
+        (sink or get_sink()).write(span)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"LLM telemetry write failed: {e}")
+
+
+def _emit(span: CallSpan, sink: Optional[TelemetrySink]) -> None:
+    """Write ``span`` without blocking a running event loop.
+
+    Inside a loop the write is handed to the default executor and not
+    awaited (``asyncio.run`` waits for it at shutdown); outside one it is
+    written inline.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _write(span, sink)
+        return
+    loop.run_in_executor(None, _write, span, sink)
+
+
+@contextlib.contextmanager
+def stage(name: str, sink: Optional[TelemetrySink] = None) -> Iterator[None]:
+    """Time a non-LLM stage (e.g. prefetch) as a span in the current section."""
+    if not telemetry_enabled():
+        yield
+        return
+    span = CallSpan(kind="stage", agent=name, section=current_section() or name)
+    error: Optional[BaseException] = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        span.finish(error)
+        _emit(span, sink)
+
+
+def _llm_span(backend: str, agent: Optional[str], model: Optional[str], mcp_servers: Sequence[str]) -> CallSpan:
+    scope = _current_section.get()
+    retry = 0
+    if scope is not None:
+        retry = scope.attempts[agent]
+        scope.attempts[agent] += 1
+    return CallSpan(
+        kind="llm",
+        backend=backend,
+        agent=agent,
+        model=model,
+        section=scope.name if scope is not None else None,
+        mcp_servers=tuple(mcp_servers),
+        retry=retry,
+    )
+
+
+@contextlib.asynccontextmanager
+async def llm_call(
+    backend: str,
+    agent: Optional[str] = None,
+    model: Optional[str] = None,
+    mcp_servers: Sequence[str] = (),
+    sink: Optional[TelemetrySink] = None,
+) -> AsyncIterator[Optional[CallSpan]]:
+    """Record one LLM call made outside :class:`InstrumentedBackend`.
+
+    For callers that drive an LLM directly (the tracking agents use
+    ``OpenAIResponsesLLM`` without an LLMBackend). Yields the active span;
+    inside an instrumented run, or with telemetry disabled, no new span is
+    opened.
+    """
+    if current_span() is not None or not telemetry_enabled():
+        yield current_span()
+        return
+    span = _llm_span(backend, agent, model, mcp_servers)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.finish(e)
+        raise
+    else:
+        span.finish()
+    finally:
+        _current_span.reset(token)
+        await asyncio.to_thread(_write, span, sink)
+
+
+class InstrumentedBackend(LLMBackend):
+    """Wraps any LLMBackend and records one span per ``run()``."""
+
+    def __init__(self, inner: LLMBackend, sink: Optional[TelemetrySink] = None) -> None:
+        self.inner = inner
+        self.name = inner.name
+        self._sink = sink
+
+    async def run(self, spec: AgentSpec, user_input: Any) -> LLMResult:
+        span = _llm_span(self.inner.name, spec.name, spec.model, spec.mcp_servers)
+        token = _current_span.set(span)
+        try:
+            result = await self.inner.run(spec, user_input)
+        except BaseException as e:
+            span.finish(e)
+            raise
+        else:
+            span.finish(usage=result.usage)
+            return result
+        finally:
+            _current_span.reset(token)
+            await asyncio.to_thread(_write, span, self._sink)
+
+
+def instrument(backend: LLMBackend, sink: Optional[TelemetrySink] = None) -> LLMBackend:
+    """Return ``backend`` wrapped for telemetry (unchanged when disabled)."""
+    if not telemetry_enabled() or isinstance(backend, InstrumentedBackend):
+        return backend
+    return InstrumentedBackend(backend, sink)
@@ -64,8 +64,10 @@ Missing-volume handling summary:
 
 from __future__ import annotations
 
+import heapq
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 # --------------------------------------------------------------------------- #
 # Constants (IBD/O'Neil — see module docstring table; mirror data_prefetch.py)  #
@@ -94,6 +96,10 @@ CORRECTION: str = "CORRECTION"
 
 PulseState = str  # semantic alias: one of UPTREND / UNDER_PRESSURE / CORRECTION
 
+# Bump when the MarketPulse.to_dict() layout changes; from_dict() rejects other
+# versions so a persisted checkpoint is rebuilt instead of misread.
+STATE_VERSION: int = 1
+
 
 @dataclass(frozen=True)
 class DailyBar:
@@ -126,6 +132,9 @@ def _count_distribution_days(
 
     ``start_idx`` lets the caller reset the window after a Follow-Through Day so
     pre-FTD distribution days no longer count (only DDs at index >= start_idx).
+
+    This full rescan is the reference definition; :class:`MarketPulse` keeps the
+    same count incrementally via :class:`_DistributionDayCounter`.
     """
     n = len(closes)
     if n < 2:
@@ -158,20 +167,113 @@ def _count_distribution_days(
     return kept
 
 
+class _DistributionDayCounter:
+    """Incremental form of :func:`_count_distribution_days` (same count, O(1)/bar).
+
+    Each live distribution day is held twice: in a deque ordered by bar index
+    (monotonic, so 25-session window expiry pops from the left) and in a min-heap
+    keyed by its +5% recovery threshold (so recovery expiry pops from the top
+    while the threshold is <= today's close). A DD never comes back once expired
+    — the max close after it only grows and the window only moves forward — so
+    every DD is pushed and popped once and nothing is rescanned. Entries already
+    expired through the other structure are dropped lazily.
+    """
+
+    def __init__(
+        self,
+        window: int = DISTRIBUTION_WINDOW,
+        drop_threshold_pct: float = DISTRIBUTION_DROP_PCT,
+        recovery_pct: float = DISTRIBUTION_RECOVERY_PCT,
+    ) -> None:
+        self.window = window
+        self.drop_threshold_pct = drop_threshold_pct
+        self.recovery_pct = recovery_pct
+        self._by_index: Deque[Tuple[int, float]] = deque()
+        self._by_threshold: List[Tuple[float, int]] = []
+        self._live: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def clear(self) -> None:
+        self._by_index.clear()
+        self._by_threshold.clear()
+        self._live.clear()
+
+    def update(
+        self,
+        idx: int,
+        prev_close: Optional[float],
+        close: float,
+        prev_vol: Optional[float],
+        vol: Optional[float],
+        start_idx: int = 0,
+    ) -> int:
+        """Ingest bar ``idx`` and return the live DD count as of that bar."""
+        # (1) +5% recovery: today's close is the newest "later close" for every
+        # live DD, all of which precede ``idx``.
+        heap = self._by_threshold
+        while heap and heap[0][0] <= close:
+            _, i = heapq.heappop(heap)
+            self._live.pop(i, None)
+
+        # (2) Is today itself a distribution day?
+        if idx >= 1 and idx >= start_idx and prev_close is not None and prev_close > 0:
+            pct = (close - prev_close) / prev_close * 100.0
+            vol_up = vol is not None and prev_vol is not None and vol > prev_vol
+            if pct <= -self.drop_threshold_pct and vol_up:
+                threshold = close * (1 + self.recovery_pct / 100.0)
+                self._live[idx] = threshold
+                self._by_index.append((idx, threshold))
+                heapq.heappush(heap, (threshold, idx))
+
+        # (3) Window expiry: only the last ``window`` comparison-days count.
+        oldest = max(1, idx + 1 - self.window, start_idx)
+        while self._by_index and self._by_index[0][0] < oldest:
+            i, _ = self._by_index.popleft()
+            self._live.pop(i, None)
+        if len(heap) > 2 * self.window:
+            self._by_threshold = [(t, i) for i, t in self._live.items()]
+            heapq.heapify(self._by_threshold)
+        return len(self._live)
+
+    def to_list(self) -> List[List[float]]:
+        return [[i, self._live[i]] for i, _ in self._by_index if i in self._live]
+
+    def load_list(self, items) -> None:
+        self.clear()
+        for i, threshold in items:
+            i, threshold = int(i), float(threshold)
+            self._live[i] = threshold
+            self._by_index.append((i, threshold))
+            self._by_threshold.append((threshold, i))
+        heapq.heapify(self._by_threshold)
+
+
 class MarketPulse:
     """Incremental O'Neil market-direction state machine.
 
     Feed index daily bars in chronological order via :meth:`feed`; it returns the
     current :data:`PulseState` after each bar. State depends only on the bars fed
     so far (as-of semantics), so replaying a fixed sequence is deterministic.
+
+    Only the last two bars are retained, so per-bar cost and memory are constant
+    however long the machine runs. :meth:`to_dict` / :meth:`from_dict` round-trip
+    the full state through JSON-safe values, so a caller can persist a checkpoint
+    and later resume by feeding only the bars after :attr:`last_date`.
     """
 
     def __init__(self) -> None:
-        self._closes: List[float] = []
-        self._vols: List[Optional[float]] = []
-        self._dates: List[str] = []
+        # Bars fed so far (absolute index of the next bar) and the last two bars.
+        self._n: int = 0
+        self._last_date: Optional[str] = None
+        self._close: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._vol: Optional[float] = None
+        self._prev_vol: Optional[float] = None
         self._state: PulseState = UPTREND
         self._last_dd: int = 0
+        self._dd = _DistributionDayCounter()
         # DD window reset point (absolute bar index); bumped after an FTD.
         self._dd_window_start: int = 0
         # Correction / rally-attempt tracking (O'Neil).
@@ -198,13 +300,30 @@ class MarketPulse:
     def distribution_days(self) -> int:
         return self._last_dd
 
+    @property
+    def bars_seen(self) -> int:
+        return self._n
+
+    @property
+    def last_date(self) -> Optional[str]:
+        """Date of the last bar fed (``None`` before the first bar)."""
+        return self._last_date
+
+    @property
+    def last_close(self) -> Optional[float]:
+        return self._close
+
     def feed(self, bar: DailyBar) -> PulseState:
         """Ingest one bar (chronological) and return the resulting state."""
-        self._dates.append(bar.date)
-        self._closes.append(float(bar.close))
-        self._vols.append(None if bar.volume is None else float(bar.volume))
-        n = len(self._closes)
-        cur = self._closes[-1]
+        idx = self._n
+        self._n += 1
+        self._last_date = bar.date
+        self._prev_close, self._close = self._close, float(bar.close)
+        self._prev_vol, self._vol = (
+            self._vol, None if bar.volume is None else float(bar.volume)
+        )
+        n = self._n
+        cur = self._close
 
         # Rev.2: maintain the rolling reference peak (max close since start or the
         # last CORRECTION exit). Updated every bar, before entry checks so a new
@@ -212,8 +331,8 @@ class MarketPulse:
         if self._reference_peak is None or cur > self._reference_peak:
             self._reference_peak = cur
 
-        dd = _count_distribution_days(
-            self._closes, self._vols, DISTRIBUTION_WINDOW, self._dd_window_start
+        dd = self._dd.update(
+            idx, self._prev_close, cur, self._prev_vol, self._vol, self._dd_window_start
         )
         self._last_dd = dd
 
@@ -244,12 +363,75 @@ class MarketPulse:
             out.append((bar.date, state, self._last_dd))
         return out
 
+    # ------------------------------------------------------------------ #
+    # Checkpointing                                                       #
+    # ------------------------------------------------------------------ #
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the full machine state (JSON-safe)."""
+        return {
+            "version": STATE_VERSION,
+            "bars_seen": self._n,
+            "last_date": self._last_date,
+            "close": self._close,
+            "prev_close": self._prev_close,
+            "volume": self._vol,
+            "prev_volume": self._prev_vol,
+            "state": self._state,
+            "distribution_days": self._last_dd,
+            "live_distribution_days": self._dd.to_list(),
+            "dd_window_start": self._dd_window_start,
+            "correction_low": self._correction_low,
+            "rally_active": self._rally_active,
+            "rally_day": self._rally_day,
+            "rally_start_low": self._rally_start_low,
+            "pre_correction_peak": self._pre_correction_peak,
+            "reference_peak": self._reference_peak,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketPulse":
+        """Restore a machine saved by :meth:`to_dict`.
+
+        Raises:
+            ValueError: unknown ``version`` or malformed state.
+        """
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"unsupported MarketPulse state version: {data.get('version')!r}")
+        if data.get("state") not in (UPTREND, UNDER_PRESSURE, CORRECTION):
+            raise ValueError(f"invalid MarketPulse state: {data.get('state')!r}")
+
+        def _opt(key: str) -> Optional[float]:
+            v = data.get(key)
+            return None if v is None else float(v)
+
+        mp = cls()
+        try:
+            mp._n = int(data["bars_seen"])
+            mp._last_date = data.get("last_date")
+            mp._close = _opt("close")
+            mp._prev_close = _opt("prev_close")
+            mp._vol = _opt("volume")
+            mp._prev_vol = _opt("prev_volume")
+            mp._state = data["state"]
+            mp._last_dd = int(data["distribution_days"])
+            mp._dd.load_list(data["live_distribution_days"])
+            mp._dd_window_start = int(data["dd_window_start"])
+            mp._correction_low = _opt("correction_low")
+            mp._rally_active = bool(data["rally_active"])
+            mp._rally_day = int(data["rally_day"])
+            mp._rally_start_low = _opt("rally_start_low")
+            mp._pre_correction_peak = _opt("pre_correction_peak")
+            mp._reference_peak = _opt("reference_peak")
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"malformed MarketPulse state: {e}") from e
+        return mp
+
     # ------------------------------------------------------------------ #
     # Correction / rally-attempt internals                                #
     # ------------------------------------------------------------------ #
     def _enter_correction(self) -> None:
         self._state = CORRECTION
-        self._correction_low = self._closes[-1]
+        self._correction_low = self._close
         # Pre-correction peak = the rolling reference peak at trigger time (max
         # close since start or the last CORRECTION exit). Identical to the highest
         # close for a DD-triggered entry, and exactly the drawdown reference for a
@@ -262,10 +444,10 @@ class MarketPulse:
         self._rally_start_low = None
 
     def _update_correction(self, n: int) -> None:
-        cur = self._closes[-1]
-        prev = self._closes[-2] if n >= 2 else cur
-        cur_vol = self._vols[-1]
-        prev_vol = self._vols[-2] if n >= 2 else None
+        cur = self._close
+        prev = self._prev_close if n >= 2 else cur
+        cur_vol = self._vol
+        prev_vol = self._prev_vol if n >= 2 else None
 
         if self._correction_low is None:
             self._correction_low = cur
@@ -314,6 +496,7 @@ class MarketPulse:
         """Shared CORRECTION exit (FTD or price-recovery): UPTREND + DD reset."""
         self._state = UPTREND
         self._dd_window_start = n  # exclude all DDs up to and including today
+        self._dd.clear()
         self._last_dd = 0
         self._rally_active = False
         self._rally_day = 0
@@ -323,4 +506,4 @@ class MarketPulse:
         # Rev.2 anti-flap: reset the rolling reference peak to today's close so a
         # NEW >=10% decline from post-exit levels is required to re-trigger a
         # price-drawdown CORRECTION. Thereafter the peak grows with new highs.
-        self._reference_peak = self._closes[-1]
+        self._reference_peak = self._close
@@ -0,0 +1,330 @@
+"""Compact encoding of prefetched data tables for agent prompts.
+
+Why this module exists
+----------------------
+The prefetch modules inject multi-year daily OHLCV, investor-flow and index
+tables into every section agent's instruction. As full-precision markdown they
+run to hundreds of padded rows: most of the prompt is table chrome and digits
+nobody reads, and every section agent pays for it in input tokens and
+time-to-first-token.
+
+What the compact format does
+----------------------------
+  * CSV rows with one header line; large columns carry a unit (``Volume(M)``).
+  * Numbers rounded to ``SIG_FIGS`` significant figures (integer parts are
+    never rounded away, so a 71,300 KRW close stays 71300).
+  * Recent ``RECENT_ROWS`` sessions at full daily resolution; older history
+    downsampled to weekly, and anything older than ``WEEKLY_SPAN_DAYS`` before
+    the daily window to monthly (O=first, H=max, L=min, C=last, volume and
+    flows summed, per-session rates left blank, other columns last value).
+  * A precomputed summary line (last/min/max, period returns, flow sums) so
+    agents do not re-derive the basics from the rows.
+
+Switch
+------
+``PRISM_PROMPT_TABLE_FORMAT=markdown`` restores the previous full markdown
+tables for report-quality comparison; the default is ``compact``. Both paths
+log the estimated token count of each section before/after.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import numbers
+import os
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SIG_FIGS = 4
+RECENT_ROWS = 60
+# History within this many days before the daily window is weekly; older is monthly
+WEEKLY_SPAN_DAYS = 182
+
+_OPEN = {"open", "시가"}
+_HIGH = {"high", "고가"}
+_LOW = {"low", "저가"}
+_CLOSE = {"close", "종가", "adj close"}
+# Column-name fragments for additive columns (volumes, trading values, net flows)
+_ADDITIVE_HINTS = ("volume", "거래량", "거래대금", "합계", "순매수", "매수", "매도", "개인", "외국인", "기관")
+# Per-session rates (daily % change) have no meaningful weekly/monthly aggregate
+_RATE_HINTS = ("률", "%", "change", "pct")
+
+_UNITS = ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K"))
+
+
+def table_format() -> str:
+    """Active prompt table format: 'compact' (default) or 'markdown'."""
+    value = os.environ.get("PRISM_PROMPT_TABLE_FORMAT", "compact").strip().lower()
+    return "markdown" if value == "markdown" else "compact"
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count (tiktoken when installed, else a char heuristic).
+
+    The heuristic counts ~4 ASCII characters per token and one token per
+    non-ASCII character (Hangul is roughly one token per syllable).
+    """
+    if not text:
+        return 0
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("o200k_base").encode(text))
+    except Exception:
+        ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+        return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _role(column: str) -> str:
+    name = str(column).strip().lower()
+    if name in _OPEN:
+        return "first"
+    if name in _HIGH:
+        return "max"
+    if name in _LOW:
+        return "min"
+    if name in _CLOSE:
+        return "last"
+    if any(hint in name for hint in _RATE_HINTS):
+        return "rate"
+    if any(hint in name for hint in _ADDITIVE_HINTS):
+        return "sum"
+    return "last"
+
+
+def format_number(value, sig: int = SIG_FIGS) -> str:
+    """Round to ``sig`` significant figures without dropping integer digits."""
+    if value is None:
+        return ""
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if math.isnan(v) or math.isinf(v):
+        return ""
+    if v == 0:
+        return "0"
+    magnitude = math.floor(math.log10(abs(v)))
+    if magnitude >= sig - 1:
+        return f"{v:.0f}"
+    text = f"{v:.{sig - 1 - magnitude}f}"
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+def format_scaled(value, sig: int = SIG_FIGS) -> str:
+    """Like format_number, but large magnitudes get an inline unit (391.0B)."""
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return format_number(value, sig)
+    for divisor, suffix in _UNITS:
+        if abs(v) >= divisor * 10:
+            return format_number(v / divisor, sig) + suffix
+    return format_number(v, sig)
+
+
+def _label(value) -> str:
+    if isinstance(value, pd.Timestamp):
+        return f"{value:%Y-%m-%d}"
+    return str(value).replace(",", " ")
+
+
+def _column_scale(series: pd.Series) -> tuple:
+    """(divisor, suffix) so a large additive column reads as e.g. 12.35M."""
+    values = pd.to_numeric(series, errors="coerce").abs().dropna()
+    if values.empty:
+        return 1.0, ""
+    typical = float(values.median())
+    for divisor, suffix in _UNITS:
+        if typical >= divisor * 10:
+            return divisor, suffix
+    return 1.0, ""
+
+
+def _format_rows(
+    df: pd.DataFrame,
+    labels: List[str],
+    scales: Optional[Dict[str, tuple]] = None,
+) -> List[str]:
+    """CSV rows; with ``scales`` numbers are divided per column, else unit-suffixed per cell."""
+    lines = []
+    for label, (_, row) in zip(labels, df.iterrows()):
+        cells = [label]
+        for col in df.columns:
+            value = row[col]
+            if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                if scales is None:
+                    cells.append(format_scaled(value))
+                else:
+                    cells.append(format_number(value / scales.get(col, (1.0, ""))[0]))
+            else:
+                cells.append("" if value is None else _label(value))
+        lines.append(",".join(cells))
+    return lines
+
+
+def _header(index_name: str, df: pd.DataFrame, scales: Optional[Dict[str, tuple]] = None) -> str:
+    cols = [index_name]
+    for col in df.columns:
+        suffix = (scales or {}).get(col, (1.0, ""))[1]
+        cols.append(f"{_label(col)}({suffix})" if suffix else _label(col))
+    return ",".join(cols)
+
+
+def _resample(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    numeric = df.apply(pd.to_numeric, errors="coerce")
+    roles = {col: _role(col) for col in numeric.columns}
+    agg = {col: "last" if role == "rate" else role for col, role in roles.items()}
+    out = numeric.resample(rule).agg(agg).dropna(how="all")
+    for col, role in roles.items():
+        if role == "rate":
+            out[col] = float("nan")
+    return out
+
+
+def _pct(a: float, b: float) -> Optional[str]:
+    if a is None or b is None or not a:
+        return None
+    return f"{(b / a - 1) * 100:+.1f}%"
+
+
+def _summary(df: pd.DataFrame, scales: Dict[str, tuple]) -> str:
+    parts = []
+    for col in df.columns:
+        series = pd.to_numeric(df[col], errors="coerce").dropna()
+        role = _role(col)
+        # Constant level columns (e.g. all-zero Dividends) carry nothing worth summarising
+        if series.empty or (role != "sum" and series.nunique() <= 1):
+            continue
+        divisor = scales.get(col, (1.0, ""))[0]
+        label = _header("", df[[col]], scales).lstrip(",")
+        if role in ("last", "rate"):
+            stats = [
+                f"last={format_number(series.iloc[-1] / divisor)}",
+                f"min={format_number(series.min() / divisor)}@{series.idxmin():%Y-%m-%d}",
+                f"max={format_number(series.max() / divisor)}@{series.idxmax():%Y-%m-%d}",
+            ]
+            if str(col).strip().lower() in _CLOSE:
+                for n in (5, 20, 60):
+                    if len(series) > n:
+                        stats.append(f"chg{n}d={_pct(series.iloc[-n - 1], series.iloc[-1])}")
+                change = _pct(series.iloc[0], series.iloc[-1])
+                if change:
+                    stats.append(f"chg_all={change}")
+            parts.append(f"{label}: " + " ".join(stats))
+        elif role == "sum":
+            stats = [f"sum{n}d={format_number(series.tail(n).sum() / divisor)}" for n in (5, 20, 60)
+                     if len(series) >= n]
+            stats.append(f"avg20d={format_number(series.tail(20).mean() / divisor)}")
+            parts.append(f"{label}: " + " ".join(stats))
+    return "; ".join(parts)
+
+
+def encode_time_series(
+    df: pd.DataFrame,
+    title: str = "",
+    note: Optional[str] = None,
+    recent_rows: int = RECENT_ROWS,
+) -> str:
+    """Encode a date-indexed table as compact CSV with downsampled history.
+
+    Args:
+        df: DataFrame indexed by date (DatetimeIndex or parseable strings)
+        title: Section title (rendered as a ``###`` heading)
+        note: Optional data-status note rendered above the rows
+        recent_rows: Sessions kept at daily resolution
+
+    Returns:
+        Compact text block, or empty string if ``df`` is empty
+    """
+    if df is None or df.empty:
+        return ""
+    if pd.api.types.is_numeric_dtype(df.index):
+        return encode_table(df, title, note=note)
+    try:
+        index = pd.to_datetime(df.index, format="ISO8601")
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_localize(None)
+    except (TypeError, ValueError):
+        return encode_table(df, title, note=note)
+
+    data = df.copy()
+    data.index = index
+    data = data.sort_index()
+    numeric_cols = [c for c in data.columns if pd.api.types.is_numeric_dtype(data[c])]
+    data = data[numeric_cols]
+    scales = {c: _column_scale(data[c]) for c in data.columns if _role(c) == "sum"}
+
+    daily = data.tail(recent_rows)
+    older = data.iloc[: max(len(data) - recent_rows, 0)]
+    split = daily.index[0] - pd.Timedelta(days=WEEKLY_SPAN_DAYS)
+    monthly = _resample(older[older.index < split], "ME") if not older.empty else older
+    weekly = _resample(older[older.index >= split], "W-FRI") if not older.empty else older
+
+    out = [f"### {title}", ""] if title else []
+    if note:
+        out += [f"> **데이터 상태:** {note}", ""]
+    out.append(
+        f"period {data.index[0]:%Y-%m-%d}..{data.index[-1]:%Y-%m-%d} ({len(data)} sessions); "
+        f"rows: monthly (M) then weekly (W, week ending) then daily (last {len(daily)}); "
+        "aggregates O=first H=max L=min C=last, volumes/flows summed"
+    )
+    summary = _summary(data, scales)
+    if summary:
+        out.append(f"summary: {summary}")
+    out.append(_header("Date", data, scales))
+    if not monthly.empty:
+        out += _format_rows(monthly, [f"M{d:%Y-%m}" for d in monthly.index], scales)
+    if not weekly.empty:
+        out += _format_rows(weekly, [f"W{d:%Y-%m-%d}" for d in weekly.index], scales)
+    out += _format_rows(daily, [f"{d:%Y-%m-%d}" for d in daily.index], scales)
+    return "\n".join(out) + "\n"
+
+
+def encode_table(df: pd.DataFrame, title: str = "", note: Optional[str] = None) -> str:
+    """Encode a non-time-series table (e.g. financial statements) as compact CSV.
+
+    Rows often mix magnitudes (revenue next to EPS), so large numbers carry
+    their unit inline (391.0B) instead of a per-column unit.
+    """
+    if df is None or df.empty:
+        return ""
+    index_name = str(df.index.name) if df.index.name else "Index"
+    out = [f"### {title}", ""] if title else []
+    if note:
+        out += [f"> **데이터 상태:** {note}", ""]
+    out.append(_header(index_name, df))
+    out += _format_rows(df, [_label(i) for i in df.index])
+    return "\n".join(out) + "\n"
+
+
+def render_for_prompt(
+    section: str,
+    markdown: Callable[[], str],
+    compact: Callable[[], str],
+) -> str:
+    """Render one prefetched section in the active format and log its token cost.
+
+    Args:
+        section: Section label for the log line
+        markdown: Builds the legacy markdown rendering
+        compact: Builds the compact rendering
+
+    Returns:
+        The rendering selected by ``PRISM_PROMPT_TABLE_FORMAT``
+    """
+    legacy = markdown()
+    if not legacy:
+        return legacy
+    try:
+        encoded = compact()
+    except Exception as e:
+        logger.warning(f"[prompt-table] compact encoding failed for {section}, using markdown: {e}")
+        return legacy
+    before, after = estimate_tokens(legacy), estimate_tokens(encoded)
+    mode = table_format()
+    saved = (1 - after / before) * 100 if before else 0.0
+    logger.info(f"[prompt-table] {section}: markdown {before} → compact {after} tokens ({saved:.0f}% less, using {mode})")
+    return legacy if mode == "markdown" else encoded
@@ -5,9 +5,11 @@ production orchestrators. It answers three questions, and nothing else:
 
   1. :func:`decide_batch_policy` — given (market, batch_mode, pulse_state), should
      THIS analysis batch run, or rest? Pure, table-driven, no I/O, no env reads.
-  2. :func:`get_market_pulse_state` — compute the CURRENT pulse state by replaying
-     :class:`cores.market_pulse.MarketPulse` over the last ~400 calendar days of
-     index bars. Fail-open: ANY error returns ``None`` (never raises).
+  2. :func:`get_market_pulse_state` — the CURRENT pulse state, read from a
+     persisted per-market :class:`cores.market_pulse.MarketPulse` checkpoint that
+     is advanced by the sessions closed since it was saved (one bar a day; a full
+     ~400-day replay only when no usable checkpoint exists). Fail-open: ANY error
+     returns ``None`` (never raises).
   3. :func:`market_pulse_mode` — read the ``MARKET_PULSE_MODE`` env flag
      (``shadow`` | ``live`` | ``off``; default ``shadow``).
 
@@ -40,9 +42,14 @@ file path even when ``sys.path`` shadowing (prism-us/cores) would otherwise win.
 
 from __future__ import annotations
 
+import json
 import logging
+import math
 import os
+import sqlite3
 from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -78,12 +85,40 @@ _UNDER_PRESSURE_REST_BATCHES: dict[str, frozenset[str]] = {}
 _STATE_CACHE: dict = {}
 
 # Item 4: post-FTD pilot re-exposure cache (per-process). True/False memoized so
-# the ~400d index replay runs at most once per market per process. Fail-open False.
+# the checkpoint lookup runs at most once per market per process. Fail-open False.
 _PILOT_CACHE: dict = {}
 
 # Item 5: Market Pulse detail cache — state + distribution_days + window, per-process.
 _DETAIL_CACHE: dict = {}
 
+# Persisted Market Pulse checkpoint, one row per market, shared by every cron
+# process (batch, sellers, tracking agents, bot). The first lookup after a
+# session close fetches only the bars since the checkpoint and feeds them; every
+# other lookup is a local read.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STATE_DB_PATH = Path(os.getenv("MARKET_PULSE_STATE_DB", str(PROJECT_ROOT / "market_pulse_state.sqlite")))
+
+# (timezone, local time after which the day's index bar is final), per market.
+_SESSION_CLOSE = {
+    "kr": ("Asia/Seoul", time(16, 0)),
+    "us": ("America/New_York", time(17, 0)),
+}
+
+# Pulse states kept with the checkpoint for the post-FTD pilot window check;
+# an exit older than this is far outside PULSE_PILOT_WINDOW_SESSIONS anyway.
+_RECENT_STATES_KEPT = 60
+
+_MIN_REPLAY_BARS = 30
+
+_CHECKPOINT_DDL = """
+CREATE TABLE IF NOT EXISTS market_pulse_checkpoint (
+    market     TEXT PRIMARY KEY,
+    as_of      TEXT NOT NULL,
+    checked_at TEXT NOT NULL,
+    payload    TEXT NOT NULL
+)
+"""
+
 
 @dataclass(frozen=True)
 class MarketPulseDetail:
@@ -427,21 +462,25 @@ def _df_to_bars(df, close_col: str, vol_col: Optional[str], DailyBar):
     return bars
 
 
-def _fetch_kr_bars(DailyBar):
+def _fetch_kr_bars(DailyBar, start_date: Optional[str] = None):
     """KOSPI index (1001) ~400d daily OHLCV via the authenticated KRX client.
 
     Mirrors tools/market_pulse_backtest.py:fetch_kr_bars but with a 400-day window
     (~2 yearly chunks; the KRX API rejects a 6y single request with INVALIDPERIOD2,
     so we fetch per calendar year and concat). Volume is required for DD detection.
+    ``start_date`` (YYYY-MM-DD, inclusive) narrows the window for a checkpoint
+    catch-up.
     """
     import pandas as pd
-    from datetime import datetime, timedelta
 
     sc = _load_root_cores("stock_chart")
     get_index_ohlcv_by_date = sc.get_index_ohlcv_by_date
 
     end_dt = datetime.now()
-    start_dt = end_dt - timedelta(days=400)
+    start_dt = (
+        datetime.strptime(start_date, "%Y-%m-%d") if start_date
+        else end_dt - timedelta(days=400)
+    )
     chunks = []
     y = start_dt.year
     while y <= end_dt.year:
@@ -465,13 +504,21 @@ def _fetch_kr_bars(DailyBar):
     return _df_to_bars(df, close_col, vol_col, DailyBar)
 
 
-def _fetch_us_bars(DailyBar):
-    """S&P 500 (^GSPC) daily via yfinance (period=2y ~ the 400d window)."""
+def _fetch_us_bars(DailyBar, start_date: Optional[str] = None):
+    """S&P 500 (^GSPC) daily via yfinance (period=2y ~ the 400d window).
+
+    ``start_date`` (YYYY-MM-DD, inclusive) narrows the window for a checkpoint
+    catch-up.
+    """
     import pandas as pd
     import yfinance as yf
 
-    df = yf.download("^GSPC", period="2y", interval="1d",
-                     auto_adjust=True, progress=False)
+    if start_date:
+        df = yf.download("^GSPC", start=start_date, interval="1d",
+                         auto_adjust=True, progress=False)
+    else:
+        df = yf.download("^GSPC", period="2y", interval="1d",
+                         auto_adjust=True, progress=False)
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
     df = df.dropna(how="all")
@@ -481,16 +528,152 @@ def _fetch_us_bars(DailyBar):
     return _df_to_bars(df.sort_index(), "Close", vol_col, DailyBar)
 
 
+def _last_closed_session(market: str, now: Optional[datetime] = None):
+    """Return ``(session_date, boundary)`` of the latest weekday session whose
+    index bar is final. ``boundary`` is the aware datetime it became final;
+    exchange holidays are not modelled (such a day costs one empty catch-up).
+    """
+    from zoneinfo import ZoneInfo
+
+    tz_name, close_at = _SESSION_CLOSE[market]
+    tz = ZoneInfo(tz_name)
+    local = (now or datetime.now(timezone.utc)).astimezone(tz)
+    day = local.date()
+    if local.time() < close_at:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.strftime("%Y-%m-%d"), datetime.combine(day, close_at, tzinfo=tz)
+
+
+def _checkpoint_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(STATE_DB_PATH), timeout=30)
+    conn.execute(_CHECKPOINT_DDL)
+    return conn
+
+
+def _load_checkpoint(market: str, MarketPulse):
+    """Return ``(pulse, recent_states, checked_at)`` or ``None`` (missing/unreadable)."""
+    if not STATE_DB_PATH.exists():
+        return None
+    try:
+        conn = _checkpoint_connect()
+        try:
+            row = conn.execute(
+                "SELECT checked_at, payload FROM market_pulse_checkpoint WHERE market = ?",
+                (market,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        payload = json.loads(row[1])
+        pulse = MarketPulse.from_dict(payload["pulse"])
+        return pulse, list(payload["recent_states"]), datetime.fromisoformat(row[0])
+    except (sqlite3.Error, ValueError, KeyError, TypeError) as e:
+        logger.warning("[MARKET_PULSE] checkpoint for %s unreadable, rebuilding: %s", market, e)
+        return None
+
+
+def _save_checkpoint(market: str, pulse, recent_states, checked_at: datetime) -> None:
+    payload = json.dumps({"pulse": pulse.to_dict(), "recent_states": recent_states})
+    try:
+        conn = _checkpoint_connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO market_pulse_checkpoint "
+                "(market, as_of, checked_at, payload) VALUES (?, ?, ?, ?)",
+                (market, pulse.last_date, checked_at.isoformat(), payload),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("[MARKET_PULSE] checkpoint save failed for %s: %s", market, e)
+
+
+def _fetch_bars(market: str, DailyBar, start_date: Optional[str] = None):
+    if market == "kr":
+        return _fetch_kr_bars(DailyBar, start_date=start_date)
+    return _fetch_us_bars(DailyBar, start_date=start_date)
+
+
+def _replay(market: str, mp_mod, until: Optional[str] = None):
+    """Full replay over the fetched ~400d window (bars after ``until`` dropped)."""
+    bars = _fetch_bars(market, mp_mod.DailyBar)
+    if until is not None:
+        bars = [b for b in bars if b.date <= until]
+    if not bars or len(bars) < _MIN_REPLAY_BARS:
+        raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
+    mp = mp_mod.MarketPulse()
+    states = [mp.feed(bar) for bar in bars]
+    return mp, states
+
+
+def _advance_checkpoint(market: str, mp_mod, now: Optional[datetime] = None):
+    """Bring the persisted pulse up to the latest closed session; return
+    ``(pulse, recent_states)``.
+
+    A checkpoint already checked after the latest session close is returned
+    as-is (no network). Otherwise only the bars since its ``as_of`` date are
+    fetched; the ``as_of`` bar itself must come back with the stored close, or
+    the index history was revised and the checkpoint is rebuilt by full replay.
+    Today's in-progress bar is never fed, so every process sees the same
+    close-of-session state.
+    """
+    now = now or datetime.now(timezone.utc)
+    session_date, boundary = _last_closed_session(market, now)
+    checkpoint = _load_checkpoint(market, mp_mod.MarketPulse)
+    if checkpoint is not None and checkpoint[2] >= boundary:
+        return checkpoint[0], checkpoint[1]
+
+    mp = None
+    states: list = []
+    if checkpoint is not None:
+        mp, states, _ = checkpoint
+        as_of = mp.last_date
+        bars = _fetch_bars(market, mp_mod.DailyBar, start_date=as_of)
+        anchor = next((b for b in bars or () if b.date == as_of), None)
+        if anchor is not None and math.isclose(anchor.close, mp.last_close, rel_tol=1e-6):
+            for bar in bars:
+                if as_of < bar.date <= session_date:
+                    states.append(mp.feed(bar))
+        else:
+            logger.info("[MARKET_PULSE] %s checkpoint (%s) no longer matches index history; "
+                        "rebuilding", market, as_of)
+            mp = None
+    if mp is None:
+        mp, states = _replay(market, mp_mod, until=session_date)
+
+    states = states[-_RECENT_STATES_KEPT:]
+    _save_checkpoint(market, mp, states, now)
+    return mp, states
+
+
+def _current_pulse(market: str, use_cache: bool):
+    """``(pulse, recent_states)`` for a known market.
+
+    ``use_cache=True`` goes through the persisted checkpoint; ``False`` forces a
+    fresh full replay over the fetched window and leaves the checkpoint alone.
+    """
+    mp_mod = _load_root_cores("market_pulse")
+    if use_cache:
+        return _advance_checkpoint(market, mp_mod)
+    return _replay(market, mp_mod)
+
+
 def get_market_pulse_state(market: str, use_cache: bool = True) -> Optional[str]:
-    """Compute the current Market Pulse state for ``market`` ("kr" | "us").
+    """Return the current Market Pulse state for ``market`` ("kr" | "us").
 
-    Replays :class:`cores.market_pulse.MarketPulse` over ~400 calendar days of
-    index bars and returns the final state string (UPTREND / UNDER_PRESSURE /
-    CORRECTION). Memoized per process (:data:`_STATE_CACHE`).
+    Reads the persisted :class:`cores.market_pulse.MarketPulse` checkpoint,
+    advancing it first by any sessions closed since it was saved (see
+    :func:`_advance_checkpoint`), and returns the final state string (UPTREND /
+    UNDER_PRESSURE / CORRECTION). Memoized per process (:data:`_STATE_CACHE`).
+    ``use_cache=False`` skips both and replays ~400 calendar days of index bars.
 
-    NOTE: 400 days is enough for current-state purposes (the rolling peak / DD
-    window reference stays inside this window). A state read near the window edge
-    can differ slightly from a full 6-year replay — acceptable for policy use.
+    NOTE: the first checkpoint is built from a 400-day replay, which is enough
+    for current-state purposes (the rolling peak / DD window reference stays
+    inside this window); from then on the checkpoint carries the state forward.
 
     Fail-open: ANY exception (network, auth, missing data, import) is logged as a
     warning and returns ``None`` (cached), so this never raises into a production
@@ -501,26 +684,13 @@ def get_market_pulse_state(market: str, use_cache: bool = True) -> Optional[str]
         return _STATE_CACHE[m]
 
     try:
-        mp_mod = _load_root_cores("market_pulse")
-        MarketPulse = mp_mod.MarketPulse
-        DailyBar = mp_mod.DailyBar
-
-        if m == "kr":
-            bars = _fetch_kr_bars(DailyBar)
-        elif m == "us":
-            bars = _fetch_us_bars(DailyBar)
-        else:
+        if m not in _SESSION_CLOSE:
             logger.warning("[MARKET_PULSE] unknown market %r -> None", market)
             _STATE_CACHE[m] = None
             return None
 
-        if not bars or len(bars) < 30:
-            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
-
-        mp = MarketPulse()
-        state: Optional[str] = None
-        for bar in bars:
-            state = mp.feed(bar)
+        mp, _ = _current_pulse(m, use_cache)
+        state: Optional[str] = mp.state
         _STATE_CACHE[m] = state
         return state
     except Exception as e:  # noqa: BLE001 - fail-open, never raise
@@ -538,11 +708,12 @@ def _reset_state_cache() -> None:
 
 
 def get_market_pulse_detail(market: str, use_cache: bool = True) -> Optional[MarketPulseDetail]:
-    """Compute Market Pulse state AND distribution-day count for ``market``.
+    """Return Market Pulse state AND distribution-day count for ``market``.
 
-    Replays :class:`cores.market_pulse.MarketPulse` over ~400 calendar days of
-    index bars and returns a :class:`MarketPulseDetail` with ``state``,
-    ``distribution_days``, and ``window``.  Per-process memoized (:data:`_DETAIL_CACHE`).
+    Same source as :func:`get_market_pulse_state` (persisted checkpoint, or a
+    ~400-day replay with ``use_cache=False``); returns a
+    :class:`MarketPulseDetail` with ``state``, ``distribution_days``, and
+    ``window``.  Per-process memoized (:data:`_DETAIL_CACHE`).
 
     Fail-open: ANY exception (network, auth, missing data, import) is logged as a
     warning and returns ``None``, so this never raises into the buy path.
@@ -553,34 +724,15 @@ def get_market_pulse_detail(market: str, use_cache: bool = True) -> Optional[Mar
         return _DETAIL_CACHE[m]
 
     try:
-        mp_mod = _load_root_cores("market_pulse")
-        MarketPulse = mp_mod.MarketPulse
-        DailyBar = mp_mod.DailyBar
-        dd_window = getattr(mp_mod, "DISTRIBUTION_WINDOW", 25)
-
-        if m == "kr":
-            bars = _fetch_kr_bars(DailyBar)
-        elif m == "us":
-            bars = _fetch_us_bars(DailyBar)
-        else:
+        if m not in _SESSION_CLOSE:
             logger.warning("[MARKET_PULSE_DETAIL] unknown market %r -> None", market)
             _DETAIL_CACHE[m] = None
             return None
 
-        if not bars or len(bars) < 30:
-            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
-
-        mp = MarketPulse()
-        state: Optional[str] = None
-        for bar in bars:
-            state = mp.feed(bar)
-
-        if state is None:
-            _DETAIL_CACHE[m] = None
-            return None
-
+        mp, _ = _current_pulse(m, use_cache)
+        dd_window = getattr(_load_root_cores("market_pulse"), "DISTRIBUTION_WINDOW", 25)
         detail = MarketPulseDetail(
-            state=state,
+            state=mp.state,
             distribution_days=int(mp.distribution_days),
             window=int(dd_window),
         )
@@ -653,8 +805,9 @@ def is_pilot_window(sessions_ago: Optional[int], flag_on: Optional[bool] = None)
 def pilot_reexposure_active(market: str, use_cache: bool = True) -> bool:
     """Return True when the pilot new-entry throttle applies for ``market`` ("kr" | "us").
 
-    Flag OFF -> False (no replay, zero cost). Otherwise replays MarketPulse over
-    ~400d of index bars, finds the last CORRECTION exit, and checks the window.
+    Flag OFF -> False (no lookup, zero cost). Otherwise takes the recent pulse
+    states kept with the checkpoint (or a ~400d replay with ``use_cache=False``),
+    finds the last CORRECTION exit, and checks the window.
     Memoized per process (:data:`_PILOT_CACHE`). Fail-open: ANY error -> False
     (정상 진입), so this never raises into a production buy path.
     """
@@ -664,24 +817,12 @@ def pilot_reexposure_active(market: str, use_cache: bool = True) -> bool:
     if use_cache and m in _PILOT_CACHE:
         return _PILOT_CACHE[m]
     try:
-        mp_mod = _load_root_cores("market_pulse")
-        MarketPulse = mp_mod.MarketPulse
-        DailyBar = mp_mod.DailyBar
-
-        if m == "kr":
-            bars = _fetch_kr_bars(DailyBar)
-        elif m == "us":
-            bars = _fetch_us_bars(DailyBar)
-        else:
+        if m not in _SESSION_CLOSE:
             logger.warning("[PULSE_PILOT] unknown market %r -> full size", market)
             _PILOT_CACHE[m] = False
             return False
 
-        if not bars or len(bars) < 30:
-            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
-
-        mp = MarketPulse()
-        states = [mp.feed(bar) for bar in bars]
+        _, states = _current_pulse(m, use_cache)
         ago = _sessions_since_correction_exit(states)
         active = is_pilot_window(ago, flag_on=True)
         _PILOT_CACHE[m] = active
@@ -1,9 +1,13 @@
+import contextlib
+
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from cores.agents.report_agent import ReportAgent
 from cores.llm.agent_bridge import ensure_openai_agents_configured
 from cores.llm.backends.openai_agents_backend import OpenAIAgentsBackend
 from cores.llm.config_loader import load_report_mcp_registry
 from cores.llm.ports import AgentSpec, LLMParams
+from cores.llm import telemetry as llm_telemetry
+from cores.llm.telemetry import instrument
 
 import os
 from cores.openai_error_logging import log_openai_error
@@ -22,7 +26,7 @@ def _get_report_backend():
     global _report_backend
     if _report_backend is None:
         ensure_openai_agents_configured()
-        _report_backend = OpenAIAgentsBackend(load_report_mcp_registry())
+        _report_backend = instrument(OpenAIAgentsBackend(load_report_mcp_registry()))
     return _report_backend
 
 
@@ -32,8 +36,13 @@ async def _generate_agent_text(
     *,
     max_tokens: int,
     max_iterations: int,
+    section: str | None = None,
 ) -> str:
-    """Run one SDK-neutral report definition through the shared LLM port."""
+    """Run one SDK-neutral report definition through the shared LLM port.
+
+    ``section`` labels the telemetry span unless the caller already opened a
+    telemetry section (which also counts retries across attempts).
+    """
     spec = AgentSpec(
         name=agent.name,
         instructions=agent.instruction,
@@ -46,7 +55,13 @@ async def _generate_agent_text(
             max_iterations=max_iterations,
         ),
     )
-    result = await _get_report_backend().run(spec, message)
+    scope = (
+        llm_telemetry.section(section)
+        if section and llm_telemetry.current_section() is None
+        else contextlib.nullcontext()
+    )
+    with scope:
+        result = await _get_report_backend().run(spec, message)
     return result.text
 
 
@@ -150,6 +165,7 @@ async def generate_report(agent, section, company_name, company_code, reference_
             message,
             max_tokens=32000,
             max_iterations=10,
+            section=section,
         )
     except Exception as e:
         log_openai_error(logger, e, f"report generation for {section}")
@@ -238,6 +254,7 @@ async def generate_market_report(agent, section, reference_date, logger, languag
             message,
             max_tokens=32000,
             max_iterations=3,
+            section=section,
         )
     except Exception as e:
         log_openai_error(logger, e, f"market report generation for {section}")
@@ -342,6 +359,7 @@ Comprehensive Analysis Report:
             message,
             max_tokens=16000,
             max_iterations=2,
+            section="executive_summary",
         )
         return executive_summary
     except Exception as e:
@@ -570,6 +588,7 @@ Please present a consistent and executable investment strategy that investors ca
             message,
             max_tokens=32000,
             max_iterations=3,
+            section="investment_strategy",
         )
         logger.info(f"Completed investment_strategy - {len(investment_strategy)} characters")
         return investment_strategy
@@ -0,0 +1,331 @@
+"""
+Translation Service for Telegram Broadcasts
+
+Every broadcast path (analysis messages, trigger alerts, tracking messages,
+translated PDF reports) used to translate message x language serially, one
+fresh LLM run per call, with a send sleep in between. Translated channels
+went out minutes after the Korean originals, and identical boilerplate was
+re-translated every batch.
+
+This service:
+- fans out (message x language) jobs concurrently, capped by
+  TRANSLATION_CONCURRENCY in-flight LLM calls per process
+- keeps a persistent translation memory (sqlite) keyed by
+  (source hash, from_lang, to_lang, model)
+- splits templated messages into fixed boilerplate and variable spans:
+  numbers, percentages and dates are masked with <<<__VAR_N__>>>
+  placeholders (amounts with a unit like 억원/조/만원 are not), so "삼성전자 +3.2%" and "삼성전자 +1.1%" share one memory
+  entry and only the boilerplate is ever sent to the LLM
+- single-flights identical in-flight jobs, so two channels asking for the
+  same translation wait on one LLM call
+
+Failed translations are never stored. The LLM call itself is injected
+(``translate_fn``) so this module has no agent framework dependency; the
+telegram translator agent owns the shared instance.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MEMORY_DB_PATH = Path(os.getenv("PRISM_TRANSLATION_MEMORY_DB", str(PROJECT_ROOT / "translation_memory.sqlite")))
+
+# Concurrent LLM translation calls per process
+TRANSLATION_CONCURRENCY = int(os.getenv("PRISM_TRANSLATION_CONCURRENCY", "4"))
+
+# Templating only pays off (and is only reliable) for message-sized text with
+# a moderate number of variable spans; long reports are memorised verbatim.
+TEMPLATE_MAX_CHARS = 4096
+TEMPLATE_MAX_VARS = 40
+
+# Korean unit suffixes the model must see with their number: "1,234억원" and
+# "8만원" only become English amounts when translated whole
+_UNIT_SUFFIXES = "천만억조원주"
+
+# Numbers with separators/decimals, optional sign and %; dates like 2025.01.10.
+# A number followed by a unit suffix stays in the boilerplate.
+_VARIABLE_RE = re.compile(
+    r"(?<![\w<])[+\-]?\d{4}[./-]\d{1,2}[./-]\d{1,2}(?!\w)"
+    r"|(?<![\w<])(?<!\d[,.])[+\-]?\d[\d,]*(?:\.\d+)?%?"
+    rf"(?![\d,]|\.\d|\s?[{_UNIT_SUFFIXES}])"
+)
+_PLACEHOLDER = "<<<__VAR_{}__>>>"
+_PLACEHOLDER_RE = re.compile(r"<<<__VAR_(\d+)__>>>")
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS translation_memory (
+    source_hash  TEXT NOT NULL,
+    from_lang    TEXT NOT NULL,
+    to_lang      TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    translated   TEXT NOT NULL,
+    source_chars INTEGER,
+    created_at   TEXT NOT NULL,
+    hit_count    INTEGER NOT NULL DEFAULT 0,
+    last_hit_at  TEXT,
+    PRIMARY KEY (source_hash, from_lang, to_lang, model)
+)
+"""
+
+TranslateFn = Callable[[str, str, str, str], Awaitable[str]]
+
+
+def split_template(message: str) -> Tuple[str, List[str]]:
+    """Mask variable spans (numbers, dates, percentages) with placeholders.
+
+    Returns:
+        (template, values) — ``fill_template(template, values)`` restores the message
+    """
+    values: List[str] = []
+
+    def _mask(match: re.Match) -> str:
+        values.append(match.group(0))
+        return _PLACEHOLDER.format(len(values) - 1)
+
+    template = _VARIABLE_RE.sub(_mask, message)
+    return template, values
+
+
+def fill_template(template: str, values: Sequence[str]) -> Optional[str]:
+    """Put variable spans back into a (translated) template.
+
+    Returns:
+        The filled text, or None if the template lost or invented placeholders
+    """
+    found = sorted(int(n) for n in _PLACEHOLDER_RE.findall(template))
+    if found != list(range(len(values))):
+        return None
+    return _PLACEHOLDER_RE.sub(lambda m: values[int(m.group(1))], template)
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """Persistent translation memory (sqlite).
+
+    Calls are blocking; the service runs them in a worker thread.
+    """
+
+    busy_timeout = 5.0
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or MEMORY_DB_PATH)
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout)
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.execute(_DDL)
+                    conn.commit()
+                    self._schema_ready = True
+        return conn
+
+    def get(self, text: str, from_lang: str, to_lang: str, model: str) -> Optional[str]:
+        key = (source_hash(text), from_lang, to_lang, model)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT translated FROM translation_memory "
+                "WHERE source_hash = ? AND from_lang = ? AND to_lang = ? AND model = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE translation_memory SET hit_count = hit_count + 1, last_hit_at = ? "
+                    "WHERE source_hash = ? AND from_lang = ? AND to_lang = ? AND model = ?",
+                    (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), *key),
+                )
+                conn.commit()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def put(self, text: str, from_lang: str, to_lang: str, model: str, translated: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO translation_memory "
+                "(source_hash, from_lang, to_lang, model, translated, source_chars, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source_hash(text), from_lang, to_lang, model, translated, len(text),
+                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            entries, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM translation_memory"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {"entries": entries, "hits": hits}
+
+
+class TranslationService:
+    """Concurrent, memoised message translation.
+
+    Args:
+        translate_fn: ``async (text, model, from_lang, to_lang) -> str``; must
+            raise on failure (a fallback result would otherwise be memorised)
+        memory: TranslationMemory (None disables persistence)
+        concurrency: Max in-flight ``translate_fn`` calls
+    """
+
+    def __init__(
+        self,
+        translate_fn: TranslateFn,
+        memory: Optional[TranslationMemory] = None,
+        concurrency: int = TRANSLATION_CONCURRENCY,
+    ):
+        self._translate_fn = translate_fn
+        self.memory = memory
+        self.concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.stats = {"memory_hits": 0, "llm_calls": 0, "template_fallbacks": 0, "failures": 0}
+
+    def _limiter(self) -> asyncio.Semaphore:
+        # Callers run under separate asyncio.run() loops; a semaphore is loop-bound
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+            self._inflight = {}
+        return self._semaphore
+
+    async def _memory_get(self, text: str, from_lang: str, to_lang: str, model: str) -> Optional[str]:
+        if self.memory is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.memory.get, text, from_lang, to_lang, model)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory read failed: {e}")
+            return None
+
+    async def _memory_put(self, text: str, from_lang: str, to_lang: str, model: str, translated: str) -> None:
+        if self.memory is None:
+            return
+        try:
+            await asyncio.to_thread(self.memory.put, text, from_lang, to_lang, model, translated)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory write failed: {e}")
+
+    async def _translate_text(self, text: str, model: str, from_lang: str, to_lang: str) -> str:
+        """Memory lookup, then one shared LLM call per (text, langs, model)."""
+        cached = await self._memory_get(text, from_lang, to_lang, model)
+        if cached is not None:
+            self.stats["memory_hits"] += 1
+            return cached
+
+        limiter = self._limiter()
+        key = (source_hash(text), from_lang, to_lang, model)
+        while key in self._inflight:
+            future = self._inflight[key]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller that owned the call gave up; the first waiter takes it over
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with limiter:
+                self.stats["llm_calls"] += 1
+                translated = await self._translate_fn(text, model, from_lang, to_lang)
+            await self._memory_put(text, from_lang, to_lang, model, translated)
+            future.set_result(translated)
+            return translated
+        except asyncio.CancelledError:
+            future.cancel()  # waiters retry rather than fail with it
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise; mark retrieved for the no-waiter case
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def translate(self, message: str, model: str, from_lang: str = "ko", to_lang: str = "en") -> str:
+        """Translate one message (raises if the LLM call fails).
+
+        Message-sized text is translated as a template with its variable spans
+        masked; if the model drops or invents a placeholder, the full message
+        is translated instead.
+        """
+        if not message.strip():
+            return message
+        if len(message) <= TEMPLATE_MAX_CHARS:
+            template, values = split_template(message)
+            if values and len(values) <= TEMPLATE_MAX_VARS:
+                translated_template = await self._translate_text(template, model, from_lang, to_lang)
+                filled = fill_template(translated_template, values)
+                if filled is not None:
+                    return filled
+                self.stats["template_fallbacks"] += 1
+                logger.warning("Translated template lost placeholders; translating full message")
+        return await self._translate_text(message, model, from_lang, to_lang)
+
+    async def translate_or_original(self, message: str, model: str, from_lang: str = "ko", to_lang: str = "en") -> str:
+        """Like ``translate`` but falls back to the original message on failure."""
+        try:
+            return await self.translate(message, model, from_lang, to_lang)
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.error(f"Translation to {to_lang} failed: {str(e)}. Using original message.")
+            return message
+
+    def schedule(
+        self,
+        messages: Sequence[str],
+        to_langs: Sequence[str],
+        model: str,
+        from_lang: str = "ko",
+    ) -> Dict[str, List[asyncio.Task]]:
+        """Start every (message x language) translation now.
+
+        Returns:
+            Dict of language -> tasks in message order; each task resolves to
+            the translation, or the original message if translation failed.
+            Senders await them in order, so a channel's first message goes out
+            as soon as it is translated rather than after the whole batch.
+        """
+        return {
+            lang: [
+                asyncio.create_task(self.translate_or_original(message, model, from_lang, lang))
+                for message in messages
+            ]
+            for lang in dict.fromkeys(to_langs)
+        }
+
+    async def translate_many(
+        self,
+        messages: Sequence[str],
+        to_langs: Sequence[str],
+        model: str,
+        from_lang: str = "ko",
+    ) -> Dict[str, List[str]]:
+        """Translate messages into every language concurrently (originals on failure)."""
+        scheduled = self.schedule(messages, to_langs, model, from_lang)
+        return {lang: list(await asyncio.gather(*tasks)) for lang, tasks in scheduled.items()}
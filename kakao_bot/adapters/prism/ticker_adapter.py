@@ -16,7 +16,7 @@ from kakao_bot.ports.analysis import (
     ResolvedTicker,
     TickerResolution,
 )
-from prism_core.ticker_resolver import resolve_ticker
+from prism_core.ticker_resolver import TickerIndex, resolve_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,7 @@ class PrismTickerResolver:
         self._path = Path(stock_map_path)
         self._code_to_name: Mapping[str, str] = {}
         self._name_to_code: Mapping[str, str] = {}
+        self._index: TickerIndex | None = None
         self._load()
 
     def _load(self) -> None:
@@ -48,6 +49,7 @@ class PrismTickerResolver:
 
         self._code_to_name = data.get("code_to_name", {}) or {}
         self._name_to_code = data.get("name_to_code", {}) or {}
+        self._index = TickerIndex.from_stock_map(data)
         logger.info("Loaded %d KR stock entries", len(self._code_to_name))
 
     @property
@@ -82,6 +84,7 @@ class PrismTickerResolver:
             text,
             code_to_name=self._code_to_name,
             name_to_code=self._name_to_code,
+            index=self._index,
         )
         if error or not code:
             return TickerResolution(
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
         campaign_id_for,
         publish_batch_campaign_best_effort,
         publish_batch_event_best_effort,
+        publish_batch_events_best_effort,
         publish_batch_reports_best_effort,
         publish_batch_tracking_story_best_effort,
     )
@@ -42,6 +43,7 @@ __all__ = [
     "campaign_id_for",
     "publish_batch_campaign_best_effort",
     "publish_batch_event_best_effort",
+    "publish_batch_events_best_effort",
     "publish_batch_reports_best_effort",
     "publish_batch_tracking_story_best_effort",
 ]
@@ -59,6 +61,7 @@ _EXPORT_MODULES = {
     "campaign_id_for": "messaging.batch_campaign_publisher",
     "publish_batch_campaign_best_effort": "messaging.batch_campaign_publisher",
     "publish_batch_event_best_effort": "messaging.batch_campaign_publisher",
+    "publish_batch_events_best_effort": "messaging.batch_campaign_publisher",
     "publish_batch_reports_best_effort": "messaging.batch_campaign_publisher",
     "publish_batch_tracking_story_best_effort": "messaging.batch_campaign_publisher",
 }
@@ -388,6 +388,25 @@ class BatchCampaignPublisher:
             logger.warning("Batch campaign publish failed (ignored): %s", exc)
             return None
 
+    async def publish_many(
+        self, events: Sequence[Mapping[str, Any]]
+    ) -> list[Optional[str]]:
+        """Queue a batch run's events in one transaction, one outcome each."""
+        if self._queue is None or not events:
+            return [None] * len(events)
+        try:
+            outcomes = list(self._queue.enqueue_many(events))
+        except Exception as exc:  # fail-open by contract
+            logger.warning("Batch campaign publish failed (ignored): %s", exc)
+            return [None] * len(events)
+        logger.info(
+            "Batch campaign events queued locally: %s (created=%d of %d)",
+            events[0].get("campaign_id"),
+            sum(outcome is not None for outcome in outcomes),
+            len(events),
+        )
+        return outcomes
+
 
 async def publish_batch_campaign_best_effort(**event_fields: Any) -> Optional[str]:
     """Build and publish an event without propagating any failure to callers."""
@@ -422,6 +441,25 @@ async def publish_batch_event_best_effort(
             await publisher.disconnect()
 
 
+async def publish_batch_events_best_effort(
+    events: Sequence[Mapping[str, Any]],
+) -> list[Optional[str]]:
+    """Publish a batch run's story events through one queue connection."""
+    if not events:
+        return []
+    publisher: Optional[BatchCampaignPublisher] = None
+    try:
+        publisher = BatchCampaignPublisher()
+        await publisher.connect()
+        return await publisher.publish_many(events)
+    except Exception as exc:
+        logger.warning("Batch story hook failed (ignored): %s", exc)
+        return [None] * len(events)
+    finally:
+        if publisher is not None:
+            await publisher.disconnect()
+
+
 async def publish_batch_reports_best_effort(
     *,
     market: str,
@@ -447,7 +485,7 @@ async def publish_batch_reports_best_effort(
         if message:
             summaries[ticker.upper()] = (company_name, message)
 
-    published = 0
+    events = []
     for raw_path in pdf_paths:
         path = Path(str(raw_path))
         parts = path.stem.split("_")
@@ -471,8 +509,9 @@ async def publish_batch_reports_best_effort(
         except Exception as exc:
             logger.warning("Could not build Kakao report event for %s: %s", path, exc)
             continue
-        published += int(await publish_batch_event_best_effort(event) is not None)
-    return published
+        events.append(event)
+    outcomes = await publish_batch_events_best_effort(events)
+    return sum(outcome is not None for outcome in outcomes)
 
 
 async def publish_batch_tracking_story_best_effort(
@@ -525,7 +564,5 @@ async def publish_batch_tracking_story_best_effort(
             )
         )
 
-    published = 0
-    for event in events:
-        published += int(await publish_batch_event_best_effort(event) is not None)
-    return published
+    outcomes = await publish_batch_events_best_effort(events)
+    return sum(outcome is not None for outcome in outcomes)
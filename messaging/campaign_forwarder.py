@@ -20,18 +20,22 @@ need the Kakao stack installed to run it.
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import logging
+import struct
 
 # ssh is invoked with a fixed argv list and shell=False; the only caller-supplied
 # value is the payload, and that goes in on stdin.
 import subprocess  # nosec B404
-from collections.abc import Mapping, Sequence
+import tempfile
+import threading
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Protocol
+from typing import IO, Protocol
 
 from messaging.local_campaign_queue import SQLiteBatchCampaignQueue
 
@@ -39,6 +43,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SSH_TIMEOUT = 60
 
+# Session framing: a 4-byte big-endian length, then that many bytes of UTF-8
+# JSON. Artifacts ride inside the frames as base64, so a raw chunk has to stay
+# well under the frame limit.
+_FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 4 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 512 * 1024
+
 
 @dataclass(frozen=True)
 class CampaignForwardRunResult:
@@ -62,6 +73,52 @@ class CampaignShipper(Protocol):
         """
 
 
+class CampaignBatchShipper(CampaignShipper, Protocol):
+    def ship_batch(
+        self, payloads: Sequence[Mapping[str, object]]
+    ) -> list[bool | Exception]:
+        """Place several events on the remote queue in one go.
+
+        Returns one outcome per payload, in order: True/False as for
+        ``ship``, or the exception that kept that event from landing. Only
+        the entries that failed are retried.
+        """
+
+
+def encode_frame(message: Mapping[str, object]) -> bytes:
+    body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    if len(body) > MAX_FRAME_BYTES:
+        raise ValueError(f"frame of {len(body)} bytes exceeds {MAX_FRAME_BYTES}")
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+def read_frame(stream: IO[bytes]) -> dict | None:
+    """Read one frame; None on a clean end of stream."""
+    header = stream.read(_FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _FRAME_HEADER.size:
+        raise ValueError("truncated frame header")
+    (length,) = _FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+    body = stream.read(length)
+    if len(body) < length:
+        raise ValueError("truncated frame")
+    message = json.loads(body)
+    if not isinstance(message, dict):
+        raise ValueError("frame is not a JSON object")
+    return message
+
+
+def remote_artifact_name(event_id: str) -> str:
+    # Hash-only: the local file name is company-named and may hold anything.
+    digest = hashlib.sha256(event_id.encode("utf-8")).hexdigest()[:16]
+    return f"{digest}.pdf"
+
+
 # The remote half ships with the repo. Sending it inline as `python -c` does
 # not survive the hop: ssh joins its trailing arguments into one string for the
 # *remote shell*, which then splits a multi-line script into separate commands
@@ -144,7 +201,7 @@ class SshCampaignShipper:
             )
         return completed.stdout.strip().endswith("NEW")
 
-    def _copy_artifact(self, artifact_path: str, *, event_id: str) -> str:
+    def _local_artifact(self, artifact_path: str) -> Path:
         if not self._remote_artifact_root:
             raise RuntimeError("remote artifact root is not configured")
         source = Path(artifact_path).resolve()
@@ -156,8 +213,13 @@ class SshCampaignShipper:
             raise RuntimeError(
                 f"report artifact is outside the allowed roots: {source}"
             )
-        digest = hashlib.sha256(event_id.encode("utf-8")).hexdigest()[:16]
-        remote_path = f"{self._remote_artifact_root}/{digest}.pdf"
+        return source
+
+    def _copy_artifact(self, artifact_path: str, *, event_id: str) -> str:
+        source = self._local_artifact(artifact_path)
+        remote_path = (
+            f"{self._remote_artifact_root}/{remote_artifact_name(event_id)}"
+        )
         command = [self._scp_binary, "-q", "-o", "BatchMode=yes"]
         if self._identity_file:
             command += ["-i", self._identity_file]
@@ -193,13 +255,201 @@ class SshCampaignShipper:
         return remote_path
 
 
+class SshSessionCampaignShipper(SshCampaignShipper):
+    """Ship a whole claimed batch over one SSH session.
+
+    `SshCampaignShipper` pays a handshake per event, plus an scp and a chmod
+    per report artifact, so a story of a dozen events cost three dozen
+    connections. This starts the remote entrypoint once in ``--stream`` mode
+    and writes length-framed JSON to it: each event, with its report bytes
+    inline when they fit one chunk and as preceding chunk frames otherwise.
+    The remote answers every event with its own NEW/DUPLICATE/ERROR frame, so
+    one bad event does not fail its neighbours, and anything left
+    unanswered when the session dies is retried.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        if not 0 < chunk_bytes <= MAX_FRAME_BYTES // 2:
+            raise ValueError(
+                f"chunk_bytes must be between 1 and {MAX_FRAME_BYTES // 2}"
+            )
+        self._chunk_bytes = chunk_bytes
+        self.stats = {"sessions": 0, "events": 0, "artifact_bytes": 0}
+
+    def _command(self) -> list[str]:
+        command = super()._command() + ["--stream"]
+        if self._remote_artifact_root:
+            command += ["--artifact-root", self._remote_artifact_root]
+        return command
+
+    def ship(self, payload: Mapping[str, object]) -> bool:
+        [outcome] = self.ship_batch([payload])
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def ship_batch(
+        self, payloads: Sequence[Mapping[str, object]]
+    ) -> list[bool | Exception]:
+        if not payloads:
+            return []
+        outcomes: list[bool | Exception | None] = [None] * len(payloads)
+        expired = threading.Event()
+        failure = ""
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(  # nosec B603
+                self._command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+            self.stats["sessions"] += 1
+
+            def expire() -> None:
+                expired.set()
+                process.kill()
+
+            def arm() -> threading.Timer:
+                # The per-event timeout restarts with every reply, so a long
+                # batch of report events is not held to one event's budget.
+                timer = threading.Timer(self._timeout, expire)
+                timer.daemon = True
+                timer.start()
+                return timer
+
+            writer = threading.Thread(
+                target=self._write_batch,
+                args=(process.stdin, payloads, outcomes),
+                daemon=True,
+            )
+            timer = arm()
+            writer.start()
+            try:
+                while (ack := read_frame(process.stdout)) is not None:
+                    timer.cancel()
+                    timer = arm()
+                    seq = ack.get("seq")
+                    if not isinstance(seq, int) or not 0 <= seq < len(payloads):
+                        raise ValueError(f"acknowledgement for unknown entry {seq!r}")
+                    outcomes[seq] = _ack_outcome(ack)
+            except ValueError as exc:
+                failure = f"remote session protocol error: {exc}"
+                process.kill()
+            finally:
+                writer.join()
+                returncode = process.wait()
+                timer.cancel()
+            if not failure:
+                stderr.seek(0)
+                failure = (
+                    f"remote session sent no reply for {self._timeout}s"
+                    if expired.is_set()
+                    else f"remote session ended before acknowledging "
+                    f"(rc={returncode}): "
+                    f"{stderr.read().decode('utf-8', 'replace').strip()[:300]}"
+                )
+        return [
+            RuntimeError(failure) if outcome is None else outcome
+            for outcome in outcomes
+        ]
+
+    def _write_batch(
+        self,
+        stream: IO[bytes],
+        payloads: Sequence[Mapping[str, object]],
+        outcomes: list[bool | Exception | None],
+    ) -> None:
+        try:
+            for seq, payload in enumerate(payloads):
+                frames = self._frames(seq, payload)
+                while True:
+                    try:
+                        frame = next(frames)
+                    except StopIteration:
+                        break
+                    except Exception as exc:  # noqa: BLE001 - this entry only
+                        outcomes[seq] = exc
+                        break
+                    stream.write(frame)
+                stream.flush()
+        except OSError:
+            # The remote went away; the entries it never acknowledged say so.
+            pass
+        finally:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _frames(self, seq: int, payload: Mapping[str, object]) -> Iterator[bytes]:
+        outbound = dict(payload)
+        message: dict[str, object] = {"kind": "event", "seq": seq}
+        artifact = outbound.get("artifact_path")
+        if artifact is not None:
+            source = self._local_artifact(str(artifact))
+            name = remote_artifact_name(str(outbound.get("event_id") or ""))
+            outbound["artifact_path"] = f"{self._remote_artifact_root}/{name}"
+            digest = hashlib.sha256()
+            with source.open("rb") as handle:
+                data = handle.read(self._chunk_bytes)
+                tail = handle.read(self._chunk_bytes)
+                if not tail:
+                    digest.update(data)
+                    size = len(data)
+                    message["artifact"] = {
+                        "name": name,
+                        "size": size,
+                        "sha256": digest.hexdigest(),
+                        "data": base64.b64encode(data).decode("ascii"),
+                    }
+                else:
+                    size = 0
+                    while data:
+                        yield encode_frame(
+                            {
+                                "kind": "chunk",
+                                "name": name,
+                                "offset": size,
+                                "data": base64.b64encode(data).decode("ascii"),
+                            }
+                        )
+                        digest.update(data)
+                        size += len(data)
+                        data, tail = tail, handle.read(self._chunk_bytes)
+                    message["artifact"] = {
+                        "name": name,
+                        "size": size,
+                        "sha256": digest.hexdigest(),
+                    }
+            self.stats["artifact_bytes"] += size
+        message["payload"] = outbound
+        self.stats["events"] += 1
+        yield encode_frame(message)
+
+
+def _ack_outcome(ack: Mapping[str, object]) -> bool | Exception:
+    status = ack.get("status")
+    if status == "NEW":
+        return True
+    if status == "DUPLICATE":
+        return False
+    error = str(ack.get("error") or status)
+    return RuntimeError(f"remote enqueue failed: {error[:300]}")
+
+
 class CampaignForwarder:
     """Claim local queue events and hand them to the remote bot host."""
 
     def __init__(
         self,
         queue: SQLiteBatchCampaignQueue,
-        shipper: CampaignShipper,
+        shipper: CampaignShipper | CampaignBatchShipper,
         *,
         lease_owner: str,
         lease_seconds: int = 60,
@@ -232,12 +482,9 @@ class CampaignForwarder:
             limit=self._batch_size,
         )
 
-        forwarded = 0
-        duplicate = 0
-        retry_scheduled = 0
         dead = 0
         stale_lease = 0
-
+        due = []
         for entry in entries:
             if entry.attempt_count > self._max_attempts:
                 marked = self._queue.mark_dead(
@@ -253,38 +500,40 @@ class CampaignForwarder:
                     entry.attempt_count,
                 )
                 continue
+            due.append(entry)
 
-            try:
-                accepted = self._shipper.ship(entry.payload)
-            except Exception as exc:  # noqa: BLE001 - retried on the next run
+        outcomes = self._ship([entry.payload for entry in due])
+        shipped: dict[int, bool] = {}
+        failed: dict[int, str] = {}
+        for entry, outcome in zip(due, outcomes):
+            if isinstance(outcome, Exception):
                 logger.warning(
-                    "Forwarding campaign %s failed: %s", entry.campaign_id, exc
+                    "Forwarding campaign %s failed: %s", entry.campaign_id, outcome
                 )
-                marked = self._queue.release(
-                    entry.queue_id,
-                    lease_owner=self._lease_owner,
-                    next_attempt_at=run_at + timedelta(seconds=self._retry_seconds),
-                    error=str(exc) or type(exc).__name__,
-                )
-                retry_scheduled += int(marked)
-                stale_lease += int(not marked)
+                failed[entry.queue_id] = str(outcome) or type(outcome).__name__
                 continue
-
-            marked = self._queue.acknowledge(
-                entry.queue_id,
-                lease_owner=self._lease_owner,
-                consumed_at=run_at,
-            )
-            stale_lease += int(not marked)
-            if marked:
-                forwarded += int(accepted)
-                duplicate += int(not accepted)
+            shipped[entry.queue_id] = outcome
             logger.info(
                 "Forwarded campaign %s (%s)",
                 entry.campaign_id,
-                "new" if accepted else "already present",
+                "new" if outcome else "already present",
             )
 
+        consumed = self._queue.acknowledge_many(
+            list(shipped),
+            lease_owner=self._lease_owner,
+            consumed_at=run_at,
+        )
+        released = self._queue.release_many(
+            failed,
+            lease_owner=self._lease_owner,
+            next_attempt_at=run_at + timedelta(seconds=self._retry_seconds),
+        )
+        forwarded = sum(shipped[queue_id] for queue_id in consumed)
+        duplicate = len(consumed) - forwarded
+        retry_scheduled = len(released)
+        stale_lease += len(shipped) - len(consumed) + len(failed) - len(released)
+
         return CampaignForwardRunResult(
             claimed=len(entries),
             forwarded=forwarded,
@@ -294,6 +543,25 @@ class CampaignForwarder:
             stale_lease=stale_lease,
         )
 
+    def _ship(
+        self, payloads: Sequence[Mapping[str, object]]
+    ) -> list[bool | Exception]:
+        if not payloads:
+            return []
+        ship_batch = getattr(self._shipper, "ship_batch", None)
+        if ship_batch is not None:
+            try:
+                return list(ship_batch(payloads))
+            except Exception as exc:  # noqa: BLE001 - retried on the next run
+                return [exc] * len(payloads)
+        outcomes: list[bool | Exception] = []
+        for payload in payloads:
+            try:
+                outcomes.append(self._shipper.ship(payload))
+            except Exception as exc:  # noqa: BLE001 - retried on the next run
+                outcomes.append(exc)
+        return outcomes
+
 
 def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
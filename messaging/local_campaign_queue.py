@@ -9,7 +9,7 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Mapping
+from typing import Mapping, Sequence
 
 
 @dataclass(frozen=True)
@@ -119,6 +119,55 @@ class SQLiteBatchCampaignQueue:
         self._connection.close()
 
     def enqueue(self, payload: Mapping[str, object]) -> str | None:
+        return self._insert((self._row(payload),))[0]
+
+    def enqueue_many(
+        self, payloads: Sequence[Mapping[str, object]]
+    ) -> tuple[str | None, ...]:
+        """Insert several events in one transaction.
+
+        Returns, per payload and in order, its queue id when it was inserted
+        and None when the queue already had it, including a repeat earlier in
+        the same list. A payload without an id or that cannot be serialized
+        is None too; it does not stop the others from being written.
+        """
+        rows: list[tuple[str, str, str] | None] = []
+        for payload in payloads:
+            try:
+                rows.append(self._row(payload))
+            except (TypeError, ValueError):
+                rows.append(None)
+        return self._insert(rows)
+
+    def _insert(
+        self, rows: Sequence[tuple[str, str, str] | None]
+    ) -> tuple[str | None, ...]:
+        outcomes: list[str | None] = []
+        seen: set[str] = set()
+        with self._connection:
+            for row in rows:
+                if row is None or row[0] in seen:
+                    outcomes.append(None)
+                    continue
+                campaign_id, payload_json, timestamp = row
+                seen.add(campaign_id)
+                cursor = self._connection.execute(
+                    """
+                    INSERT OR IGNORE INTO prism_batch_campaign_queue(
+                        campaign_id,
+                        payload_json,
+                        status,
+                        created_at
+                    )
+                    VALUES (?, ?, 'PENDING', ?)
+                    """,
+                    (campaign_id, payload_json, timestamp),
+                )
+                outcomes.append(campaign_id if cursor.rowcount == 1 else None)
+        return tuple(outcomes)
+
+    @staticmethod
+    def _row(payload: Mapping[str, object]) -> tuple[str, str, str]:
         # A screening campaign has one event and historically used campaign_id
         # as its queue key.  The automatic batch story adds report, decision,
         # and portfolio events under that same campaign, so those events carry
@@ -133,29 +182,13 @@ class SQLiteBatchCampaignQueue:
             if isinstance(created_at, str) and created_at.strip()
             else _utc_iso(datetime.now(timezone.utc))
         )
-        with self._connection:
-            cursor = self._connection.execute(
-                """
-                INSERT OR IGNORE INTO prism_batch_campaign_queue(
-                    campaign_id,
-                    payload_json,
-                    status,
-                    created_at
-                )
-                VALUES (?, ?, 'PENDING', ?)
-                """,
-                (
-                    campaign_id.strip(),
-                    json.dumps(
-                        dict(payload),
-                        ensure_ascii=False,
-                        separators=(",", ":"),
-                        sort_keys=True,
-                    ),
-                    timestamp,
-                ),
-            )
-        return campaign_id.strip() if cursor.rowcount == 1 else None
+        payload_json = json.dumps(
+            dict(payload),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        return campaign_id.strip(), payload_json, timestamp
 
     def claim(
         self,
@@ -274,6 +307,41 @@ class SQLiteBatchCampaignQueue:
             )
         return cursor.rowcount == 1
 
+    def acknowledge_many(
+        self,
+        queue_ids: Sequence[int],
+        *,
+        lease_owner: str,
+        consumed_at: datetime,
+    ) -> frozenset[int]:
+        """Acknowledge a shipped batch in one transaction.
+
+        Returns the ids that were still leased to ``lease_owner``; the rest
+        lost their lease mid-run and belong to whoever reclaimed them.
+        """
+        consumed_iso = _utc_iso(consumed_at)
+        marked: set[int] = set()
+        with self._connection:
+            for queue_id in queue_ids:
+                cursor = self._connection.execute(
+                    """
+                    UPDATE prism_batch_campaign_queue
+                    SET
+                        status = 'CONSUMED',
+                        consumed_at = ?,
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        last_error = NULL
+                    WHERE id = ?
+                      AND status = 'SENDING'
+                      AND lease_owner = ?
+                    """,
+                    (consumed_iso, queue_id, lease_owner),
+                )
+                if cursor.rowcount == 1:
+                    marked.add(queue_id)
+        return frozenset(marked)
+
     def release(
         self,
         queue_id: int,
@@ -305,6 +373,41 @@ class SQLiteBatchCampaignQueue:
             )
         return cursor.rowcount == 1
 
+    def release_many(
+        self,
+        errors: Mapping[int, str],
+        *,
+        lease_owner: str,
+        next_attempt_at: datetime,
+    ) -> frozenset[int]:
+        """Put failed entries back for retry in one transaction.
+
+        ``errors`` maps queue id to the error recorded for it. Returns the
+        ids that were still leased to ``lease_owner``.
+        """
+        next_attempt_iso = _utc_iso(next_attempt_at)
+        marked: set[int] = set()
+        with self._connection:
+            for queue_id, error in errors.items():
+                cursor = self._connection.execute(
+                    """
+                    UPDATE prism_batch_campaign_queue
+                    SET
+                        status = 'PENDING',
+                        next_attempt_at = ?,
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        last_error = ?
+                    WHERE id = ?
+                      AND status = 'SENDING'
+                      AND lease_owner = ?
+                    """,
+                    (next_attempt_iso, error[:1_000], queue_id, lease_owner),
+                )
+                if cursor.rowcount == 1:
+                    marked.add(queue_id)
+        return frozenset(marked)
+
     def mark_dead(
         self,
         queue_id: int,
@@ -13,11 +13,14 @@ Usage:
 from dotenv import load_dotenv
 load_dotenv()
 
+import math
 import sqlite3
 import argparse
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 # Logging setup
@@ -53,14 +56,20 @@ class PerformanceTrackerBatch:
     # Tracking day thresholds
     TRACK_DAYS = [7, 14, 30]
 
-    def __init__(self, db_path: str = None, dry_run: bool = False):
+    # Default number of tickers fetched concurrently
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, db_path: str = None, dry_run: bool = False,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Args:
             db_path: SQLite DB path
             dry_run: If True, test only without actual DB updates
+            max_workers: Maximum number of concurrent per-ticker history fetches
         """
         self.db_path = db_path or str(DB_PATH)
         self.dry_run = dry_run
+        self.max_workers = max(1, int(max_workers or 1))
         self.today = datetime.now().strftime("%Y-%m-%d")
         self.today_yyyymmdd = datetime.now().strftime("%Y%m%d")
 
@@ -115,39 +124,116 @@ class PerformanceTrackerBatch:
         finally:
             conn.close()
 
-    def get_current_price(self, ticker: str) -> Optional[float]:
-        """Query current stock price
+    def fetch_price_history(self, ticker: str, start_date: str) -> Optional[Dict[str, float]]:
+        """Query daily close history once for a ticker
 
         Args:
             ticker: Stock code (6 digits)
+            start_date: First date to include (YYYY-MM-DD)
 
         Returns:
-            Current close price or None
+            {YYYY-MM-DD: close} sorted by date, or None
         """
         if not KRX_AVAILABLE:
             logger.error("krx_data_client is not available.")
             return None
 
         try:
-            # Get nearest business day within last 7 days
-            today = datetime.now().strftime("%Y%m%d")
-            week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
-
-            df = get_market_ohlcv_by_date(week_ago, today, ticker)
+            fromdate = start_date.replace('-', '')
+            df = get_market_ohlcv_by_date(fromdate, self.today_yyyymmdd, ticker)
 
             if df is None or df.empty:
-                logger.warning(f"[{ticker}] No price data available")
+                logger.warning(f"[{ticker}] No price history available")
                 return None
 
-            # Return most recent close price (krx_data_client uses English column names)
             close_col = 'Close' if 'Close' in df.columns else '종가'
-            latest_close = df[close_col].iloc[-1]
-            return float(latest_close)
+            history = {}
+            for idx, close in df[close_col].items():
+                try:
+                    value = float(close)
+                except (TypeError, ValueError):
+                    continue
+                if math.isnan(value) or value <= 0:
+                    continue
+                day = idx.strftime("%Y-%m-%d") if hasattr(idx, 'strftime') else str(idx)[:10]
+                history[day] = value
+            return dict(sorted(history.items())) or None
 
         except Exception as e:
-            logger.error(f"[{ticker}] Price query failed: {e}")
+            logger.error(f"[{ticker}] Price history query failed: {e}")
             return None
 
+    @staticmethod
+    def resolve_checkpoint_price(
+        history: Dict[str, float],
+        analyzed_date: str,
+        checkpoint_date: str
+    ) -> Optional[Tuple[str, float]]:
+        """Resolve the close of the last session on or before a checkpoint
+
+        Falls back to the first session after the checkpoint when no session
+        exists between the analysis date and the checkpoint (long holidays).
+
+        Args:
+            history: {YYYY-MM-DD: close} sorted by date
+            analyzed_date: Analysis date (YYYY-MM-DD); sessions on or before it are ignored
+            checkpoint_date: Checkpoint date (YYYY-MM-DD)
+
+        Returns:
+            (session date, close) or None if no session is available yet
+        """
+        resolved = None
+        for day, close in history.items():
+            if day <= analyzed_date:
+                continue
+            if day > checkpoint_date:
+                return resolved or (day, close)
+            resolved = (day, close)
+        return resolved
+
+    def get_due_checkpoints(self, record: Dict[str, Any], days_elapsed: int) -> List[int]:
+        """List tracking periods that are due but not yet recorded
+
+        Args:
+            record: Tracking record
+            days_elapsed: Days elapsed since analysis
+
+        Returns:
+            Due periods (subset of TRACK_DAYS)
+        """
+        return [
+            days for days in self.TRACK_DAYS
+            if days_elapsed >= days and record.get(f'tracked_{days}d_price') is None
+        ]
+
+    def fetch_histories(self, start_dates: Dict[str, str]) -> Dict[str, Optional[Dict[str, float]]]:
+        """Fetch price history for each ticker with bounded concurrency
+
+        Args:
+            start_dates: {ticker: first date to include}
+
+        Returns:
+            {ticker: history or None}
+        """
+        histories: Dict[str, Optional[Dict[str, float]]] = {}
+        if not start_dates:
+            return histories
+
+        workers = min(self.max_workers, len(start_dates))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.fetch_price_history, ticker, start): ticker
+                for ticker, start in start_dates.items()
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    histories[ticker] = future.result()
+                except Exception as e:
+                    logger.error(f"[{ticker}] Price history fetch failed: {e}")
+                    histories[ticker] = None
+        return histories
+
     def calculate_days_elapsed(self, analyzed_date: str) -> int:
         """Calculate days elapsed since analysis date
 
@@ -185,7 +271,7 @@ class PerformanceTrackerBatch:
         self,
         record: Dict[str, Any],
         days_elapsed: int,
-        current_price: float,
+        checkpoint_prices: Dict[int, Tuple[str, float]],
         analyzed_price: float
     ) -> Dict[str, Any]:
         """Update tracking record
@@ -193,32 +279,27 @@ class PerformanceTrackerBatch:
         Args:
             record: Existing record info (to check already recorded values)
             days_elapsed: Days elapsed
-            current_price: Current price
+            checkpoint_prices: {period days: (session date, close)} resolved from history
             analyzed_price: Price at analysis time
 
         Returns:
             Fields and values to update
         """
         updates = {}
-        return_rate = self.calculate_return(analyzed_price, current_price)
-
-        # 7-day update (if not yet recorded and 7+ days elapsed)
-        if days_elapsed >= 7 and record.get('tracked_7d_return') is None:
-            updates['tracked_7d_date'] = self.today
-            updates['tracked_7d_price'] = current_price
-            updates['tracked_7d_return'] = return_rate
-
-        # 14-day update (if not yet recorded and 14+ days elapsed)
-        if days_elapsed >= 14 and record.get('tracked_14d_return') is None:
-            updates['tracked_14d_date'] = self.today
-            updates['tracked_14d_price'] = current_price
-            updates['tracked_14d_return'] = return_rate
-
-        # 30-day update (if not yet recorded and 30+ days elapsed)
-        if days_elapsed >= 30 and record.get('tracked_30d_return') is None:
-            updates['tracked_30d_date'] = self.today
-            updates['tracked_30d_price'] = current_price
-            updates['tracked_30d_return'] = return_rate
+
+        # 7/14/30-day updates (if not yet recorded, period elapsed and price resolved)
+        for days in self.TRACK_DAYS:
+            if days_elapsed < days or record.get(f'tracked_{days}d_return') is not None:
+                continue
+            resolved = checkpoint_prices.get(days)
+            if resolved is None:
+                continue
+            session_date, price = resolved
+            updates[f'tracked_{days}d_date'] = session_date
+            updates[f'tracked_{days}d_price'] = price
+            updates[f'tracked_{days}d_return'] = self.calculate_return(analyzed_price, price)
+
+        if 'tracked_30d_return' in updates:
             updates['tracking_status'] = 'completed'
         elif days_elapsed >= 7 and record.get('tracking_status') == 'pending':
             updates['tracking_status'] = 'in_progress'
@@ -228,36 +309,42 @@ class PerformanceTrackerBatch:
 
         return updates
 
-    def apply_updates(self, record_id: int, updates: Dict[str, Any]) -> bool:
-        """Apply updates to database
+    def apply_updates(self, batch: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        """Apply updates to database in a single transaction
+
+        Updates sharing the same column set are written with one executemany.
 
         Args:
-            record_id: Record ID
-            updates: Fields and values to update
+            batch: [(record ID, fields and values to update)]
 
         Returns:
             Success status
         """
-        if not updates:
+        batch = [(record_id, updates) for record_id, updates in batch if updates]
+        if not batch:
             return True
 
         if self.dry_run:
-            logger.info(f"[DRY-RUN] ID {record_id}: {updates}")
+            for record_id, updates in batch:
+                logger.info(f"[DRY-RUN] ID {record_id}: {updates}")
             return True
 
+        grouped: Dict[Tuple[str, ...], List[List[Any]]] = defaultdict(list)
+        for record_id, updates in batch:
+            columns = tuple(updates.keys())
+            grouped[columns].append(list(updates.values()) + [record_id])
+
         conn = self.connect_db()
         try:
-            # Dynamically generate UPDATE query
-            set_clause = ", ".join([f"{k} = ?" for k in updates.keys()])
-            values = list(updates.values()) + [record_id]
-
-            query = f"UPDATE analysis_performance_tracker SET {set_clause} WHERE id = ?"
-            conn.execute(query, values)
-            conn.commit()
+            with conn:
+                for columns, rows in grouped.items():
+                    # Dynamically generate UPDATE query
+                    set_clause = ", ".join([f"{k} = ?" for k in columns])
+                    query = f"UPDATE analysis_performance_tracker SET {set_clause} WHERE id = ?"
+                    conn.executemany(query, rows)
             return True
         except Exception as e:
-            logger.error(f"DB update failed (ID {record_id}): {e}")
-            conn.rollback()
+            logger.error(f"DB update failed ({len(batch)} records): {e}")
             return False
         finally:
             conn.close()
@@ -265,6 +352,10 @@ class PerformanceTrackerBatch:
     def run(self) -> Dict[str, Any]:
         """Execute batch
 
+        Pending records are grouped by ticker, each ticker's history is
+        fetched once (concurrently, bounded by max_workers) and every due
+        checkpoint is resolved from that history.
+
         Returns:
             Execution result statistics
         """
@@ -281,6 +372,7 @@ class PerformanceTrackerBatch:
             'skipped': 0,
             'errors': 0,
             'completed': 0,
+            'tickers': 0,
             'by_trigger_type': {},
             'by_decision': {'traded': 0, 'watched': 0}
         }
@@ -294,80 +386,107 @@ class PerformanceTrackerBatch:
             logger.info("No stocks to track.")
             return stats
 
-        # Process each stock
+        # Group records with due checkpoints by ticker
+        due_by_ticker: Dict[str, List[Tuple[Dict[str, Any], int, List[int]]]] = defaultdict(list)
+        start_dates: Dict[str, str] = {}
         for record in targets:
             ticker = record['ticker']
-            company_name = record['company_name']
-            trigger_type = record['trigger_type'] or 'unknown'
-            analyzed_date = record['analyzed_date']
-            analyzed_price = record['analyzed_price']
-            was_traded = record['was_traded']
-
-            # Calculate days elapsed
-            days_elapsed = self.calculate_days_elapsed(analyzed_date)
-
-            # Skip if tracking already completed for this period
-            should_update = False
-            if days_elapsed >= 7 and record['tracked_7d_price'] is None:
-                should_update = True
-            if days_elapsed >= 14 and record['tracked_14d_price'] is None:
-                should_update = True
-            if days_elapsed >= 30 and record['tracked_30d_price'] is None:
-                should_update = True
-
-            if not should_update:
-                logger.debug(f"[{ticker}] {company_name}: No update needed ({days_elapsed} days elapsed)")
+            days_elapsed = self.calculate_days_elapsed(record['analyzed_date'])
+            due = self.get_due_checkpoints(record, days_elapsed)
+
+            if not due:
+                logger.debug(f"[{ticker}] {record['company_name']}: No update needed ({days_elapsed} days elapsed)")
                 stats['skipped'] += 1
                 continue
 
-            logger.info(f"[{ticker}] {company_name}: {days_elapsed} days elapsed, trigger={trigger_type}")
-
-            # Query current price
-            current_price = self.get_current_price(ticker)
-            if current_price is None:
-                logger.warning(f"[{ticker}] Price query failed, skipping")
-                stats['errors'] += 1
+            due_by_ticker[ticker].append((record, days_elapsed, due))
+            analyzed_day = record['analyzed_date'].split(' ')[0]
+            if ticker not in start_dates or analyzed_day < start_dates[ticker]:
+                start_dates[ticker] = analyzed_day
+
+        stats['tickers'] = len(start_dates)
+        logger.info(f"Fetching price history for {stats['tickers']} tickers "
+                    f"(workers={self.max_workers})")
+        histories = self.fetch_histories(start_dates)
+
+        # Resolve checkpoint prices from each ticker's history
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        for ticker, entries in due_by_ticker.items():
+            history = histories.get(ticker)
+            if not history:
+                logger.warning(f"[{ticker}] Price query failed, skipping {len(entries)} records")
+                stats['errors'] += len(entries)
                 continue
 
-            # Calculate return
-            return_rate = self.calculate_return(analyzed_price, current_price)
-            logger.info(f"  Analyzed: {analyzed_price:,.0f} → Current: {current_price:,.0f} ({return_rate*100:+.2f}%)")
-
-            # Determine updates
-            updates = self.update_tracking_record(
-                record,
-                days_elapsed,
-                current_price,
-                analyzed_price
-            )
-
-            # Apply DB updates
-            if self.apply_updates(record['id'], updates):
-                stats['updated'] += 1
-
-                # Statistics by trigger type
-                if trigger_type not in stats['by_trigger_type']:
-                    stats['by_trigger_type'][trigger_type] = {'count': 0, 'returns': []}
-                stats['by_trigger_type'][trigger_type]['count'] += 1
-                stats['by_trigger_type'][trigger_type]['returns'].append(return_rate)
-
-                # Classify traded/watched
-                if was_traded:
-                    stats['by_decision']['traded'] += 1
-                else:
-                    stats['by_decision']['watched'] += 1
-
-                # Count completed
-                if updates.get('tracking_status') == 'completed':
-                    stats['completed'] += 1
+            for record, days_elapsed, due in entries:
+                analyzed_day = record['analyzed_date'].split(' ')[0]
+                analyzed_price = record['analyzed_price']
+                analyzed = datetime.strptime(analyzed_day, "%Y-%m-%d")
+
+                checkpoint_prices = {}
+                for days in due:
+                    checkpoint = (analyzed + timedelta(days=days)).strftime("%Y-%m-%d")
+                    resolved = self.resolve_checkpoint_price(history, analyzed_day, checkpoint)
+                    if resolved is not None:
+                        checkpoint_prices[days] = resolved
+
+                updates = self.update_tracking_record(
+                    record,
+                    days_elapsed,
+                    checkpoint_prices,
+                    analyzed_price
+                )
+                if not any(f'tracked_{days}d_price' in updates for days in due):
+                    logger.warning(f"[{ticker}] No session found for due checkpoints {due}, skipping")
+                    stats['errors'] += 1
+                    continue
+
+                logger.info(f"[{ticker}] {record['company_name']}: {days_elapsed} days elapsed, "
+                            f"trigger={record['trigger_type'] or 'unknown'}")
+                for days in due:
+                    if f'tracked_{days}d_price' in updates:
+                        price = updates[f'tracked_{days}d_price']
+                        return_rate = updates[f'tracked_{days}d_return']
+                        logger.info(f"  {days}d: Analyzed: {analyzed_price:,.0f} → {price:,.0f} "
+                                    f"({return_rate*100:+.2f}%)")
+
+                batch.append((record['id'], updates))
+
+        # Apply DB updates
+        if not self.apply_updates(batch):
+            stats['errors'] += len(batch)
+            batch = []
+
+        records = {record['id']: record for record in targets}
+        for record_id, updates in batch:
+            record = records[record_id]
+            trigger_type = record['trigger_type'] or 'unknown'
+            stats['updated'] += 1
+
+            # Statistics by trigger type (latest resolved checkpoint)
+            latest_days = max(days for days in self.TRACK_DAYS if f'tracked_{days}d_return' in updates)
+            return_rate = updates[f'tracked_{latest_days}d_return']
+            if trigger_type not in stats['by_trigger_type']:
+                stats['by_trigger_type'][trigger_type] = {'count': 0, 'returns': []}
+            stats['by_trigger_type'][trigger_type]['count'] += 1
+            stats['by_trigger_type'][trigger_type]['returns'].append(return_rate)
+
+            # Classify traded/watched
+            if record['was_traded']:
+                stats['by_decision']['traded'] += 1
             else:
-                stats['errors'] += 1
+                stats['by_decision']['watched'] += 1
+
+            # Count completed
+            if updates.get('tracking_status') == 'completed':
+                stats['completed'] += 1
 
         # Summary
         logger.info("="*60)
         logger.info("Batch execution completed")
         logger.info(f"  Total: {stats['total']}, Updated: {stats['updated']}, "
-                   f"Skipped: {stats['skipped']}, Errors: {stats['errors']}")
+                   f"Skipped: {stats['skipped']}, Errors: {stats['errors']}, "
+                   f"Tickers fetched: {stats['tickers']}")
         logger.info(f"  Completed: {stats['completed']}, Traded: {stats['by_decision']['traded']}, "
                    f"Watched: {stats['by_decision']['watched']}")
         logger.info("="*60)
@@ -562,10 +681,21 @@ Examples:
         default=None,
         help="SQLite DB path (default: ./stock_tracking_db.sqlite)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PerformanceTrackerBatch.DEFAULT_MAX_WORKERS,
+        help="Concurrent per-ticker price history fetches "
+             f"(default: {PerformanceTrackerBatch.DEFAULT_MAX_WORKERS})"
+    )
 
     args = parser.parse_args()
 
-    tracker = PerformanceTrackerBatch(db_path=args.db, dry_run=args.dry_run)
+    tracker = PerformanceTrackerBatch(
+        db_path=args.db,
+        dry_run=args.dry_run,
+        max_workers=args.workers,
+    )
 
     if args.report:
         # Print report only
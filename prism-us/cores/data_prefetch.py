@@ -9,9 +9,13 @@ parameterized data fetches (OHLCV, holder info, market indices).
 """
 
 import logging
+import time
 from pathlib import Path
 import importlib.util
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
 from zoneinfo import ZoneInfo
 
 import numpy as np
@@ -19,6 +23,15 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Major US indices: key -> (symbol, period)
+_US_INDICES = {
+    "sp500": ("^GSPC", "1y"),
+    "nasdaq": ("^IXIC", "1y"),
+    "dow": ("^DJI", "1y"),
+    "russell": ("^RUT", "1y"),
+    "vix": ("^VIX", "3mo"),
+}
+
 
 def _df_to_markdown(df: pd.DataFrame, title: str = "") -> str:
     """Convert DataFrame to markdown table string (no tabulate dependency).
@@ -63,19 +76,61 @@ def _get_us_data_client():
     return module.USDataClient()
 
 
-def prefetch_us_stock_ohlcv(ticker: str, period: str = "1y") -> str:
+_prompt_table_encoder = None
+
+
+def _get_prompt_table_encoder():
+    """Load the shared cores/prompt_table_encoder.py by path (None if unavailable)."""
+    global _prompt_table_encoder
+    if _prompt_table_encoder is None:
+        try:
+            _encoder_path = Path(__file__).resolve().parents[2] / "cores" / "prompt_table_encoder.py"
+            spec = importlib.util.spec_from_file_location("prompt_table_encoder", _encoder_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _prompt_table_encoder = module
+        except Exception as e:
+            logger.warning(f"Prompt table encoder unavailable, using markdown: {e}")
+            return None
+    return _prompt_table_encoder
+
+
+def _render_table(df: pd.DataFrame, title: str, time_series: bool = False) -> str:
+    """Render a prefetched table in the active prompt format (compact or markdown).
+
+    Args:
+        df: DataFrame to render
+        title: Section title
+        time_series: Date-indexed table (history is downsampled in compact mode)
+
+    Returns:
+        Rendered table string
+    """
+    encoder = _get_prompt_table_encoder()
+    if encoder is None:
+        return _df_to_markdown(df, title)
+    compact = encoder.encode_time_series if time_series else encoder.encode_table
+    return encoder.render_for_prompt(
+        title,
+        lambda: _df_to_markdown(df, title),
+        lambda: compact(df, title),
+    )
+
+
+def prefetch_us_stock_ohlcv(ticker: str, period: str = "1y", stock=None) -> str:
     """Prefetch US stock OHLCV data using yfinance.
 
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL") or index symbol (e.g., "^GSPC")
         period: Data period (default: "1y")
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
-        Markdown formatted OHLCV data string, or empty string on error
+        OHLCV table string (compact or markdown), or empty string on error
     """
     try:
         client = _get_us_data_client()
-        df = client.get_ohlcv(ticker, period=period, interval="1d")
+        df = client.get_ohlcv(ticker, period=period, interval="1d", stock=stock)
 
         if df is None or df.empty:
             logger.warning(f"No OHLCV data for {ticker}")
@@ -85,24 +140,25 @@ def prefetch_us_stock_ohlcv(ticker: str, period: str = "1y") -> str:
         df.columns = [col.title().replace("_", " ") for col in df.columns]
         df.index.name = "Date"
 
-        return _df_to_markdown(df, f"OHLCV: {ticker} ({period})")
+        return _render_table(df, f"OHLCV: {ticker} ({period})", time_series=True)
     except Exception as e:
         logger.error(f"Error prefetching OHLCV for {ticker}: {e}")
         return ""
 
 
-def prefetch_us_holder_info(ticker: str) -> str:
+def prefetch_us_holder_info(ticker: str, stock=None) -> str:
     """Prefetch US institutional holder data using yfinance.
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
         Markdown formatted holder data string (major + institutional + mutualfund), or empty string on error
     """
     try:
         client = _get_us_data_client()
-        holders = client.get_institutional_holders(ticker)
+        holders = client.get_institutional_holders(ticker, stock=stock)
 
         if not holders:
             logger.warning(f"No holder data for {ticker}")
@@ -148,16 +204,8 @@ def prefetch_us_market_indices(reference_date: str = None) -> dict:
         - "russell": Russell 2000 data
         - "vix": VIX data
     """
-    indices = {
-        "sp500": ("^GSPC", "1y"),
-        "nasdaq": ("^IXIC", "1y"),
-        "dow": ("^DJI", "1y"),
-        "russell": ("^RUT", "1y"),
-        "vix": ("^VIX", "3mo"),
-    }
-
     result = {}
-    for key, (symbol, period) in indices.items():
+    for key, (symbol, period) in _US_INDICES.items():
         data = prefetch_us_stock_ohlcv(symbol, period=period)
         if data:
             result[key] = data
@@ -168,7 +216,7 @@ def prefetch_us_market_indices(reference_date: str = None) -> dict:
     return result
 
 
-def prefetch_stock_info(ticker: str) -> str:
+def prefetch_stock_info(ticker: str, stock=None) -> str:
     """Prefetch company info and key statistics via yfinance.
 
     Replaces yahoo_finance MCP get_stock_info call and
@@ -176,13 +224,14 @@ def prefetch_stock_info(ticker: str) -> str:
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional; reuses its info payload)
 
     Returns:
         Markdown formatted company info string, or empty string on error
     """
     try:
         client = _get_us_data_client()
-        info = client.get_company_info(ticker)
+        info = client.get_company_info(ticker, stock=stock)
 
         if not info or not info.get("name"):
             logger.warning(f"No company info for {ticker}")
@@ -275,18 +324,19 @@ def prefetch_stock_info(ticker: str) -> str:
         return ""
 
 
-def prefetch_recommendations(ticker: str) -> str:
+def prefetch_recommendations(ticker: str, stock=None) -> str:
     """Prefetch analyst recommendations via yfinance.
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
         Markdown formatted recommendations string, or empty string on error
     """
     try:
         import yfinance as yf
-        stock = yf.Ticker(ticker)
+        stock = stock if stock is not None else yf.Ticker(ticker)
         recs = stock.recommendations
 
         if recs is None or recs.empty:
@@ -299,20 +349,21 @@ def prefetch_recommendations(ticker: str) -> str:
         return ""
 
 
-def prefetch_analysis_estimates(ticker: str) -> str:
+def prefetch_analysis_estimates(ticker: str, stock=None) -> str:
     """Prefetch earnings/revenue estimates and analyst data via yfinance.
 
     Replaces firecrawl scrape of Yahoo Finance Analysis page for company_status agent.
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
         Markdown formatted analysis estimates string, or empty string on error
     """
     try:
         import yfinance as yf
-        stock = yf.Ticker(ticker)
+        stock = stock if stock is not None else yf.Ticker(ticker)
 
         result = ""
 
@@ -395,20 +446,21 @@ def prefetch_analysis_estimates(ticker: str) -> str:
         return ""
 
 
-def prefetch_company_profile(ticker: str) -> str:
+def prefetch_company_profile(ticker: str, stock=None) -> str:
     """Prefetch company profile data via yfinance.
 
     Replaces firecrawl profile page scrape for company_overview agent.
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
         Markdown formatted company profile string, or empty string on error
     """
     try:
         import yfinance as yf
-        stock = yf.Ticker(ticker)
+        stock = stock if stock is not None else yf.Ticker(ticker)
         info = stock.info
 
         if not info:
@@ -455,20 +507,21 @@ def prefetch_company_profile(ticker: str) -> str:
         return ""
 
 
-def prefetch_financial_statements(ticker: str) -> str:
+def prefetch_financial_statements(ticker: str, stock=None) -> str:
     """Prefetch financial statements (income statement, balance sheet, cash flow) via yfinance.
 
     Replaces SEC EDGAR get_financials/get_key_metrics calls.
 
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
 
     Returns:
-        Markdown formatted financial statements string, or empty string on error
+        Financial statement tables (compact or markdown), or empty string on error
     """
     try:
         import yfinance as yf
-        stock = yf.Ticker(ticker)
+        stock = stock if stock is not None else yf.Ticker(ticker)
 
         result = ""
 
@@ -476,7 +529,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             income = stock.income_stmt
             if income is not None and not income.empty:
-                result += _df_to_markdown(income, f"Annual Income Statement: {ticker}")
+                result += _render_table(income, f"Annual Income Statement: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No annual income statement for {ticker}: {e}")
@@ -485,7 +538,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             balance = stock.balance_sheet
             if balance is not None and not balance.empty:
-                result += _df_to_markdown(balance, f"Annual Balance Sheet: {ticker}")
+                result += _render_table(balance, f"Annual Balance Sheet: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No annual balance sheet for {ticker}: {e}")
@@ -494,7 +547,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             cashflow = stock.cashflow
             if cashflow is not None and not cashflow.empty:
-                result += _df_to_markdown(cashflow, f"Annual Cash Flow: {ticker}")
+                result += _render_table(cashflow, f"Annual Cash Flow: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No annual cash flow for {ticker}: {e}")
@@ -503,7 +556,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             q_income = stock.quarterly_income_stmt
             if q_income is not None and not q_income.empty:
-                result += _df_to_markdown(q_income, f"Quarterly Income Statement: {ticker}")
+                result += _render_table(q_income, f"Quarterly Income Statement: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No quarterly income statement for {ticker}: {e}")
@@ -512,7 +565,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             q_balance = stock.quarterly_balance_sheet
             if q_balance is not None and not q_balance.empty:
-                result += _df_to_markdown(q_balance, f"Quarterly Balance Sheet: {ticker}")
+                result += _render_table(q_balance, f"Quarterly Balance Sheet: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No quarterly balance sheet for {ticker}: {e}")
@@ -521,7 +574,7 @@ def prefetch_financial_statements(ticker: str) -> str:
         try:
             q_cashflow = stock.quarterly_cashflow
             if q_cashflow is not None and not q_cashflow.empty:
-                result += _df_to_markdown(q_cashflow, f"Quarterly Cash Flow: {ticker}")
+                result += _render_table(q_cashflow, f"Quarterly Cash Flow: {ticker}")
                 result += "\n"
         except Exception as e:
             logger.debug(f"No quarterly cash flow for {ticker}: {e}")
@@ -749,23 +802,83 @@ def _parse_10k_segment_revenue(html_content: str) -> str:
     return result
 
 
-def prefetch_segment_revenue(ticker: str) -> str:
+_sec_filing_cache = None
+
+
+def _get_sec_filing_cache():
+    """Load the local sec_filing_cache module once (None if unavailable)."""
+    global _sec_filing_cache
+    if _sec_filing_cache is None:
+        try:
+            _cache_path = Path(__file__).parent / "sec_filing_cache.py"
+            spec = importlib.util.spec_from_file_location("us_sec_filing_cache", _cache_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _sec_filing_cache = module
+        except Exception as e:
+            logger.warning(f"SEC filing cache unavailable: {e}")
+            return None
+    return _sec_filing_cache
+
+
+def _cache_call(method: str, *args):
+    """Call a sec_filing_cache function; cache failures never break the prefetch."""
+    cache = _get_sec_filing_cache()
+    if cache is None:
+        return None
+    try:
+        return getattr(cache, method)(*args)
+    except Exception as e:
+        logger.warning(f"SEC filing cache {method} failed: {e}")
+        return None
+
+
+def _segment_markdown(ticker: str, html_content: str, filing_type: str) -> str:
+    """Parse segment revenue from filing HTML and label it with the filing type."""
+    result = _parse_10k_segment_revenue(html_content)
+    if result:
+        # Update title to reflect actual filing type
+        result = result.replace("from 10-K filing", f"from {filing_type} filing")
+        logger.info(f"Parsed segment revenue for {ticker} from {filing_type} ({len(html_content):,} chars HTML)")
+    else:
+        logger.warning(f"No segment revenue data found in {filing_type} for {ticker}")
+    return result
+
+
+def prefetch_segment_revenue(ticker: str, stock=None, refresh: bool = False) -> str:
     """Prefetch segment revenue data from latest 10-K filing via Yahoo Finance CDN.
 
     Uses yfinance sec_filings to find 10-K URL, downloads XBRL inline HTML from
     cdn.yahoofinance.com, and parses segment revenue breakdowns.
 
+    Results are cached per ticker + filing URL (see sec_filing_cache): within
+    the metadata TTL no network call is made, and a filing is only downloaded
+    when sec_filings points at one not yet cached.
+
     Args:
         ticker: Stock ticker symbol
+        stock: Shared yf.Ticker session (optional)
+        refresh: Re-check sec_filings metadata even if the cached check is fresh
 
     Returns:
         Markdown formatted segment revenue data, or empty string on error
     """
     try:
+        cache = _get_sec_filing_cache()
+        if cache is not None and not refresh:
+            latest = _cache_call("get_latest", ticker)
+            if (latest and latest["fresh"] and latest["segment_md"] is not None
+                    and latest["parser_version"] == cache.PARSER_VERSION):
+                logger.info(
+                    f"Segment revenue for {ticker} from cache "
+                    f"({latest['filing_type']} {latest['filing_date']})"
+                )
+                return latest["segment_md"]
+
         import yfinance as yf
         import urllib.request
 
-        stock = yf.Ticker(ticker)
+        stock = stock if stock is not None else yf.Ticker(ticker)
         filings = stock.sec_filings
 
         if not filings:
@@ -790,6 +903,19 @@ def prefetch_segment_revenue(ticker: str) -> str:
         if not url:
             logger.warning(f"No {filing_type} exhibit URL for {ticker}")
             return ""
+        filing_date = str(filing['date']) if filing.get('date') else None
+
+        # Same filing as last time: reuse the parsed table, or re-parse the stored HTML
+        if cache is not None:
+            entry = _cache_call("get_filing", ticker, url)
+            if entry and entry["segment_md"] is not None and entry["parser_version"] == cache.PARSER_VERSION:
+                _cache_call("mark_checked", ticker, url)
+                logger.info(f"Segment revenue for {ticker} from cache ({filing_type} {filing_date})")
+                return entry["segment_md"]
+            if entry and entry["raw"]:
+                result = _segment_markdown(ticker, entry["raw"], filing_type)
+                _cache_call("update_parsed", ticker, url, result)
+                return result
 
         # Download filing HTML from Yahoo Finance CDN
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
@@ -800,81 +926,173 @@ def prefetch_segment_revenue(ticker: str) -> str:
             logger.warning(f"Empty {filing_type} HTML for {ticker}")
             return ""
 
-        result = _parse_10k_segment_revenue(html_content)
-        if result:
-            # Update title to reflect actual filing type
-            result = result.replace("from 10-K filing", f"from {filing_type} filing")
-            logger.info(f"Parsed segment revenue for {ticker} from {filing_type} ({len(html_content):,} chars HTML)")
-        else:
-            logger.warning(f"No segment revenue data found in {filing_type} for {ticker}")
-
+        result = _segment_markdown(ticker, html_content, filing_type)
+        _cache_call("store_filing", ticker, url, filing_type, filing_date, html_content, result)
         return result
     except Exception as e:
         logger.warning(f"Segment revenue prefetch failed for {ticker}: {e}")
         return ""
 
 
-def prefetch_us_analysis_data(ticker: str) -> dict:
+# Concurrent prefetch executor
+PREFETCH_MAX_WORKERS = 8
+PREFETCH_TASK_TIMEOUT = 30.0  # seconds, measured from when a task starts running
+
+
+@dataclass(frozen=True)
+class PrefetchTask:
+    """One prefetch step. Runs after every task named in ``deps`` has finished."""
+
+    name: str
+    fn: Callable[[], Any]
+    deps: Tuple[str, ...] = ()
+    timeout: float = PREFETCH_TASK_TIMEOUT
+
+
+def iter_prefetch_tasks(
+    tasks: Iterable[PrefetchTask],
+    max_workers: int = PREFETCH_MAX_WORKERS,
+) -> Iterator[Tuple[str, Any, float]]:
+    """Run prefetch tasks on a bounded thread pool, yielding results as they complete.
+
+    A task is submitted once all of its dependencies have finished (successfully
+    or not). Failures and timeouts yield ``None`` so callers can keep whatever
+    partial data arrived. A timed-out worker thread cannot be interrupted; its
+    result is simply discarded.
+
+    Args:
+        tasks: Tasks to run (names must be unique)
+        max_workers: Thread pool size
+
+    Yields:
+        (task name, result or None, elapsed seconds) in completion order
+    """
+    tasks = list(tasks)
+    names = {t.name for t in tasks}
+    waiting = list(tasks)
+    finished = set()
+    started_at = {}
+    running = {}
+
+    def _timed(task):
+        started_at[task.name] = time.monotonic()
+        return task.fn()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="us-prefetch")
+    try:
+        while waiting or running:
+            ready = [t for t in waiting if all(d in finished or d not in names for d in t.deps)]
+            for task in ready:
+                waiting.remove(task)
+                running[executor.submit(_timed, task)] = task
+            if not running:
+                for task in waiting:
+                    logger.error(f"[prefetch] {task.name}: unresolved dependencies {task.deps}")
+                    yield task.name, None, 0.0
+                return
+
+            now = time.monotonic()
+            deadlines = [
+                started_at[t.name] + t.timeout for t in running.values() if t.name in started_at
+            ]
+            # Queued tasks have no deadline yet; re-check periodically once they start
+            wait_for = max(0.0, min(deadlines) - now) if deadlines else 1.0
+            done, _ = wait(running, timeout=min(wait_for, 1.0), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                task = running.pop(future)
+                elapsed = time.monotonic() - started_at.get(task.name, now)
+                try:
+                    value = future.result()
+                except Exception as e:
+                    logger.warning(f"[prefetch] {task.name} failed after {elapsed:.2f}s: {e}")
+                    value = None
+                else:
+                    logger.info(f"[prefetch] {task.name}: {elapsed:.2f}s")
+                finished.add(task.name)
+                yield task.name, value, elapsed
+
+            now = time.monotonic()
+            for future, task in list(running.items()):
+                started = started_at.get(task.name)
+                if started is not None and now - started >= task.timeout:
+                    running.pop(future)
+                    future.cancel()
+                    logger.warning(f"[prefetch] {task.name} timed out after {task.timeout:.0f}s")
+                    finished.add(task.name)
+                    yield task.name, None, now - started
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _us_analysis_tasks(ticker: str, stock) -> List[PrefetchTask]:
+    """Prefetch graph for one US ticker, sharing a single yf.Ticker session.
+
+    The ``info`` task loads the quote summary once; stock_info and
+    company_profile read it from the shared session instead of re-pulling it.
+    """
+    tasks = [
+        PrefetchTask("info", lambda: stock.info),
+        PrefetchTask("stock_ohlcv", lambda: prefetch_us_stock_ohlcv(ticker, period="1y", stock=stock)),
+        PrefetchTask("holder_info", lambda: prefetch_us_holder_info(ticker, stock=stock)),
+        PrefetchTask("stock_info", lambda: prefetch_stock_info(ticker, stock=stock), deps=("info",)),
+        PrefetchTask("recommendations", lambda: prefetch_recommendations(ticker, stock=stock)),
+        PrefetchTask("company_profile", lambda: prefetch_company_profile(ticker, stock=stock), deps=("info",)),
+        PrefetchTask("analysis_estimates", lambda: prefetch_analysis_estimates(ticker, stock=stock)),
+        PrefetchTask("financial_statements", lambda: prefetch_financial_statements(ticker, stock=stock),
+                     timeout=45.0),
+        PrefetchTask("segment_revenue", lambda: prefetch_segment_revenue(ticker, stock=stock), timeout=60.0),
+    ]
+    for key, (symbol, period) in _US_INDICES.items():
+        tasks.append(PrefetchTask(
+            f"index:{key}",
+            lambda symbol=symbol, period=period: prefetch_us_stock_ohlcv(symbol, period=period),
+        ))
+    return tasks
+
+
+def prefetch_us_analysis_data(ticker: str, max_workers: int = PREFETCH_MAX_WORKERS) -> dict:
     """Prefetch all data needed for US stock analysis agents.
 
+    Fetches run concurrently (see ``iter_prefetch_tasks``); any task that fails
+    or times out is left out of the result.
+
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL")
+        max_workers: Thread pool size for the prefetch tasks
 
     Returns:
         Dictionary with prefetched data:
         - "stock_ohlcv": OHLCV data as markdown
         - "holder_info": Institutional holder data as markdown
         - "market_indices": Dict of index data
+        - "stock_info", "recommendations", "company_profile", "analysis_estimates",
+          "financial_statements", "segment_revenue": markdown sections
     """
-    result = {}
+    import yfinance as yf
 
-    # 1. Stock OHLCV
-    stock_ohlcv = prefetch_us_stock_ohlcv(ticker, period="1y")
-    if stock_ohlcv:
-        result["stock_ohlcv"] = stock_ohlcv
+    started = time.monotonic()
+    fetched = {}
+    for name, value, _ in iter_prefetch_tasks(_us_analysis_tasks(ticker, yf.Ticker(ticker)), max_workers):
+        if value:
+            fetched[name] = value
 
-    # 2. Holder info
-    holder_info = prefetch_us_holder_info(ticker)
-    if holder_info:
-        result["holder_info"] = holder_info
-
-    # 3. Market indices
-    market_indices = prefetch_us_market_indices()
+    result = {}
+    for key in ("stock_ohlcv", "holder_info"):
+        if key in fetched:
+            result[key] = fetched[key]
+    market_indices = {key: fetched[f"index:{key}"] for key in _US_INDICES if f"index:{key}" in fetched}
     if market_indices:
         result["market_indices"] = market_indices
-
-    # 4. Stock info (for company_status - replaces key-statistics/financials firecrawl + yahoo_finance MCP)
-    stock_info = prefetch_stock_info(ticker)
-    if stock_info:
-        result["stock_info"] = stock_info
-
-    # 5. Recommendations (for company_status - replaces yahoo_finance MCP get_recommendations)
-    recommendations = prefetch_recommendations(ticker)
-    if recommendations:
-        result["recommendations"] = recommendations
-
-    # 6. Company profile (for company_overview - replaces firecrawl profile page)
-    company_profile = prefetch_company_profile(ticker)
-    if company_profile:
-        result["company_profile"] = company_profile
-
-    # 7. Analysis estimates (for company_status - replaces firecrawl Analysis page)
-    analysis_estimates = prefetch_analysis_estimates(ticker)
-    if analysis_estimates:
-        result["analysis_estimates"] = analysis_estimates
-
-    # 8. Financial statements (for company_status - replaces SEC EDGAR financials)
-    financial_statements = prefetch_financial_statements(ticker)
-    if financial_statements:
-        result["financial_statements"] = financial_statements
-
-    # 9. Segment revenue (for company_overview - parsed from 10-K XBRL via Yahoo Finance CDN)
-    segment_revenue = prefetch_segment_revenue(ticker)
-    if segment_revenue:
-        result["segment_revenue"] = segment_revenue
+    for key in ("stock_info", "recommendations", "company_profile", "analysis_estimates",
+                "financial_statements", "segment_revenue"):
+        if key in fetched:
+            result[key] = fetched[key]
 
     if result:
-        logger.info(f"Prefetched US data for {ticker}: {list(result.keys())}")
+        logger.info(
+            f"Prefetched US data for {ticker} in {time.monotonic() - started:.1f}s: {list(result.keys())}"
+        )
     else:
         logger.warning(f"Failed to prefetch any US data for {ticker}")
 
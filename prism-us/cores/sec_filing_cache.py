@@ -0,0 +1,255 @@
+"""
+SEC Filing Cache for US Segment Revenue
+
+prefetch_segment_revenue used to download the full 10-K/10-Q inline-XBRL HTML
+(often several MB) and re-parse it on every US report, although filings only
+change quarterly. This module keeps, per ticker and filing URL:
+
+- the zlib-compressed raw document (so a parser change can re-parse offline)
+- the parsed segment revenue markdown (empty string = parsed, no segments)
+- when the ticker's sec_filings metadata was last checked
+
+A report only re-checks yfinance metadata after METADATA_TTL_HOURS, and only
+downloads when that metadata points at a filing URL not yet in the cache.
+
+Warm the cache off-hours for the watchlist universe:
+
+    python prism-us/cores/sec_filing_cache.py --watchlist --days 30
+    python prism-us/cores/sec_filing_cache.py AAPL MSFT NVDA
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DB_PATH = Path(os.getenv("PRISM_SEC_FILING_CACHE_DB", str(PROJECT_ROOT / "sec_filing_cache.sqlite")))
+TRACKING_DB_PATH = PROJECT_ROOT / "stock_tracking_db.sqlite"
+
+# Re-check sec_filings metadata at most this often per ticker
+METADATA_TTL_HOURS = 12
+# Bump when _parse_10k_segment_revenue output changes; cached raw HTML is re-parsed
+PARSER_VERSION = 1
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS sec_filing_cache (
+    ticker          TEXT NOT NULL,
+    filing_url      TEXT NOT NULL,
+    filing_type     TEXT,
+    filing_date     TEXT,
+    raw_zlib        BLOB,
+    raw_size        INTEGER,
+    segment_md      TEXT,
+    parser_version  INTEGER,
+    fetched_at      TEXT NOT NULL,
+    checked_at      TEXT NOT NULL,
+    PRIMARY KEY (ticker, filing_url)
+)
+"""
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path or CACHE_DB_PATH), timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(_DDL)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sec_filing_ticker_checked "
+        "ON sec_filing_cache(ticker, checked_at DESC)"
+    )
+    return conn
+
+
+def get_latest(ticker: str, db_path: Optional[Path] = None) -> Optional[Dict]:
+    """Most recently checked cache entry for a ticker.
+
+    Returns:
+        Dict with filing_url, filing_type, filing_date, segment_md,
+        parser_version, checked_at and ``fresh`` (metadata checked within
+        METADATA_TTL_HOURS), or None if the ticker was never cached
+    """
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT filing_url, filing_type, filing_date, segment_md, parser_version, checked_at "
+            "FROM sec_filing_cache WHERE ticker = ? ORDER BY checked_at DESC LIMIT 1",
+            (ticker.upper(),),
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    entry = dict(row)
+    cutoff = (datetime.now() - timedelta(hours=METADATA_TTL_HOURS)).strftime("%Y-%m-%d %H:%M:%S")
+    entry["fresh"] = entry["checked_at"] >= cutoff
+    return entry
+
+
+def get_filing(ticker: str, filing_url: str, db_path: Optional[Path] = None) -> Optional[Dict]:
+    """Cache entry for one filing, with the raw HTML decompressed on demand.
+
+    Returns:
+        Dict with segment_md, parser_version and ``raw`` (str or None), or None
+    """
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT segment_md, parser_version, raw_zlib FROM sec_filing_cache "
+            "WHERE ticker = ? AND filing_url = ?",
+            (ticker.upper(), filing_url),
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    raw = None
+    if row["raw_zlib"]:
+        try:
+            raw = zlib.decompress(row["raw_zlib"]).decode("utf-8", errors="replace")
+        except zlib.error as e:
+            logger.warning(f"Corrupt cached filing for {ticker}: {e}")
+    return {"segment_md": row["segment_md"], "parser_version": row["parser_version"], "raw": raw}
+
+
+def store_filing(
+    ticker: str,
+    filing_url: str,
+    filing_type: str,
+    filing_date: Optional[str],
+    raw_html: Optional[str],
+    segment_md: str,
+    db_path: Optional[Path] = None,
+) -> None:
+    """Insert or replace a filing with its compressed HTML and parsed segments."""
+    raw_bytes = raw_html.encode("utf-8") if raw_html else b""
+    now = _now()
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO sec_filing_cache
+                (ticker, filing_url, filing_type, filing_date, raw_zlib, raw_size,
+                 segment_md, parser_version, fetched_at, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                ticker.upper(), filing_url, filing_type, filing_date,
+                zlib.compress(raw_bytes, 6) if raw_bytes else None, len(raw_bytes),
+                segment_md, PARSER_VERSION, now, now,
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def update_parsed(ticker: str, filing_url: str, segment_md: str, db_path: Optional[Path] = None) -> None:
+    """Record a re-parse of cached HTML with the current parser."""
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            "UPDATE sec_filing_cache SET segment_md = ?, parser_version = ?, checked_at = ? "
+            "WHERE ticker = ? AND filing_url = ?",
+            (segment_md, PARSER_VERSION, _now(), ticker.upper(), filing_url),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def mark_checked(ticker: str, filing_url: str, db_path: Optional[Path] = None) -> None:
+    """Record that sec_filings metadata still points at this filing."""
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            "UPDATE sec_filing_cache SET checked_at = ? WHERE ticker = ? AND filing_url = ?",
+            (_now(), ticker.upper(), filing_url),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def watchlist_tickers(days: int = 30, db_path: Optional[Path] = None) -> List[str]:
+    """Tickers held or analyzed in the last ``days`` days (US tracking DB)."""
+    path = db_path or TRACKING_DB_PATH
+    if not Path(path).exists():
+        logger.warning(f"Tracking DB not found: {path}")
+        return []
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    tickers: List[str] = []
+    conn = sqlite3.connect(str(path))
+    try:
+        for query, params in (
+            ("SELECT DISTINCT ticker FROM us_stock_holdings", ()),
+            ("SELECT DISTINCT ticker FROM us_watchlist_history WHERE analyzed_date >= ?", (since,)),
+        ):
+            try:
+                tickers += [r[0] for r in conn.execute(query, params).fetchall() if r[0]]
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Skipping watchlist source: {e}")
+    finally:
+        conn.close()
+    return sorted({t.upper() for t in tickers})
+
+
+def _load_data_prefetch():
+    """Load prism-us data_prefetch by path (the root package is also named 'cores')."""
+    path = Path(__file__).parent / "data_prefetch.py"
+    spec = importlib.util.spec_from_file_location("us_data_prefetch", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def warm(tickers: Iterable[str], max_workers: int = 4) -> Dict[str, bool]:
+    """Refresh filing metadata and segment revenue for tickers, ignoring the metadata TTL.
+
+    Returns:
+        Dict of ticker -> whether segment revenue data is available
+    """
+    prefetch = _load_data_prefetch()
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda t: bool(prefetch.prefetch_segment_revenue(t, refresh=True)), tickers
+        )
+        return dict(zip(tickers, results))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm the SEC filing / segment revenue cache")
+    parser.add_argument("tickers", nargs="*", help="Tickers to warm")
+    parser.add_argument("--watchlist", action="store_true",
+                        help="Include US holdings and recently analyzed tickers")
+    parser.add_argument("--days", type=int, default=30, help="Watchlist lookback in days")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent downloads")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    tickers = list(args.tickers)
+    if args.watchlist:
+        tickers += watchlist_tickers(days=args.days)
+    if not tickers:
+        parser.error("no tickers given (pass tickers or --watchlist)")
+
+    results = warm(tickers, max_workers=args.workers)
+    with_data = sum(results.values())
+    logger.info(f"Warmed SEC filing cache: {len(results)} tickers, {with_data} with segment data")
+
+
+if __name__ == "__main__":
+    main()
@@ -55,7 +55,8 @@ class USDataClient:
         period: str = "1mo",
         interval: str = "1d",
         start: Optional[str] = None,
-        end: Optional[str] = None
+        end: Optional[str] = None,
+        stock: Optional[yf.Ticker] = None
     ) -> pd.DataFrame:
         """
         Get OHLCV (Open, High, Low, Close, Volume) data.
@@ -66,12 +67,13 @@ class USDataClient:
             interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
             start: Start date (YYYY-MM-DD), overrides period
             end: End date (YYYY-MM-DD), overrides period
+            stock: Existing yf.Ticker to reuse (optional)
 
         Returns:
             DataFrame with OHLCV data
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = stock if stock is not None else yf.Ticker(ticker)
 
             if start and end:
                 df = stock.history(start=start, end=end, interval=interval)
@@ -115,18 +117,19 @@ class USDataClient:
     # Company Information (yfinance)
     # =========================================================================
 
-    def get_company_info(self, ticker: str) -> Dict[str, Any]:
+    def get_company_info(self, ticker: str, stock: Optional[yf.Ticker] = None) -> Dict[str, Any]:
         """
         Get comprehensive company information.
 
         Args:
             ticker: Stock ticker symbol
+            stock: Existing yf.Ticker to reuse (optional; its info payload is cached)
 
         Returns:
             Dictionary with company info
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = stock if stock is not None else yf.Ticker(ticker)
             info = stock.info
 
             if not info:
@@ -255,7 +258,7 @@ class USDataClient:
     # Institutional Holders (yfinance - FREE!)
     # =========================================================================
 
-    def get_institutional_holders(self, ticker: str) -> Dict[str, Any]:
+    def get_institutional_holders(self, ticker: str, stock: Optional[yf.Ticker] = None) -> Dict[str, Any]:
         """
         Get institutional ownership data.
 
@@ -263,12 +266,13 @@ class USDataClient:
 
         Args:
             ticker: Stock ticker symbol
+            stock: Existing yf.Ticker to reuse (optional)
 
         Returns:
             Dictionary with institutional holders and major holders
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = stock if stock is not None else yf.Ticker(ticker)
 
             result = {
                 "institutional_holders": stock.institutional_holders,
@@ -0,0 +1,119 @@
+import sys
+import urllib.request
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PRISM_US_DIR = PROJECT_ROOT / "prism-us"
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PRISM_US_DIR))
+
+from cores import data_prefetch as dp  # noqa: E402
+
+
+class _FakeStock:
+    def __init__(self, url):
+        self.url = url
+        self.metadata_calls = 0
+
+    @property
+    def sec_filings(self):
+        self.metadata_calls += 1
+        return [
+            {"type": "8-K", "date": date(2026, 8, 20), "exhibits": {"8-K": "https://cdn/8k.htm"}},
+            {"type": "10-Q", "date": date(2026, 8, 1), "exhibits": {"10-Q": self.url}},
+        ]
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body.encode("utf-8")
+
+
+@pytest.fixture()
+def env(tmp_path, monkeypatch):
+    cache = dp._get_sec_filing_cache()
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "sec_filing_cache.sqlite")
+
+    downloads = []
+    parses = []
+
+    def fake_urlopen(req, timeout=None):
+        downloads.append(req.full_url)
+        return _FakeResponse("<html>" + "x" * 5000 + "</html>")
+
+    def fake_parse(html):
+        parses.append(len(html))
+        return "### Segment Revenue from 10-K filing\n\n| Segment | Revenue |\n"
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(dp, "_parse_10k_segment_revenue", fake_parse)
+    return cache, downloads, parses
+
+
+def test_repeat_reports_skip_metadata_download_and_parse(env):
+    cache, downloads, parses = env
+    stock = _FakeStock("https://cdn/aapl-10q.htm")
+
+    first = dp.prefetch_segment_revenue("AAPL", stock=stock)
+    second = dp.prefetch_segment_revenue("AAPL", stock=stock)
+
+    assert "from 10-Q filing" in first
+    assert second == first
+    assert downloads == ["https://cdn/aapl-10q.htm"]
+    assert len(parses) == 1
+    assert stock.metadata_calls == 1
+
+
+def test_refresh_checks_metadata_and_downloads_only_new_filings(env):
+    cache, downloads, parses = env
+    stock = _FakeStock("https://cdn/aapl-10q.htm")
+    dp.prefetch_segment_revenue("AAPL", stock=stock)
+
+    # Metadata still points at the cached filing: no download
+    assert dp.prefetch_segment_revenue("AAPL", stock=stock, refresh=True)
+    assert stock.metadata_calls == 2 and len(downloads) == 1
+
+    # A newer filing appears
+    stock.url = "https://cdn/aapl-10k.htm"
+    dp.prefetch_segment_revenue("AAPL", stock=stock, refresh=True)
+    assert downloads == ["https://cdn/aapl-10q.htm", "https://cdn/aapl-10k.htm"]
+    assert cache.get_latest("AAPL")["filing_date"] == "2026-08-01"
+
+
+def test_parser_version_bump_reparses_stored_html(env, monkeypatch):
+    cache, downloads, parses = env
+    stock = _FakeStock("https://cdn/msft-10q.htm")
+    dp.prefetch_segment_revenue("MSFT", stock=stock)
+
+    stored = cache.get_filing("MSFT", "https://cdn/msft-10q.htm")
+    assert stored["raw"].startswith("<html>")
+
+    monkeypatch.setattr(cache, "PARSER_VERSION", cache.PARSER_VERSION + 1)
+    dp.prefetch_segment_revenue("MSFT", stock=stock)
+
+    assert len(downloads) == 1
+    assert len(parses) == 2
+
+
+def test_watchlist_tickers_reads_holdings_and_recent_analyses(tmp_path):
+    import sqlite3
+
+    cache = dp._get_sec_filing_cache()
+    db = tmp_path / "tracking.sqlite"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE us_stock_holdings (ticker TEXT)")
+    conn.execute("CREATE TABLE us_watchlist_history (ticker TEXT, analyzed_date TEXT)")
+    conn.execute("INSERT INTO us_stock_holdings VALUES ('nvda')")
+    conn.execute("INSERT INTO us_watchlist_history VALUES ('AAPL', '2999-01-01')")
+    conn.execute("INSERT INTO us_watchlist_history VALUES ('IBM', '2000-01-01')")
+    conn.commit()
+    conn.close()
+
+    assert cache.watchlist_tickers(days=30, db_path=db) == ["AAPL", "NVDA"]
@@ -83,6 +83,7 @@ def tmp_db(tmp_path, monkeypatch):
     conn.commit()
     conn.close()
     monkeypatch.setattr(lb, "DB_PATH", str(db))
+    monkeypatch.setattr(lb, "_baseline_failed_at", {})
     return str(db)
 
 
@@ -115,7 +116,10 @@ def _patch(monkeypatch, trader, agent_holder=None, make_agent_counter=None,
             FakeCtx(trader), intent_store=IntentStore(lb.DB_PATH)
         ),
     )
-    monkeypatch.setattr(lb, "_fetch_ma50", lambda market, ticker: ma50)
+    monkeypatch.setattr(
+        lb, "_compute_baseline",
+        lambda market, ticker, session_date: {"ma_50": ma50},
+    )
     monkeypatch.setattr(lb, "_compute_live_regime", lambda market: regime)
 
     async def _fake_make_agent(market):
@@ -0,0 +1,100 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PRISM_US_DIR = PROJECT_ROOT / "prism-us"
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PRISM_US_DIR))
+
+from cores import data_prefetch as dp  # noqa: E402
+
+
+def test_dependent_task_waits_for_shared_result():
+    order = []
+    lock = threading.Lock()
+
+    def step(name, delay=0.0):
+        def run():
+            time.sleep(delay)
+            with lock:
+                order.append(name)
+            return name
+        return run
+
+    tasks = [
+        dp.PrefetchTask("profile", step("profile"), deps=("info",)),
+        dp.PrefetchTask("info", step("info", delay=0.05)),
+        dp.PrefetchTask("ohlcv", step("ohlcv")),
+    ]
+
+    results = {name: value for name, value, _ in dp.iter_prefetch_tasks(tasks, max_workers=3)}
+
+    assert results == {"profile": "profile", "info": "info", "ohlcv": "ohlcv"}
+    assert order.index("info") < order.index("profile")
+
+
+def test_failures_and_timeouts_yield_none_without_blocking_others():
+    release = threading.Event()
+
+    def boom():
+        raise RuntimeError("rate limited")
+
+    tasks = [
+        dp.PrefetchTask("slow", lambda: release.wait(5), timeout=0.1),
+        dp.PrefetchTask("broken", boom),
+        dp.PrefetchTask("fast", lambda: "ok"),
+    ]
+
+    start = time.monotonic()
+    results = {name: value for name, value, _ in dp.iter_prefetch_tasks(tasks, max_workers=3)}
+    release.set()
+
+    assert results == {"slow": None, "broken": None, "fast": "ok"}
+    assert time.monotonic() - start < 2
+
+
+def test_analysis_prefetch_runs_concurrently_and_shares_one_ticker(monkeypatch):
+    import yfinance as yf
+
+    created = []
+
+    class _FakeTicker:
+        def __init__(self, ticker):
+            created.append(ticker)
+
+        @property
+        def info(self):
+            return {"longName": "Apple"}
+
+    seen_sessions = set()
+
+    def slow(label):
+        def fetch(ticker, stock=None, period=None):
+            if stock is not None:
+                seen_sessions.add(id(stock))
+            time.sleep(0.1)
+            return f"{label}:{ticker}"
+        return fetch
+
+    monkeypatch.setattr(yf, "Ticker", _FakeTicker)
+    for name in ("prefetch_us_holder_info", "prefetch_stock_info", "prefetch_recommendations",
+                 "prefetch_company_profile", "prefetch_analysis_estimates",
+                 "prefetch_financial_statements", "prefetch_segment_revenue"):
+        monkeypatch.setattr(dp, name, slow(name))
+    monkeypatch.setattr(dp, "prefetch_us_stock_ohlcv", slow("ohlcv"))
+
+    start = time.monotonic()
+    result = dp.prefetch_us_analysis_data("AAPL", max_workers=16)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.6  # 13 fetches of 0.1s each ran in parallel
+    assert created == ["AAPL"]
+    assert len(seen_sessions) == 1
+    assert result["stock_ohlcv"] == "ohlcv:AAPL"
+    assert list(result["market_indices"]) == ["sp500", "nasdaq", "dow", "russell", "vix"]
+    assert result["market_indices"]["vix"] == "ohlcv:^VIX"
+    assert result["segment_revenue"] == "prefetch_segment_revenue:AAPL"
+    assert "info" not in result
@@ -188,6 +188,7 @@ _translator_module = _import_from_main_cores(
     "cores/agents/telegram_translator_agent.py"
 )
 translate_telegram_message = _translator_module.translate_telegram_message
+schedule_telegram_translations = _translator_module.schedule_telegram_translations
 
 # Directory configuration
 US_REPORTS_DIR = PRISM_US_DIR / "reports"
@@ -750,23 +751,27 @@ class USStockAnalysisOrchestrator:
     async def _send_translated_messages(self, bot_agent, message_contents: list):
         """
         Send translated telegram messages to broadcast channels (non-blocking, fire-and-forget)
-        Languages are processed in parallel for faster delivery.
+        All (message x language) translations start at once; each language
+        channel sends in order as soon as its next translation is ready.
 
         Args:
             bot_agent: TelegramBotAgent instance
             message_contents: List of original message content strings (pre-read from files)
         """
         try:
+            channels = {}
+            for lang in self.telegram_config.broadcast_languages:
+                channel_id = self.telegram_config.get_broadcast_channel_id(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+            translations = schedule_telegram_translations(message_contents, list(channels))
+
             async def _translate_and_send_lang(lang, channel_id):
-                for original_message in message_contents:
+                for translation in translations[lang]:
                     try:
-                        logger.info(f"Translating US telegram message to {lang}")
-                        translated_message = await translate_telegram_message(
-                            original_message,
-                            model="gpt-5.6-luna",
-                            from_lang="ko",
-                            to_lang=lang
-                        )
+                        translated_message = await translation
                         success = await bot_agent.send_message(channel_id, translated_message, msg_type="analysis")
                         if success:
                             logger.info(f"US telegram message sent successfully to {lang} channel")
@@ -781,11 +786,7 @@ class USStockAnalysisOrchestrator:
                             return
 
             lang_tasks = []
-            for lang in self.telegram_config.broadcast_languages:
-                channel_id = self.telegram_config.get_broadcast_channel_id(lang)
-                if not channel_id:
-                    logger.warning(f"No channel ID configured for language: {lang}")
-                    continue
+            for lang, channel_id in channels.items():
                 logger.info(f"Dispatching parallel translation for US {lang} channel")
                 lang_tasks.append(_translate_and_send_lang(lang, channel_id))
 
@@ -807,23 +808,33 @@ class USStockAnalysisOrchestrator:
         try:
             from pdf_converter import PdfRenderer
 
-            async def _translate_pdfs_for_lang(lang, channel_id, renderer):
-                for report_path in report_paths:
-                    try:
-                        logger.info(f"Translating US markdown report {report_path} to {lang}")
-
-                        with open(report_path, 'r', encoding='utf-8') as f:
-                            original_report = f.read()
+            # Read each report once and start its translation into every
+            # language now, so rendering never waits on a serial LLM queue.
+            prepared = []
+            for report_path in report_paths:
+                try:
+                    with open(report_path, 'r', encoding='utf-8') as f:
+                        original_report = f.read()
+                    text_for_translation, images = self._extract_base64_images(original_report)
+                    logger.info(f"Prepared US report for translation: {len(text_for_translation)} chars (extracted {len(images)} images)")
+                    prepared.append((report_path, text_for_translation, images))
+                except Exception as e:
+                    logger.error(f"Error reading US report {report_path}: {str(e)}")
 
-                        text_for_translation, images = self._extract_base64_images(original_report)
-                        logger.info(f"Prepared US report for translation: {len(text_for_translation)} chars (extracted {len(images)} images)")
+            channels = {}
+            for lang in self.telegram_config.broadcast_languages:
+                channel_id = self.telegram_config.get_broadcast_channel_id(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+            translations = schedule_telegram_translations([text for _, text, _ in prepared], list(channels))
 
-                        translated_report = await translate_telegram_message(
-                            text_for_translation,
-                            model="gpt-5.6-luna",
-                            from_lang="ko",
-                            to_lang=lang
-                        )
+            async def _translate_pdfs_for_lang(lang, channel_id, renderer):
+                for (report_path, _, images), translation in zip(prepared, translations[lang]):
+                    try:
+                        logger.info(f"Waiting for {lang} translation of US markdown report {report_path}")
+                        translated_report = await translation
 
                         translated_report = self._restore_base64_images(translated_report, images)
                         logger.info(f"Restored images to translated US report: {len(translated_report)} chars")
@@ -866,11 +877,7 @@ class USStockAnalysisOrchestrator:
             # them so the Chromium launch cost is paid ONCE instead of once per file
             # (previously N launches for N PDFs — the batch's main slow tail).
             async with PdfRenderer() as renderer:
-                for lang in self.telegram_config.broadcast_languages:
-                    channel_id = self.telegram_config.get_broadcast_channel_id(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID configured for language: {lang}")
-                        continue
+                for lang, channel_id in channels.items():
                     logger.info(f"Processing PDF translation for US {lang} channel (shared browser)")
                     try:
                         await _translate_pdfs_for_lang(lang, channel_id, renderer)
@@ -51,6 +51,8 @@ from prism_core.positions import (  # noqa: E402
     legacy_position_id,
     mirror_write_fail_open,
 )
+from prism_core.tracking_repository import TrackingRepository  # noqa: E402
+from telegram_broadcaster import get_broadcaster  # noqa: E402
 
 _openai_debug_spec = _ilu.spec_from_file_location("cores.openai_debug", PROJECT_ROOT / "cores" / "openai_debug.py")
 if _openai_debug_spec and _openai_debug_spec.loader:
@@ -64,7 +66,7 @@ if _error_spec and _error_spec.loader:
     log_openai_error = _error_mod.log_openai_error
 
 from telegram import Bot
-from telegram.error import NetworkError, RetryAfter, TelegramError, TimedOut
+from telegram.error import NetworkError, TelegramError, TimedOut
 
 # O'Neil 룰베이스 매도 fallback (2026-06-04 quota 사고 대응).
 # prism-us/cores 가 sys.path 우선이라 prism-us/cores/oneil_fallback 로 해석됨.
@@ -144,6 +146,8 @@ _translator_module = _import_from_main_cores(
     "cores/agents/telegram_translator_agent.py"
 )
 translate_telegram_message = _translator_module.translate_telegram_message
+translate_telegram_messages = _translator_module.translate_telegram_messages
+schedule_telegram_translations = _translator_module.schedule_telegram_translations
 
 # Load parse_llm_json from main project cores/utils.py
 # (avoids prism-us/cores/ namespace collision)
@@ -529,6 +533,7 @@ class USStockTrackingAgent:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self.repo: TrackingRepository | None = None
         self.language = "en"  # Default to English for US
         # Trading journal feature flag — Priority: parameter > env > default(False).
         # KR 에이전트와 동일하게 ENABLE_TRADING_JOURNAL env 를 존중한다.
@@ -583,6 +588,8 @@ class USStockTrackingAgent:
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
+        # Non-blocking access for the hot async paths (own connection, DB thread)
+        self.repo = TrackingRepository(self.db_path, holdings_table="us_stock_holdings")
 
         # Initialize trading scenario agent for US (skipped for lightweight consumers).
         self.trading_agent = None if skip_llm_agent else \
@@ -880,15 +887,33 @@ class USStockTrackingAgent:
         """Calculate trading value ranking change."""
         return await get_trading_value_rank_change(ticker)
 
+    def _db_repo(self) -> TrackingRepository | None:
+        """The DB-thread repository, or None to use the shared connection.
+
+        Falls back while the shared connection holds uncommitted writes: the
+        repository's own connection would not see them yet.
+        """
+        repo = getattr(self, "repo", None)
+        if repo is None or (isinstance(self.conn, sqlite3.Connection) and self.conn.in_transaction):
+            return None
+        return repo
+
+    async def _db_call(self, fn, *args, **kwargs):
+        """Run a cursor-based helper off the event loop."""
+        repo = self._db_repo()
+        if repo is None:
+            return fn(self.cursor, *args, **kwargs)
+        return await repo.call(fn, *args, **kwargs)
+
     async def _is_ticker_in_holdings(self, ticker: str) -> bool:
         """Check if stock is already in holdings."""
         account_key, _ = self._account_scope()
-        return is_us_ticker_in_holdings(self.cursor, ticker, account_key=account_key)
+        return await self._db_call(is_us_ticker_in_holdings, ticker, account_key=account_key)
 
     async def _get_current_slots_count(self) -> int:
         """Get current number of holdings."""
         account_key, _ = self._account_scope()
-        return get_us_holdings_count(self.cursor, account_key=account_key)
+        return await self._db_call(get_us_holdings_count, account_key=account_key)
 
     async def _check_sector_diversity(self, sector: str, is_pyramiding_add: bool = False) -> bool:
         """Check for over-concentration in same sector.
@@ -901,8 +926,8 @@ class USStockTrackingAgent:
         if is_pyramiding_add:
             return True
         account_key, _ = self._account_scope()
-        return check_sector_diversity(
-            self.cursor, sector,
+        return await self._db_call(
+            check_sector_diversity, sector,
             self.MAX_SAME_SECTOR, self.SECTOR_CONCENTRATION_RATIO, account_key=account_key
         )
 
@@ -2769,15 +2794,19 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
             # Query holdings list
             # id included for pyramiding (#288): enables per-row delete and
             # fractional-sell quantity computation for multi-row tickers.
-            self.cursor.execute(
-                """SELECT id, ticker, company_name, buy_price, buy_date, current_price,
-                   scenario, target_price, stop_loss, last_updated,
-                   trigger_type, trigger_mode, sector, account_key, account_name
-                   FROM us_stock_holdings
-                   WHERE account_key = ?""",
-                (self._account_scope()[0],)
-            )
-            holdings = [dict(row) for row in self.cursor.fetchall()]
+            repo = self._db_repo()
+            if repo is not None:
+                holdings = await repo.holdings(self._account_scope()[0])
+            else:
+                self.cursor.execute(
+                    """SELECT id, ticker, company_name, buy_price, buy_date, current_price,
+                       scenario, target_price, stop_loss, last_updated,
+                       trigger_type, trigger_mode, sector, account_key, account_name
+                       FROM us_stock_holdings
+                       WHERE account_key = ?""",
+                    (self._account_scope()[0],)
+                )
+                holdings = [dict(row) for row in self.cursor.fetchall()]
 
             if not holdings:
                 logger.info("No US holdings")
@@ -3072,14 +3101,17 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                     # Save holding decision when not selling
                     await self._save_holding_decision(ticker, current_price, should_sell, sell_reason, stock)
 
-                    # Update current price
-                    self.cursor.execute(
-                        """UPDATE us_stock_holdings
-                           SET current_price = ?, last_updated = ?
-                           WHERE ticker = ? AND account_key = ?""",
-                        (current_price, now, ticker, stock.get("account_key"))
-                    )
-                    self.conn.commit()
+                    # Update current price (batched into one commit per cycle)
+                    if repo is not None:
+                        repo.queue_price_update(ticker, stock.get("account_key"), current_price, now)
+                    else:
+                        self.cursor.execute(
+                            """UPDATE us_stock_holdings
+                               SET current_price = ?, last_updated = ?
+                               WHERE ticker = ? AND account_key = ?""",
+                            (current_price, now, ticker, stock.get("account_key"))
+                        )
+                        self.conn.commit()
                     logger.info(f"{ticker} ({company_name}) price updated: ${current_price:.2f} ({sell_reason})")
 
             return sold_stocks
@@ -3088,6 +3120,14 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
             logger.error(f"Error updating holdings: {str(e)}")
             logger.error(traceback.format_exc())
             return []
+        finally:
+            # Price refreshes must land before the summary reads them back
+            repo = getattr(self, "repo", None)
+            if repo is not None and repo.pending:
+                try:
+                    await repo.flush()
+                except sqlite3.Error as e:
+                    logger.error(f"Holding price update flush failed: {e}")
 
     async def generate_report_summary(self) -> str:
         """
@@ -3728,29 +3768,28 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
         포트폴리오 유실, 방송채널 en/es 3건 유실 — logs/us_afternoon.log).
         주의: TimedOut 은 서버가 이미 수신했을 수 있어 재시도 시 드물게 중복
         발송 가능 — 채널 공지 특성상 유실보다 중복이 낫다는 운영 판단.
+
+        Pacing, per-chat ordering and RetryAfter waits are handled by the shared
+        broadcaster; transient network errors are retried here.
         """
-        last_err = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                return await self.telegram_bot.send_message(
-                    chat_id=chat_id,
-                    text=text,
-                    connect_timeout=10,
-                    read_timeout=30,
-                    write_timeout=30,
-                    pool_timeout=10,
-                )
-            except RetryAfter as e:
-                last_err = e
-                wait = float(getattr(e, "retry_after", 3)) + 1.0
-                logger.warning(f"Telegram flood control (attempt {attempt}/{max_attempts}): wait {wait}s")
-                await asyncio.sleep(wait)
-            except (TimedOut, NetworkError) as e:
-                last_err = e
-                if attempt < max_attempts:
+        async def _send():
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await self.telegram_bot.send_message(
+                        chat_id=chat_id,
+                        text=text,
+                        connect_timeout=10,
+                        read_timeout=30,
+                        write_timeout=30,
+                        pool_timeout=10,
+                    )
+                except (TimedOut, NetworkError) as e:
+                    if attempt >= max_attempts:
+                        raise
                     logger.warning(f"Telegram send attempt {attempt}/{max_attempts} failed ({e}); retrying")
                     await asyncio.sleep(2 * attempt)
-        raise last_err
+
+        return await get_broadcaster().send(chat_id, _send, max_retries=max_attempts)
 
     async def send_telegram_message(self, chat_id: str, language: str = "ko",
                                     portfolio_force: bool = False,
@@ -3826,14 +3865,9 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
             if language == "en":
                 logger.info(f"Translating {len(self.message_queue)} US messages to English")
                 try:
-                    # Note: translate_telegram_message is pre-loaded at module level
+                    # Note: translate_telegram_messages is pre-loaded at module level
                     # from main project's cores/agents/telegram_translator_agent.py
-                    translated_queue = []
-                    for idx, message in enumerate(self.message_queue, 1):
-                        logger.info(f"Translating US message {idx}/{len(self.message_queue)}")
-                        translated = await translate_telegram_message(message, model="gpt-5.6-luna")
-                        translated_queue.append(translated)
-                    self.message_queue = translated_queue
+                    self.message_queue = await translate_telegram_messages(self.message_queue, to_lang="en")
                     logger.info("All US messages translated successfully")
                 except Exception as e:
                     logger.error(f"Translation failed: {str(e)}. Using original Korean messages.")
@@ -3876,7 +3910,6 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                             )
                             if i == 1:
                                 first_msg_id = result.message_id
-                            await asyncio.sleep(0.5)  # Short delay between split messages
 
                         # Notify with full original message, link to first part
                         firebase_tasks.append(self._schedule_firebase(message, chat_id, first_msg_id, msg_type=msg_type))
@@ -3886,12 +3919,10 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                     logger.error(f"US Telegram message send failed: {e}")
                     success = False
 
-                # Delay to prevent API rate limiting
-                await asyncio.sleep(1)
-
             # Gather Firebase notifications (non-blocking for Telegram delivery)
             if firebase_tasks:
                 await asyncio.gather(*firebase_tasks, return_exceptions=True)
+            get_broadcaster().log_metrics("US Telegram tracking")
 
             # Send to broadcast channels if configured (awaited in run() finally block,
             # or inline here when await_broadcast=True — intraday loops don't call run()
@@ -3927,32 +3958,31 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
             msg_types: msg_type for each message in the list
         """
         try:
-            # Note: translate_telegram_message is pre-loaded at module level
+            # Note: schedule_telegram_translations is pre-loaded at module level
             # from main project's cores/agents/telegram_translator_agent.py
-
+            channels = {}
             for lang in self.telegram_config.broadcast_languages:
-                try:
-                    # Get channel ID for this language
-                    channel_id = self.telegram_config.get_broadcast_channel_id(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID configured for language: {lang}")
-                        continue
+                # Get channel ID for this language
+                channel_id = self.telegram_config.get_broadcast_channel_id(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+
+            # Start every (message x language) translation up front; each channel
+            # sends in order as soon as its next translation is ready.
+            translations = schedule_telegram_translations(messages, list(channels))
 
+            async def _send_lang(lang, channel_id):
+                try:
                     logger.info(f"Sending US tracking messages to {lang} channel")
 
-                    # Translate and send each message (Firebase non-blocking)
+                    # Send each translated message (Firebase non-blocking)
                     firebase_tasks = []
-                    for msg_idx, message in enumerate(messages):
+                    for msg_idx, translation in enumerate(translations[lang]):
                         msg_type = msg_types[msg_idx] if msg_types and msg_idx < len(msg_types) else None
                         try:
-                            # Translate message
-                            logger.info(f"Translating US tracking message to {lang}")
-                            translated_message = await translate_telegram_message(
-                                message,
-                                model="gpt-5.6-luna",
-                                from_lang="ko",
-                                to_lang=lang
-                            )
+                            translated_message = await translation
 
                             # Send translated message
                             MAX_MESSAGE_LENGTH = 4096
@@ -3983,19 +4013,21 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                                     )
                                     if i == 1:
                                         first_msg_id = result.message_id
-                                    await asyncio.sleep(0.5)
 
                                 firebase_tasks.append(self._schedule_firebase(translated_message, channel_id, first_msg_id, msg_type=msg_type))
 
                             logger.info(f"US tracking message sent successfully to {lang} channel")
 
-                            await asyncio.sleep(1)
-
                         except Exception as e:
                             logger.error(f"Error translating/sending US message to {lang}: {str(e)}")
                             from telegram_config import is_openai_quota_error, send_openai_quota_alert
                             if is_openai_quota_error(e):
-                                await send_openai_quota_alert(self.telegram_config, market="US")
+                                if not quota_alerted:
+                                    quota_alerted.append(lang)
+                                    await send_openai_quota_alert(self.telegram_config, market="US")
+                                for pending in translations.values():
+                                    for task in pending:
+                                        task.cancel()
                                 return
 
                     # Gather Firebase notifications for this language
@@ -4005,6 +4037,13 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                 except Exception as e:
                     logger.error(f"Error processing language {lang}: {str(e)}")
 
+            quota_alerted = []
+            await asyncio.gather(
+                *(_send_lang(lang, channel_id) for lang, channel_id in channels.items()),
+                return_exceptions=True,
+            )
+            get_broadcaster().log_metrics("US Telegram tracking broadcast")
+
         except Exception as e:
             logger.error(f"Error in _send_to_translation_channels: {str(e)}")
 
@@ -4219,6 +4258,9 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                     self._broadcast_task = None
 
                 # Ensure connection is always closed
+                if getattr(self, "repo", None) is not None:
+                    await self.repo.close()
+                    self.repo = None
                 if self.conn:
                     self.conn.close()
                     logger.info("Database connection closed")
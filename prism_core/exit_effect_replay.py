@@ -1,9 +1,17 @@
-"""Bounded, transport-agnostic replay for durable exit effects."""
+"""Bounded, transport-agnostic replay for durable exit effects.
+
+``run_exit_effect_replay`` claims one bounded batch and returns.
+``ExitEffectReplayWorker`` keeps running: it refills per-type slots as
+handlers finish, renews leases for in-flight work and keeps per-type
+throughput and latency counters.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import logging
 import sqlite3
+import time
 from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -17,8 +25,14 @@ from prism_core.exit_effects import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 EffectHandler = Callable[[dict[str, Any]], Awaitable[str | bool | None]]
 
+# Handlers of one type share a transport: the journal writes to the same
+# SQLite file and Telegram rate-limits per bot, while the publishers scale.
+DEFAULT_TYPE_CONCURRENCY = {"JOURNAL": 1, "TELEGRAM": 2, "REDIS": 8, "GCP": 8}
+
 
 @dataclass(frozen=True)
 class ExitEffectDeliveryOutcome:
@@ -57,6 +71,54 @@ def _retry_delay(
     return delay
 
 
+def _selected_effect_types(handlers: Mapping[str, EffectHandler]) -> tuple[str, ...]:
+    unsupported = set(handlers) - set(EXIT_EFFECT_TYPES)
+    if unsupported:
+        raise ValueError("unsupported exit effect handler")
+    if any(not callable(handler) for handler in handlers.values()):
+        raise TypeError("exit effect handlers must be callable")
+    return tuple(
+        effect_type for effect_type in EXIT_EFFECT_TYPES if effect_type in handlers
+    )
+
+
+def _validate_replay_bounds(
+    *,
+    lease_seconds: int,
+    handler_timeout_seconds: float,
+    max_attempts: int,
+    base_delay_seconds: int,
+    max_delay_seconds: int,
+) -> None:
+    if handler_timeout_seconds <= 0 or handler_timeout_seconds >= lease_seconds:
+        raise ValueError("handler timeout must be positive and shorter than the lease")
+    if base_delay_seconds < 1 or max_delay_seconds < base_delay_seconds:
+        raise ValueError("invalid replay delay bounds")
+    if not isinstance(max_attempts, int) or max_attempts < 1:
+        raise ValueError("max_attempts must be a positive integer")
+
+
+def _type_concurrency(
+    effect_types: tuple[str, ...], concurrency: int | Mapping[str, int] | None
+) -> dict[str, int]:
+    if concurrency is None:
+        limits = {t: DEFAULT_TYPE_CONCURRENCY[t] for t in effect_types}
+    elif isinstance(concurrency, int):
+        limits = {t: concurrency for t in effect_types}
+    else:
+        if set(concurrency) - set(EXIT_EFFECT_TYPES):
+            raise ValueError("unsupported exit effect type")
+        limits = {
+            t: concurrency.get(t, DEFAULT_TYPE_CONCURRENCY[t]) for t in effect_types
+        }
+    if any(
+        isinstance(value, bool) or not isinstance(value, int) or value < 1
+        for value in limits.values()
+    ):
+        raise ValueError("concurrency must be a positive integer")
+    return limits
+
+
 def _open_replay_database(db_path: str | Path) -> sqlite3.Connection:
     resolved_db_path = Path(db_path).expanduser().resolve()
     if not resolved_db_path.is_file():
@@ -177,12 +239,13 @@ async def deliver_exit_effect_once(
         raise ValueError("unsupported exit effect type")
     if not callable(handler):
         raise TypeError("exit effect handler must be callable")
-    if handler_timeout_seconds <= 0 or handler_timeout_seconds >= lease_seconds:
-        raise ValueError("handler timeout must be positive and shorter than the lease")
-    if base_delay_seconds < 1 or max_delay_seconds < base_delay_seconds:
-        raise ValueError("invalid replay delay bounds")
-    if not isinstance(max_attempts, int) or max_attempts < 1:
-        raise ValueError("max_attempts must be a positive integer")
+    _validate_replay_bounds(
+        lease_seconds=lease_seconds,
+        handler_timeout_seconds=handler_timeout_seconds,
+        max_attempts=max_attempts,
+        base_delay_seconds=base_delay_seconds,
+        max_delay_seconds=max_delay_seconds,
+    )
 
     connection = _open_replay_database(db_path)
     store = ExitEffectStore(connection)
@@ -228,12 +291,58 @@ async def deliver_exit_effect_once(
         connection.close()
 
 
+async def _keep_leases(
+    connection: sqlite3.Connection,
+    store: ExitEffectStore,
+    in_flight: Mapping[str, str],
+    stopped: asyncio.Event,
+    *,
+    owner: str,
+    lease_seconds: int,
+    interval_seconds: float,
+    now: Callable[[], datetime],
+    on_renewed: Callable[[str], None] | None = None,
+) -> None:
+    """Extend the leases of ``in_flight`` (id -> effect type) until ``stopped``."""
+
+    while True:
+        try:
+            await asyncio.wait_for(stopped.wait(), timeout=interval_seconds)
+            return
+        except asyncio.TimeoutError:
+            pass
+        effects = dict(in_flight)
+        if not effects:
+            continue
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            renewed = store.renew_leases(
+                effect_ids=effects,
+                owner=owner,
+                now=now(),
+                lease_seconds=lease_seconds,
+            )
+            connection.commit()
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.rollback()
+            logger.warning("exit effect lease renewal failed", exc_info=True)
+            continue
+        lost = sorted(set(effects) - set(renewed))
+        if lost:
+            logger.warning("exit effect leases lost before completion: %s", lost)
+        if on_renewed is not None:
+            for effect_id in renewed:
+                on_renewed(effects[effect_id])
+
+
 async def run_exit_effect_replay(
     db_path: str | Path,
     *,
     handlers: Mapping[str, EffectHandler],
     owner: str,
     limit: int = 10,
+    concurrency: int | Mapping[str, int] | None = None,
     lease_seconds: int = 60,
     handler_timeout_seconds: float = 30,
     max_attempts: int = 5,
@@ -241,25 +350,28 @@ async def run_exit_effect_replay(
     max_delay_seconds: int = 3600,
     now: Callable[[], datetime] = _utc_now,
 ) -> dict[str, int]:
-    """Claim and process at most ``limit`` effects without holding I/O locks."""
+    """Claim and process at most ``limit`` effects without holding I/O locks.
 
-    effect_types = tuple(
-        effect_type for effect_type in EXIT_EFFECT_TYPES if effect_type in handlers
-    )
-    unsupported = set(handlers) - set(EXIT_EFFECT_TYPES)
-    if unsupported:
-        raise ValueError("unsupported exit effect handler")
-    if any(not callable(handler) for handler in handlers.values()):
-        raise TypeError("exit effect handlers must be callable")
+    Claimed effects run concurrently, at most ``concurrency`` per effect type
+    (``DEFAULT_TYPE_CONCURRENCY`` when omitted). Leases of effects still
+    waiting for a slot or running are renewed until they complete.
+    """
+
+    effect_types = _selected_effect_types(handlers)
     summary = {"claimed": 0, "delivered": 0, "rescheduled": 0, "dead": 0}
     if not effect_types:
         return summary
-    if handler_timeout_seconds <= 0 or handler_timeout_seconds >= lease_seconds:
-        raise ValueError("handler timeout must be positive and shorter than the lease")
-    if base_delay_seconds < 1 or max_delay_seconds < base_delay_seconds:
-        raise ValueError("invalid replay delay bounds")
-    if not isinstance(max_attempts, int) or max_attempts < 1:
-        raise ValueError("max_attempts must be a positive integer")
+    _validate_replay_bounds(
+        lease_seconds=lease_seconds,
+        handler_timeout_seconds=handler_timeout_seconds,
+        max_attempts=max_attempts,
+        base_delay_seconds=base_delay_seconds,
+        max_delay_seconds=max_delay_seconds,
+    )
+    slots = {
+        effect_type: asyncio.Semaphore(value)
+        for effect_type, value in _type_concurrency(effect_types, concurrency).items()
+    }
 
     connection = _open_replay_database(db_path)
     store = ExitEffectStore(connection)
@@ -274,23 +386,302 @@ async def run_exit_effect_replay(
         )
         connection.commit()
         summary["claimed"] = len(claimed)
+        pending = {str(effect["id"]): str(effect["effect_type"]) for effect in claimed}
 
-        for effect in claimed:
+        async def process(effect: dict[str, Any]) -> ExitEffectDeliveryOutcome:
             effect_type = str(effect["effect_type"])
-            handler = handlers[effect_type]
-            outcome = await _process_claimed_effect(
+            try:
+                async with slots[effect_type]:
+                    return await _process_claimed_effect(
+                        connection,
+                        store,
+                        effect,
+                        handler=handlers[effect_type],
+                        owner=owner,
+                        handler_timeout_seconds=handler_timeout_seconds,
+                        max_attempts=max_attempts,
+                        base_delay_seconds=base_delay_seconds,
+                        max_delay_seconds=max_delay_seconds,
+                        now=now,
+                    )
+            finally:
+                pending.pop(str(effect["id"]), None)
+
+        stopped = asyncio.Event()
+        keeper = asyncio.create_task(
+            _keep_leases(
                 connection,
                 store,
-                effect,
-                handler=handler,
+                pending,
+                stopped,
                 owner=owner,
-                handler_timeout_seconds=handler_timeout_seconds,
-                max_attempts=max_attempts,
-                base_delay_seconds=base_delay_seconds,
-                max_delay_seconds=max_delay_seconds,
+                lease_seconds=lease_seconds,
+                interval_seconds=lease_seconds / 3,
                 now=now,
             )
+        )
+        tasks = [asyncio.create_task(process(effect)) for effect in claimed]
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            stopped.set()
+            await asyncio.gather(keeper, return_exceptions=True)
+        for outcome in outcomes:
             summary[outcome.status] += 1
     finally:
         connection.close()
     return summary
+
+
+def _empty_type_stats() -> dict[str, float]:
+    return {
+        "claimed": 0,
+        "delivered": 0,
+        "rescheduled": 0,
+        "dead": 0,
+        "cancelled": 0,
+        "errors": 0,
+        "in_flight": 0,
+        "lease_renewals": 0,
+        "latency_total_ms": 0.0,
+        "latency_max_ms": 0.0,
+    }
+
+
+class ExitEffectReplayWorker:
+    """Long-running replay that keeps every effect type's slots busy.
+
+    Each type has its own concurrency limit, so a slow Telegram backlog never
+    holds up Redis or GCP publishing. The worker claims only as many effects
+    as a type has free slots, claims again as soon as one finishes, and
+    renews the leases of running effects every ``renew_interval_seconds``.
+    Handlers are plain coroutines, so tests can pass in-process fakes.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        handlers: Mapping[str, EffectHandler],
+        owner: str,
+        concurrency: int | Mapping[str, int] | None = None,
+        lease_seconds: int = 60,
+        handler_timeout_seconds: float = 30,
+        max_attempts: int = 5,
+        base_delay_seconds: int = 30,
+        max_delay_seconds: int = 3600,
+        poll_interval_seconds: float = 5.0,
+        renew_interval_seconds: float | None = None,
+        now: Callable[[], datetime] = _utc_now,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        effect_types = _selected_effect_types(handlers)
+        if not effect_types:
+            raise ValueError("at least one exit effect handler is required")
+        if not str(owner or "").strip():
+            raise ValueError("lease owner is required")
+        _validate_replay_bounds(
+            lease_seconds=lease_seconds,
+            handler_timeout_seconds=handler_timeout_seconds,
+            max_attempts=max_attempts,
+            base_delay_seconds=base_delay_seconds,
+            max_delay_seconds=max_delay_seconds,
+        )
+        if poll_interval_seconds <= 0:
+            raise ValueError("poll interval must be positive")
+        if renew_interval_seconds is None:
+            renew_interval_seconds = lease_seconds / 3
+        if renew_interval_seconds <= 0 or renew_interval_seconds >= lease_seconds:
+            raise ValueError("renew interval must be positive and shorter than the lease")
+
+        self.db_path = db_path
+        self.handlers = dict(handlers)
+        self.owner = owner
+        self.effect_types = effect_types
+        self.concurrency = _type_concurrency(effect_types, concurrency)
+        self.lease_seconds = lease_seconds
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.renew_interval_seconds = renew_interval_seconds
+        self.now = now
+        self.clock = clock
+        self.stats = {effect_type: _empty_type_stats() for effect_type in effect_types}
+        self._in_flight: dict[str, str] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._stopping = False
+        self._wake: asyncio.Event | None = None
+        self._started_at: float | None = None
+
+    def stop(self) -> None:
+        """Stop claiming; ``run`` returns once in-flight effects finish."""
+
+        self._stopping = True
+        if self._wake is not None:
+            self._wake.set()
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Per-type counters plus average latency and completions per second."""
+
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = max(self.clock() - self._started_at, 1e-9)
+        report = {}
+        for effect_type, stats in self.stats.items():
+            completed = stats["delivered"] + stats["rescheduled"] + stats["dead"]
+            report[effect_type] = {
+                **stats,
+                "concurrency": self.concurrency[effect_type],
+                "latency_avg_ms": (
+                    stats["latency_total_ms"] / completed if completed else 0.0
+                ),
+                "per_second": completed / elapsed if elapsed else 0.0,
+            }
+        return report
+
+    async def run(self, *, until_idle: bool = False) -> dict[str, dict[str, float]]:
+        """Replay until ``stop()``, or until nothing is ready and running.
+
+        Cancelling ``run`` cancels in-flight handlers; each records its
+        failure and is rescheduled before the cancellation propagates.
+        """
+
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._started_at = self.clock()
+        connection = _open_replay_database(self.db_path)
+        store = ExitEffectStore(connection)
+        stopped = asyncio.Event()
+        keeper = asyncio.create_task(
+            _keep_leases(
+                connection,
+                store,
+                self._in_flight,
+                stopped,
+                owner=self.owner,
+                lease_seconds=self.lease_seconds,
+                interval_seconds=self.renew_interval_seconds,
+                now=self.now,
+                on_renewed=self._count_renewal,
+            )
+        )
+        try:
+            while not self._stopping:
+                claimed = self._claim(connection, store)
+                for effect in claimed:
+                    task = asyncio.create_task(self._deliver(connection, store, effect))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._finished)
+                if until_idle and not claimed and not self._tasks:
+                    break
+                self._wake.clear()
+                if self._tasks and all(
+                    self.stats[t]["in_flight"] >= self.concurrency[t]
+                    for t in self.effect_types
+                ):
+                    await self._wake.wait()
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(), timeout=self.poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            for task in self._tasks:
+                task.cancel()
+            raise
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            stopped.set()
+            await asyncio.gather(keeper, return_exceptions=True)
+            connection.close()
+        return self.metrics()
+
+    def _claim(
+        self, connection: sqlite3.Connection, store: ExitEffectStore
+    ) -> list[dict[str, Any]]:
+        free = {
+            effect_type: self.concurrency[effect_type] - self.stats[effect_type]["in_flight"]
+            for effect_type in self.effect_types
+        }
+        free = {effect_type: count for effect_type, count in free.items() if count > 0}
+        if not free:
+            return []
+        current = self.now()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            claimed = []
+            for effect_type, count in free.items():
+                claimed.extend(
+                    store.claim_ready_effects(
+                        owner=self.owner,
+                        limit=count,
+                        effect_types=(effect_type,),
+                        now=current,
+                        lease_seconds=self.lease_seconds,
+                    )
+                )
+            connection.commit()
+        except BaseException:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+        for effect in claimed:
+            effect_type = str(effect["effect_type"])
+            self.stats[effect_type]["claimed"] += 1
+            self.stats[effect_type]["in_flight"] += 1
+            self._in_flight[str(effect["id"])] = effect_type
+        return claimed
+
+    async def _deliver(
+        self,
+        connection: sqlite3.Connection,
+        store: ExitEffectStore,
+        effect: dict[str, Any],
+    ) -> None:
+        effect_type = str(effect["effect_type"])
+        stats = self.stats[effect_type]
+        started = self.clock()
+        try:
+            outcome = await _process_claimed_effect(
+                connection,
+                store,
+                effect,
+                handler=self.handlers[effect_type],
+                owner=self.owner,
+                handler_timeout_seconds=self.handler_timeout_seconds,
+                max_attempts=self.max_attempts,
+                base_delay_seconds=self.base_delay_seconds,
+                max_delay_seconds=self.max_delay_seconds,
+                now=self.now,
+            )
+        except asyncio.CancelledError:
+            stats["cancelled"] += 1
+            raise
+        except Exception:
+            # The lease expires and another claim retries the effect.
+            stats["errors"] += 1
+            logger.exception("exit effect replay failed: %s", effect["id"])
+            return
+        finally:
+            stats["in_flight"] -= 1
+            self._in_flight.pop(str(effect["id"]), None)
+        latency_ms = (self.clock() - started) * 1000
+        stats[outcome.status] += 1
+        stats["latency_total_ms"] += latency_ms
+        stats["latency_max_ms"] = max(stats["latency_max_ms"], latency_ms)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if self._wake is not None:
+            self._wake.set()
+
+    def _count_renewal(self, effect_type: str) -> None:
+        self.stats[effect_type]["lease_renewals"] += 1
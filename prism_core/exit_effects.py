@@ -438,6 +438,41 @@ class ExitEffectStore:
             raise RuntimeError("exit effect failure changed unexpectedly")
         return status
 
+    def renew_leases(
+        self,
+        *,
+        effect_ids: Iterable[str],
+        owner: str,
+        now: datetime | None = None,
+        lease_seconds: int = 60,
+    ) -> list[str]:
+        """Extend leases still held by ``owner``; return the ids it kept."""
+
+        self._require_active_transaction()
+        owner = str(owner or "").strip()
+        if not owner:
+            raise ValueError("lease owner is required")
+        if not isinstance(lease_seconds, int) or lease_seconds < 1:
+            raise ValueError("lease_seconds must be a positive integer")
+        current = _utc_datetime(now)
+        current_iso = _utc_iso(current)
+        lease_expires_at = _utc_iso(current + timedelta(seconds=lease_seconds))
+        renewed = []
+        for effect_id in dict.fromkeys(str(value or "").strip() for value in effect_ids):
+            if not effect_id:
+                continue
+            changed = self._execute(
+                """
+                UPDATE exit_effect_outbox
+                SET lease_expires_at=?, updated_at=?
+                WHERE id=? AND status='IN_PROGRESS' AND lease_owner=?
+                """,
+                (lease_expires_at, current_iso, effect_id, owner),
+            ).rowcount
+            if changed == 1:
+                renewed.append(effect_id)
+        return renewed
+
     def list_for_intent(self, intent_id: str) -> list[dict[str, Any]]:
         """Return decoded effect rows for audit and tests without mutation."""
 
@@ -0,0 +1,408 @@
+"""Pushed quotes for the intraday exit monitor.
+
+The cron exit loops asked KIS for a REST price per holding on every run, so a
+stop breach waited for the next cron slot to be seen. A long-running monitor
+holds one subscription set instead and is handed a tick per trade. This module
+is the seam between the two: a ``QuoteStream`` yields ``QuoteTick`` for the
+tickers currently subscribed, and the monitor does not care whether they come
+from the KIS websocket, a REST poll, or a recorded session replayed in a test.
+
+Streams are single-consumer: ``ticks()`` is iterated by one task, while
+``subscribe()`` may be called from others as holdings change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class QuoteTick:
+    market: str
+    ticker: str
+    price: float
+    at: datetime
+
+
+class QuoteStream(Protocol):
+    async def subscribe(self, tickers: Collection[str]) -> None:
+        """Replace the subscribed set; ticks for anything else stop."""
+
+    def ticks(self) -> AsyncIterator[QuoteTick]:
+        """Yield ticks until the stream ends or is closed."""
+
+    async def close(self) -> None:
+        """End ``ticks()``; safe to call more than once."""
+
+
+class ReplayQuoteStream:
+    """Play back recorded ticks, for tests or to rehearse a session offline.
+
+    Only subscribed tickers are delivered. ``speed`` > 0 keeps the recorded
+    spacing (divided by ``speed``); the default delivers ticks back to back.
+    """
+
+    def __init__(self, ticks: Iterable[QuoteTick], *, speed: float = 0.0) -> None:
+        if speed < 0:
+            raise ValueError("speed must not be negative")
+        self._ticks = list(ticks)
+        self._speed = speed
+        self._subscribed: frozenset[str] = frozenset()
+        self._closed = asyncio.Event()
+        self.stats = {"delivered": 0, "dropped": 0}
+
+    @classmethod
+    def from_jsonl(
+        cls, path: str | Path, *, market: str, speed: float = 0.0
+    ) -> "ReplayQuoteStream":
+        """One ``{"ticker", "price", "at"}`` object per line; ``at`` is ISO-8601."""
+        ticks = []
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                at = datetime.fromisoformat(row["at"])
+                if at.tzinfo is None:
+                    at = at.replace(tzinfo=timezone.utc)
+                ticks.append(
+                    QuoteTick(market, str(row["ticker"]), float(row["price"]), at)
+                )
+        return cls(ticks, speed=speed)
+
+    async def subscribe(self, tickers: Collection[str]) -> None:
+        self._subscribed = frozenset(tickers)
+
+    async def ticks(self) -> AsyncIterator[QuoteTick]:
+        previous: datetime | None = None
+        for tick in self._ticks:
+            if self._closed.is_set():
+                return
+            if self._speed and previous is not None:
+                gap = (tick.at - previous).total_seconds() / self._speed
+                if gap > 0 and await _closed_within(self._closed, gap):
+                    return
+            previous = tick.at
+            if tick.ticker not in self._subscribed:
+                self.stats["dropped"] += 1
+                continue
+            self.stats["delivered"] += 1
+            yield tick
+
+    async def close(self) -> None:
+        self._closed.set()
+
+
+class PollingQuoteStream:
+    """REST fallback when no push feed is available.
+
+    Every ``interval`` seconds the subscribed tickers are fetched through
+    ``fetch_price`` (a blocking call such as ``trader.get_current_price``)
+    on worker threads, at most ``concurrency`` at a time, and every price
+    that came back is yielded.
+    """
+
+    def __init__(
+        self,
+        market: str,
+        fetch_price: Callable[[str], Any],
+        *,
+        interval: float = 5.0,
+        concurrency: int = 4,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if interval <= 0 or concurrency <= 0:
+            raise ValueError("interval and concurrency must be positive")
+        self._market = market
+        self._fetch_price = fetch_price
+        self._interval = interval
+        self._concurrency = concurrency
+        self._clock = clock
+        self._subscribed: frozenset[str] = frozenset()
+        self._closed = asyncio.Event()
+        self.stats = {"rounds": 0, "delivered": 0, "errors": 0}
+
+    async def subscribe(self, tickers: Collection[str]) -> None:
+        self._subscribed = frozenset(tickers)
+
+    async def ticks(self) -> AsyncIterator[QuoteTick]:
+        gate = asyncio.Semaphore(self._concurrency)
+
+        async def fetch(ticker: str) -> float:
+            async with gate:
+                try:
+                    return _price_of(await asyncio.to_thread(self._fetch_price, ticker))
+                except Exception as exc:  # noqa: BLE001 - skip this ticker this round
+                    self.stats["errors"] += 1
+                    logger.warning("[%s] %s price poll failed: %s", self._market, ticker, exc)
+                    return 0.0
+
+        while not self._closed.is_set():
+            tickers = sorted(self._subscribed)
+            prices = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+            self.stats["rounds"] += 1
+            at = self._clock()
+            for ticker, price in zip(tickers, prices):
+                if price > 0 and ticker in self._subscribed:
+                    self.stats["delivered"] += 1
+                    yield QuoteTick(self._market, ticker, price, at)
+            if await _closed_within(self._closed, self._interval):
+                return
+
+    async def close(self) -> None:
+        self._closed.set()
+
+
+# Trade-tick feeds: KRX 실시간체결가 and 해외주식 실시간지연체결가.
+KIS_TRADE_TR_IDS = {"KR": "H0STCNT0", "US": "HDFSCNT0"}
+# Per TR: (fields per record, index of the symbol, index of the trade price).
+_KIS_TRADE_LAYOUT = {"H0STCNT0": (46, 0, 2), "HDFSCNT0": (26, 1, 11)}
+# Order-side exchange codes -> the three-letter codes the US feed keys on.
+US_FEED_EXCHANGES = {
+    "NASD": "NAS", "NAS": "NAS", "NYSE": "NYS", "NYS": "NYS", "AMEX": "AMS", "AMS": "AMS",
+}
+
+
+class KisRealtimeQuoteStream:
+    """KIS websocket trade feed.
+
+    One connection carries every subscription (KIS allows 40 per session;
+    anything past that is logged and left out). The connection is
+    re-established with exponential backoff and the current set is
+    re-subscribed, so a dropped socket costs ticks, not subscriptions.
+
+    ``approval_key`` is called on every connect, so a refreshed key is
+    picked up after a reconnect. ``exchanges`` maps US tickers to their
+    order-side exchange code (NASD/NYSE/AMEX); unknown tickers use NASD.
+    """
+
+    max_subscriptions = 40
+
+    def __init__(
+        self,
+        market: str,
+        *,
+        url: str,
+        approval_key: Callable[[], str],
+        exchanges: Mapping[str, str] | None = None,
+        us_key_prefix: str = "D",
+        connect: Callable[[str], Any] | None = None,
+        retry_seconds: float = 1.0,
+        max_retry_seconds: float = 30.0,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if market not in KIS_TRADE_TR_IDS:
+            raise ValueError(f"unsupported market: {market}")
+        self._market = market
+        self._tr_id = KIS_TRADE_TR_IDS[market]
+        self._url = url
+        self._approval_key = approval_key
+        self._exchanges = dict(exchanges or {})
+        self._us_key_prefix = us_key_prefix
+        self._connect = connect
+        self._retry_seconds = retry_seconds
+        self._max_retry_seconds = max_retry_seconds
+        self._clock = clock
+        self._wanted: frozenset[str] = frozenset()
+        self._ws: Any = None
+        self._key = ""
+        self._closed = asyncio.Event()
+        self.stats = {
+            "connects": 0, "delivered": 0, "dropped": 0, "errors": 0, "encrypted": 0,
+        }
+
+    def _tr_key(self, ticker: str, exchanges: Mapping[str, str] | None = None) -> str:
+        if self._market == "KR":
+            return ticker
+        code = (exchanges if exchanges is not None else self._exchanges).get(ticker) or "NASD"
+        exchange = US_FEED_EXCHANGES.get(code.upper(), "NAS")
+        return f"{self._us_key_prefix}{exchange}{ticker}"
+
+    def _message(self, tr_type: str, ticker: str, tr_key: str | None = None) -> str:
+        return json.dumps(
+            {
+                "header": {
+                    "approval_key": self._key,
+                    "custtype": "P",
+                    "tr_type": tr_type,
+                    "content-type": "utf-8",
+                },
+                "body": {
+                    "input": {"tr_id": self._tr_id, "tr_key": tr_key or self._tr_key(ticker)}
+                },
+            }
+        )
+
+    async def set_exchanges(self, exchanges: Mapping[str, str]) -> None:
+        """Replace the US ticker -> exchange map.
+
+        A subscribed ticker whose feed key changed is moved on the open
+        socket (unsubscribe the old key, subscribe the new one); otherwise
+        the next connect uses the new keys.
+        """
+        previous, self._exchanges = self._exchanges, dict(exchanges)
+        ws = self._ws
+        if ws is None or self._market == "KR":
+            return
+        try:
+            for ticker in sorted(self._wanted):
+                old_key, new_key = self._tr_key(ticker, previous), self._tr_key(ticker)
+                if old_key != new_key:
+                    await ws.send(self._message("2", ticker, old_key))
+                    await ws.send(self._message("1", ticker, new_key))
+        except Exception as exc:  # noqa: BLE001 - the reconnect re-subscribes
+            logger.warning("[%s] exchange update failed: %s", self._market, exc)
+
+    async def subscribe(self, tickers: Collection[str]) -> None:
+        wanted = sorted(set(tickers))
+        if len(wanted) > self.max_subscriptions:
+            logger.warning(
+                "[%s] %d tickers exceed the %d-subscription limit; dropping %s",
+                self._market,
+                len(wanted),
+                self.max_subscriptions,
+                wanted[self.max_subscriptions:],
+            )
+            wanted = wanted[: self.max_subscriptions]
+        previous, self._wanted = self._wanted, frozenset(wanted)
+        ws = self._ws
+        if ws is None:
+            return  # the next connect subscribes the whole set
+        try:
+            for ticker in sorted(previous - self._wanted):
+                await ws.send(self._message("2", ticker))
+            for ticker in sorted(self._wanted - previous):
+                await ws.send(self._message("1", ticker))
+        except Exception as exc:  # noqa: BLE001 - the reconnect re-subscribes
+            logger.warning("[%s] subscription update failed: %s", self._market, exc)
+
+    async def ticks(self) -> AsyncIterator[QuoteTick]:
+        connect = self._connect
+        if connect is None:
+            import websockets
+
+            connect = websockets.connect
+        delay = self._retry_seconds
+        while not self._closed.is_set():
+            try:
+                async with connect(self._url) as ws:
+                    self._key = self._approval_key()
+                    self._ws = ws
+                    self.stats["connects"] += 1
+                    for ticker in sorted(self._wanted):
+                        await ws.send(self._message("1", ticker))
+                    delay = self._retry_seconds
+                    async for raw in ws:
+                        if self._closed.is_set():
+                            return
+                        if isinstance(raw, bytes):
+                            raw = raw.decode("utf-8", "replace")
+                        if raw[:1] == "0":
+                            for tick in self._parse(raw):
+                                if tick.ticker in self._wanted:
+                                    self.stats["delivered"] += 1
+                                    yield tick
+                                else:
+                                    self.stats["dropped"] += 1
+                        elif raw[:1] == "1":
+                            # Trade feeds are plain; only order notices are encrypted.
+                            self.stats["encrypted"] += 1
+                        else:
+                            await self._control(ws, raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - reconnect below
+                self.stats["errors"] += 1
+                logger.warning(
+                    "[%s] quote feed dropped (%s); reconnecting in %.0fs",
+                    self._market,
+                    exc,
+                    delay,
+                )
+            finally:
+                self._ws = None
+            if await _closed_within(self._closed, delay):
+                return
+            delay = min(delay * 2, self._max_retry_seconds)
+
+    def _parse(self, raw: str) -> list[QuoteTick]:
+        parts = raw.split("|", 3)
+        if len(parts) < 4 or parts[1] not in _KIS_TRADE_LAYOUT:
+            return []
+        width, symbol_at, price_at = _KIS_TRADE_LAYOUT[parts[1]]
+        fields = parts[3].split("^")
+        try:
+            count = int(parts[2])
+        except ValueError:
+            return []
+        at = self._clock()
+        ticks = []
+        for index in range(count):
+            record = fields[index * width : (index + 1) * width]
+            if len(record) <= price_at:
+                break
+            try:
+                price = float(record[price_at])
+            except ValueError:
+                continue
+            if price > 0:
+                ticks.append(QuoteTick(self._market, record[symbol_at], price, at))
+        return ticks
+
+    async def _control(self, ws: Any, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+        header = message.get("header") or {}
+        if header.get("tr_id") == "PINGPONG":
+            await ws.send(raw)
+            return
+        body = message.get("body") or {}
+        if str(body.get("rt_cd", "0")) != "0":
+            logger.warning(
+                "[%s] subscription %s rejected: %s",
+                self._market,
+                header.get("tr_key"),
+                body.get("msg1"),
+            )
+
+    async def close(self) -> None:
+        self._closed.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:  # noqa: BLE001 - already going away
+                pass
+
+
+def _price_of(info: Any) -> float:
+    if isinstance(info, Mapping):
+        info = info.get("current_price")
+    try:
+        return float(info or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def _closed_within(closed: asyncio.Event, seconds: float) -> bool:
+    """Wait up to ``seconds``; True if ``closed`` was set meanwhile."""
+    try:
+        await asyncio.wait_for(closed.wait(), seconds)
+    except asyncio.TimeoutError:
+        return False
+    return True
@@ -11,6 +11,13 @@ Stance 의 위조 방지는 접수시각 하나에 달려 있다.
 
 시세를 못 구하면 거부가 아니라 보류(PENDING)다.
 소스 장애는 서버 책임이지 참여자 책임이 아니다.
+
+── 하루 마감은 묶음으로 찍는다 ──────────────────────────────────────────
+
+`quotes(market, symbols)` 는 `stance.server.marker.close_day` 의 묶음 조회 규약이다.
+KIS 관심종목 시세(intstock-multprice)로 30종목씩 한 번에 찍으므로
+보유 종목이 늘어도 마감 요청은 몇 번에 그친다. 묶음에서 빠진 종목은
+단건 현재가로 메운다.
 """
 
 from __future__ import annotations
@@ -43,6 +50,8 @@ class KisQuoteProvider:
        그 편이 "못 사는데 샀다고 인정" 하는 것보다 낫다고 판단했다.
     """
 
+    batch_size = 30     # intstock-multprice 한 번에 넣을 수 있는 종목 수
+
     def __init__(self, trading_client, source: str = "kis"):
         self.client = trading_client
         self.source = source
@@ -58,6 +67,39 @@ class KisQuoteProvider:
             logger.exception("[stance] 시세 조회 실패 (%s) — 보류 처리된다", symbol)
             return None
 
+        return self._quote(symbol, data)
+
+    def quotes(self, market: str, symbols) -> dict[str, Quote]:
+        """종가 마감용 묶음 조회. 못 구한 종목은 결과에서 빠진다.
+
+        멀티종목 시세에는 종목상태 코드가 없으므로 거래정지 여부는 싣지 않는다.
+        마감에는 가격만 쓰인다.
+
+        묶음 조회가 실패하거나(모의투자 미지원, 장애) 일부 종목을 빠뜨리면
+        빠진 종목만 단건 현재가로 다시 찍는다. 묶음이 막혔다고 마감이 통째로
+        보류되면 안 된다.
+        """
+        if market != "KRX":
+            logger.warning("[stance] KIS 제공자는 KRX 전용입니다: %s", market)
+            return {}
+        symbols = list(symbols)
+        rows = {}
+        fetch_many = getattr(self.client, "get_multi_price", None)
+        if fetch_many is not None:
+            try:
+                rows = fetch_many(symbols) or {}
+            except Exception:
+                logger.exception("[stance] 멀티종목 시세 조회 실패 — 단건 조회로 대신한다")
+
+        found = {s: self._quote(s, rows.get(s)) for s in symbols}
+        missing = [s for s, q in found.items() if q is None]
+        if fetch_many is not None and missing:
+            logger.info("[stance] 멀티종목 시세에서 빠진 %d종목은 단건 조회한다", len(missing))
+        for s in missing:
+            found[s] = self(market, s)
+        return {s: q for s, q in found.items() if q is not None}
+
+    def _quote(self, symbol: str, data) -> Quote | None:
         if not data:
             return None
 
@@ -93,9 +135,16 @@ def _to_decimal(value) -> Decimal | None:
 class StaticQuoteProvider:
     """테스트·데모용. 고정 가격을 돌려준다."""
 
-    def __init__(self, prices: dict[str, float]):
+    def __init__(self, prices: dict[str, float], batch_size: int = 100):
         self.prices = {k: Decimal(str(v)) for k, v in prices.items()}
+        self.batch_size = batch_size
+        self.requests: list[list[str]] = []
 
     def __call__(self, market: str, symbol: str) -> Quote | None:
         price = self.prices.get(symbol)
         return None if price is None else Quote(symbol, price, source="static")
+
+    def quotes(self, market: str, symbols) -> dict[str, Quote]:
+        self.requests.append(list(symbols))
+        found = {s: self(market, s) for s in symbols}
+        return {s: q for s, q in found.items() if q is not None}
@@ -2,22 +2,334 @@
 
 Extracted from telegram_ai_bot.TelegramAIBot.get_stock_code so the Kakao bot can
 reuse the same stock name/code resolution logic without needing a Telegram bot
-instance. Logic-preserving extraction: instance state (self.stock_map,
-self.stock_name_map) becomes explicit keyword arguments; error message
-wording, matching order, and logging are otherwise unchanged.
+instance. Instance state (self.stock_map, self.stock_name_map) becomes explicit
+keyword arguments; error message wording is unchanged.
+
+Name queries go through a :class:`TickerIndex` built once per stock map instead
+of scanning every name per call. The index matches, in rank order:
+
+1. the normalized name (case, spacing and punctuation ignored) or an alias,
+2. a normalized substring, prefixes first — the legacy partial match,
+3. initial consonants (초성), e.g. ``ㅅㅅㅈㅈ`` -> 삼성전자,
+4. names one typo away (substitution, insertion, deletion or swap).
+
+A lower tier is only consulted when every higher tier is empty.
 """
 import logging
 import re
-from typing import Mapping, Optional, Tuple
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, Dict, List, Mapping, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Common English names for large KRX listings; entries whose code is not in
+# the stock map are ignored.
+DEFAULT_ALIASES: Dict[str, str] = {
+    "Samsung Electronics": "005930",
+    "SK Hynix": "000660",
+    "LG Energy Solution": "373220",
+    "Samsung Biologics": "207940",
+    "Hyundai Motor": "005380",
+    "Kia": "000270",
+    "Celltrion": "068270",
+    "POSCO Holdings": "005490",
+    "Kakao": "035720",
+    "LG Chem": "051910",
+}
+
+MATCH_RANKS = {
+    "exact": 0,
+    "alias": 1,
+    "prefix": 2,
+    "substring": 3,
+    "chosung": 4,
+    "typo": 5,
+}
+
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_STRIP = re.compile(r"[\s\-_.,·&/()'\"]+")
+
+
+def normalize_name(text: str) -> str:
+    """Case-, width-, spacing- and punctuation-insensitive form of a name."""
+    # NFKC folds full-width letters, but it would also turn the compatibility
+    # jamo of a 초성 query (ㅅ) into conjoining jamo, so those are kept as is.
+    folded = unicodedata.normalize("NFC", text)
+    if not unicodedata.is_normalized("NFKC", folded):
+        folded = "".join(
+            ch if "\u3131" <= ch <= "\u318e" else unicodedata.normalize("NFKC", ch)
+            for ch in folded
+        )
+    return _STRIP.sub("", folded).lower()
+
+
+def chosung(text: str) -> str:
+    """Replace each Hangul syllable with its initial consonant."""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            out.append(_CHOSUNG[(code - _HANGUL_FIRST) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _grams(text: str, size: int = 2) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True when ``a`` and ``b`` differ by exactly one edit or adjacent swap."""
+    if a == b or abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        return (
+            i + 1 < len(a)
+            and a[i] == b[i + 1]
+            and a[i + 1] == b[i]
+            and a[i + 2:] == b[i + 2:]
+        )
+    return a[i:] == b[i + 1:]
+
+
+@dataclass(frozen=True)
+class TickerCandidate:
+    """One ranked match from :meth:`TickerIndex.search`."""
+
+    name: str
+    code: str
+    match: str
+
+    @property
+    def rank(self) -> int:
+        return MATCH_RANKS[self.match]
+
+
+class TickerIndex:
+    """Prebuilt lookup structures over a name -> code map.
+
+    Building costs one pass over the map. A search intersects the posting
+    sets of the query's characters and bigrams, so its cost follows the
+    number of matches rather than the size of the universe.
+    """
+
+    def __init__(
+        self,
+        name_to_code: Mapping[str, str],
+        *,
+        aliases: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.names: List[str] = []
+        self.codes: List[str] = []
+        self._normalized: List[str] = []
+        self._chosung: List[str] = []
+        exact: DefaultDict[str, Set[int]] = defaultdict(set)
+        alias: DefaultDict[str, Set[int]] = defaultdict(set)
+        # Keys of length 1, 2 and 3 are characters, bigrams and trigrams.
+        grams: DefaultDict[str, Set[int]] = defaultdict(set)
+        starts: DefaultDict[str, Set[int]] = defaultdict(set)
+        chosung_grams: DefaultDict[str, Set[int]] = defaultdict(set)
+        chosung_starts: DefaultDict[str, Set[int]] = defaultdict(set)
+        by_code: Dict[str, int] = {}
+
+        skipped = 0
+        for name, code in name_to_code.items():
+            if not isinstance(name, str) or not isinstance(code, str):
+                skipped += 1
+                continue
+            normalized = normalize_name(name)
+            if not normalized:
+                continue
+            entry = len(self.names)
+            initials = chosung(normalized)
+            self.names.append(name)
+            self.codes.append(code)
+            self._normalized.append(normalized)
+            self._chosung.append(initials)
+            exact[normalized].add(entry)
+            by_code.setdefault(code, entry)
+            self._add(grams, starts, normalized, entry)
+            if initials != normalized:
+                # Only names with Hangul can answer a 초성 query.
+                self._add(chosung_grams, chosung_starts, initials, entry)
+        if skipped:
+            logger.warning(f"Skipped {skipped} stock map entries with invalid types")
+
+        # Codes resolve like aliases, so a US ticker finds its listing too.
+        alias_items = list((aliases or {}).items()) + [(c, c) for c in by_code]
+        for other_name, code in alias_items:
+            entry = by_code.get(code)
+            key = normalize_name(other_name) if isinstance(other_name, str) else ""
+            if entry is not None and key:
+                alias[key].add(entry)
+
+        # Plain dicts from here on, so lookups of unseen keys add nothing.
+        self._exact: Dict[str, Set[int]] = dict(exact)
+        self._alias: Dict[str, Set[int]] = dict(alias)
+        self._grams: Dict[str, Set[int]] = dict(grams)
+        self._starts: Dict[str, Set[int]] = dict(starts)
+        self._chosung_grams: Dict[str, Set[int]] = dict(chosung_grams)
+        self._chosung_starts: Dict[str, Set[int]] = dict(chosung_starts)
+
+    @staticmethod
+    def _add(grams: DefaultDict[str, Set[int]], starts: DefaultDict[str, Set[int]],
+             text: str, entry: int) -> None:
+        for key in set(text) | _grams(text) | _grams(text, 3):
+            grams[key].add(entry)
+        starts[text[:1]].add(entry)
+        starts[text[:2]].add(entry)
+
+    @classmethod
+    def from_stock_map(cls, data: Mapping[str, Mapping[str, str]]) -> "TickerIndex":
+        """Build from a ``stock_map.json`` payload (``name_to_code`` + ``aliases``)."""
+        aliases = dict(DEFAULT_ALIASES)
+        aliases.update(data.get("aliases") or {})
+        return cls(data.get("name_to_code") or {}, aliases=aliases)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, limit: Optional[int] = 5) -> List[TickerCandidate]:
+        """Ranked candidates for ``query``: best tier first, then map order."""
+        tiers = self._tiers(normalize_name(query or ""))
+        return self._take([group for tier in tiers for group in tier], limit)
+
+    def resolve(
+        self, query: str, limit: int = 5
+    ) -> Tuple[List[TickerCandidate], int]:
+        """Best-tier matches for a bot query: the top ``limit`` and the total.
+
+        An exact or alias hit stands alone; otherwise every substring match
+        counts, as the linear partial match did, and the fuzzy tiers are
+        only tried when nothing contains the query.
+        """
+        tiers = self._tiers(normalize_name(query or ""))
+        for tier in tiers:
+            groups = [group for group in tier if group[1]]
+            if not groups:
+                continue
+            if groups[0][0] in ("exact", "alias"):
+                groups = groups[:1]
+            return self._take(groups, limit), sum(len(g) for _, g in groups)
+        return [], 0
+
+    def _tiers(self, normalized: str) -> List[List[Tuple[str, Set[int]]]]:
+        if not normalized:
+            return []
+        exact = self._exact.get(normalized, set())
+        alias = self._alias.get(normalized, set()) - exact
+        contains = self._containing(self._grams, self._normalized, normalized)
+        prefix = self._prefixed(self._starts, self._normalized, normalized, contains)
+        substring = contains - prefix
+        if exact or alias:
+            prefix -= exact | alias
+            substring -= exact | alias
+        tiers = [
+            [("exact", exact), ("alias", alias)],
+            [("prefix", prefix), ("substring", substring)],
+        ]
+        if exact or alias or contains:
+            return tiers
+        if any(ch in _CHOSUNG_SET for ch in normalized):
+            initials = chosung(normalized)
+            found = self._containing(self._chosung_grams, self._chosung, initials)
+            first = self._prefixed(self._chosung_starts, self._chosung, initials, found)
+            tiers.append([("chosung", first), ("chosung", found - first)])
+            if found:
+                return tiers
+        if len(normalized) >= 3:
+            tiers.append([("typo", self._typos(normalized))])
+        return tiers
+
+    def _take(self, groups: List[Tuple[str, Set[int]]],
+              limit: Optional[int]) -> List[TickerCandidate]:
+        taken: List[TickerCandidate] = []
+        for match, entries in groups:
+            if limit is None:
+                ordered = sorted(entries)
+            else:
+                remaining = limit - len(taken)
+                if remaining <= 0:
+                    break
+                ordered = sorted(entries)[:remaining]
+            taken.extend(
+                TickerCandidate(self.names[e], self.codes[e], match) for e in ordered
+            )
+        return taken
+
+    @staticmethod
+    def _containing(grams: Dict[str, Set[int]], texts: List[str], query: str) -> Set[int]:
+        if len(query) <= 3:
+            return grams.get(query, set())
+        postings = []
+        for gram in _grams(query, 3):
+            found = grams.get(gram)
+            if not found:
+                return set()
+            postings.append(found)
+        postings.sort(key=len)
+        result = postings[0].intersection(*postings[1:])
+        return {e for e in result if query in texts[e]}
+
+    @staticmethod
+    def _prefixed(starts: Dict[str, Set[int]], texts: List[str], query: str,
+                  within: Set[int]) -> Set[int]:
+        result = starts.get(query[:2], set()) & within
+        if len(query) > 2:
+            result = {e for e in result if texts[e].startswith(query)}
+        return result
+
+    def _typos(self, normalized: str) -> Set[int]:
+        query_grams = _grams(normalized)
+        # One edit removes at most three of the query's bigrams (a swap).
+        needed = max(1, len(query_grams) - 3)
+        overlap: Counter = Counter()
+        for gram in query_grams:
+            overlap.update(self._grams.get(gram, ()))
+        return {
+            entry
+            for entry, shared in overlap.items()
+            if shared >= needed and _one_edit_apart(normalized, self._normalized[entry])
+        }
+
+
+_index_cache: Dict[int, Tuple[Mapping[str, str], int, TickerIndex]] = {}
+
+
+def index_for(name_to_code: Mapping[str, str]) -> TickerIndex:
+    """Index for ``name_to_code``, rebuilt only when a new map is passed in.
+
+    The bots replace their map object on reload, so identity plus size is
+    enough to notice a new map without rehashing every name per query.
+    """
+    cached = _index_cache.get(id(name_to_code))
+    if cached is not None and cached[0] is name_to_code and cached[1] == len(name_to_code):
+        return cached[2]
+    index = TickerIndex(name_to_code, aliases=DEFAULT_ALIASES)
+    if len(_index_cache) >= 8:
+        _index_cache.clear()
+    _index_cache[id(name_to_code)] = (name_to_code, len(name_to_code), index)
+    return index
+
 
 def resolve_ticker(
     stock_input: str,
     *,
     code_to_name: Optional[Mapping[str, str]],
     name_to_code: Optional[Mapping[str, str]],
+    index: Optional[TickerIndex] = None,
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Convert stock name or code input to a stock code.
 
@@ -27,6 +339,7 @@ def resolve_ticker(
         stock_input: Stock code or name.
         code_to_name: Mapping of stock code -> stock name (was self.stock_map).
         name_to_code: Mapping of stock name -> stock code (was self.stock_name_map).
+        index: Prebuilt index over ``name_to_code``; built and cached when omitted.
 
     Returns:
         tuple: (stock_code, stock_name, error_message)
@@ -40,11 +353,8 @@ def resolve_ticker(
         logger.warning(f"Invalid input type: {type(stock_input)}")
         stock_input = str(stock_input)
 
-    original_input = stock_input
     stock_input = stock_input.strip()
 
-    logger.info(f"Stock search started - Input: '{original_input}' -> Cleaned input: '{stock_input}'")
-
     # Check name_to_code status
     if name_to_code is None:
         logger.error("stock_name_map is not initialized")
@@ -54,8 +364,6 @@ def resolve_ticker(
         logger.error(f"stock_name_map type error: {type(name_to_code)}")
         return None, None, "시스템 오류: 주식 데이터 형식이 잘못되었습니다."
 
-    logger.info(f"stock_name_map status - Size: {len(name_to_code)}")
-
     # Check code_to_name status
     if code_to_name is None:
         logger.warning("stock_map is not initialized")
@@ -63,7 +371,6 @@ def resolve_ticker(
 
     # If already a stock code (6-digit number)
     if re.match(r'^\d{6}$', stock_input):
-        logger.info(f"Recognized as 6-digit numeric code: {stock_input}")
         stock_code = stock_input
         stock_name = code_to_name.get(stock_code)
 
@@ -74,57 +381,27 @@ def resolve_ticker(
             logger.warning(f"No name information for stock code {stock_code}")
             return stock_code, f"종목_{stock_code}", "해당 종목 코드에 대한 정보가 없습니다. 코드가 정확한지 확인해주세요."
 
-    # If entered as stock name - check for exact match
-    logger.info(f"Starting exact name match search: '{stock_input}'")
-
-    # Log key samples for debugging
-    sample_keys = list(name_to_code.keys())[:5]
-    logger.debug(f"stock_name_map key samples: {sample_keys}")
-
     # Exact match check
     if stock_input in name_to_code:
         stock_code = name_to_code[stock_input]
         logger.info(f"Exact match successful: '{stock_input}' -> {stock_code}")
         return stock_code, stock_input, None
-    else:
-        logger.info(f"Exact match failed: '{stock_input}'")
-
-        # Log input value details
-        logger.debug(f"Input details - Length: {len(stock_input)}, "
-                     f"Bytes: {stock_input.encode('utf-8')}, "
-                     f"Unicode: {[ord(c) for c in stock_input]}")
-
-    # Partial stock name match search
-    logger.info("Starting partial match search")
-    possible_matches = []
 
     try:
-        for name, code in name_to_code.items():
-            if not isinstance(name, str) or not isinstance(code, str):
-                logger.warning(f"Invalid data type: name={type(name)}, code={type(code)}")
-                continue
-
-            if stock_input.lower() in name.lower():
-                possible_matches.append((name, code))
-                logger.debug(f"Partial match found: '{name}' ({code})")
-
+        candidates, total = (index or index_for(name_to_code)).resolve(stock_input)
     except Exception as e:
         logger.error(f"Error during partial match search: {e}")
         return None, None, "검색 중 오류가 발생했습니다."
 
-    logger.info(f"Partial match results: {len(possible_matches)} found")
-
-    if len(possible_matches) == 1:
-        # Use if single match found
-        stock_name, stock_code = possible_matches[0]
-        logger.info(f"Single partial match successful: '{stock_name}' ({stock_code})")
-        return stock_code, stock_name, None
-    elif len(possible_matches) > 1:
-        # Return error message if multiple matches
-        logger.info(f"Multiple matches: {[f'{name}({code})' for name, code in possible_matches]}")
-        match_info = "\n".join([f"{name} ({code})" for name, code in possible_matches[:5]])
-        if len(possible_matches) > 5:
-            match_info += f"\n... 외 {len(possible_matches)-5}개"
+    if total == 1:
+        match = candidates[0]
+        logger.info(f"Single {match.match} match successful: '{match.name}' ({match.code})")
+        return match.code, match.name, None
+    elif total > 1:
+        logger.info(f"Multiple matches for '{stock_input}': {total} found")
+        match_info = "\n".join([f"{c.name} ({c.code})" for c in candidates])
+        if total > 5:
+            match_info += f"\n... 외 {total-5}개"
 
         return None, None, f"'{stock_input}'에 해당하는 종목이 여러 개 있습니다. 정확한 종목명이나 코드를 입력해주세요:\n{match_info}"
     else:
@@ -0,0 +1,209 @@
+"""Async SQLite access for the KR/US tracking agents.
+
+The tracking agents keep one synchronous ``sqlite3`` connection and run their
+queries and commits inline in ``async`` methods, so every holdings read and
+per-holding price update stalled the event loop (and with it concurrent
+Telegram sends and KIS calls). ``TrackingRepository`` runs all of its work on
+one dedicated DB thread that owns its own connection:
+
+- ``call(fn, *args)`` runs ``fn(cursor, *args)`` on the DB thread, so the
+  cursor-based helpers in ``tracking.helpers`` work unchanged
+  (``await repo.call(get_current_slots_count, account_key=...)``)
+- ``queue()`` buffers writes; ``flush()`` applies them in one transaction,
+  grouping consecutive identical statements into ``executemany``
+- the connection runs in WAL mode (readers never wait for the agent's own
+  writer connection) with ``synchronous=NORMAL`` and a statement cache, so
+  the fixed per-cycle queries are prepared once
+
+Being single-threaded, the repository also serializes its own statements;
+no asyncio lock is needed around them. Writes through the agent's legacy
+connection still commit before anything here reads them back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HOLDING_COLUMNS = (
+    "id, ticker, company_name, buy_price, buy_date, current_price, scenario, "
+    "target_price, stop_loss, last_updated, trigger_type, trigger_mode, "
+    "account_key, account_name, sector"
+)
+
+
+class TrackingRepository:
+    """Holdings/history/watchlist access on a dedicated DB thread.
+
+    Args:
+        db_path: SQLite database file shared with the agent's connection
+        holdings_table: ``stock_holdings`` (KR) or ``us_stock_holdings`` (US)
+        busy_timeout_ms: Wait for the other connection's write lock
+        wal: Switch the database to WAL journaling on first use
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        holdings_table: str = "stock_holdings",
+        busy_timeout_ms: int = 5_000,
+        wal: bool = True,
+        cached_statements: int = 256,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.holdings_table = holdings_table
+        self._busy_timeout_ms = int(busy_timeout_ms)
+        self._wal = wal
+        self._cached_statements = cached_statements
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracking-db")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[str, tuple]] = []
+        self.stats = {"calls": 0, "queued": 0, "flushes": 0, "flushed_rows": 0}
+
+    # ── DB thread ────────────────────────────────────────────────────────
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self._busy_timeout_ms / 1000.0,
+                cached_statements=self._cached_statements,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+            if self._wal and self.db_path != ":memory:":
+                try:
+                    conn.execute("PRAGMA journal_mode = WAL")
+                except sqlite3.OperationalError as e:
+                    # Another connection holds a lock; stay in the current mode
+                    logger.warning(f"Tracking DB WAL switch skipped: {e}")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            self._conn = conn
+        return self._conn
+
+    def _call(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            result = fn(cursor, *args, **kwargs)
+            if conn.in_transaction:
+                conn.commit()
+            return result
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _apply(self, writes: Sequence[Tuple[str, tuple]]) -> int:
+        conn = self._connection()
+        rows = 0
+        with conn:
+            index = 0
+            while index < len(writes):
+                sql = writes[index][0]
+                end = index
+                while end < len(writes) and writes[end][0] == sql:
+                    end += 1
+                cursor = conn.executemany(sql, [params for _, params in writes[index:end]])
+                rows += max(cursor.rowcount, 0)
+                index = end
+        return rows
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── async API ────────────────────────────────────────────────────────
+
+    async def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(cursor, *args, **kwargs)`` on the DB thread.
+
+        Any write ``fn`` makes is committed when it returns (rolled back if it
+        raises).
+        """
+        self.stats["calls"] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args, kwargs)
+
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        def _fetch(cursor):
+            cursor.execute(sql, tuple(params))
+            return [dict(row) for row in cursor.fetchall()]
+        return await self.call(_fetch)
+
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[Dict[str, Any]]:
+        def _fetch(cursor):
+            cursor.execute(sql, tuple(params))
+            row = cursor.fetchone()
+            return dict(row) if row is not None else None
+        return await self.call(_fetch)
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run one write now and commit it; returns the affected row count."""
+        def _execute(cursor):
+            cursor.execute(sql, tuple(params))
+            return cursor.rowcount
+        return await self.call(_execute)
+
+    def queue(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """Buffer a write until the next ``flush()``."""
+        self._pending.append((sql, tuple(params)))
+        self.stats["queued"] += 1
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Apply every queued write in one transaction; returns rows affected.
+
+        On failure nothing is applied and the writes are dropped (the caller's
+        cycle recomputes them next run).
+        """
+        if not self._pending:
+            return 0
+        writes, self._pending = self._pending, []
+        self.stats["calls"] += 1
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(self._executor, self._apply, writes)
+        self.stats["flushes"] += 1
+        self.stats["flushed_rows"] += rows
+        return rows
+
+    async def close(self) -> None:
+        """Flush pending writes, close the connection and stop the DB thread."""
+        try:
+            await self.flush()
+        finally:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._close)
+            self._executor.shutdown(wait=False)
+
+    # ── holdings ─────────────────────────────────────────────────────────
+
+    async def holdings(self, account_key: str) -> List[Dict[str, Any]]:
+        """Every holding row of one account (one dict per pyramiding row)."""
+        return await self.fetch_all(
+            f"SELECT {HOLDING_COLUMNS} FROM {self.holdings_table} WHERE account_key = ?",
+            (account_key,),
+        )
+
+    def queue_price_update(self, ticker: str, account_key: str, price: float, updated_at: str) -> None:
+        """Buffer a holding's per-cycle ``current_price`` refresh."""
+        self.queue(
+            f"UPDATE {self.holdings_table} SET current_price = ?, last_updated = ? "
+            "WHERE ticker = ? AND account_key = ?",
+            (price, updated_at, ticker, account_key),
+        )
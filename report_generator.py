@@ -20,6 +20,7 @@ from cores.llm.agent_bridge import ensure_openai_agents_configured
 from cores.llm.backends.openai_agents_backend import OpenAIAgentsBackend
 from cores.llm.config_loader import load_report_mcp_registry
 from cores.llm.ports import AgentSpec, LLMParams
+from cores.llm.telemetry import instrument
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -77,7 +78,7 @@ def _get_telegram_backend():
     global _telegram_backend
     if _telegram_backend is None:
         ensure_openai_agents_configured()
-        _telegram_backend = OpenAIAgentsBackend(load_report_mcp_registry())
+        _telegram_backend = instrument(OpenAIAgentsBackend(load_report_mcp_registry()))
     return _telegram_backend
 
 
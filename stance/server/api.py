@@ -14,21 +14,27 @@
     POST /keys/rotate       인증키 교체
     GET  /portfolio         검산용 보유·자산 스냅샷
     GET  /leaderboard       리더보드 (원장을 재생해 만든 계산 결과)
+
+/leaderboard 와 /portfolio 는 원장 버전(Ledger.version)이 같으면 지난번에 직렬화한
+응답을 그대로 돌려준다. ETag 를 붙이고 If-None-Match 가 맞으면 304 로 답한다.
     GET  /markets           지원 시장과 각 보드의 규칙
     GET  /health
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import secrets
+import threading
 from datetime import datetime
 from typing import Any, Literal
 from urllib.parse import urlsplit
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .leaderboard import build as build_leaderboard
@@ -91,6 +97,78 @@ def get_service() -> StanceService:
 def set_service(service: StanceService) -> None:
     global _service
     _service = service
+    _responses.clear()
+
+
+# ── 응답 캐시 ─────────────────────────────────────────────────────────────
+
+class ResponseCache:
+    """원장 버전에 묶인 직렬화 응답.
+
+    리더보드는 전 전략의 원장을 재생해 채점하므로 요청마다 만들면 폴링 트래픽이
+    그대로 재계산 비용이 된다. 원장이 그대로면 결과도 그대로이므로, 키(엔드포인트·
+    시장·전략)마다 마지막 버전의 본문 하나만 들고 있다가 버전이 바뀌면 버린다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, tuple[str, bytes]] = {}
+        self._boot = secrets.token_hex(4)   # 재시작 전의 ETag 와 겹치지 않게
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def etag(self, key: tuple, version: tuple[int, ...]) -> str:
+        raw = f"{self._boot}|{PROFILE_VERSION}|{key}|{version}"
+        return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+    def get(self, key: tuple, etag: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == etag:
+            self.stats["hits"] += 1
+            return entry[1]
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: tuple, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (etag, body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_responses = ResponseCache()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+
+def _cached_json(
+    service: StanceService, key: tuple, if_none_match: str | None,
+    build, *, private: bool = False,
+) -> Response:
+    """원장 버전이 같으면 304 또는 저장된 본문, 바뀌었으면 build() 로 새로 만든다."""
+    etag = _responses.etag(key, service.ledger.version())
+    headers = {
+        "ETag": etag,
+        # 매번 재검증하게 한다 — 304 는 버전 조회 한 번이면 나간다
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+    }
+    if private:
+        headers["Vary"] = "Authorization"
+    if _etag_matches(if_none_match, etag):
+        _responses.stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    body = _responses.get(key, etag)
+    if body is None:
+        body = JSONResponse(jsonable_encoder(build())).body
+        _responses.put(key, etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.exception_handler(StanceError)
@@ -358,24 +436,33 @@ def submit(
 @app.get("/portfolio", response_model=PortfolioOut)
 def portfolio(
     strategy_id: str = Depends(current_strategy),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     service: StanceService = Depends(get_service),
-) -> PortfolioOut:
+) -> Response:
     """검산용 스냅샷.
 
     선언을 보내기 전에 호출할 필요는 없다 — 목표 비중은 자기 시스템이 아는 값으로 계산된다.
     `last_seq` 는 프로세스 재시작 시 일련번호 복구에 쓴다.
+    원장이 그대로면 같은 스냅샷을 돌려주므로 `as_of` 는 그 스냅샷을 만든 시각이다.
     """
-    return PortfolioOut(**service.portfolio(strategy_id))
+    return _cached_json(
+        service, ("portfolio", strategy_id), if_none_match,
+        lambda: PortfolioOut(**service.portfolio(strategy_id)), private=True,
+    )
 
 
 @app.get("/leaderboard")
 def leaderboard(
     market: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     service: StanceService = Depends(get_service),
-) -> dict[str, Any]:
-    entries = service.strategies()
-    if market:
-        entries = [e for e in entries if e[3].upper() == market.upper()]
-    if not entries:
-        return preparing([market.upper()] if market else ["KRX"])
-    return build_leaderboard(service.ledger, entries)
+) -> Response:
+    def build() -> dict[str, Any]:
+        entries = service.strategies()
+        if market:
+            entries = [e for e in entries if e[3].upper() == market.upper()]
+        if not entries:
+            return preparing([market.upper()] if market else ["KRX"])
+        return build_leaderboard(service.ledger, entries)
+
+    return _cached_json(service, ("leaderboard", (market or "").upper()), if_none_match, build)
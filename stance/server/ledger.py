@@ -24,8 +24,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import queue
 import sqlite3
 import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime, time as dtime, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -127,6 +131,9 @@ BEGIN SELECT RAISE(ABORT, '원장은 삭제할 수 없다'); END;
 """
 
 
+CHAIN_TABLES = ("stances", "quotes", "market_events", "daily_marks")
+
+
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -136,26 +143,103 @@ def _digest(prev: str | None, payload: dict) -> str:
     return hashlib.sha256(((prev or "") + body).encode("utf-8")).hexdigest()
 
 
+def row_payload(table: str, r: sqlite3.Row) -> dict:
+    """저장된 행에서 해시에 들어간 payload 를 되살린다. append_* 와 짝이 맞아야 한다."""
+    if table == "stances":
+        return {
+            "protocol": PROTOCOL_VERSION, "strategy_id": r["strategy_id"], "seq": r["seq"],
+            "kind": r["kind"], "symbol": r["symbol"], "target_weight": r["target_weight"],
+            "reason": r["reason"], "received_at": r["received_at"],
+        }
+    if table == "quotes":
+        return {"stance_id": r["stance_id"], "symbol": r["symbol"], "price": r["price"],
+                "tradable": bool(r["tradable"]), "observed_at": r["observed_at"],
+                "source": r["source"]}
+    if table == "market_events":
+        return {"market": r["market"], "symbol": r["symbol"],
+                "event_type": r["event_type"], "payload": json.loads(r["payload"]),
+                "effective_at": r["effective_at"]}
+    if table == "daily_marks":
+        return {"market": r["market"], "on_date": r["on_date"],
+                "prices": json.loads(r["prices"])}
+    raise ValueError(f"해시체인 대상이 아닙니다: {table}")
+
+
+def row_digest(table: str, r: sqlite3.Row) -> str:
+    return _digest(r["prev_hash"], row_payload(table, r))
+
+
+@dataclass
+class _Append:
+    """기록기 스레드에 넘기는 해시체인 추가 한 건."""
+
+    table: str
+    sql: str
+    row: tuple                      # prev_hash, hash 앞까지의 컬럼 값
+    payload: dict
+    done: Future = field(default_factory=Future)
+
+
 class Ledger:
     """원장.
 
-    SQLite 커넥션은 기본적으로 만들어진 스레드에서만 쓸 수 있다.
-    그런데 웹 서버는 동기 핸들러를 스레드풀에서 돌리므로 요청마다 스레드가 달라진다.
-    그래서 `check_same_thread=False` 로 열고, 쓰기는 락으로 직렬화한다.
-    (읽기는 WAL 모드라 동시에 이뤄져도 안전하다.)
+    웹 서버는 동기 핸들러를 스레드풀에서 돌리므로 요청마다 스레드가 달라진다.
+    그래서 쓰기와 읽기의 길을 나눈다.
+
+    - 해시체인 추가(선언·시세·이벤트·마감)는 전용 기록기 스레드 하나가 맡는다.
+      동시에 들어온 추가를 한 트랜잭션으로 묶어 한 번에 커밋한다(group commit).
+      체인은 큐에 들어온 순서대로 이어지고, 꼬리 해시는 메모리에 둬서
+      추가마다 `SELECT hash ... ORDER BY id DESC` 를 하지 않는다.
+      한 건이 실패해도(예: 같은 seq 중복) 그 건만 되돌리고 나머지는 커밋된다.
+    - 파일 원장의 조회는 읽기 전용 WAL 커넥션 풀에서 돈다. 기록기를 기다리지 않는다.
+      `:memory:` 원장은 커넥션이 하나뿐이라 락을 잡고 같은 커넥션을 쓴다.
+
+    다른 프로세스(마감 스크립트 등)가 같은 파일에 커밋하면 `PRAGMA data_version` 이
+    바뀌므로, 기록기는 배치를 시작할 때 그것을 보고 꼬리 해시를 다시 읽는다.
+    `conn` 은 기록 커넥션이다. 등록·프로필 같은 비체인 쓰기와 마이그레이션이 쓴다.
     """
 
-    def __init__(self, path: str | Path = ":memory:"):
+    def __init__(self, path: str | Path = ":memory:", *,
+                 read_pool: int = 4, max_batch: int = 256, writer_idle: float = 1.0):
+        self.path = str(path)
         self._lock = threading.RLock()
-        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         with self._lock:
             self.conn.executescript(SCHEMA)
             self._migrate_strategy_profiles()
             self.conn.executescript(IMMUTABILITY)
             self.conn.commit()
+            self._tails = {t: self._tail_hash(t) for t in CHAIN_TABLES}
+            self._data_version = self._pragma_data_version()
+        self._revision = 0                  # 등록 외 메타데이터(프로필·인증키) 변경 횟수
+
+        self._memory = self.path == ":memory:" or self.path.startswith("file::memory:")
+        self._read_uri = None if self._memory else Path(self.path).resolve().as_uri() + "?mode=ro"
+        self._read_pool_size = max(0, int(read_pool))
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._max_batch = max(1, int(max_batch))
+        self._writer_idle = writer_idle
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+        self.stats = {"appends": 0, "batches": 0, "max_batch": 0, "failed": 0}
 
     def close(self) -> None:
+        with self._writer_lock:
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._jobs.put(None)
+        if writer is not None:
+            writer.join()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
         with self._lock:
             self.conn.close()
 
@@ -217,11 +301,12 @@ class Ledger:
             if cur.rowcount != 1:
                 raise KeyError(strategy_id)
             self.conn.commit()
+            self._revision += 1
 
     def cadence_of(self, strategy_id: str) -> Cadence:
-        row = self.conn.execute(
+        row = self.query_one(
             "SELECT cadence FROM strategies WHERE strategy_id=?", (strategy_id,)
-        ).fetchone()
+        )
         return Cadence(row["cadence"]) if row else Cadence.DAILY
 
     def rotate_api_key(self, strategy_id: str, api_key_hash: str) -> None:
@@ -234,30 +319,150 @@ class Ledger:
             if cur.rowcount != 1:
                 raise KeyError(strategy_id)
             self.conn.commit()
+            self._revision += 1
 
     # ── 원장 기록 ─────────────────────────────────────────────────────────
 
     def _tail_hash(self, table: str) -> str | None:
-        if table == "stances":
-            row = self.conn.execute(
-                "SELECT hash FROM stances ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-        elif table == "quotes":
-            row = self.conn.execute(
-                "SELECT hash FROM quotes ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-        elif table == "market_events":
-            row = self.conn.execute(
-                "SELECT hash FROM market_events ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-        elif table == "daily_marks":
-            row = self.conn.execute(
-                "SELECT hash FROM daily_marks ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-        else:
+        if table not in CHAIN_TABLES:
             raise ValueError(f"해시체인 대상이 아닙니다: {table}")
+        row = self.conn.execute(
+            f"SELECT hash FROM {table} ORDER BY id DESC LIMIT 1"
+        ).fetchone()
         return row["hash"] if row else None
 
+    def _pragma_data_version(self) -> int:
+        return int(self.conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def _append(self, table: str, sql: str, row: tuple, payload: dict) -> int:
+        """기록기 큐에 넣고 커밋될 때까지 기다린다. 새 행의 id 를 돌려준다."""
+        job = _Append(table, sql, row, payload)
+        with self._writer_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("닫힌 원장입니다")
+            self._jobs.put(job)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="stance-ledger-writer", daemon=True,
+                )
+                self._writer.start()
+        return job.done.result()
+
+    def _write_loop(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get(timeout=self._writer_idle)
+            except queue.Empty:
+                with self._writer_lock:
+                    # 큐에 넣기는 이 락 안에서만 일어나므로 놓친 작업은 없다
+                    if self._jobs.empty():
+                        self._writer = None
+                        return
+                continue
+            if job is None:
+                return
+            batch = [job]
+            stop = False
+            while len(batch) < self._max_batch:
+                try:
+                    nxt = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: list[_Append]) -> None:
+        """한 트랜잭션으로 기록한다. 건마다 SAVEPOINT 를 걸어 실패한 건만 되돌린다.
+
+        결과는 커밋이 끝난 뒤에 알린다 — 호출자가 받은 id 는 이미 디스크에 있다.
+        """
+        outcomes: list[tuple[_Append, int | None, BaseException | None]] = []
+        with self._lock:
+            conn = self.conn
+            data_version = self._pragma_data_version()
+            if data_version != self._data_version:
+                # 다른 커넥션이 그 사이 커밋했다 — 메모리의 꼬리는 믿을 수 없다
+                self._tails = {t: self._tail_hash(t) for t in CHAIN_TABLES}
+                self._data_version = data_version
+            tails = dict(self._tails)
+            try:
+                conn.execute("SAVEPOINT ledger_batch")
+                for job in batch:
+                    conn.execute("SAVEPOINT ledger_append")
+                    try:
+                        prev = tails[job.table]
+                        digest = _digest(prev, job.payload)
+                        cur = conn.execute(job.sql, (*job.row, prev, digest))
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO ledger_append")
+                        conn.execute("RELEASE ledger_append")
+                        outcomes.append((job, None, e))
+                        continue
+                    conn.execute("RELEASE ledger_append")
+                    tails[job.table] = digest
+                    outcomes.append((job, int(cur.lastrowid), None))
+                conn.execute("RELEASE ledger_batch")
+                if conn.in_transaction:
+                    conn.commit()
+            except BaseException as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._tails = {t: self._tail_hash(t) for t in CHAIN_TABLES}
+                self.stats["failed"] += len(batch)
+                for job in batch:
+                    job.done.set_exception(e)
+                return
+            self._tails = tails
+            self.stats["batches"] += 1
+            self.stats["appends"] += len(batch)
+            self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+
+        for job, rowid, error in outcomes:
+            if error is not None:
+                self.stats["failed"] += 1
+                job.done.set_exception(error)
+            else:
+                job.done.set_result(rowid)
+
+    # ── 조회 커넥션 ────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _reader(self):
+        """조회용 커넥션을 빌린다. 파일 원장이면 읽기 전용 풀에서 꺼낸다."""
+        if self._read_uri is None or self._read_pool_size == 0:
+            with self._lock:
+                yield self.conn
+            return
+        with self._readers_lock:
+            conn = self._readers.pop() if self._readers else None
+        if conn is None:
+            # 풀이 비면 새로 연다 — 조회가 서로를 기다리는 일은 없다
+            conn = sqlite3.connect(self._read_uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            with self._readers_lock:
+                if not self._closed and len(self._readers) < self._read_pool_size:
+                    self._readers.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        """조회 전용. 원장 밖의 코드가 `conn` 을 직접 쓰지 않게 한다."""
+        with self._reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: tuple = ()) -> sqlite3.Row | None:
+        with self._reader() as conn:
+            return conn.execute(sql, params).fetchone()
+
     def append_stance(
         self, strategy_id: str, seq: int, kind: Kind = Kind.SET,
         symbol: str | None = None, target_weight: Decimal | None = None,
@@ -270,32 +475,27 @@ class Ledger:
             "target_weight": str(target_weight) if target_weight is not None else None,
             "reason": reason, "received_at": received_at,
         }
-        with self._lock:
-            prev = self._tail_hash("stances")
-            cur = self.conn.execute(
-                "INSERT INTO stances (strategy_id, seq, kind, symbol, target_weight,"
-                " reason, received_at, prev_hash, hash) VALUES (?,?,?,?,?,?,?,?,?)",
-                (strategy_id, seq, kind.value, symbol,
-                 str(target_weight) if target_weight is not None else None,
-                 reason, received_at, prev, _digest(prev, payload)),
-            )
-            self.conn.commit()
-            return int(cur.lastrowid)
+        return self._append(
+            "stances",
+            "INSERT INTO stances (strategy_id, seq, kind, symbol, target_weight,"
+            " reason, received_at, prev_hash, hash) VALUES (?,?,?,?,?,?,?,?,?)",
+            (strategy_id, seq, kind.value, symbol,
+             str(target_weight) if target_weight is not None else None,
+             reason, received_at),
+            payload,
+        )
 
     def append_quote(self, stance_id: int | None, q: Quote) -> int:
         observed = (q.observed_at.isoformat() if q.observed_at else _now())
         payload = {"stance_id": stance_id, "symbol": q.symbol, "price": str(q.price),
                    "tradable": q.tradable, "observed_at": observed, "source": q.source}
-        with self._lock:
-            prev = self._tail_hash("quotes")
-            cur = self.conn.execute(
-                "INSERT INTO quotes (stance_id, symbol, price, tradable, observed_at,"
-                " source, prev_hash, hash) VALUES (?,?,?,?,?,?,?,?)",
-                (stance_id, q.symbol, str(q.price), int(q.tradable), observed,
-                 q.source, prev, _digest(prev, payload)),
-            )
-            self.conn.commit()
-            return int(cur.lastrowid)
+        return self._append(
+            "quotes",
+            "INSERT INTO quotes (stance_id, symbol, price, tradable, observed_at,"
+            " source, prev_hash, hash) VALUES (?,?,?,?,?,?,?,?)",
+            (stance_id, q.symbol, str(q.price), int(q.tradable), observed, q.source),
+            payload,
+        )
 
     def append_event(self, market: str, ev: MarketEvent) -> int:
         body = {"ratio": str(ev.ratio) if ev.ratio is not None else None,
@@ -305,43 +505,38 @@ class Ledger:
         payload = {"market": market, "symbol": ev.symbol,
                    "event_type": ev.event_type.value, "payload": body,
                    "effective_at": effective}
-        with self._lock:
-            prev = self._tail_hash("market_events")
-            cur = self.conn.execute(
-                "INSERT INTO market_events (market, symbol, event_type, payload,"
-                " effective_at, prev_hash, hash) VALUES (?,?,?,?,?,?,?)",
-                (market, ev.symbol, ev.event_type.value, json.dumps(body),
-                 effective, prev, _digest(prev, payload)),
-            )
-            self.conn.commit()
-            return int(cur.lastrowid)
+        return self._append(
+            "market_events",
+            "INSERT INTO market_events (market, symbol, event_type, payload,"
+            " effective_at, prev_hash, hash) VALUES (?,?,?,?,?,?,?)",
+            (market, ev.symbol, ev.event_type.value, json.dumps(body), effective),
+            payload,
+        )
 
     def append_daily_mark(self, market: str, on: date, prices: dict[str, Decimal]) -> int:
         """하루를 마감하고 종가를 봉인한다. 같은 날을 두 번 마감할 수 없다."""
         body = {s: str(p) for s, p in sorted(prices.items())}
         payload = {"market": market, "on_date": on.isoformat(), "prices": body}
-        with self._lock:
-            prev = self._tail_hash("daily_marks")
-            cur = self.conn.execute(
-                "INSERT INTO daily_marks (market, on_date, prices, prev_hash, hash)"
-                " VALUES (?,?,?,?,?)",
-                (market, on.isoformat(), json.dumps(body), prev, _digest(prev, payload)),
-            )
-            self.conn.commit()
-            return int(cur.lastrowid)
+        return self._append(
+            "daily_marks",
+            "INSERT INTO daily_marks (market, on_date, prices, prev_hash, hash)"
+            " VALUES (?,?,?,?,?)",
+            (market, on.isoformat(), json.dumps(body)),
+            payload,
+        )
 
     def has_mark(self, market: str, on: date) -> bool:
-        row = self.conn.execute(
+        row = self.query_one(
             "SELECT 1 FROM daily_marks WHERE market=? AND on_date=?",
             (market, on.isoformat()),
-        ).fetchone()
+        )
         return row is not None
 
     def daily_marks(self, market: str) -> list[DailyMark]:
-        rows = self.conn.execute(
+        rows = self.query(
             "SELECT on_date, prices FROM daily_marks WHERE market=? ORDER BY on_date, id",
             (market,),
-        ).fetchall()
+        )
         return [
             DailyMark(
                 on=date.fromisoformat(r["on_date"]),
@@ -355,10 +550,18 @@ class Ledger:
     def timeline(self, strategy_id: str) -> list:
         """원장을 재생 가능한 형태로 꺼낸다. 채점의 입력이 되는 전부다."""
         items: list = []
-        rows = self.conn.execute(
-            "SELECT * FROM stances WHERE strategy_id=? ORDER BY received_at, id",
-            (strategy_id,),
-        ).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM stances WHERE strategy_id=? ORDER BY received_at, id",
+                (strategy_id,),
+            ).fetchall()
+            quotes: dict[int, sqlite3.Row] = {}
+            for qrow in conn.execute(
+                "SELECT q.* FROM quotes q JOIN stances s ON q.stance_id = s.id"
+                " WHERE s.strategy_id=? ORDER BY q.id",
+                (strategy_id,),
+            ):
+                quotes.setdefault(qrow["stance_id"], qrow)
         for r in rows:
             stance = Stance(
                 seq=r["seq"],
@@ -368,9 +571,7 @@ class Ledger:
                 target_weight=Decimal(r["target_weight"]) if r["target_weight"] else None,
                 reason=r["reason"],
             )
-            qrow = self.conn.execute(
-                "SELECT * FROM quotes WHERE stance_id=? ORDER BY id LIMIT 1", (r["id"],)
-            ).fetchone()
+            qrow = quotes.get(r["id"])
             quote = (
                 Quote(symbol=qrow["symbol"], price=Decimal(qrow["price"]),
                       tradable=bool(qrow["tradable"]),
@@ -387,9 +588,9 @@ class Ledger:
         같은 날에 선언과 마감이 함께 있으면 **마감이 나중**이다.
         그날의 선언이 모두 반영된 뒤 자산을 찍어야 하기 때문이다.
         """
-        row = self.conn.execute(
+        row = self.query_one(
             "SELECT market FROM strategies WHERE strategy_id=?", (strategy_id,)
-        ).fetchone()
+        )
         market = row["market"] if row else "KRX"
 
         items: list[tuple[datetime, int, object]] = []
@@ -403,9 +604,9 @@ class Ledger:
         return [item for _, _, item in items]
 
     def market_events(self, market: str) -> list[MarketEvent]:
-        rows = self.conn.execute(
+        rows = self.query(
             "SELECT * FROM market_events WHERE market=? ORDER BY effective_at, id", (market,)
-        ).fetchall()
+        )
         out: list[MarketEvent] = []
         for r in rows:
             body = json.loads(r["payload"])
@@ -418,10 +619,25 @@ class Ledger:
             ))
         return out
 
+    def version(self) -> tuple[int, ...]:
+        """원장이 바뀌면 함께 커지는 값. 계산 결과 캐시의 키로 쓴다.
+
+        (stances, quotes, daily_marks, market_events 의 마지막 id, strategies 의 마지막 rowid, 메타 변경 수)
+        id 는 AUTOINCREMENT 라 되돌아가지 않는다. 다른 프로세스의 마감도 여기에 잡힌다.
+        """
+        row = self.query_one(
+            "SELECT (SELECT IFNULL(MAX(id), 0) FROM stances),"
+            " (SELECT IFNULL(MAX(id), 0) FROM quotes),"
+            " (SELECT IFNULL(MAX(id), 0) FROM daily_marks),"
+            " (SELECT IFNULL(MAX(id), 0) FROM market_events),"
+            " (SELECT IFNULL(MAX(rowid), 0) FROM strategies)"
+        )
+        return (*(int(v) for v in row), self._revision)
+
     def next_seq(self, strategy_id: str) -> int:
-        row = self.conn.execute(
+        row = self.query_one(
             "SELECT MAX(seq) AS s FROM stances WHERE strategy_id=?", (strategy_id,)
-        ).fetchone()
+        )
         return int(row["s"] or 0) + 1
 
     # ── 검증 ──────────────────────────────────────────────────────────────
@@ -431,20 +647,23 @@ class Ledger:
 
         누구든 원장을 받아 이 검증을 독립적으로 수행할 수 있다.
         그것이 운영자 조작을 막는 유일한 방법이다.
+        연결(prev_hash)만 보지 않고 행마다 해시를 다시 계산한다. 행은 스트리밍으로 읽는다.
         """
-        prev: str | None = None
-        if table == "stances":
-            rows = self.conn.execute("SELECT * FROM stances ORDER BY id").fetchall()
-        elif table == "quotes":
-            rows = self.conn.execute("SELECT * FROM quotes ORDER BY id").fetchall()
-        elif table == "market_events":
-            rows = self.conn.execute("SELECT * FROM market_events ORDER BY id").fetchall()
-        elif table == "daily_marks":
-            rows = self.conn.execute("SELECT * FROM daily_marks ORDER BY id").fetchall()
-        else:
-            raise ValueError(f"해시체인 대상이 아닙니다: {table}")
-        for r in rows:
-            if r["prev_hash"] != prev:
-                return False
-            prev = r["hash"]
-        return True
+        from .verify import verify_table
+
+        with self._reader() as conn:
+            return verify_table(conn, table).ok
+
+    def verify(self, key: bytes | None = None, full: bool = False) -> list:
+        """전 체인을 검증하고, 서명 키가 있으면 검증 지점을 남긴다.
+
+        다음 실행은 서명이 맞는 마지막 지점 뒤만 검증한다 (`full=True` 면 처음부터).
+        """
+        from .verify import save_checkpoints, verify_ledger
+
+        with self._reader() as conn:
+            reports = verify_ledger(conn, key=key, full=full)
+        if key:
+            with self._lock:
+                save_checkpoints(self.conn, reports, key)
+        return reports
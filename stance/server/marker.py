@@ -10,6 +10,10 @@
     ② 종가를 찍는다
     ③ 원장에 봉인한다
 
+②는 묶음 조회를 쓴다. 제공자가 `quotes(market, symbols)` 를 갖고 있으면
+`batch_size` 개씩 나눠 동시에 조회하고, 빠진 종목만 골라 다시 묻는다.
+종목 수가 늘어도 요청 수는 몇 번에 그친다. 종목 하나씩만 아는 제공자도 그대로 받는다.
+
 종가를 원장에 넣는 이유는 재현 가능성 때문이다. 외부 시세 공급자를 다시 조회해야 한다면
 "원장만 공개하면 제3자가 순위를 독립 재현한다" 는 주장이 성립하지 않는다.
 
@@ -20,9 +24,11 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from decimal import Decimal
-from typing import Callable
+from typing import Callable, Mapping, Protocol, Sequence
 
 from .engine import replay
 from .ledger import Ledger
@@ -33,15 +39,31 @@ logger = logging.getLogger(__name__)
 PriceFetcher = Callable[[str, str], "object | None"]
 TradingDayCheck = Callable[[date], bool]
 
+FETCH_CONCURRENCY = 4
+FETCH_RETRIES = 2
+RETRY_DELAY = 0.2
+
+
+class BatchQuoteProvider(Protocol):
+    """여러 종목을 한 번에 찍는 시세 제공자.
+
+    돌려받지 못한 종목은 결과에서 빠진다(예외를 던져도 그 묶음 전체가 빠진 것으로 친다).
+    `batch_size` 는 한 번의 요청에 넣을 수 있는 종목 수다.
+    """
+
+    batch_size: int
+
+    def quotes(self, market: str, symbols: Sequence[str]) -> Mapping[str, "object"]: ...
+
 
 def held_symbols(ledger: Ledger, market: str) -> set[str]:
     """그 시장의 전 전략이 지금 들고 있는 종목.
 
     선언이 없던 종목도 포함된다 — 보유는 선언과 무관하게 이어진다.
     """
-    rows = ledger.conn.execute(
+    rows = ledger.query(
         "SELECT strategy_id FROM strategies WHERE market=?", (market,)
-    ).fetchall()
+    )
 
     symbols: set[str] = set()
     for r in rows:
@@ -54,10 +76,12 @@ def held_symbols(ledger: Ledger, market: str) -> set[str]:
 def close_day(
     ledger: Ledger,
     market: str,
-    fetcher: PriceFetcher | None,
+    fetcher: PriceFetcher | BatchQuoteProvider | None,
     on: date | None = None,
     force: bool = False,
     is_trading_day: TradingDayCheck | None = None,
+    concurrency: int = FETCH_CONCURRENCY,
+    retries: int = FETCH_RETRIES,
 ) -> dict:
     """하루를 마감한다.
 
@@ -81,21 +105,12 @@ def close_day(
         logger.info("[%s] %s 는 이미 마감되었습니다.", profile.code, on)
         return {"market": profile.code, "date": on.isoformat(), "skipped": True}
 
-    symbols = held_symbols(ledger, profile.code)
-    prices: dict[str, Decimal] = {}
-    missing: list[str] = []
-
-    for symbol in sorted(symbols):
-        quote = None
-        if fetcher is not None:
-            try:
-                quote = fetcher(profile.code, symbol)
-            except Exception:
-                logger.exception("[%s] 종가 조회 실패", symbol)
-        if quote is None or quote.price <= 0:
-            missing.append(symbol)
-            continue
-        prices[symbol] = quote.price
+    symbols = sorted(held_symbols(ledger, profile.code))
+    prices = (
+        fetch_closes(fetcher, profile.code, symbols, concurrency=concurrency, retries=retries)
+        if fetcher is not None else {}
+    )
+    missing = [s for s in symbols if s not in prices]
 
     if missing:
         # 종가를 못 구한 종목은 직전 가격이 유지된다(엔진이 그렇게 동작한다).
@@ -115,6 +130,56 @@ def close_day(
     }
 
 
+def fetch_closes(
+    fetcher: PriceFetcher | BatchQuoteProvider,
+    market: str,
+    symbols: Sequence[str],
+    *,
+    concurrency: int = FETCH_CONCURRENCY,
+    retries: int = FETCH_RETRIES,
+    retry_delay: float = RETRY_DELAY,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, Decimal]:
+    """종목들의 종가. 묶음으로 나눠 동시에 찍고, 못 구한 종목만 다시 묻는다.
+
+    가격이 0 이하이거나 끝내 못 구한 종목은 결과에 없다.
+    """
+    batch = getattr(fetcher, "quotes", None)
+    size = max(1, int(getattr(fetcher, "batch_size", 1))) if batch else 1
+
+    def fetch(chunk: list[str]) -> dict[str, Decimal]:
+        got: dict[str, Decimal] = {}
+        try:
+            if batch:
+                quotes = dict(batch(market, chunk))
+            else:
+                quotes = {chunk[0]: fetcher(market, chunk[0])}
+        except Exception:
+            logger.exception("[%s] 종가 조회 실패: %s", market, ", ".join(chunk[:5]))
+            return got
+        for symbol in chunk:
+            quote = quotes.get(symbol)
+            if quote is not None and quote.price > 0:
+                got[symbol] = quote.price
+        return got
+
+    prices: dict[str, Decimal] = {}
+    pending = list(symbols)
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            logger.info("[%s] 종가 누락 %d개 재조회 (%d/%d)", market, len(pending), attempt, retries)
+            sleep(retry_delay * attempt)
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        workers = max(1, min(concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stance-close") as pool:
+            for got in pool.map(fetch, chunks):
+                prices.update(got)
+        pending = [s for s in pending if s not in prices]
+    return prices
+
+
 # CLI 는 여기 없다.
 #
 # 시세 제공자와 시장 캘린더는 PRISM 이 쥐고 있고, `stance/` 는 그것을 알아서는 안 된다.
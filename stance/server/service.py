@@ -108,7 +108,10 @@ class StanceService:
         self.clock = clock or (lambda: datetime.now(timezone.utc))
         self._engines: dict[str, Engine] = {}
         self._profiles: dict[str, MarketProfile] = {}
-        self._submit_lock = threading.RLock()
+        # 선언 접수는 전략 단위로만 직렬화한다. seq 검사와 장부 반영이 한 전략 안에서
+        # 원자적이면 충분하고, 서로 다른 전략의 접수는 원장 기록기에서 함께 커밋된다.
+        self._submit_locks: dict[str, threading.Lock] = {}
+        self._submit_locks_guard = threading.Lock()
 
     # ── 등록 ──────────────────────────────────────────────────────────
 
@@ -145,11 +148,11 @@ class StanceService:
         unknown = set(updates) - set(fields)
         if unknown:
             raise StanceError(f"알 수 없는 프로필 필드: {', '.join(sorted(unknown))}")
-        row = self.ledger.conn.execute(
+        row = self.ledger.query_one(
             "SELECT owner_name, tagline, description, website_url, source_url"
             " FROM strategies WHERE strategy_id=?",
             (strategy_id,),
-        ).fetchone()
+        )
         if row is None:
             raise StanceError("등록되지 않은 전략입니다", status=404)
         profile = {field: updates.get(field, row[field]) for field in fields}
@@ -162,18 +165,18 @@ class StanceService:
         }
 
     def _exists(self, strategy_id: str) -> bool:
-        row = self.ledger.conn.execute(
+        row = self.ledger.query_one(
             "SELECT 1 FROM strategies WHERE strategy_id=?", (strategy_id,)
-        ).fetchone()
+        )
         return row is not None
 
     def authenticate(self, api_key: str | None) -> str:
         """인증키로 전략을 찾는다. 참여자는 자기 전략에만 쓸 수 있다."""
         if not api_key:
             raise StanceError("인증키가 없습니다", status=401)
-        row = self.ledger.conn.execute(
+        row = self.ledger.query_one(
             "SELECT strategy_id FROM strategies WHERE api_key_hash=?", (_hash(api_key),)
-        ).fetchone()
+        )
         if row is None:
             raise StanceError("인증키가 올바르지 않습니다", status=401)
         return row["strategy_id"]
@@ -193,7 +196,7 @@ class StanceService:
         symbol: str | None = None, target_weight: str | float | None = None,
         reason: str | None = None,
     ) -> dict:
-        with self._submit_lock:
+        with self._submit_lock(strategy_id):
             return self._submit(strategy_id, seq, kind, symbol, target_weight, reason)
 
     def _submit(
@@ -326,19 +329,26 @@ class StanceService:
                      profile=self._profile(strategy_id))
 
     def strategies(self) -> list[tuple[str | None, ...]]:
-        rows = self.ledger.conn.execute(
+        rows = self.ledger.query(
             "SELECT strategy_id, display_name, handle, market, owner_name, tagline,"
             " description, website_url, source_url FROM strategies ORDER BY created_at"
-        ).fetchall()
+        )
         return [tuple(r) for r in rows]
 
     # ── 내부 ──────────────────────────────────────────────────────────
 
+    def _submit_lock(self, strategy_id: str) -> threading.Lock:
+        with self._submit_locks_guard:
+            lock = self._submit_locks.get(strategy_id)
+            if lock is None:
+                lock = self._submit_locks[strategy_id] = threading.Lock()
+            return lock
+
     def _profile(self, strategy_id: str) -> MarketProfile:
         if strategy_id not in self._profiles:
-            row = self.ledger.conn.execute(
+            row = self.ledger.query_one(
                 "SELECT market FROM strategies WHERE strategy_id=?", (strategy_id,)
-            ).fetchone()
+            )
             if row is None:
                 raise StanceError("등록되지 않은 전략입니다", status=404)
             self._profiles[strategy_id] = profile_for(row["market"])
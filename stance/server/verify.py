@@ -0,0 +1,187 @@
+"""원장 해시체인 검증 — 스트리밍 + 서명된 검증 지점.
+
+검증은 두 가지를 본다.
+
+    ① 연결    행의 prev_hash 가 바로 앞 행의 hash 와 같은가
+    ② 내용    행에 저장된 값으로 해시를 다시 계산하면 hash 와 같은가
+
+①만 보면 값을 고치고 hash 는 그대로 둔 조작을 놓친다. 그래서 행마다 ②를 한다.
+행은 id 순으로 조금씩 읽는다 — 몇 년 치 원장이라도 메모리는 일정하다.
+
+매일 마감마다 처음부터 다시 계산할 필요는 없다. 검증을 마친 마지막 행(id, hash)을
+서버 키로 서명해 `verify_checkpoints` 에 남기고, 다음 실행은 그 뒤만 본다.
+지점을 쓸 때 그 행의 hash 가 지금도 같은지 확인하므로, 지점 앞을 고치고 해시를
+다시 이어 붙인 조작은 그 자리에서 드러난다. 서명이 맞지 않는 지점은 없는 것으로
+친다 — 원장 파일을 손댈 수 있는 사람이 지점을 위조해 검증을 건너뛰게 할 수 없다.
+
+키가 없으면 지점을 읽지도 쓰지도 않고 늘 처음부터 검증한다. 원장 사본을 받은
+제3자는 그렇게 독립적으로 검증하면 된다 (`python -m stance_verify --db 사본.db`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from .ledger import CHAIN_TABLES, row_digest
+
+CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verify_checkpoints (
+  id            INTEGER PRIMARY KEY AUTOINCREMENT,
+  tbl           TEXT NOT NULL,
+  row_id        INTEGER NOT NULL,
+  hash          TEXT NOT NULL,
+  verified_at   TEXT NOT NULL,
+  signature     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_verify_checkpoints ON verify_checkpoints(tbl, id);
+"""
+
+BATCH_SIZE = 1000
+
+
+def key_from_env() -> bytes | None:
+    """검증 지점 서명 키. STANCE_VERIFY_KEY 가 없으면 늘 전체 검증한다."""
+    key = os.getenv("STANCE_VERIFY_KEY")
+    return key.encode("utf-8") if key else None
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    table: str
+    row_id: int
+    hash: str
+    verified_at: str
+    signature: str
+
+    def valid(self, key: bytes) -> bool:
+        return hmac.compare_digest(
+            self.signature, _sign(key, self.table, self.row_id, self.hash, self.verified_at)
+        )
+
+
+@dataclass(frozen=True)
+class ChainReport:
+    table: str
+    ok: bool
+    checked: int                    # 이번에 다시 계산한 행 수
+    resumed_from: int               # 이어서 시작한 행 id (0 = 처음부터)
+    last_id: int
+    last_hash: str | None
+    broken_id: int | None = None
+    reason: str | None = None
+
+
+def _sign(key: bytes, table: str, row_id: int, hash_: str, verified_at: str) -> str:
+    message = f"{table}|{row_id}|{hash_}|{verified_at}".encode("utf-8")
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def _check_table(table: str) -> None:
+    if table not in CHAIN_TABLES:
+        raise ValueError(f"해시체인 대상이 아닙니다: {table}")
+
+
+def latest_checkpoint(conn: sqlite3.Connection, table: str, key: bytes) -> Checkpoint | None:
+    """서명이 맞는 가장 최근 지점. 테이블이 없거나 맞는 지점이 없으면 None."""
+    _check_table(table)
+    try:
+        rows = conn.execute(
+            "SELECT tbl, row_id, hash, verified_at, signature FROM verify_checkpoints"
+            " WHERE tbl=? ORDER BY id DESC LIMIT 20",
+            (table,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    for r in rows:
+        cp = Checkpoint(r[0], int(r[1]), r[2], r[3], r[4])
+        if cp.valid(key):
+            return cp
+    return None
+
+
+def verify_table(
+    conn: sqlite3.Connection, table: str, *,
+    start: Checkpoint | None = None, batch_size: int = BATCH_SIZE,
+) -> ChainReport:
+    """`start` 뒤의 행을 id 순으로 읽으며 연결과 내용을 함께 검증한다."""
+    _check_table(table)
+    after = start.row_id if start else 0
+    prev = start.hash if start else None
+    checked = 0
+
+    def report(ok: bool, broken_id: int | None = None, reason: str | None = None):
+        return ChainReport(table, ok, checked, after, last_id, prev, broken_id, reason)
+
+    last_id = after
+    if start is not None:
+        row = conn.execute(f"SELECT hash FROM {table} WHERE id=?", (start.row_id,)).fetchone()
+        if row is None or row[0] != start.hash:
+            return report(False, start.row_id, "검증 지점의 해시가 원장과 다릅니다")
+
+    cur = conn.cursor()
+    cur.row_factory = sqlite3.Row
+    cur.execute(f"SELECT * FROM {table} WHERE id > ? ORDER BY id", (after,))
+    try:
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return report(True)
+            for r in rows:
+                if r["prev_hash"] != prev:
+                    return report(False, r["id"], "prev_hash 가 앞 행의 hash 와 다릅니다")
+                if row_digest(table, r) != r["hash"]:
+                    return report(False, r["id"], "행 내용으로 다시 계산한 해시가 다릅니다")
+                prev = r["hash"]
+                last_id = r["id"]
+                checked += 1
+    finally:
+        cur.close()
+
+
+def verify_ledger(
+    conn: sqlite3.Connection, tables: tuple[str, ...] = CHAIN_TABLES, *,
+    key: bytes | None = None, full: bool = False, batch_size: int = BATCH_SIZE,
+) -> list[ChainReport]:
+    """체인마다 verify_table. 키가 있고 full 이 아니면 마지막 지점 뒤만 본다."""
+    reports = []
+    for table in tables:
+        start = None if full or not key else latest_checkpoint(conn, table, key)
+        reports.append(verify_table(conn, table, start=start, batch_size=batch_size))
+    return reports
+
+
+def save_checkpoints(
+    conn: sqlite3.Connection, reports: list[ChainReport], key: bytes,
+) -> list[Checkpoint]:
+    """통과한 체인의 마지막 행을 서명해 남긴다. 실패한 체인에는 남기지 않는다."""
+    saved = []
+    conn.executescript(CHECKPOINT_SCHEMA)
+    verified_at = datetime.now(timezone.utc).isoformat()
+    for rep in reports:
+        if not rep.ok or rep.last_hash is None or rep.checked == 0:
+            continue
+        cp = Checkpoint(rep.table, rep.last_id, rep.last_hash, verified_at,
+                        _sign(key, rep.table, rep.last_id, rep.last_hash, verified_at))
+        conn.execute(
+            "INSERT INTO verify_checkpoints (tbl, row_id, hash, verified_at, signature)"
+            " VALUES (?,?,?,?,?)",
+            (cp.table, cp.row_id, cp.hash, cp.verified_at, cp.signature),
+        )
+        saved.append(cp)
+    conn.commit()
+    return saved
+
+
+def summary_lines(reports: list[ChainReport]) -> list[str]:
+    lines = []
+    for rep in reports:
+        head = f"{rep.table:<14} {'OK' if rep.ok else 'BROKEN':<7}"
+        span = f"검증 {rep.checked}행 (id {rep.resumed_from} 이후, 마지막 id {rep.last_id})"
+        tail = f" — id {rep.broken_id}: {rep.reason}" if not rep.ok else ""
+        lines.append(f"{head} {span}{tail}")
+    return lines
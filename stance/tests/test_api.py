@@ -308,6 +308,45 @@ def test_leaderboard_lists_registered_strategy(client, registered):
     assert "avg_exposure" in entries[0]["metrics"]
 
 
+def test_leaderboard_is_cached_until_the_ledger_changes(client, registered, monkeypatch):
+    builds = []
+    real_build = api_module.build_leaderboard
+    monkeypatch.setattr(api_module, "build_leaderboard",
+                        lambda ledger, entries: builds.append(1) or real_build(ledger, entries))
+
+    first = client.get("/leaderboard")
+    etag = first.headers["etag"]
+    assert client.get("/leaderboard").json() == first.json()
+    assert client.get("/leaderboard", headers={"If-None-Match": etag}).status_code == 304
+    assert len(builds) == 1
+
+    # 시장별 응답은 따로 캐시된다
+    assert client.get("/leaderboard?market=KRX").headers["etag"] != etag
+
+    client.post("/stances", headers=auth(registered),
+                json={"protocol": "stance/1", "seq": 1, "symbol": "005930", "target_weight": 0.3})
+    fresh = client.get("/leaderboard", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+    assert fresh.json()["boards"]["KRX"]["entries"][0]["metrics"]["avg_exposure"] is not None
+
+
+def test_portfolio_etag_is_per_strategy(client, registered):
+    other = client.post("/strategies", json={
+        "strategy": "s2", "display_name": "둘째", "handle": "@me", "market": "KRX",
+    }).json()["api_key"]
+    mine = client.get("/portfolio", headers=auth(registered))
+    theirs = client.get("/portfolio", headers=auth(other))
+    assert mine.headers["etag"] != theirs.headers["etag"]
+    assert mine.headers["vary"] == "Authorization"
+
+    r = client.get("/portfolio", headers={**auth(registered), "If-None-Match": mine.headers["etag"]})
+    assert r.status_code == 304
+    client.post("/stances", headers=auth(registered),
+                json={"protocol": "stance/1", "seq": 1, "kind": "hold"})
+    r = client.get("/portfolio", headers={**auth(registered), "If-None-Match": mine.headers["etag"]})
+    assert r.status_code == 200 and r.json()["last_seq"] == 1
+
+
 def test_openapi_exposes_typed_core_responses(client):
     schema = client.get("/openapi.json").json()
     assert schema["paths"]["/strategies"]["post"]["responses"]["201"]["content"][
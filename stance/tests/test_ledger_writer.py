@@ -0,0 +1,112 @@
+"""원장 기록기 — 동시 추가를 묶어 커밋해도 해시체인이 어긋나지 않는지 본다."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import date
+from decimal import Decimal as D
+
+import pytest
+
+from stance.server import Kind, Ledger, Quote
+from stance.server.service import StanceService
+
+
+def _hold_writer(led: Ledger, appenders: list[threading.Thread], queued: int) -> None:
+    """기록기를 막아 둔 채 추가를 큐에 쌓은 뒤 풀어준다 — 한 배치로 묶이게 한다."""
+    with led._lock:
+        for t in appenders:
+            t.start()
+        deadline = time.monotonic() + 2
+        while led._jobs.qsize() < queued and time.monotonic() < deadline:
+            time.sleep(0.005)
+    for t in appenders:
+        t.join()
+
+
+def test_concurrent_appends_share_commits_and_keep_the_chain(tmp_path):
+    led = Ledger(tmp_path / "ledger.db")
+    for i in range(8):
+        led.register(f"s{i}", f"S{i}", "@h")
+    ids: list[int] = []
+
+    def append(i: int) -> None:
+        ids.append(led.append_stance(f"s{i}", 1, Kind.SET, "AAA", D("0.1")))
+
+    _hold_writer(led, [threading.Thread(target=append, args=(i,)) for i in range(8)], 7)
+
+    assert sorted(ids) == list(range(1, 9))
+    assert led.stats["appends"] == 8 and led.stats["batches"] <= 2
+    assert led.verify_chain("stances")
+    led.close()
+
+
+def test_failed_append_is_rolled_back_alone():
+    led = Ledger()
+    led.register("s1", "S1", "@h")
+    led.register("s2", "S2", "@h")
+    results: dict[str, object] = {}
+
+    def append(name: str, strategy: str) -> None:
+        try:
+            results[name] = led.append_stance(strategy, 1, Kind.HOLD)
+        except sqlite3.IntegrityError as e:
+            results[name] = e
+
+    threads = [threading.Thread(target=append, args=args)
+               for args in (("a", "s1"), ("dup", "s1"), ("b", "s2"))]
+    _hold_writer(led, threads, 2)
+
+    failed = [k for k, v in results.items() if isinstance(v, sqlite3.IntegrityError)]
+    assert len(failed) == 1 and led.stats["failed"] == 1
+    assert led.query_one("SELECT COUNT(*) AS n FROM stances")["n"] == 2
+    assert led.verify_chain("stances")
+
+    # 실패한 건의 해시가 꼬리에 남지 않았다 — 이어지는 추가도 체인에 붙는다
+    led.append_stance("s2", 2, Kind.HOLD)
+    assert led.verify_chain("stances")
+
+
+def test_file_ledger_reads_from_read_only_pool(tmp_path):
+    svc = StanceService(ledger=Ledger(tmp_path / "ledger.db"),
+                        quote_provider=lambda market, symbol: Quote(symbol, D(10000)))
+    for i in range(4):
+        svc.register(f"s{i}", f"S{i}", "@h")
+
+    def submit(i: int) -> None:
+        for seq in range(1, 6):
+            svc.submit(f"s{i}", seq, "set", "005930", "0.1")
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    led = svc.ledger
+    assert [led.next_seq(f"s{i}") for i in range(4)] == [6, 6, 6, 6]
+    assert len(led.timeline("s0")) == 5 and led.timeline("s0")[0][1] is not None
+    assert led.verify_chain("stances") and led.verify_chain("quotes")
+
+    with led._reader() as conn:
+        assert conn is not led.conn
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO strategies (strategy_id) VALUES ('x')")
+    led.close()
+
+
+def test_commits_from_another_connection_move_version_and_tail(tmp_path):
+    led = Ledger(tmp_path / "ledger.db")
+    led.append_daily_mark("KRX", date(2026, 10, 15), {"AAA": D(100)})
+    before = led.version()
+
+    marker = Ledger(tmp_path / "ledger.db")   # 마감 스크립트처럼 따로 연 기록자
+    marker.append_daily_mark("KRX", date(2026, 10, 16), {"AAA": D(101)})
+    marker.close()
+
+    assert led.version() > before
+    led.append_daily_mark("KRX", date(2026, 10, 19), {"AAA": D(102)})
+    assert led.verify_chain("daily_marks")
+    led.close()
@@ -14,6 +14,7 @@ import pytest
 
 from stance.server import Kind, Ledger, Quote, close_day, held_symbols
 from stance.server.leaderboard import build
+from stance.server.marker import fetch_closes
 from stance.server.service import StanceService
 
 
@@ -178,3 +179,50 @@ def test_without_calendar_every_day_is_a_trading_day(svc):
     svc.submit("s1", 1, symbol="AAA", target_weight="0.5")
     result = close_day(svc.ledger, "KRX", prices(AAA=1000), on=date(2026, 1, 1))
     assert result["skipped"] is False
+
+
+# ── 묶음 조회 ─────────────────────────────────────────────────────────────
+
+class BatchPrices:
+    """묶음 시세 제공자. `flaky` 종목은 처음 물을 때만 빠뜨린다."""
+
+    def __init__(self, table, batch_size=2, flaky=()):
+        self.table = {k: D(str(v)) for k, v in table.items()}
+        self.batch_size = batch_size
+        self.flaky = set(flaky)
+        self.requests = []
+
+    def quotes(self, market, symbols):
+        self.requests.append(list(symbols))
+        if "BOOM" in symbols:
+            raise RuntimeError("묶음 전체 실패")
+        skip = {s for s in symbols if s in self.flaky and sum(s in r for r in self.requests) == 1}
+        return {s: Quote(s, self.table[s]) for s in symbols if s in self.table and s not in skip}
+
+
+def test_fetch_closes_batches_and_retries_only_missing():
+    provider = BatchPrices({s: 100 for s in "ABCDE"}, batch_size=2, flaky={"A"})
+    got = fetch_closes(provider, "KRX", list("ABCDE"), sleep=lambda _: None)
+
+    assert got == {s: D(100) for s in "ABCDE"}
+    assert sorted(map(sorted, provider.requests[:3])) == [["A", "B"], ["C", "D"], ["E"]]
+    assert provider.requests[3:] == [["A"]]          # 다시 묻는 것은 빠진 종목뿐
+
+
+def test_fetch_closes_gives_up_after_retries():
+    provider = BatchPrices({"A": 100}, batch_size=1)
+    got = fetch_closes(provider, "KRX", ["A", "BOOM", "ZZZ"], retries=1, sleep=lambda _: None)
+    assert got == {"A": D(100)}
+    assert provider.requests.count(["ZZZ"]) == 2 and provider.requests.count(["BOOM"]) == 2
+
+
+def test_close_day_uses_the_batch_provider(svc):
+    svc.submit("s1", 1, symbol="AAA", target_weight="0.3")
+    svc.submit("s1", 2, symbol="BBB", target_weight="0.3")
+    provider = BatchPrices({"AAA": 1000, "BBB": 2000}, batch_size=30)
+
+    result = close_day(svc.ledger, "KRX", provider, on=date(2026, 1, 5))
+
+    assert result["marked"] == 2 and result["missing"] == []
+    assert provider.requests == [["AAA", "BBB"]]
+    assert svc.ledger.daily_marks("KRX")[0].prices == {"AAA": D(1000), "BBB": D(2000)}
@@ -0,0 +1,98 @@
+"""해시체인 검증 — 내용 재계산, 서명된 검증 지점, 오프라인 CLI."""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal as D
+
+import pytest
+
+import stance_verify
+from stance.server import EventType, Kind, Ledger, MarketEvent, Quote
+from stance.server.verify import latest_checkpoint, verify_table
+
+KEY = b"test-verify-key"
+
+
+def _ledger(path=":memory:", stances=5) -> Ledger:
+    led = Ledger(path)
+    led.register("s1", "S1", "@h")
+    for seq in range(1, stances + 1):
+        sid = led.append_stance("s1", seq, Kind.SET, "AAA", D("0.1"), reason=f"r{seq}")
+        led.append_quote(sid, Quote("AAA", D(1000 + seq)))
+    led.append_daily_mark("KRX", date(2026, 10, 16), {"AAA": D(1005)})
+    led.append_event("KRX", MarketEvent(EventType.SPLIT, "AAA", datetime(2026, 10, 16),
+                                        ratio=D(2)))
+    return led
+
+
+def test_recomputes_row_digests_not_just_links():
+    led = _ledger()
+    assert all(led.verify_chain(t) for t in ("stances", "quotes", "daily_marks", "market_events"))
+
+    # 연결은 그대로 두고 내용만 고친다 — prev_hash 비교로는 보이지 않는 조작
+    led.conn.execute("DROP TRIGGER stances_no_update")
+    led.conn.execute("UPDATE stances SET reason='조작' WHERE seq=3")
+    report = verify_table(led.conn, "stances", batch_size=2)
+    assert not report.ok and report.broken_id == 3 and report.checked == 2
+    assert not led.verify_chain("stances")
+
+
+def test_signed_checkpoints_resume_from_the_last_verified_row(tmp_path):
+    led = _ledger(tmp_path / "ledger.db")
+    first = {r.table: r for r in led.verify(key=KEY)}
+    assert first["stances"].ok and first["stances"].checked == 5
+
+    for seq in (6, 7):
+        led.append_stance("s1", seq, Kind.HOLD)
+    again = {r.table: r for r in led.verify(key=KEY)}
+    assert again["stances"].resumed_from == first["stances"].last_id
+    assert again["stances"].checked == 2 and again["quotes"].checked == 0
+
+    # 서명이 맞지 않는 지점은 무시된다 — 파일을 손댈 수 있어도 검증을 건너뛰게 못 한다
+    led.conn.execute(
+        "INSERT INTO verify_checkpoints (tbl, row_id, hash, verified_at, signature)"
+        " VALUES ('stances', 7, 'x', 'now', 'forged')"
+    )
+    led.conn.commit()
+    assert latest_checkpoint(led.conn, "stances", KEY).row_id == 7
+    assert latest_checkpoint(led.conn, "stances", KEY).hash != "x"
+    assert latest_checkpoint(led.conn, "stances", b"other-key") is None
+    led.close()
+
+
+def test_checkpoint_detects_rewritten_prefix(tmp_path):
+    led = _ledger(tmp_path / "ledger.db")
+    led.verify(key=KEY)
+    led.conn.execute("DROP TRIGGER stances_no_update")
+    led.conn.execute("UPDATE stances SET hash='다시 이은 체인' WHERE seq=5")
+    led.conn.commit()
+
+    (report,) = [r for r in led.verify(key=KEY) if r.table == "stances"]
+    assert not report.ok and report.broken_id == 5
+    assert [r.ok for r in led.verify(key=KEY, full=True) if r.table == "stances"] == [False]
+    led.close()
+
+
+def test_cli_verifies_a_copied_ledger_offline(tmp_path, monkeypatch, capsys):
+    led = _ledger(tmp_path / "ledger.db")
+    led.close()
+    copy = tmp_path / "copy.db"
+    shutil.copy(tmp_path / "ledger.db", copy)
+    monkeypatch.setenv("STANCE_VERIFY_KEY", KEY.decode())
+
+    assert stance_verify.main(["--db", str(copy), "--read-only", "--json"]) == 0
+    assert '"ok": true' in capsys.readouterr().out
+    conn = sqlite3.connect(copy)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("SELECT * FROM verify_checkpoints")   # 읽기 전용이면 지점을 남기지 않는다
+
+    conn.execute("DROP TRIGGER quotes_no_update")
+    conn.execute("UPDATE quotes SET price='1' WHERE id=2")
+    conn.commit()
+    conn.close()
+    assert stance_verify.main(["--db", str(copy), "--table", "quotes"]) == 1
+    assert "BROKEN" in capsys.readouterr().out
+    assert stance_verify.main(["--db", str(tmp_path / "missing.db")]) == 2
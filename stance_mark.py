@@ -14,6 +14,7 @@ cron (정규장 마감 후)
     STANCE_DB       원장 파일 경로 (서버와 같은 경로를 써야 한다)
     STANCE_QUOTES   kis (기본) | none
     STANCE_KIS_MODE real (기본) | vps
+    STANCE_VERIFY_KEY  검증 지점 서명 키. 있으면 마감마다 지난 지점 뒤만 검증한다
 """
 
 from __future__ import annotations
@@ -59,10 +60,10 @@ def _write_dashboard_json(ledger, path: str) -> None:
     from stance.server.leaderboard import build, preparing, write_json
 
     try:
-        rows = ledger.conn.execute(
+        rows = ledger.query(
             "SELECT strategy_id, display_name, handle, market FROM strategies"
             " ORDER BY created_at"
-        ).fetchall()
+        )
         entries = [(r["strategy_id"], r["display_name"], r["handle"], r["market"])
                    for r in rows]
         payload = build(ledger, entries) if entries else preparing(["KRX"])
@@ -72,6 +73,18 @@ def _write_dashboard_json(ledger, path: str) -> None:
         logger.exception("리더보드 JSON 갱신 실패 — 마감은 성공했다")
 
 
+def _verify_ledger(ledger) -> bool:
+    from stance.server.verify import key_from_env, summary_lines
+
+    reports = ledger.verify(key=key_from_env())
+    for line in summary_lines(reports):
+        logger.info("원장 검증: %s", line)
+    broken = [r for r in reports if not r.ok]
+    if broken:
+        logger.error("원장 해시체인이 어긋났습니다: %s", ", ".join(r.table for r in broken))
+    return not broken
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Stance 하루 마감")
     parser.add_argument("--market", default="KRX")
@@ -104,6 +117,10 @@ def main(argv: list[str] | None = None) -> int:
         result = close_day(ledger, args.market, fetcher, on=on, is_trading_day=calendar)
         print(result)
 
+        # 봉인 직후 해시체인을 검증한다. 어긋났으면 cron 이 알 수 있게 실패로 끝낸다.
+        if not _verify_ledger(ledger):
+            return 1
+
         # 마감 직후 리더보드를 다시 만든다. 계산장부라 언제든 재생성해도 된다.
         if args.dashboard_json:
             _write_dashboard_json(ledger, args.dashboard_json)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Stance 원장 검증 — 해시체인을 행마다 다시 계산해 대조한다.
+
+운영 원장이든 내려받은 사본이든 파일 하나만 있으면 된다. 원장 서버를 띄우지 않는다.
+
+    python -m stance_verify --db stance_ledger.db            # 마지막 검증 지점 뒤만
+    python -m stance_verify --db 사본.db --full --read-only   # 제3자의 독립 검증
+
+검증 지점은 STANCE_VERIFY_KEY 로 서명한다. 키가 없으면 지점을 쓰지 않고 늘 처음부터 본다.
+
+종료 코드
+    0  모든 체인 통과
+    1  어긋난 체인이 있다
+    2  원장 파일이 없다
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+logger = logging.getLogger("stance_verify")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from stance.server.ledger import CHAIN_TABLES
+    from stance.server.verify import key_from_env, save_checkpoints, summary_lines, verify_ledger
+
+    parser = argparse.ArgumentParser(description="Stance 원장 해시체인 검증")
+    parser.add_argument("--db", default=os.getenv("STANCE_DB", "stance_ledger.db"))
+    parser.add_argument("--table", action="append", choices=CHAIN_TABLES,
+                        help="검증할 체인 (여러 번 지정 가능, 기본: 전부)")
+    parser.add_argument("--full", action="store_true",
+                        help="검증 지점을 무시하고 처음부터 다시 계산한다")
+    parser.add_argument("--read-only", action="store_true",
+                        help="파일을 읽기 전용으로 열고 검증 지점을 남기지 않는다")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력한다")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=os.getenv("STANCE_LOG_LEVEL", "INFO"),
+                        format="%(asctime)s %(levelname)-7s | %(message)s")
+
+    path = Path(args.db)
+    if not path.exists():
+        logger.error("원장 파일이 없습니다: %s", path)
+        return 2
+
+    key = key_from_env()
+    tables = tuple(args.table) if args.table else CHAIN_TABLES
+    if args.read_only:
+        conn = sqlite3.connect(path.resolve().as_uri() + "?mode=ro", uri=True)
+    else:
+        conn = sqlite3.connect(str(path))
+    try:
+        reports = verify_ledger(conn, tables, key=key, full=args.full)
+        if key and not args.read_only:
+            save_checkpoints(conn, reports, key)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], ensure_ascii=False, indent=2))
+    else:
+        for line in summary_lines(reports):
+            print(line)
+    return 0 if all(r.ok for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
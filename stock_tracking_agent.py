@@ -27,7 +27,9 @@ from typing import List, Dict, Any, Tuple, Optional
 
 import cores.openai_debug  # noqa: F401 — OpenAI 400/429 request metadata logging
 from telegram import Bot
-from telegram.error import TelegramError, TimedOut, RetryAfter
+from telegram.error import TelegramError, TimedOut
+
+from telegram_broadcaster import get_broadcaster
 
 # Logging configuration
 logging.basicConfig(
@@ -66,6 +68,7 @@ from prism_core.positions import (
     legacy_position_id,
     mirror_write_fail_open,
 )
+from prism_core.tracking_repository import TrackingRepository
 
 # O'Neil 룰베이스 매도 (2026-06-04 US quota 사고 동일 룰 결함 KR에도 적용).
 # 방어적 import: 실패 시 _ONEIL_FALLBACK_AVAILABLE=False 로 기존 레거시 룰 유지.
@@ -244,6 +247,7 @@ class StockTrackingAgent:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self.repo: TrackingRepository | None = None
         self.account_configs: list[dict[str, Any]] = []
         self.active_account: dict[str, Any] | None = None
         self.position_ledger_shadow_enabled = os.environ.get(
@@ -298,6 +302,8 @@ class StockTrackingAgent:
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row  # Return results as dictionary
         self.cursor = self.conn.cursor()
+        # Non-blocking access for the hot async paths (own connection, DB thread)
+        self.repo = TrackingRepository(self.db_path)
 
         # Initialize trading scenario generation agent with language and sector names.
         # Skipped for lightweight sell-only consumers (see skip_llm_agent docstring).
@@ -578,21 +584,39 @@ class StockTrackingAgent:
         """Calculate trading value ranking change (delegates to tracking.helpers)"""
         return await get_trading_value_rank_change(ticker)
 
+    def _db_repo(self) -> TrackingRepository | None:
+        """The DB-thread repository, or None to use the shared connection.
+
+        Falls back while the shared connection holds uncommitted writes: the
+        repository's own connection would not see them yet.
+        """
+        repo = getattr(self, "repo", None)
+        if repo is None or (isinstance(self.conn, sqlite3.Connection) and self.conn.in_transaction):
+            return None
+        return repo
+
+    async def _db_call(self, fn, *args, **kwargs):
+        """Run a cursor-based tracking.helpers function off the event loop."""
+        repo = self._db_repo()
+        if repo is None:
+            return fn(self.cursor, *args, **kwargs)
+        return await repo.call(fn, *args, **kwargs)
+
     async def _is_ticker_in_holdings(self, ticker: str) -> bool:
         """Check if stock is already in holdings (delegates to tracking.helpers)"""
         account_key, _ = self._account_scope()
-        return is_ticker_in_holdings(self.cursor, ticker, account_key=account_key)
+        return await self._db_call(is_ticker_in_holdings, ticker, account_key=account_key)
 
     async def _get_current_slots_count(self) -> int:
         """Get current number of holdings (delegates to tracking.helpers)"""
         account_key, _ = self._account_scope()
-        return get_current_slots_count(self.cursor, account_key=account_key)
+        return await self._db_call(get_current_slots_count, account_key=account_key)
 
     async def _check_sector_diversity(self, sector: str) -> bool:
         """Check for over-concentration in same sector (delegates to tracking.helpers)"""
         account_key, _ = self._account_scope()
-        return check_sector_diversity(
-            self.cursor, sector,
+        return await self._db_call(
+            check_sector_diversity, sector,
             self.MAX_SAME_SECTOR, self.SECTOR_CONCENTRATION_RATIO, account_key=account_key
         )
 
@@ -848,12 +872,16 @@ class StockTrackingAgent:
             current_slots = await self._get_current_slots_count()
 
             # Collect current portfolio information
-            self.cursor.execute("""
-                SELECT ticker, company_name, buy_price, current_price, scenario
-                FROM stock_holdings
-                WHERE account_key = ?
-            """, (self._account_scope()[0],))
-            holdings = [dict(row) for row in self.cursor.fetchall()]
+            repo = self._db_repo()
+            if repo is not None:
+                holdings = await repo.holdings(self._account_scope()[0])
+            else:
+                self.cursor.execute("""
+                    SELECT ticker, company_name, buy_price, current_price, scenario
+                    FROM stock_holdings
+                    WHERE account_key = ?
+                """, (self._account_scope()[0],))
+                holdings = [dict(row) for row in self.cursor.fetchall()]
 
             # Analyze sector distribution
             sector_distribution = {}
@@ -3183,15 +3211,19 @@ class StockTrackingAgent:
             # Query holdings list
             # id included for pyramiding (#288): enables per-row delete and
             # fractional-sell quantity computation for multi-row tickers.
-            self.cursor.execute(
-                """SELECT id, ticker, company_name, buy_price, buy_date, current_price,
-                   scenario, target_price, stop_loss, last_updated,
-                   trigger_type, trigger_mode, account_key, account_name, sector
-                   FROM stock_holdings
-                   WHERE account_key = ?""",
-                (self._account_scope()[0],)
-            )
-            holdings = [dict(row) for row in self.cursor.fetchall()]
+            repo = self._db_repo()
+            if repo is not None:
+                holdings = await repo.holdings(self._account_scope()[0])
+            else:
+                self.cursor.execute(
+                    """SELECT id, ticker, company_name, buy_price, buy_date, current_price,
+                       scenario, target_price, stop_loss, last_updated,
+                       trigger_type, trigger_mode, account_key, account_name, sector
+                       FROM stock_holdings
+                       WHERE account_key = ?""",
+                    (self._account_scope()[0],)
+                )
+                holdings = [dict(row) for row in self.cursor.fetchall()]
 
             if not holdings or len(holdings) == 0:
                 logger.info("No holdings")
@@ -3449,14 +3481,17 @@ class StockTrackingAgent:
                             "account_label": account_label,
                         })
                 else:
-                    # Update current price
-                    self.cursor.execute(
-                        """UPDATE stock_holdings
-                           SET current_price = ?, last_updated = ?
-                           WHERE ticker = ? AND account_key = ?""",
-                        (current_price, now, ticker, stock.get("account_key"))
-                    )
-                    self.conn.commit()
+                    # Update current price (batched into one commit per cycle)
+                    if repo is not None:
+                        repo.queue_price_update(ticker, stock.get("account_key"), current_price, now)
+                    else:
+                        self.cursor.execute(
+                            """UPDATE stock_holdings
+                               SET current_price = ?, last_updated = ?
+                               WHERE ticker = ? AND account_key = ?""",
+                            (current_price, now, ticker, stock.get("account_key"))
+                        )
+                        self.conn.commit()
                     logger.info(f"{ticker}({company_name}) current price updated: {current_price:,.0f} KRW ({sell_reason})")
 
             return sold_stocks
@@ -3465,6 +3500,14 @@ class StockTrackingAgent:
             logger.error(f"Error updating holdings: {str(e)}")
             logger.error(traceback.format_exc())
             return []
+        finally:
+            # Price refreshes must land before the summary reads them back
+            repo = getattr(self, "repo", None)
+            if repo is not None and repo.pending:
+                try:
+                    await repo.flush()
+                except sqlite3.Error as e:
+                    logger.error(f"Holding price update flush failed: {e}")
 
     async def generate_report_summary(self) -> str:
         """
@@ -4109,24 +4152,24 @@ class StockTrackingAgent:
         return asyncio.create_task(self._notify_firebase(message, chat_id, message_id, msg_type=msg_type))
 
     async def _send_with_retry(self, chat_id: str, text: str, max_retries: int = 3):
-        """Send a single Telegram message with retry on timeout and rate-limit."""
-        for attempt in range(max_retries + 1):
-            try:
-                return await self.telegram_bot.send_message(chat_id=chat_id, text=text)
-            except RetryAfter as e:
-                if attempt < max_retries:
-                    wait_time = e.retry_after + 1
-                    logger.warning(f"Rate limit hit. Waiting {wait_time}s before retry... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
-            except TimedOut:
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt  # 1, 2, 4 seconds
-                    logger.warning(f"Timeout sending to {chat_id}. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
+        """Send a single Telegram message with retry on timeout and rate-limit.
+
+        Pacing, per-chat ordering and RetryAfter waits are handled by the shared
+        broadcaster; timeouts are retried here with exponential backoff.
+        """
+        async def _send():
+            for attempt in range(max_retries + 1):
+                try:
+                    return await self.telegram_bot.send_message(chat_id=chat_id, text=text)
+                except TimedOut:
+                    if attempt < max_retries:
+                        wait_time = 2 ** attempt  # 1, 2, 4 seconds
+                        logger.warning(f"Timeout sending to {chat_id}. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                        await asyncio.sleep(wait_time)
+                    else:
+                        raise
+
+        return await get_broadcaster().send(chat_id, _send, max_retries=max_retries)
 
     async def send_telegram_message(self, chat_id: str, language: str = "ko",
                                     portfolio_force: bool = False,
@@ -4194,13 +4237,8 @@ class StockTrackingAgent:
             if language == "en":
                 logger.info(f"Translating {len(self.message_queue)} messages to English")
                 try:
-                    from cores.agents.telegram_translator_agent import translate_telegram_message
-                    translated_queue = []
-                    for idx, message in enumerate(self.message_queue, 1):
-                        logger.info(f"Translating message {idx}/{len(self.message_queue)}")
-                        translated = await translate_telegram_message(message, model="gpt-5.6-luna")
-                        translated_queue.append(translated)
-                    self.message_queue = translated_queue
+                    from cores.agents.telegram_translator_agent import translate_telegram_messages
+                    self.message_queue = await translate_telegram_messages(self.message_queue, to_lang="en")
                     logger.info("All messages translated successfully")
                 except Exception as e:
                     logger.error(f"Translation failed: {str(e)}. Using original Korean messages.")
@@ -4252,7 +4290,6 @@ class StockTrackingAgent:
                             result = await self._send_with_retry(chat_id=chat_id, text=f"[{i}/{len(parts)}]\n{part}")
                             if i == 1:
                                 first_msg_id = result.message_id
-                            await asyncio.sleep(0.5)  # Short delay between split messages
 
                         # Notify with full original message, link to first part
                         firebase_tasks.append(self._schedule_firebase(message, chat_id, first_msg_id, msg_type=msg_type))
@@ -4298,12 +4335,10 @@ class StockTrackingAgent:
                     )
                     success = False
 
-                # Delay to prevent API rate limiting
-                await asyncio.sleep(1)
-
             # Gather Firebase notifications (non-blocking for Telegram delivery)
             if firebase_tasks:
                 await asyncio.gather(*firebase_tasks, return_exceptions=True)
+            get_broadcaster().log_metrics("Telegram tracking")
 
             # Send to broadcast channels if configured (awaited in run() finally block,
             # or inline here when await_broadcast=True — intraday loops don't call run()
@@ -4338,31 +4373,31 @@ class StockTrackingAgent:
             msg_types: msg_type for each message in the list
         """
         try:
-            from cores.agents.telegram_translator_agent import translate_telegram_message
+            from cores.agents.telegram_translator_agent import schedule_telegram_translations
 
+            channels = {}
             for lang in self.telegram_config.broadcast_languages:
-                try:
-                    # Get channel ID for this language
-                    channel_id = self.telegram_config.get_broadcast_channel_id(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID configured for language: {lang}")
-                        continue
+                # Get channel ID for this language
+                channel_id = self.telegram_config.get_broadcast_channel_id(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+
+            # Start every (message x language) translation up front; each channel
+            # sends in order as soon as its next translation is ready.
+            translations = schedule_telegram_translations(messages, list(channels))
 
+            async def _send_lang(lang, channel_id):
+                try:
                     logger.info(f"Sending tracking messages to {lang} channel")
 
-                    # Translate and send each message (Firebase non-blocking)
+                    # Send each translated message (Firebase non-blocking)
                     firebase_tasks = []
-                    for msg_idx, message in enumerate(messages):
+                    for msg_idx, translation in enumerate(translations[lang]):
                         msg_type = msg_types[msg_idx] if msg_types and msg_idx < len(msg_types) else None
                         try:
-                            # Translate message
-                            logger.info(f"Translating tracking message to {lang}")
-                            translated_message = await translate_telegram_message(
-                                message,
-                                model="gpt-5.6-luna",
-                                from_lang="ko",
-                                to_lang=lang
-                            )
+                            translated_message = await translation
 
                             # Send translated message
                             MAX_MESSAGE_LENGTH = 4096
@@ -4392,18 +4427,21 @@ class StockTrackingAgent:
                                     result = await self._send_with_retry(chat_id=channel_id, text=f"[{i}/{len(parts)}]\n{part}")
                                     if i == 1:
                                         first_msg_id = result.message_id
-                                    await asyncio.sleep(0.5)
 
                                 firebase_tasks.append(self._schedule_firebase(translated_message, channel_id, first_msg_id, msg_type=msg_type))
 
                             logger.info(f"Tracking message sent successfully to {lang} channel")
-                            await asyncio.sleep(1)
 
                         except Exception as e:
                             logger.error(f"Error sending tracking message to {lang}: {str(e)}")
                             from telegram_config import is_openai_quota_error, send_openai_quota_alert
                             if is_openai_quota_error(e):
-                                await send_openai_quota_alert(self.telegram_config, market="KR")
+                                if not quota_alerted:
+                                    quota_alerted.append(lang)
+                                    await send_openai_quota_alert(self.telegram_config, market="KR")
+                                for pending in translations.values():
+                                    for task in pending:
+                                        task.cancel()
                                 return
 
                     # Gather Firebase notifications for this language
@@ -4413,6 +4451,13 @@ class StockTrackingAgent:
                 except Exception as e:
                     logger.error(f"Error processing language {lang}: {str(e)}")
 
+            quota_alerted = []
+            await asyncio.gather(
+                *(_send_lang(lang, channel_id) for lang, channel_id in channels.items()),
+                return_exceptions=True,
+            )
+            get_broadcaster().log_metrics("Telegram tracking broadcast")
+
         except Exception as e:
             logger.error(f"Error in _send_to_translation_channels: {str(e)}")
 
@@ -4499,6 +4544,9 @@ class StockTrackingAgent:
                     self._broadcast_task = None
 
                 # Ensure connection is always closed
+                if getattr(self, "repo", None) is not None:
+                    await self.repo.close()
+                    self.repo = None
                 if self.conn:
                     self.conn.close()
                     logger.info("Database connection closed")
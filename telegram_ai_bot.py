@@ -43,7 +43,7 @@ from firecrawl_client import firecrawl_agent
 from cores.search_presets import search_preset
 from cores.market_facts_cache import daily_facts
 from cores.disclaimer_utils import strip_trailing_disclaimer as _strip_trailing_disclaimer
-from prism_core.ticker_resolver import resolve_ticker
+from prism_core.ticker_resolver import index_for, resolve_ticker
 from telegram_moderation import CommunityModerator, community_notice
 from datetime import timedelta
 from dataclasses import dataclass
@@ -797,6 +797,8 @@ class TelegramAIBot:
                     data = json.load(f)
                     self.stock_map = data.get("code_to_name", {})
                     self.stock_name_map = data.get("name_to_code", {})
+                # Build the name index now rather than on the first user query
+                index_for(self.stock_name_map)
 
                 logger.info(f"Loaded {len(self.stock_map)} stock information entries")
             else:
@@ -6,6 +6,8 @@ from telegram import Bot
 from telegram.error import TelegramError, RetryAfter, TimedOut
 from telegram.request import HTTPXRequest
 
+from telegram_broadcaster import get_broadcaster
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +41,8 @@ class TelegramBotAgent:
         )
 
         self.bot = Bot(token=self.token, request=request)
+        # Paces sends per chat/globally and waits out RetryAfter precisely
+        self.broadcaster = get_broadcaster()
 
     async def send_message(self, chat_id, message, parse_mode="Markdown", retry_count=0, max_retries=3, msg_type=None):
         """
@@ -56,11 +60,11 @@ class TelegramBotAgent:
         """
         try:
             # Attempt to send with specified parse_mode
-            result = await self.bot.send_message(
+            result = await self.broadcaster.send(chat_id, lambda: self.bot.send_message(
                 chat_id=chat_id,
                 text=message,
                 parse_mode=parse_mode
-            )
+            ))
             logger.info(f"Message sent successfully ({parse_mode}): {chat_id}")
             # Firebase Bridge - save metadata + push notification
             try:
@@ -74,16 +78,10 @@ class TelegramBotAgent:
             except Exception as e:
                 logger.debug(f"Firebase bridge: {e}")
             return True
-        except RetryAfter as e:
-            # Rate limit hit, wait and retry
-            wait_time = e.retry_after + 1
-            logger.warning(f"Rate limit hit. Waiting {wait_time} seconds before retry...")
-            await asyncio.sleep(wait_time)
-            if retry_count < max_retries:
-                return await self.send_message(chat_id, message, parse_mode, retry_count + 1, max_retries, msg_type=msg_type)
-            else:
-                logger.error("Max retries reached after rate limit")
-                return False
+        except RetryAfter:
+            # The broadcaster already waited out and retried flood control
+            logger.error("Max retries reached after rate limit")
+            return False
         except TimedOut:
             # Timeout occurred, retry with exponential backoff
             if retry_count < max_retries:
@@ -100,10 +98,10 @@ class TelegramBotAgent:
             if parse_mode and "parse" in str(e).lower():
                 try:
                     logger.info("Retrying with plain text.")
-                    result = await self.bot.send_message(
+                    result = await self.broadcaster.send(chat_id, lambda: self.bot.send_message(
                         chat_id=chat_id,
                         text=message
-                    )
+                    ))
                     logger.info(f"Message sent successfully (plain text): {chat_id}")
                     try:
                         from firebase_bridge import notify
@@ -136,9 +134,10 @@ class TelegramBotAgent:
         Returns:
             bool: Transmission success status
         """
-        try:
+        async def _send():
+            # Reopened per attempt: a flood-control retry re-uploads the file
             with open(document_path, 'rb') as document:
-                result = await self.bot.send_document(
+                return await self.bot.send_document(
                     chat_id=chat_id,
                     document=document,
                     caption=caption,
@@ -147,6 +146,9 @@ class TelegramBotAgent:
                     write_timeout=60,
                     connect_timeout=30,
                 )
+
+        try:
+            result = await self.broadcaster.send(chat_id, _send)
             logger.info(f"File sent successfully: {document_path}")
             try:
                 from firebase_bridge import notify
@@ -163,16 +165,10 @@ class TelegramBotAgent:
             except Exception as e:
                 logger.debug(f"Firebase bridge: {e}")
             return True
-        except RetryAfter as e:
-            # Rate limit hit, wait and retry
-            wait_time = e.retry_after + 1
-            logger.warning(f"Rate limit hit. Waiting {wait_time} seconds before retry...")
-            await asyncio.sleep(wait_time)
-            if retry_count < max_retries:
-                return await self.send_document(chat_id, document_path, caption, retry_count + 1, max_retries, msg_type=msg_type, market=market)
-            else:
-                logger.error("Max retries reached after rate limit")
-                return False
+        except RetryAfter:
+            # The broadcaster already waited out and retried flood control
+            logger.error("Max retries reached after rate limit")
+            return False
         except TimedOut:
             # Timeout occurred, retry with exponential backoff
             if retry_count < max_retries:
@@ -207,25 +203,25 @@ class TelegramBotAgent:
         """
         try:
             from io import BytesIO
-            buf = BytesIO(image_bytes)
-            buf.name = "insight.jpg"
-            await self.bot.send_photo(
-                chat_id=chat_id,
-                photo=buf,
-                caption=caption,
-                parse_mode="Markdown",
-                read_timeout=60,
-                write_timeout=60,
-                connect_timeout=30,
-            )
+
+            async def _send():
+                buf = BytesIO(image_bytes)
+                buf.name = "insight.jpg"
+                return await self.bot.send_photo(
+                    chat_id=chat_id,
+                    photo=buf,
+                    caption=caption,
+                    parse_mode="Markdown",
+                    read_timeout=60,
+                    write_timeout=60,
+                    connect_timeout=30,
+                )
+
+            await self.broadcaster.send(chat_id, _send)
             logger.info("Insight image sent successfully")
             return True
-        except RetryAfter as e:
-            wait_time = e.retry_after + 1
-            logger.warning(f"Rate limit hit (photo). Waiting {wait_time}s before retry...")
-            await asyncio.sleep(wait_time)
-            if retry_count < max_retries:
-                return await self.send_photo_bytes(chat_id, image_bytes, caption, retry_count + 1, max_retries, market=market)
+        except RetryAfter:
+            # The broadcaster already waited out and retried flood control
             logger.error("Max retries reached after rate limit (photo)")
             return False
         except TimedOut:
@@ -298,9 +294,6 @@ class TelegramBotAgent:
                         msg_file.rename(new_name)
                         logger.info(f"Sent and renamed: {new_name.name}")
 
-                # Delay to prevent Telegram API rate limits
-                await asyncio.sleep(1)
-
             except Exception as e:
                 logger.error(f"Error processing {msg_file.name}: {e}")
 
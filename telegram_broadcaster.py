@@ -0,0 +1,289 @@
+"""
+Rate-aware Telegram Broadcaster
+
+Senders used to pace themselves with fixed ``asyncio.sleep(1)`` / ``sleep(0.5)``
+pauses after every message and PDF, one chat at a time, whatever Telegram's
+real limits were. A batch of tracking messages plus translated channels
+therefore took (messages x channels) seconds even though the channels never
+compete for the same per-chat limit, and a ``RetryAfter`` slept
+``retry_after + 1`` seconds in whichever coroutine happened to hit it.
+
+This broadcaster paces by the documented limits instead:
+- a process-wide limit of GLOBAL_RATE sends per second across all chats
+- per chat, CHAT_RATE sends per second; groups and channels (negative ids
+  and ``@username``) additionally GROUP_PER_MINUTE sends per minute
+- sends to one chat run strictly in submission order (one worker per chat
+  draining a FIFO queue), sends to different chats run concurrently
+- ``RetryAfter`` pauses only the affected chat for exactly ``retry_after``
+  seconds and retries the same send before anything queued behind it
+
+Limits are sliding windows with reservation: a send takes the earliest slot
+that keeps every window within its limit, so a burst never exceeds a limit
+at any point (a refilling bucket would allow a second burst inside the same
+minute). ``metrics()`` exposes queue depth, throughput, throttling and
+rate-limit waits.
+
+The send itself is an injected coroutine factory, so this module has no
+python-telegram-bot dependency; any exception with a ``retry_after``
+attribute is treated as a flood-control response.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_RATE = int(os.getenv("PRISM_TELEGRAM_GLOBAL_RATE", "30"))
+CHAT_RATE = int(os.getenv("PRISM_TELEGRAM_CHAT_RATE", "1"))
+GROUP_PER_MINUTE = int(os.getenv("PRISM_TELEGRAM_GROUP_PER_MINUTE", "20"))
+
+# Flood-control retries per send before the RetryAfter reaches the caller
+MAX_RETRY_AFTER = 3
+
+SendFn = Callable[[], Awaitable[Any]]
+
+
+def is_group_chat(chat_id: Any) -> bool:
+    """Groups/channels have negative ids or are addressed as @username."""
+    return str(chat_id).startswith(("-", "@"))
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Seconds requested by a flood-control error, or None for other errors."""
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class RateLimit:
+    """At most ``limit`` sends in any ``period`` seconds (sliding window).
+
+    ``reserve(now)`` books the earliest allowed slot and returns how long the
+    caller must wait for it; booked slots may lie in the future.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.limit = max(1, int(limit))
+        self.period = float(period)
+        self._slots: Deque[float] = deque(maxlen=self.limit)
+
+    def next_slot(self, now: float) -> float:
+        if len(self._slots) < self.limit:
+            return now
+        return max(now, self._slots[0] + self.period)
+
+    def book(self, at: float) -> None:
+        self._slots.append(at)
+
+    def reserve(self, now: float) -> float:
+        at = self.next_slot(now)
+        self.book(at)
+        return at - now
+
+
+@dataclass
+class _Job:
+    send: SendFn
+    future: asyncio.Future
+    submitted_at: float
+    max_retries: int
+
+
+@dataclass
+class _ChatLane:
+    limits: tuple
+    queue: Deque[_Job] = field(default_factory=deque)
+    worker: Optional[asyncio.Task] = None
+    paused_until: float = 0.0
+
+
+class TelegramBroadcaster:
+    """Per-chat FIFO send queues under global and per-chat rate limits.
+
+    Args:
+        global_rate: Sends per ``global_period`` across all chats
+        chat_rate: Sends per ``chat_period`` to one chat
+        group_per_minute: Extra per-minute limit for groups and channels
+            (0 disables it)
+        max_retries: Flood-control retries per send
+        sleep: ``async (seconds) -> None``; defaults to ``asyncio.sleep``
+        clock: Monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        global_rate: int = GLOBAL_RATE,
+        chat_rate: int = CHAT_RATE,
+        group_per_minute: int = GROUP_PER_MINUTE,
+        max_retries: int = MAX_RETRY_AFTER,
+        *,
+        global_period: float = 1.0,
+        chat_period: float = 1.0,
+        group_period: float = 60.0,
+        sleep: Optional[Callable[[float], Awaitable[Any]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.chat_rate = chat_rate
+        self.chat_period = chat_period
+        self.group_per_minute = group_per_minute
+        self.group_period = group_period
+        self.max_retries = max_retries
+        self._global = RateLimit(global_rate, global_period)
+        self._sleep = sleep
+        self._clock = clock
+        self._lanes: Dict[str, _ChatLane] = {}
+        self._loop = None
+        self.stats = {
+            "submitted": 0,
+            "sent": 0,
+            "failed": 0,
+            "retry_after": 0,
+            "retry_after_wait_s": 0.0,
+            "throttle_wait_s": 0.0,
+            "max_queue_wait_ms": 0.0,
+        }
+
+    async def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            await (self._sleep or asyncio.sleep)(seconds)
+
+    def _lane(self, chat_id: str) -> _ChatLane:
+        # Callers run under separate asyncio.run() loops; workers are loop-bound
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Keep the rate windows; queues and workers died with the old loop
+            for lane in self._lanes.values():
+                lane.queue.clear()
+                lane.worker = None
+            self._loop = loop
+        lane = self._lanes.get(chat_id)
+        if lane is None:
+            limits = [RateLimit(self.chat_rate, self.chat_period)]
+            if self.group_per_minute and is_group_chat(chat_id):
+                limits.append(RateLimit(self.group_per_minute, self.group_period))
+            lane = self._lanes[chat_id] = _ChatLane(limits=tuple(limits))
+        return lane
+
+    def submit(self, chat_id: Any, send: SendFn, max_retries: Optional[int] = None) -> asyncio.Future:
+        """Queue ``send()`` for ``chat_id``; the future resolves to its result.
+
+        Sends to the same chat run in submission order.
+        """
+        chat_id = str(chat_id)
+        lane = self._lane(chat_id)
+        future = asyncio.get_running_loop().create_future()
+        lane.queue.append(_Job(
+            send=send,
+            future=future,
+            submitted_at=self._clock(),
+            max_retries=self.max_retries if max_retries is None else max_retries,
+        ))
+        self.stats["submitted"] += 1
+        if lane.worker is None:
+            lane.worker = asyncio.create_task(self._drain(chat_id, lane))
+        return future
+
+    async def send(self, chat_id: Any, send: SendFn, max_retries: Optional[int] = None) -> Any:
+        """Queue ``send()`` for ``chat_id`` and wait for its result."""
+        return await self.submit(chat_id, send, max_retries)
+
+    async def _acquire(self, lane: _ChatLane) -> None:
+        """Wait for a slot in the chat's windows, then in the global one.
+
+        The chat's windows are booked at the actual send time, after the
+        global wait: booked any earlier, the next send to the chat would be
+        spaced from a time this one never went out at. Only the lane's own
+        worker touches them, so nothing else can take the slot meanwhile.
+        """
+        now = self._clock()
+        at = max([lane.paused_until, now] + [limit.next_slot(now) for limit in lane.limits])
+        await self._wait(at - now)
+
+        global_wait = self._global.reserve(self._clock())
+        await self._wait(global_wait)
+        sent_at = self._clock()
+        for limit in lane.limits:
+            limit.book(sent_at)
+        self.stats["throttle_wait_s"] += (at - now) + global_wait
+
+    async def _drain(self, chat_id: str, lane: _ChatLane) -> None:
+        try:
+            while lane.queue:
+                job = lane.queue[0]
+                if not job.future.done():  # else the caller gave up waiting
+                    await self._run(chat_id, lane, job)
+                lane.queue.popleft()
+        except asyncio.CancelledError:
+            for job in lane.queue:
+                job.future.cancel()
+            lane.queue.clear()
+            raise
+        finally:
+            lane.worker = None
+
+    async def _run(self, chat_id: str, lane: _ChatLane, job: _Job) -> None:
+        attempt = 0
+        while True:
+            await self._acquire(lane)
+            queue_wait_ms = (self._clock() - job.submitted_at) * 1000.0
+            self.stats["max_queue_wait_ms"] = max(self.stats["max_queue_wait_ms"], queue_wait_ms)
+            try:
+                result = await job.send()
+            except Exception as e:
+                wait = retry_after_seconds(e)
+                if wait is not None and attempt < job.max_retries:
+                    attempt += 1
+                    self.stats["retry_after"] += 1
+                    self.stats["retry_after_wait_s"] += wait
+                    lane.paused_until = self._clock() + wait
+                    logger.warning(
+                        f"Telegram flood control on {chat_id}: retrying in {wait:g}s "
+                        f"(attempt {attempt}/{job.max_retries}, {len(lane.queue) - 1} queued behind)"
+                    )
+                    continue
+                self.stats["failed"] += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+                return
+            self.stats["sent"] += 1
+            if not job.future.done():
+                job.future.set_result(result)
+            return
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth per chat plus cumulative send/throttle counters."""
+        depths = {chat_id: len(lane.queue) for chat_id, lane in self._lanes.items() if lane.queue}
+        return {
+            **self.stats,
+            "queued": sum(depths.values()),
+            "active_chats": len(depths),
+            "queue_depth": depths,
+        }
+
+    def log_metrics(self, label: str = "Telegram") -> None:
+        m = self.metrics()
+        logger.info(
+            f"[{label}] sent={m['sent']} failed={m['failed']} queued={m['queued']} "
+            f"retry_after={m['retry_after']} ({m['retry_after_wait_s']:.1f}s) "
+            f"throttled={m['throttle_wait_s']:.1f}s max_queue_wait={m['max_queue_wait_ms']:.0f}ms"
+        )
+
+
+_default_broadcaster: Optional[TelegramBroadcaster] = None
+
+
+def get_broadcaster() -> TelegramBroadcaster:
+    """Process-wide broadcaster; every sender shares the global limit."""
+    global _default_broadcaster
+    if _default_broadcaster is None:
+        _default_broadcaster = TelegramBroadcaster()
+    return _default_broadcaster
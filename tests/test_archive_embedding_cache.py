@@ -0,0 +1,142 @@
+"""Tests for the archive embedding cache (LRU + embedding_cache table)."""
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from cores.archive import embedding
+
+
+class _StubEmbeddings:
+    """Local stand-in for the OpenAI embeddings endpoint."""
+
+    def __init__(self, dim=embedding.EMBEDDING_DIM):
+        self.requests = []
+        self.dim = dim
+
+    async def create(self, model, input):
+        self.requests.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text) + i)] * self.dim)
+            for i, text in enumerate(input)
+        ])
+
+
+@pytest.fixture()
+def stub(monkeypatch):
+    embedding.reset_cache()
+    api = _StubEmbeddings()
+    monkeypatch.setattr(
+        embedding, "_get_openai_client", lambda api_key: SimpleNamespace(embeddings=api)
+    )
+    yield api
+    embedding.reset_cache()
+
+
+@pytest.mark.asyncio
+async def test_embed_many_batches_and_dedupes(stub, tmp_path):
+    db_path = str(tmp_path / "archive.db")
+
+    blobs = await embedding.embed_many(
+        ["반도체 전망", "반도체   전망 ", "", "HBM 수요"], "key", db_path=db_path
+    )
+
+    assert stub.requests == [["반도체 전망", "HBM 수요"]]
+    assert blobs[0] == blobs[1] and blobs[2] is None and blobs[3] is not None
+    assert embedding.decode_embedding(blobs[3]).shape == (embedding.EMBEDDING_DIM,)
+
+
+@pytest.mark.asyncio
+async def test_repeat_hits_memory_then_persistent_cache(stub, tmp_path):
+    db_path = str(tmp_path / "archive.db")
+    first = await embedding.embed_text("삼성전자 실적", "key", db_path=db_path)
+
+    again = await embedding.embed_text("삼성전자 실적", "key", db_path=db_path)
+    assert again == first
+    assert len(stub.requests) == 1
+    assert embedding.get_cache_stats()["memory_hits"] == 1
+
+    # New process: LRU empty, archive.db still has the vector
+    embedding.reset_cache()
+    restored = await embedding.embed_text("삼성전자 실적", "key", db_path=db_path)
+    assert restored == first
+    assert len(stub.requests) == 1
+    stats = embedding.get_cache_stats()
+    assert stats["db_hits"] == 1 and stats["misses"] == 0 and stats["hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_wrong_dimension_is_rejected_and_not_cached(monkeypatch, tmp_path):
+    embedding.reset_cache()
+    api = _StubEmbeddings(dim=8)
+    monkeypatch.setattr(
+        embedding, "_get_openai_client", lambda api_key: SimpleNamespace(embeddings=api)
+    )
+    db_path = str(tmp_path / "archive.db")
+
+    assert await embedding.embed_text("short vector", "key", db_path=db_path) is None
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0] == 0
+    conn.close()
+    embedding.reset_cache()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_model(stub, tmp_path, monkeypatch):
+    db_path = str(tmp_path / "archive.db")
+    await embedding.embed_text("같은 질문", "key", db_path=db_path)
+
+    embedding.reset_cache()
+    monkeypatch.setattr(embedding, "EMBEDDING_MODEL", "text-embedding-3-large")
+    await embedding.embed_text("같은 질문", "key", db_path=db_path)
+
+    assert len(stub.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_hits_touch_last_used_at_only_when_it_is_old(tmp_path):
+    from cores.archive import archive_db
+
+    db_path = str(tmp_path / "archive.db")
+    await archive_db.store_embeddings(
+        "m", {"fresh": (2, b"a"), "old": (2, b"b")}, db_path=db_path,
+    )
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE embedding_cache SET last_used_at = '2000-01-01 00:00:00'")
+    conn.execute("UPDATE embedding_cache SET last_used_at = '2999-01-01 00:00:00' "
+                 "WHERE text_hash = 'fresh'")
+    conn.commit()
+
+    found = await archive_db.get_cached_embeddings("m", ["fresh", "old", "miss"], db_path=db_path)
+
+    assert found == {"fresh": (2, b"a"), "old": (2, b"b")}
+    used = dict(conn.execute("SELECT text_hash, last_used_at FROM embedding_cache"))
+    conn.close()
+    assert used["fresh"] == "2999-01-01 00:00:00"
+    assert used["old"] > "2000-01-01 00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_api_failure_returns_none(monkeypatch, tmp_path):
+    embedding.reset_cache()
+
+    class _Broken:
+        async def create(self, model, input):
+            raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(
+        embedding, "_get_openai_client", lambda api_key: SimpleNamespace(embeddings=_Broken())
+    )
+
+    blobs = await embedding.embed_many(["a", "b"], "key", db_path=str(tmp_path / "a.db"))
+
+    assert blobs == [None, None]
+    assert embedding.get_cache_stats()["errors"] == 1
+    embedding.reset_cache()
+
+
+def test_cosine_roundtrip():
+    vec = np.ones(embedding.EMBEDDING_DIM, dtype=np.float32)
+    assert embedding.cosine(vec.tobytes(), vec.tobytes()) == pytest.approx(1.0)
@@ -0,0 +1,176 @@
+"""Tests for the staged batch ingest of the report archive."""
+import sqlite3
+
+import pytest
+
+from cores.archive import ingest
+
+
+class _FakeResult:
+    def __init__(self, ticker, market):
+        self.ticker = ticker
+        self.market = market
+
+    def to_dict(self):
+        return {
+            "ticker": self.ticker, "market": self.market,
+            "price_at_analysis": 100.0, "index_at_analysis": 2500.0,
+            "index_change_20d": 1.5, "market_phase": "bull",
+            "return_7d": None, "return_14d": None, "return_30d": None,
+            "return_60d": None, "return_90d": None,
+            "stop_loss_price": None, "stop_loss_triggered": 0, "stop_loss_date": None,
+            "post_stop_30d": None, "post_stop_60d": None, "stop_was_correct": None,
+            "target_1_price": None, "target_1_hit": 0, "days_to_target_1": None,
+            "data_source": "fake",
+        }
+
+
+class _FakeEnricher:
+    def __init__(self, calls, market):
+        self.calls = calls
+        self.market = market
+
+    async def enrich(self, ticker, analysis_date, stop_loss=None, target_1=None):
+        self.calls.append((ticker, analysis_date, stop_loss, target_1))
+        return _FakeResult(ticker, self.market)
+
+
+@pytest.fixture()
+def env(tmp_path, monkeypatch):
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    tracker_db = tmp_path / "stock_trading.db"
+    conn = sqlite3.connect(tracker_db)
+    conn.execute(
+        "CREATE TABLE analysis_performance_tracker "
+        "(ticker TEXT, analyzed_date TEXT, stop_loss REAL, target_price REAL, report_path TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO analysis_performance_tracker VALUES ('005930', '2026-03-02 09:10:00', 90.0, 120.0, NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    calls = []
+    monkeypatch.setattr(ingest, "get_enricher", lambda market: _FakeEnricher(calls, market))
+    monkeypatch.setattr(ingest, "_TRACKER_CONFIG", {
+        "kr": (tracker_db, "analysis_performance_tracker", "analyzed_date"),
+    })
+    return reports, str(tmp_path / "archive.db"), tracker_db, calls
+
+
+def _write(reports, name, text):
+    (reports / name).write_text(text, encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_reingest_skips_unchanged_content(env):
+    reports, db_path, tracker_db, calls = env
+    _write(reports, "005930_삼성전자_20260302_morning_gpt5.md", "반도체 리포트")
+    _write(reports, "000660_SK하이닉스_20260302_morning_gpt5.md", "HBM 리포트")
+    _write(reports, "035420_NAVER_20240102_morning_gpt5.md", "pre-season")
+
+    first = await ingest.ingest_directory(str(reports), db_path=db_path, batch_size=2)
+
+    assert (first["total"], first["ingested"], first["skipped"], first["errors"]) == (3, 2, 1, 0)
+    assert first["stages"]["insert"]["count"] == 2
+    assert first["stages"]["enrich"]["count"] == 2
+    assert ("005930", "2026-03-02", 90.0, 120.0) in calls
+    conn = sqlite3.connect(tracker_db)
+    assert conn.execute("SELECT report_path FROM analysis_performance_tracker").fetchone()[0] \
+        .endswith("005930_삼성전자_20260302_morning_gpt5.md")
+    conn.close()
+
+    calls.clear()
+    second = await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    assert second["ingested"] == 0
+    assert second["stages"]["hash_skip"]["count"] == 2
+    assert calls == []
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT report_count FROM market_timeline").fetchone()[0] == 2
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_content_refreshes_row_and_fts(env):
+    reports, db_path, _, calls = env
+    name = "005930_삼성전자_20260302_morning_gpt5.md"
+    _write(reports, name, "old wording")
+    await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    _write(reports, name, "fresh wording")
+    summary = await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    assert summary["ingested"] == 1
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*), MAX(content) FROM report_archive").fetchone() == (1, "fresh wording")
+    hits = conn.execute(
+        "SELECT rowid FROM report_archive_fts WHERE report_archive_fts MATCH 'fresh'"
+    ).fetchall()
+    stale = conn.execute(
+        "SELECT rowid FROM report_archive_fts WHERE report_archive_fts MATCH 'old'"
+    ).fetchall()
+    assert len(hits) == 1 and stale == []
+    # A content refresh is not a new report for the timeline
+    assert conn.execute("SELECT report_count FROM market_timeline").fetchone()[0] == 1
+    assert conn.execute("SELECT updated_at FROM report_archive").fetchone()[0] is not None
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_content_is_refreshed_even_from_a_new_path(env):
+    reports, db_path, _, calls = env
+    name = "005930_삼성전자_20260302_morning_gpt5.md"
+    _write(reports, name, "old wording")
+    await ingest.ingest_directory(str(reports), db_path=db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE report_archive SET file_path = 'moved/elsewhere.md'")
+    conn.commit()
+
+    _write(reports, name, "fresh wording")
+    summary = await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    assert summary["ingested"] == 1
+    assert conn.execute("SELECT content FROM report_archive").fetchone()[0] == "fresh wording"
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_same_key_from_another_model_keeps_first_file(env):
+    reports, db_path, _, calls = env
+    _write(reports, "005930_삼성전자_20260302_morning_claude.md", "claude version")
+    _write(reports, "005930_삼성전자_20260302_morning_gpt5.md", "gpt version")
+
+    await ingest.ingest_directory(str(reports), db_path=db_path)
+    again = await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    assert again["ingested"] == 0
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT content FROM report_archive").fetchall() == [("claude version",)]
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_force_reenriches_unchanged_reports(env):
+    reports, db_path, _, calls = env
+    _write(reports, "005930_삼성전자_20260302_morning_gpt5.md", "반도체 리포트")
+    await ingest.ingest_directory(str(reports), db_path=db_path)
+
+    calls.clear()
+    summary = await ingest.ingest_directory(str(reports), db_path=db_path, force=True)
+
+    assert summary["ingested"] == 1
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_dry_run_writes_nothing(env, tmp_path):
+    reports, db_path, _, calls = env
+    _write(reports, "005930_삼성전자_20260302_morning_gpt5.md", "반도체 리포트")
+
+    summary = await ingest.ingest_directory(str(reports), db_path=db_path, dry_run=True)
+
+    assert summary["ingested"] == 0 and summary["skipped"] == 1
+    assert calls == []
+    assert not (tmp_path / "archive.db").exists()
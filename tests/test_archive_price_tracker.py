@@ -0,0 +1,147 @@
+"""Tests for the ticker-deduplicated archive price update pipeline."""
+import random
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from cores.archive import archive_db
+from cores.archive import price_tracker as pt
+
+
+def _series(start, days, seed):
+    rng = random.Random(seed)
+    base = datetime.strptime(start, "%Y-%m-%d")
+    price = 100.0
+    closes = {}
+    for i in range(days):
+        day = base + timedelta(days=i)
+        if day.weekday() >= 5:
+            continue
+        price = max(1.0, price * (1 + rng.uniform(-0.04, 0.04)))
+        closes[day.strftime("%Y-%m-%d")] = round(price, 2)
+    return closes
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shared_series_matches_per_report_aggregates(seed):
+    closes = _series("2024-01-01", 500, seed)
+    dates = sorted(closes)
+    reports = [(d, closes[d]) for d in dates[::37]] + [("2023-12-30", 90.0), (dates[-1], 50.0)]
+
+    many = pt._compute_aggregates_many(closes, reports)
+
+    assert many == [pt._compute_aggregates(closes, d, p) for d, p in reports]
+
+
+def test_ties_pick_the_earliest_date():
+    closes = {"2026-01-02": 10.0, "2026-01-05": 12.0, "2026-01-06": 12.0,
+              "2026-01-07": 8.0, "2026-01-08": 8.0}
+
+    agg = pt._compute_aggregates_many(closes, [("2026-01-01", 10.0)])[0]
+
+    assert agg["max_return_date"] == "2026-01-05"
+    assert agg["max_drawdown_date"] == "2026-01-07"
+
+
+async def _seed_report(db_path, ticker, market, report_date, price):
+    report_id = await archive_db.insert_report(
+        ticker=ticker, company_name=ticker, report_date=report_date,
+        mode="morning", model="test", market=market,
+        file_path=f"/tmp/{ticker}_{report_date}.md",
+        content=f"{ticker} {report_date}", db_path=db_path,
+    )
+    await archive_db.upsert_enrichment(report_id, {
+        "ticker": ticker, "market": market, "analysis_date": report_date,
+        "price_at_analysis": price, "index_at_analysis": None,
+        "index_change_20d": None, "market_phase": None,
+        "return_7d": None, "return_14d": None, "return_30d": None,
+        "return_60d": None, "return_90d": None,
+        "stop_loss_price": None, "stop_loss_triggered": None, "stop_loss_date": None,
+        "post_stop_30d": None, "post_stop_60d": None, "stop_was_correct": None,
+        "target_1_price": None, "target_1_hit": None, "days_to_target_1": None,
+        "data_source": "test",
+    }, db_path=db_path)
+    return report_id
+
+
+@pytest.mark.asyncio
+async def test_run_fetches_each_ticker_once(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "archive.db")
+    await archive_db.init_db(db_path)
+    closes = _series("2026-01-01", 120, seed=7)
+    ids = [
+        await _seed_report(db_path, "005930", "kr", "2026-01-05", 100.0),
+        await _seed_report(db_path, "005930", "kr", "2026-02-10", 100.0),
+        await _seed_report(db_path, "AAPL", "us", "2026-03-02", 100.0),
+    ]
+
+    calls = []
+    lock = threading.Lock()
+
+    def fake_fetch(market, ticker, start_date, end_date):
+        with lock:
+            calls.append((market, ticker, start_date))
+        return dict(closes)
+
+    monkeypatch.setattr(pt, "_fetch_daily", fake_fetch)
+
+    summary = await pt.PriceTracker(db_path=db_path).run(concurrency=2)
+
+    assert sorted(calls) == [("kr", "005930", "2026-01-05"), ("us", "AAPL", "2026-03-02")]
+    assert summary["processed"] == 3
+    assert summary["errors"] == 0
+
+    conn = sqlite3.connect(db_path)
+    for report_id, report_date in zip(ids, ["2026-01-05", "2026-02-10", "2026-03-02"]):
+        rows = conn.execute(
+            "SELECT COUNT(*) FROM ticker_price_history WHERE report_id = ?", (report_id,)
+        ).fetchone()[0]
+        assert rows == sum(1 for d in closes if d > report_date)
+        perf = conn.execute(
+            "SELECT return_current, max_return_date, last_price_update "
+            "FROM report_enrichment WHERE report_id = ?", (report_id,)
+        ).fetchone()
+        expected = pt._compute_aggregates(closes, report_date, 100.0)
+        assert perf[0] == expected["return_current"]
+        assert perf[1] == expected["max_return_date"]
+        assert perf[2] is not None
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_and_empty_fetch_write_nothing(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "archive.db")
+    await archive_db.init_db(db_path)
+    await _seed_report(db_path, "005930", "kr", "2026-01-05", 100.0)
+    await _seed_report(db_path, "000660", "kr", "2026-01-05", 100.0)
+
+    def fake_fetch(market, ticker, start_date, end_date):
+        return {} if ticker == "000660" else _series("2026-01-01", 60, seed=1)
+
+    monkeypatch.setattr(pt, "_fetch_daily", fake_fetch)
+
+    summary = await pt.PriceTracker(db_path=db_path).run(dry_run=True)
+
+    assert summary["processed"] == 1
+    assert summary["skipped"] == 1
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM ticker_price_history").fetchone()[0] == 0
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_report_without_a_base_price_is_skipped_alone(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "archive.db")
+    await archive_db.init_db(db_path)
+    await _seed_report(db_path, "005930", "kr", "2026-01-05", 0.0)
+    good = await _seed_report(db_path, "005930", "kr", "2026-02-10", 100.0)
+    monkeypatch.setattr(pt, "_fetch_daily",
+                        lambda market, ticker, start, end: _series("2026-01-01", 60, seed=3))
+
+    summary = await pt.PriceTracker(db_path=db_path).run()
+
+    assert summary["processed"] == 1
+    assert summary["skipped"] == 1 and summary["errors"] == 0
+    assert [r["report_id"] for r in summary["results"]] == [good]
@@ -0,0 +1,225 @@
+"""Tests for the semantic answer cache behind /query and /insight."""
+import sqlite3
+
+import numpy as np
+import pytest
+
+from cores.archive import archive_db
+from cores.archive import query_engine as qe
+from cores.archive import semantic_cache as sc
+from cores.archive.embedding import EMBEDDING_DIM
+
+
+def _vec(seed, noise=0.0, base_seed=None):
+    rng = np.random.default_rng(seed if base_seed is None else base_seed)
+    vec = rng.standard_normal(EMBEDDING_DIM).astype(np.float32)
+    if noise:
+        vec += np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32) * noise
+    return vec.tobytes()
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    sc.reset_stats()
+    yield str(tmp_path / "archive.db")
+    sc.reset_stats()
+
+
+async def _store(db_path, question, emb, scope, tickers=("005930",), market="kr"):
+    return await sc.store(
+        "query", question, emb, scope, {"answer": f"answer to {question}"},
+        market=market, tickers=list(tickers), latency_ms=1200.0, db_path=db_path,
+    )
+
+
+@pytest.mark.asyncio
+async def test_paraphrase_hits_within_scope(db_path):
+    scope = sc.scope_key("kr", "005930")
+    await _store(db_path, "삼성전자 최근 리포트 요약해줘", _vec(1), scope)
+
+    hit = await sc.lookup(
+        "query", "삼성전자 리포트 최근 거 요약", _vec(2, noise=0.1, base_seed=1), scope,
+        market="kr", db_path=db_path,
+    )
+
+    assert hit is not None
+    assert hit.payload["answer"] == "answer to 삼성전자 최근 리포트 요약해줘"
+    assert hit.similarity > 0.99
+    assert hit.provenance()["cached_question"] == "삼성전자 최근 리포트 요약해줘"
+    stats = sc.get_stats()
+    assert stats["hits"] == 1 and stats["saved_latency_ms"] == 1200.0
+
+
+@pytest.mark.asyncio
+async def test_different_scope_or_question_misses(db_path):
+    await _store(db_path, "삼성전자 전망", _vec(1), sc.scope_key("kr", "005930"))
+
+    other_ticker = await sc.lookup(
+        "query", "삼성전자 전망", _vec(1), sc.scope_key("kr", "000660"), db_path=db_path,
+    )
+    unrelated = await sc.lookup(
+        "query", "HBM 수요는?", _vec(9), sc.scope_key("kr", "005930"), db_path=db_path,
+    )
+    other_kind = await sc.lookup(
+        "insight", "삼성전자 전망", _vec(1), sc.scope_key("kr", "005930"), db_path=db_path,
+    )
+
+    assert other_ticker is None and unrelated is None and other_kind is None
+    assert sc.get_stats()["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_normalized_exact_match_works_without_embedding(db_path):
+    scope = sc.scope_key("us")
+    await _store(db_path, "What moved NVDA?", None, scope, tickers=("NVDA",), market="us")
+
+    hit = await sc.lookup("query", "  what moved   nvda ", None, scope, db_path=db_path)
+
+    assert hit is not None and hit.similarity == 1.0
+
+
+@pytest.mark.asyncio
+async def test_new_report_or_price_update_invalidates(db_path):
+    scope = sc.scope_key("kr", "005930")
+    await _store(db_path, "삼성전자 전망", _vec(1), scope)
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE semantic_answer_cache SET created_at = '2000-01-01 00:00:00'")
+    conn.commit()
+    conn.close()
+
+    # An unrelated ticker's new report leaves the entry valid
+    await archive_db.insert_report(
+        ticker="000660", company_name="SK하이닉스", report_date="2026-03-02",
+        mode="morning", model="test", market="kr", file_path="/tmp/a.md",
+        content="x", db_path=db_path,
+    )
+    assert await sc.lookup("query", "삼성전자 전망", _vec(1), scope, db_path=db_path)
+
+    await archive_db.insert_report(
+        ticker="005930", company_name="삼성전자", report_date="2026-03-02",
+        mode="morning", model="test", market="kr", file_path="/tmp/b.md",
+        content="y", db_path=db_path,
+    )
+    assert await sc.lookup("query", "삼성전자 전망", _vec(1), scope, db_path=db_path) is None
+    assert sc.get_stats()["stale"] == 1
+
+    # Stale entries are expired, not re-checked on every lookup
+    assert await sc.lookup("query", "삼성전자 전망", _vec(1), scope, db_path=db_path) is None
+    assert sc.get_stats()["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refreshed_report_invalidates(db_path):
+    scope = sc.scope_key("kr", "005930")
+    rows = [{
+        "ticker": "005930", "company_name": "삼성전자", "report_date": "2026-03-02",
+        "mode": "morning", "model": "test", "market": "kr", "file_path": "a.md",
+        "content": "old",
+    }]
+    await archive_db.init_db(db_path)
+    ids = await archive_db.bulk_upsert_reports(rows, db_path=db_path)
+    await _store(db_path, "삼성전자 전망", _vec(1), scope)
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE report_archive SET created_at = '2000-01-01 00:00:00'")
+    conn.execute("UPDATE semantic_answer_cache SET created_at = '2001-01-01 00:00:00'")
+    conn.commit()
+    conn.close()
+    assert await sc.lookup("query", "삼성전자 전망", _vec(1), scope, db_path=db_path)
+
+    report_id = next(iter(ids.values()))
+    await archive_db.bulk_upsert_reports(
+        [{**rows[0], "content": "new", "report_id": report_id}], db_path=db_path,
+    )
+
+    assert await sc.lookup("query", "삼성전자 전망", _vec(1), scope, db_path=db_path) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_ignored(db_path):
+    scope = sc.scope_key("kr")
+    await sc.store(
+        "query", "시장 전반", _vec(3), scope, {"answer": "old"},
+        market="kr", ttl_hours=-1, db_path=db_path,
+    )
+
+    assert await sc.lookup("query", "시장 전반", _vec(3), scope, db_path=db_path) is None
+
+
+@pytest.mark.asyncio
+async def test_query_engine_serves_paraphrase_without_synthesis(db_path, monkeypatch):
+    snippet = qe.ReportSnippet(
+        report_id=7, ticker="005930", company_name="삼성전자",
+        report_date="2026-03-02", market="kr", mode="morning",
+    )
+    calls = []
+
+    async def fake_retrieve(self, **kwargs):
+        return [snippet]
+
+    async def fake_synthesize(text, context, api_key, model):
+        calls.append(text)
+        return "삼성전자는 HBM 수요로 강세"
+
+    async def fake_embed(text, api_key, db_path=None):
+        return _vec(1, noise=0.05 if "요약" in text else 0.0, base_seed=1)
+
+    monkeypatch.setattr(qe.QueryEngine, "retrieve", fake_retrieve)
+    monkeypatch.setattr(qe, "synthesize", fake_synthesize)
+    monkeypatch.setattr(qe, "embed_text", fake_embed)
+    monkeypatch.setattr(qe, "load_api_key", lambda: "key")
+
+    engine = qe.QueryEngine(db_path=db_path)
+    first = await engine.query("삼성전자 전망 알려줘", market="kr", ticker="005930")
+    second = await engine.query("삼성전자 전망 요약", market="kr", ticker="005930")
+
+    assert calls == ["삼성전자 전망 알려줘"]
+    assert not first.cached and first.cache_provenance is None
+    assert second.cached and second.answer == first.answer
+    assert second.evidence_ids == [7]
+    assert second.cache_provenance["cached_question"] == "삼성전자 전망 알려줘"
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_is_a_miss(db_path, monkeypatch):
+    async def broken_init(path):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(sc, "init_db", broken_init)
+
+    hit = await sc.lookup("query", "삼성전자 전망", _vec(1), sc.scope_key("kr", "005930"),
+                          db_path=db_path)
+
+    assert hit is None
+    assert sc.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_insight_cache_hit_saves_the_askers_own_insight(db_path, monkeypatch):
+    from datetime import datetime
+
+    ia = pytest.importorskip("cores.archive.insight_agent")
+    monkeypatch.setattr(ia, "load_api_key", lambda: None)
+    await archive_db.init_db(db_path)
+    question = "삼성전자 전망 알려줘"
+    hints = qe.parse_query_hints(question)
+    scope = sc.scope_key(
+        hints["market"], hints["ticker"], date_from=hints["date_from"],
+        date_to=hints["date_to"], day=datetime.now(ia._KST).strftime("%Y-%m-%d"),
+    )
+    await sc.store(
+        "insight", question, None, scope,
+        {"answer": "HBM 수요로 강세", "key_takeaways": ["HBM"], "insight_id": 1},
+        market=hints["market"], db_path=db_path,
+    )
+
+    result = await ia.InsightAgent(db_path=db_path).run(
+        question, user_id=2, chat_id=20, daily_limit=0,
+    )
+
+    assert result.cached and result.answer == "HBM 수요로 강세"
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT user_id, chat_id, answer FROM persistent_insights WHERE id = ?",
+            (result.insight_id,),
+        ).fetchone()
+    assert row == (2, 20, "HBM 수요로 강세")
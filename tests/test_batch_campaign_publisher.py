@@ -236,12 +236,12 @@ async def test_best_effort_helper_swallows_invalid_event():
 async def test_tracking_story_publishes_each_decision_before_portfolio(monkeypatch):
     events = []
 
-    async def capture(event):
-        events.append(event)
-        return event["event_id"]
+    async def capture(batch):
+        events.extend(batch)
+        return [event["event_id"] for event in batch]
 
     monkeypatch.setattr(
-        "messaging.batch_campaign_publisher.publish_batch_event_best_effort",
+        "messaging.batch_campaign_publisher.publish_batch_events_best_effort",
         capture,
     )
 
@@ -277,12 +277,12 @@ async def test_report_story_skips_partial_artifact_failures(tmp_path, monkeypatc
     summary.write_text("실제 텔레그램 요약", encoding="utf-8")
     events = []
 
-    async def capture(event):
-        events.append(event)
-        return event["event_id"]
+    async def capture(batch):
+        events.extend(batch)
+        return [event["event_id"] for event in batch]
 
     monkeypatch.setattr(
-        "messaging.batch_campaign_publisher.publish_batch_event_best_effort",
+        "messaging.batch_campaign_publisher.publish_batch_events_best_effort",
         capture,
     )
 
@@ -300,6 +300,77 @@ async def test_report_story_skips_partial_artifact_failures(tmp_path, monkeypatc
     assert events[0]["company_name"] == "삼성_전자"
 
 
+@pytest.mark.asyncio
+async def test_report_story_is_queued_through_one_connection(tmp_path, monkeypatch):
+    message_paths, pdf_paths = [], []
+    for ticker in ("005930", "000660", "035420", "068270"):
+        pdf = tmp_path / f"{ticker}_회사_20260807.pdf"
+        pdf.write_bytes(b"%PDF-1.7")
+        summary = tmp_path / f"{ticker}_회사_telegram.txt"
+        summary.write_text(f"{ticker} 요약", encoding="utf-8")
+        pdf_paths.append(pdf)
+        message_paths.append(summary)
+    database_path = tmp_path / "campaigns.sqlite"
+    monkeypatch.setenv("PRISM_CAMPAIGN_QUEUE_PATH", str(database_path))
+    opened = []
+
+    class CountingQueue(SQLiteBatchCampaignQueue):
+        def __init__(self, *args, **kwargs):
+            opened.append(args)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "messaging.batch_campaign_publisher.SQLiteBatchCampaignQueue",
+        CountingQueue,
+    )
+    story = {
+        "market": "KR",
+        "session": "AFTERNOON",
+        "trade_date": "20260807",
+        "regime": "UPTREND",
+        "pdf_paths": pdf_paths + pdf_paths[:1],
+        "message_paths": message_paths,
+    }
+
+    assert await publish_batch_reports_best_effort(**story) == 4
+    assert len(opened) == 1
+    # A rerun of the batch is all duplicates, still on one connection.
+    assert await publish_batch_reports_best_effort(**story) == 0
+    assert len(opened) == 2
+
+    with SQLiteBatchCampaignQueue(database_path) as queue:
+        assert [entry["campaign_id"] for entry in queue.list_entries()] == [
+            f"kr-afternoon-2026-08-07:report:{ticker}"
+            for ticker in ("005930", "000660", "035420", "068270")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_publish_reports_each_outcome_and_fails_open(tmp_path):
+    event = build_batch_campaign_event(
+        market="KR",
+        session="AFTERNOON",
+        trade_date="20260723",
+        regime="UPTREND",
+        status=COMPLETED,
+        candidates=["005930"],
+    )
+    story = {**event, "event_id": f"{event['campaign_id']}:decision"}
+    async with BatchCampaignPublisher(tmp_path / "campaigns.sqlite") as publisher:
+        assert await publisher.publish(event) == "kr-afternoon-2026-07-23"
+        assert await publisher.publish_many([event, story, story]) == [
+            None,
+            "kr-afternoon-2026-07-23:decision",
+            None,
+        ]
+        assert await publisher.publish_many([]) == []
+
+    failing_queue = MagicMock()
+    failing_queue.enqueue_many.side_effect = RuntimeError("database is locked")
+    publisher = BatchCampaignPublisher(queue=failing_queue)
+    assert await publisher.publish_many([event, story]) == [None, None]
+
+
 def test_campaign_publisher_has_no_network_transport_dependency():
     source = (PROJECT_ROOT / "messaging" / "batch_campaign_publisher.py").read_text(
         encoding="utf-8"
@@ -8,16 +8,21 @@ consuming attempts instead of blocking the queue forever.
 
 from __future__ import annotations
 
+import stat
+import sys
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
 from messaging.campaign_forwarder import (
     CampaignForwarder,
     SshCampaignShipper,
+    SshSessionCampaignShipper,
 )
 from messaging.local_campaign_queue import SQLiteBatchCampaignQueue
 
+ROOT = Path(__file__).resolve().parents[1]
 NOW = datetime(2026, 8, 3, 5, 0, tzinfo=timezone.utc)
 OWNER = "db-server:1"
 
@@ -306,3 +311,201 @@ class TestSshShipper:
                     "artifact_path": str(artifact),
                 }
             )
+
+
+class FakeBatchShipper(FakeShipper):
+    """Same script of outcomes, handed over as one batch per run."""
+
+    def __init__(self, *outcomes) -> None:
+        super().__init__(*outcomes)
+        self.batches = 0
+
+    def ship_batch(self, payloads):
+        self.batches += 1
+        outcomes = []
+        for payload in payloads:
+            try:
+                outcomes.append(self.ship(payload))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
+
+def test_a_batch_shipper_gets_the_whole_claim_at_once(queue):
+    for campaign_id in ("kr-morning-20260803", "kr-afternoon-20260803", "bad"):
+        queue.enqueue(event(campaign_id))
+    shipper = FakeBatchShipper(True, False, RuntimeError("remote said no"))
+
+    result = forwarder(queue, shipper).run_once(now=NOW)
+
+    assert shipper.batches == 1
+    assert (result.forwarded, result.duplicate, result.retry_scheduled) == (1, 1, 1)
+    assert status_of(queue, "kr-afternoon-20260803") == "CONSUMED"
+    assert status_of(queue, "bad") == "PENDING"
+
+
+FAKE_SSH = """#!{python}
+# Stands in for ssh: logs the connection, drops the options and the host, and
+# becomes the remote command, so killing "ssh" ends the remote session too.
+import os, sys
+args = sys.argv[1:]
+with open({log!r}, "a") as log:
+    log.write(" ".join(args) + "\\n")
+while args[0] in ("-o", "-i"):
+    args = args[2:]
+os.execvp(args[1], args[1:])
+"""
+
+
+SLOW_REMOTE = """#!{python}
+# Stands in for the stream entrypoint: acknowledges each event after a pause.
+import sys, time
+sys.path.insert(0, {root!r})
+from messaging.campaign_forwarder import encode_frame, read_frame
+while (frame := read_frame(sys.stdin.buffer)) is not None:
+    if frame["kind"] == "event":
+        time.sleep({pause})
+        sys.stdout.buffer.write(encode_frame({{"seq": frame["seq"], "status": "NEW"}}))
+        sys.stdout.buffer.flush()
+"""
+
+
+class TestSshSessionShipper:
+    """A forward run against the real remote entrypoint, run locally."""
+
+    @pytest.fixture
+    def remote(self, tmp_path):
+        ssh = tmp_path / "ssh"
+        log = tmp_path / "ssh.log"
+        ssh.write_text(FAKE_SSH.format(python=sys.executable, log=str(log)))
+        ssh.chmod(0o755)
+        (tmp_path / "pdf_reports").mkdir()
+        (tmp_path / "remote_reports").mkdir()
+
+        class Remote:
+            queue_path = tmp_path / "remote.sqlite"
+            artifact_root = tmp_path / "remote_reports"
+
+            @staticmethod
+            def handshakes():
+                return len(log.read_text().splitlines()) if log.exists() else 0
+
+            @staticmethod
+            def statuses():
+                with SQLiteBatchCampaignQueue(Remote.queue_path) as remote_queue:
+                    return {
+                        entry["campaign_id"]: entry["status"]
+                        for entry in remote_queue.list_entries()
+                    }
+
+            @staticmethod
+            def shipper(**kwargs):
+                return SshSessionCampaignShipper(
+                    **{
+                        "host": "prism@bot-host",
+                        "repo_path": str(ROOT),
+                        "queue_path": str(Remote.queue_path),
+                        "python_path": sys.executable,
+                        "ssh_binary": str(ssh),
+                        "local_artifact_roots": [tmp_path / "pdf_reports"],
+                        "remote_artifact_root": str(Remote.artifact_root),
+                        "chunk_bytes": 4096,
+                        **kwargs,
+                    }
+                )
+
+        return Remote
+
+    def story(self, tmp_path, *tickers):
+        campaign = event()
+        events = [{**campaign, "event_id": f"{campaign['campaign_id']}:completed"}]
+        for ticker, size in tickers:
+            artifact = tmp_path / "pdf_reports" / f"{ticker}.pdf"
+            artifact.write_bytes(b"%PDF-1.7" + bytes(range(256)) * (size // 256))
+            events.append(
+                {
+                    **campaign,
+                    "event_id": f"{campaign['campaign_id']}:report:{ticker}",
+                    "event_type": "BATCH_CAMPAIGN_REPORT_READY",
+                    "artifact_path": str(artifact),
+                }
+            )
+        return events
+
+    def test_a_story_costs_one_handshake_and_acks_every_event(
+        self, queue, remote, tmp_path
+    ):
+        # One report fits a single frame, the other needs several chunks.
+        story = self.story(tmp_path, ("005930", 1024), ("000660", 20_000))
+        for payload in story:
+            queue.enqueue(payload)
+        shipper = remote.shipper()
+
+        result = forwarder(queue, shipper).run_once(now=NOW)
+
+        assert remote.handshakes() == 1
+        assert (result.claimed, result.forwarded) == (3, 3)
+        assert list(remote.statuses().values()) == ["PENDING"] * 3
+        assert {entry["status"] for entry in queue.list_entries()} == {"CONSUMED"}
+        copies = sorted(remote.artifact_root.iterdir())
+        assert [p.suffix for p in copies] == [".pdf", ".pdf"]
+        assert sorted(p.stat().st_size for p in copies) == [1032, 19976]
+        assert all(stat.S_IMODE(p.stat().st_mode) == 0o644 for p in copies)
+        assert shipper.stats == {"sessions": 1, "events": 3, "artifact_bytes": 21008}
+
+    def test_a_resent_story_is_acknowledged_as_duplicate(self, remote, tmp_path):
+        story = self.story(tmp_path, ("005930", 1024))
+        shipper = remote.shipper()
+
+        assert shipper.ship_batch(story) == [True, True]
+        assert shipper.ship_batch(story) == [False, False]
+        assert remote.handshakes() == 2
+
+    def test_one_bad_event_fails_alone(self, remote, tmp_path):
+        outside = tmp_path / "elsewhere.pdf"
+        outside.write_bytes(b"%PDF-1.7")
+        story = self.story(tmp_path, ("005930", 1024))
+        rejected_remotely = {"schema_version": 1}  # no campaign_id
+        rejected_locally = {**story[1], "artifact_path": str(outside)}
+
+        outcomes = remote.shipper().ship_batch(
+            [story[0], rejected_remotely, rejected_locally, story[1]]
+        )
+
+        assert outcomes[0] is True and outcomes[3] is True
+        assert "requires campaign_id" in str(outcomes[1])
+        assert "outside the allowed roots" in str(outcomes[2])
+        assert len(remote.statuses()) == 2
+
+    def test_a_dead_session_fails_everything_it_did_not_acknowledge(
+        self, queue, remote, tmp_path
+    ):
+        for payload in self.story(tmp_path, ("005930", 1024)):
+            queue.enqueue(payload)
+        shipper = remote.shipper(python_path="false")
+
+        result = forwarder(queue, shipper).run_once(now=NOW)
+
+        assert (result.forwarded, result.retry_scheduled) == (0, 2)
+        assert {entry["status"] for entry in queue.list_entries()} == {"PENDING"}
+        assert "rc=1" in queue.list_entries()[0]["last_error"]
+
+    def test_the_timeout_is_per_reply_not_per_batch(self, remote, tmp_path):
+        slow = tmp_path / "slow_remote"
+        slow.write_text(SLOW_REMOTE.format(python=sys.executable, root=str(ROOT), pause=0.3))
+        slow.chmod(0o755)
+        story = self.story(tmp_path, *[(f"00{n}930", 1024) for n in range(4)])
+
+        outcomes = remote.shipper(python_path=str(slow), timeout=1).ship_batch(story)
+
+        assert outcomes == [True] * 5  # 1.5s in all, each reply within 1s
+
+    def test_the_remote_runs_the_stream_entrypoint(self, remote):
+        command = remote.shipper()._command()
+
+        assert command[-3:] == [
+            "--stream",
+            "--artifact-root",
+            str(remote.artifact_root),
+        ]
+        assert "BatchMode=yes" in command
@@ -0,0 +1,186 @@
+"""Streaming passthrough, pooled upstream session and single-flight token refresh."""
+
+import asyncio
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from cores.chatgpt_proxy import api_translator, proxy_server
+from cores.chatgpt_proxy.token_manager import TokenManager
+
+
+def _event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+_TEXT_EVENTS = [
+    _event("response.created", {"response": {"id": "resp_1"}}),
+    _event("response.output_text.delta", {"delta": "Hel"}),
+    _event("response.output_text.delta", {"delta": "lo"}),
+    _event("response.completed", {"response": {
+        "id": "resp_1",
+        "output": [{"type": "message", "content": [{"type": "output_text", "text": "Hello"}]}],
+        "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+    }}),
+]
+
+_TOOL_EVENTS = [
+    _event("response.created", {"response": {"id": "resp_2"}}),
+    _event("response.output_item.added", {"item": {
+        "type": "function_call", "id": "fc_1", "call_id": "call_1", "name": "get_price",
+    }}),
+    _event("response.function_call_arguments.delta", {"item_id": "fc_1", "delta": '{"ticker":'}),
+    _event("response.function_call_arguments.delta", {"item_id": "fc_1", "delta": '"005930"}'}),
+    _event("response.output_item.done", {"item": {
+        "type": "function_call", "id": "fc_1", "call_id": "call_1", "name": "get_price",
+        "arguments": '{"ticker":"005930"}',
+    }}),
+    _event("response.completed", {"response": {"id": "resp_2", "output": []}}),
+]
+
+
+def test_sse_parser_handles_chunks_split_mid_line():
+    text = "".join(_TEXT_EVENTS)
+    parser = api_translator.SSEParser()
+    events = []
+    for i in range(0, len(text), 7):
+        events.extend(parser.feed(text[i:i + 7]))
+    events.extend(parser.flush())
+
+    assert [name for name, _ in events] == [
+        "response.created", "response.output_text.delta",
+        "response.output_text.delta", "response.completed",
+    ]
+    assert api_translator.collect_sse_to_response(text)["id"] == "resp_1"
+
+
+def test_stream_translator_chunks_add_up_to_tool_call():
+    translator = api_translator.ChatCompletionStreamTranslator("gpt-4o", include_usage=True)
+    chunks = []
+    for name, raw in api_translator.SSEParser().feed("".join(_TOOL_EVENTS)):
+        chunks.extend(translator.feed(name, raw))
+
+    assert translator.done
+    assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+    assert all(c["id"] == "chatcmpl-resp_2" for c in chunks)
+    calls = [tc for c in chunks if c["choices"] for tc in c["choices"][0]["delta"].get("tool_calls", [])]
+    assert calls[0]["id"] == "call_1" and calls[0]["function"]["name"] == "get_price"
+    assert "".join(tc["function"]["arguments"] for tc in calls) == '{"ticker":"005930"}'
+    assert chunks[-2]["choices"][0]["finish_reason"] == "tool_calls"
+    assert chunks[-1]["choices"] == [] and "usage" in chunks[-1]
+
+
+def test_stream_translator_emits_text_only_reported_on_completion():
+    translator = api_translator.ChatCompletionStreamTranslator("m")
+    chunks = translator.feed("response.completed", json.dumps({"response": {
+        "id": "r", "output": [{"type": "message", "content": [{"type": "output_text", "text": "Hi"}]}],
+    }}))
+    assert chunks[0]["choices"][0]["delta"] == {"role": "assistant", "content": "Hi"}
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+
+class _StaticTokens:
+    async def get_token(self):
+        return "token"
+
+    async def get_account_id(self):
+        return "acct"
+
+
+async def _run_proxy(events, check):
+    """Run the proxy against a fake upstream that waits for ``release`` before finishing."""
+    release = asyncio.Event()
+    upstream_requests = []
+
+    async def upstream(request):
+        upstream_requests.append(await request.json())
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        for i, event in enumerate(events):
+            if i == len(events) - 1:
+                await asyncio.wait_for(release.wait(), 5)
+            await resp.write(event.encode())
+        await resp.write_eof()
+        return resp
+
+    upstream_app = web.Application()
+    upstream_app.router.add_post("/responses", upstream)
+    async with TestServer(upstream_app) as upstream_server:
+        original_url = proxy_server.CHATGPT_RESPONSES_URL
+        proxy_server.CHATGPT_RESPONSES_URL = str(upstream_server.make_url("/responses"))
+        try:
+            async with TestClient(TestServer(proxy_server.create_app(_StaticTokens()))) as client:
+                await check(client, release, upstream_requests)
+        finally:
+            proxy_server.CHATGPT_RESPONSES_URL = original_url
+    assert proxy_server._upstream_session is None  # closed by app cleanup
+
+
+def test_chat_completions_stream_before_upstream_finishes():
+    async def check(client, release, upstream_requests):
+        resp = await client.post("/v1/chat/completions", json={
+            "model": "gpt-4o", "stream": True,
+            "messages": [{"role": "user", "content": "hi"}],
+        })
+        assert resp.headers["Content-Type"].startswith("text/event-stream")
+
+        # First content chunk arrives while upstream is still holding the completion
+        first = None
+        while first is None:
+            line = (await asyncio.wait_for(resp.content.readline(), 5)).decode().strip()
+            if line.startswith("data: "):
+                first = json.loads(line[6:])
+        assert not release.is_set()
+        assert first["choices"][0]["delta"] == {"role": "assistant", "content": "Hel"}
+
+        release.set()
+        rest = (await resp.read()).decode()
+        assert rest.rstrip().endswith("data: [DONE]")
+        assert '"finish_reason": "stop"' in rest
+        assert upstream_requests[0]["stream"] is True
+
+    asyncio.run(_run_proxy(_TEXT_EVENTS, check))
+
+
+def test_non_streaming_callers_get_one_body_over_a_pooled_session():
+    async def check(client, release, upstream_requests):
+        release.set()
+        sessions = []
+        for _ in range(2):
+            resp = await client.post("/v1/chat/completions", json={
+                "model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}],
+            })
+            body = await resp.json()
+            assert body["choices"][0]["message"]["content"] == "Hello"
+            assert body["usage"]["total_tokens"] == 5
+            sessions.append(proxy_server._upstream_session)
+
+        assert sessions[0] is sessions[1] and not sessions[0].closed
+
+        resp = await client.post("/v1/responses", json={"model": "m", "input": "hi", "stream": True})
+        raw = (await resp.read()).decode()
+        assert raw == "".join(_TEXT_EVENTS)
+
+    asyncio.run(_run_proxy(_TEXT_EVENTS, check))
+
+
+def test_concurrent_expired_token_refreshes_once():
+    manager = TokenManager()
+    manager._auth_data = {"access_token": "old", "refresh_token": "r", "expires_at": 0}
+    calls = []
+
+    async def fake_refresh(auth_data):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {**auth_data, "access_token": "new", "expires_at": int(time.time()) + 3600}
+
+    manager._refresh_token = fake_refresh
+
+    async def run():
+        return await asyncio.gather(*(manager.get_token() for _ in range(5)))
+
+    assert asyncio.run(run()) == ["new"] * 5
+    assert calls == [1]
+    assert manager._refresh_task is None
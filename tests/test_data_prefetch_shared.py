@@ -0,0 +1,128 @@
+"""Shared per-date artifacts in the KR prefetch (index series, sector map, regime)."""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from cores import data_prefetch as dp
+
+
+def _series(end, days):
+    end_dt = datetime.strptime(end, "%Y%m%d")
+    out = {}
+    price = 2500.0
+    for i in range(days, -1, -1):
+        day = end_dt - timedelta(days=i)
+        if day.weekday() >= 5:
+            continue
+        price *= 1.002
+        out[day.strftime("%Y-%m-%d")] = {
+            "Open": price, "High": price * 1.01, "Low": price * 0.99,
+            "Close": price, "Volume": 1000,
+        }
+    return out
+
+
+class _FakeServer:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def get_stock_ohlcv(self, start, end, code):
+        self._record("stock", code)
+        return _series(end, 30)
+
+    def get_stock_trading_volume(self, start, end, code):
+        self._record("flows", code)
+        return {"2026-08-07": {"외국인합계": 1, "기관합계": 2}}
+
+    def get_index_ohlcv(self, start, end, index_ticker):
+        self._record("index", index_ticker, start, end)
+        return _series(end, 250)
+
+    def get_sector_info(self, market):
+        self._record("sector", market)
+        return {"005930": "전기전자"} if market == "KOSPI" else {"035720": "IT"}
+
+
+@pytest.fixture()
+def server(monkeypatch, tmp_path):
+    dp.clear_shared_cache()
+    fake = _FakeServer()
+    monkeypatch.setattr(dp, "_get_mcp_server_module", lambda: fake)
+    monkeypatch.setattr(dp, "_log_regime_snapshot", lambda *args: None)
+    yield fake
+    dp.clear_shared_cache()
+
+
+def test_batch_downloads_and_renders_each_index_once(server, monkeypatch):
+    renders = []
+    original = dp._dict_to_markdown
+
+    def counting(data, title=""):
+        renders.append(title)
+        return original(data, title)
+
+    monkeypatch.setattr(dp, "_dict_to_markdown", counting)
+
+    results = [
+        dp.prefetch_kr_analysis_data(code, "20260807", "20250807")
+        for code in ("005930", "000660", "035720")
+    ]
+
+    index_calls = [c for c in server.calls if c[0] == "index"]
+    assert sorted(index_calls) == [
+        ("index", "1001", "20250807", "20260807"),
+        ("index", "2001", "20250807", "20260807"),
+    ]
+    assert sum("Index" in t for t in renders) == 2
+    assert sorted(c[1] for c in server.calls if c[0] == "stock") == ["000660", "005930", "035720"]
+    for result in results:
+        assert set(result) == {"stock_ohlcv", "trading_volume", "kospi_index", "kosdaq_index"}
+    assert results[0]["kospi_index"] is results[2]["kospi_index"]
+
+
+def test_macro_prefetch_reuses_regime_and_sector_map(server):
+    first = dp.prefetch_macro_intelligence_data("20260807")
+    calls_after_first = len(server.calls)
+
+    first["computed_regime"]["market_regime"] = "mutated by caller"
+    second = dp.prefetch_macro_intelligence_data("20260807")
+
+    assert len(server.calls) == calls_after_first
+    assert second["sector_map"] == {"005930": "전기전자", "035720": "IT"}
+    assert second["computed_regime"]["market_regime"] != "mutated by caller"
+    assert dp.get_shared_cache_stats()["hits"] >= 4
+
+
+def test_failed_fetch_is_retried(server, monkeypatch):
+    monkeypatch.setattr(server, "get_index_ohlcv", lambda *a: {"error": "KRX down"})
+    assert dp.prefetch_index_ohlcv("1001", "20250807", "20260807") == ""
+
+    monkeypatch.setattr(server, "get_index_ohlcv", lambda s, e, t: _series(e, 30))
+    assert "KOSPI Index" in dp.prefetch_index_ohlcv("1001", "20250807", "20260807")
+
+
+def test_concurrent_callers_share_one_build(server, monkeypatch):
+    gate = threading.Event()
+    builds = []
+
+    def slow_build():
+        builds.append(1)
+        gate.wait(2)
+        return "artifact"
+
+    threads = [
+        threading.Thread(target=lambda: dp._shared(("k",), slow_build)) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert builds == [1]
@@ -1,10 +1,11 @@
 import asyncio
 import sqlite3
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from prism_core.exit_effect_replay import (
+    ExitEffectReplayWorker,
     deliver_exit_effect_once,
     run_exit_effect_replay,
 )
@@ -15,28 +16,29 @@ INTENT_ID = "intent-replay-1"
 NOW = datetime(2026, 7, 20, tzinfo=timezone.utc)
 
 
-def _seed(path):
+def _seed(path, intent_ids=(INTENT_ID,)):
     with sqlite3.connect(path) as connection:
         store = ExitEffectStore(connection)
         store.ensure_schema()
         connection.commit()
         connection.execute("BEGIN IMMEDIATE")
-        store.enqueue_exit_effects(
-            intent_id=INTENT_ID,
-            market="KR",
-            account_id="vps:kr-primary:01",
-            symbol="005930",
-            source="kr_batch",
-            payload={
-                "version": 1,
-                "event_id": INTENT_ID,
-                "market": "KR",
-                "source": "kr_batch",
-                "account_id": "vps:kr-primary:01",
-                "symbol": "005930",
-                "message": "sold",
-            },
-        )
+        for intent_id in intent_ids:
+            store.enqueue_exit_effects(
+                intent_id=intent_id,
+                market="KR",
+                account_id="vps:kr-primary:01",
+                symbol="005930",
+                source="kr_batch",
+                payload={
+                    "version": 1,
+                    "event_id": intent_id,
+                    "market": "KR",
+                    "source": "kr_batch",
+                    "account_id": "vps:kr-primary:01",
+                    "symbol": "005930",
+                    "message": "sold",
+                },
+            )
         connection.commit()
 
 
@@ -336,3 +338,250 @@ async def test_exact_delivery_rejects_effect_type_mismatch(tmp_path):
             owner="immediate-a",
             now=lambda: NOW,
         )
+
+
+async def _pause(seconds):
+    # A real delay even if another test module left asyncio.sleep patched.
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    loop.call_later(seconds, future.set_result, None)
+    await future
+
+
+async def _until(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await _pause(0.005)
+
+
+def _statuses(path, effect_type):
+    with sqlite3.connect(path) as connection:
+        return [
+            row[0]
+            for row in connection.execute(
+                "SELECT status FROM exit_effect_outbox WHERE effect_type=? ORDER BY id",
+                (effect_type,),
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_slow_type_from_blocking_other_types(tmp_path):
+    db_path = tmp_path / "worker-types.sqlite"
+    _seed(db_path, [f"intent-{index}" for index in range(3)])
+    release = asyncio.Event()
+
+    async def telegram(_payload):
+        await release.wait()
+        return "telegram-message"
+
+    async def redis(payload):
+        return f"redis-{payload['event_id']}"
+
+    worker = ExitEffectReplayWorker(
+        db_path,
+        handlers={"TELEGRAM": telegram, "REDIS": redis},
+        owner="worker-a",
+        concurrency={"TELEGRAM": 1, "REDIS": 2},
+        poll_interval_seconds=0.01,
+        now=lambda: NOW,
+    )
+    run = asyncio.create_task(worker.run(until_idle=True))
+    await _until(lambda: worker.stats["REDIS"]["delivered"] == 3)
+
+    assert worker.stats["TELEGRAM"]["claimed"] == 1
+    assert worker.stats["TELEGRAM"]["in_flight"] == 1
+    assert _statuses(db_path, "TELEGRAM").count("PENDING") == 2
+
+    release.set()
+    metrics = await run
+
+    assert metrics["TELEGRAM"]["delivered"] == 3
+    assert metrics["REDIS"]["delivered"] == 3
+    assert metrics["REDIS"]["in_flight"] == 0
+    assert metrics["REDIS"]["latency_avg_ms"] >= 0
+    assert metrics["TELEGRAM"]["latency_max_ms"] >= metrics["REDIS"]["latency_max_ms"]
+    assert metrics["TELEGRAM"]["per_second"] > 0
+    assert set(_statuses(db_path, "TELEGRAM")) == {"DELIVERED"}
+
+
+@pytest.mark.asyncio
+async def test_worker_caps_each_type_and_claims_as_slots_free(tmp_path):
+    db_path = tmp_path / "worker-cap.sqlite"
+    _seed(db_path, [f"intent-{index}" for index in range(5)])
+    running = []
+    peak = []
+
+    async def gcp(payload):
+        running.append(payload["event_id"])
+        peak.append(len(running))
+        await _pause(0.01)
+        running.remove(payload["event_id"])
+        return f"gcp-{payload['event_id']}"
+
+    worker = ExitEffectReplayWorker(
+        db_path,
+        handlers={"GCP": gcp},
+        owner="worker-a",
+        concurrency={"GCP": 2},
+        poll_interval_seconds=5,
+        now=lambda: NOW,
+    )
+    metrics = await asyncio.wait_for(worker.run(until_idle=True), timeout=2)
+
+    assert max(peak) == 2
+    assert metrics["GCP"]["claimed"] == 5
+    assert metrics["GCP"]["delivered"] == 5
+    assert set(_statuses(db_path, "GCP")) == {"DELIVERED"}
+
+
+@pytest.mark.asyncio
+async def test_worker_renews_leases_for_in_flight_work(tmp_path):
+    db_path = tmp_path / "worker-lease.sqlite"
+    _seed(db_path)
+    current = [NOW]
+    observed = {}
+
+    async def redis(_payload):
+        current[0] = NOW + timedelta(seconds=10)
+        await _pause(0.1)
+        with sqlite3.connect(db_path) as connection:
+            store = ExitEffectStore(connection)
+            observed["lease"] = store.get_effect(f"{INTENT_ID}:redis")[
+                "lease_expires_at"
+            ]
+            connection.execute("BEGIN IMMEDIATE")
+            observed["stolen"] = store.claim_ready_effects(
+                owner="worker-b", limit=4, now=current[0], lease_seconds=2
+            )
+            connection.rollback()
+        return "redis-message-1"
+
+    worker = ExitEffectReplayWorker(
+        db_path,
+        handlers={"REDIS": redis},
+        owner="worker-a",
+        lease_seconds=2,
+        handler_timeout_seconds=1,
+        renew_interval_seconds=0.02,
+        now=lambda: current[0],
+    )
+    metrics = await worker.run(until_idle=True)
+
+    assert observed["lease"] == (NOW + timedelta(seconds=12)).isoformat()
+    assert [effect["effect_type"] for effect in observed["stolen"]] == [
+        "JOURNAL",
+        "TELEGRAM",
+        "GCP",
+    ]
+    assert metrics["REDIS"]["lease_renewals"] >= 1
+    assert metrics["REDIS"]["delivered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_worker_reschedules_in_flight_effects(tmp_path):
+    db_path = tmp_path / "worker-cancel.sqlite"
+    _seed(db_path)
+    started = asyncio.Event()
+
+    async def journal(_payload):
+        started.set()
+        await asyncio.Event().wait()
+
+    worker = ExitEffectReplayWorker(
+        db_path,
+        handlers={"JOURNAL": journal},
+        owner="worker-a",
+        now=lambda: NOW,
+    )
+    run = asyncio.create_task(worker.run())
+    await asyncio.wait_for(started.wait(), timeout=2)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    row = _rows(db_path)[0]
+    assert row["status"] == "PENDING"
+    assert row["last_error"] == "CancelledError"
+    assert worker.stats["JOURNAL"]["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_stop_finishes_in_flight_work(tmp_path):
+    db_path = tmp_path / "worker-stop.sqlite"
+    _seed(db_path)
+    release = asyncio.Event()
+
+    async def journal(_payload):
+        await release.wait()
+        return True
+
+    worker = ExitEffectReplayWorker(
+        db_path,
+        handlers={"JOURNAL": journal},
+        owner="worker-a",
+        now=lambda: NOW,
+    )
+    run = asyncio.create_task(worker.run())
+    await _until(lambda: worker.stats["JOURNAL"]["in_flight"] == 1)
+    worker.stop()
+    release.set()
+    metrics = await asyncio.wait_for(run, timeout=2)
+
+    assert metrics["JOURNAL"]["delivered"] == 1
+    assert _rows(db_path)[0]["status"] == "DELIVERED"
+
+
+def test_worker_rejects_invalid_concurrency(tmp_path):
+    async def journal(_payload):
+        return True
+
+    with pytest.raises(ValueError, match="concurrency"):
+        ExitEffectReplayWorker(
+            tmp_path / "unused.sqlite",
+            handlers={"JOURNAL": journal},
+            owner="worker-a",
+            concurrency={"JOURNAL": 0},
+        )
+    with pytest.raises(ValueError, match="unsupported"):
+        ExitEffectReplayWorker(
+            tmp_path / "unused.sqlite",
+            handlers={"JOURNAL": journal},
+            owner="worker-a",
+            concurrency={"SLACK": 1},
+        )
+
+
+@pytest.mark.asyncio
+async def test_single_replay_runs_claimed_types_concurrently(tmp_path):
+    db_path = tmp_path / "batch-concurrent.sqlite"
+    _seed(db_path)
+    release = asyncio.Event()
+    order = []
+
+    async def telegram(_payload):
+        order.append("telegram-start")
+        await release.wait()
+        order.append("telegram-end")
+        return "telegram-message"
+
+    async def redis(_payload):
+        order.append("redis")
+        release.set()
+        return "redis-message-1"
+
+    summary = await asyncio.wait_for(
+        run_exit_effect_replay(
+            db_path,
+            handlers={"TELEGRAM": telegram, "REDIS": redis},
+            owner="runner-a",
+            limit=2,
+            now=lambda: NOW,
+        ),
+        timeout=2,
+    )
+
+    assert order == ["telegram-start", "redis", "telegram-end"]
+    assert summary["delivered"] == 2
@@ -108,3 +108,26 @@ def test_execute_runs_bounded_selected_handler(tmp_path, monkeypatch, capsys):
     assert calls == [INTENT_ID]
     assert row["status"] == "DELIVERED"
     assert row["remote_id"] == "redis-cli-message-1"
+
+
+def test_follow_and_concurrency_options_are_validated(tmp_path):
+    db_path = tmp_path / "options.sqlite"
+    _seed(db_path)
+
+    with pytest.raises(SystemExit) as follow_error:
+        replay_exit_effects.main(["--db-path", str(db_path), "--follow"])
+    with pytest.raises(SystemExit) as concurrency_error:
+        replay_exit_effects.main(
+            [
+                "--db-path",
+                str(db_path),
+                "--execute",
+                "--effect",
+                "REDIS",
+                "--concurrency",
+                "REDIS=many",
+            ]
+        )
+
+    assert follow_error.value.code == 2
+    assert concurrency_error.value.code == 2
@@ -0,0 +1,328 @@
+"""Tests for the event-driven exit monitor (tools/exit_monitor.py).
+
+The monitor replays ticks through the cron tools' own decision and order paths,
+so these tests pin what the daemon adds on top of them:
+  - a TIER1 breach is acted on at the breaching tick, with no REST price read;
+  - a repeating breach fires once (in-flight guard + per-rule cooldown);
+  - trend-exit keeps its checkpoint cadence and confirms in the close window;
+  - fill-chase prices off the tick;
+  - US holdings are subscribed on their own exchange's feed key;
+  - a DB error while opening is reported, not raised, and nothing leaks.
+
+Ticks come from ReplayQuoteStream; trading contexts and the agent are fakes,
+so everything is network-free. Run in the KR (root) pytest session.
+"""
+import asyncio
+import json
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+import tools.exit_monitor as em  # noqa: E402
+from prism_core.quote_stream import (  # noqa: E402
+    KisRealtimeQuoteStream,
+    QuoteTick,
+    ReplayQuoteStream,
+)
+
+# 10:00 KST — mid-session, outside the trend-exit close window.
+T0 = datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)
+
+
+class FakeTrader:
+    def __init__(self, orders=()):
+        self.calls = []
+        self._orders = list(orders)
+
+    def get_current_price(self, ticker, exchange=None):
+        self.calls.append(f"price:{ticker}")
+        return {"current_price": 0}
+
+    def get_holding_quantity(self, ticker):
+        return 10
+
+    def get_holding_quantity_checked(self, ticker):
+        return ("HELD", 10)
+
+    async def async_sell_stock(self, ticker, exchange=None, timeout=30.0,
+                               limit_price=None, use_moo=False, quantity=None):
+        self.calls.append(f"kis:{ticker}:{quantity}")
+        return {"success": True, "order_no": "ORD1", "message": "ok"}
+
+    def get_revisable_orders(self):
+        return list(self._orders)
+
+
+class FakeCtx:
+    def __init__(self, trader):
+        self._trader = trader
+
+    async def __aenter__(self):
+        return self._trader
+
+    async def __aexit__(self, *a):
+        return False
+
+
+class FakeAgent:
+    def __init__(self, calls):
+        self.calls = calls
+        self.conn = None
+
+    async def sell_stock(self, stock_data, sell_reason, **kwargs):
+        self.calls.append(f"sim:{stock_data['ticker']}@{stock_data['current_price']}")
+        return True
+
+    def _link_position_exit_intent(self, **kwargs):
+        return True
+
+    @staticmethod
+    def _position_pending_kr_enabled():
+        return False
+
+    async def send_telegram_message(self, chat_id, language="ko", **kwargs):
+        self.calls.append("tg")
+        return True
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    db = str(tmp_path / "t.sqlite")
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE stock_holdings (id INTEGER PRIMARY KEY, ticker TEXT, company_name TEXT, "
+        "buy_price REAL, buy_date TEXT, scenario TEXT, target_price REAL, stop_loss REAL, "
+        "highest_price REAL, account_key TEXT, account_name TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO stock_holdings VALUES (1, '005930', '005930', 100.0, "
+        "'2026-06-01 10:00:00', '{}', 0, 0, 0, 'acc1', 'primary')"
+    )
+    conn.commit()
+    conn.close()
+    for module in (em.hardstop_seller, em.trend_exit_seller, em.fill_chaser):
+        monkeypatch.setattr(module, "DB_PATH", db)
+    monkeypatch.setattr(em.hardstop_seller, "HARDSTOP_LIVE", False)
+    monkeypatch.setattr(em.trend_exit_seller, "TREND_EXIT_LIVE", False)
+    monkeypatch.setattr(em.fill_chaser, "FILL_CHASER_LIVE", False)
+    monkeypatch.setattr(em.trend_exit_seller, "_baseline_failed_at", {})
+    return db
+
+
+def _patch_sells(monkeypatch, trader, agent):
+    from prism_core.execution_service import ExecutionService
+    from prism_core.order_intents import IntentStore
+
+    for module in (em.hardstop_seller, em.trend_exit_seller):
+        monkeypatch.setattr(
+            module,
+            "_open_context",
+            lambda market, account_name=None: ExecutionService(
+                FakeCtx(trader), intent_store=IntentStore(em.hardstop_seller.DB_PATH)
+            ),
+        )
+
+        async def _make_agent(market):
+            return agent
+
+        monkeypatch.setattr(module, "_make_agent", _make_agent)
+
+
+def _ticks(*prices, step=timedelta(seconds=1), start=T0):
+    return [QuoteTick("KR", "005930", price, start + i * step) for i, price in enumerate(prices)]
+
+
+def _count(db, sql):
+    with sqlite3.connect(db) as conn:
+        return conn.execute(sql).fetchone()[0]
+
+
+def test_shadow_hardstop_fires_on_the_breaching_tick_without_a_price_read(tmp_db):
+    trader = FakeTrader()
+    stream = ReplayQuoteStream(_ticks(99.0, 95.0, 92.0, 91.0))
+    monitor = em.ExitMonitor("KR", stream, trader=trader, rules=("hardstop",))
+
+    summary = asyncio.run(monitor.run())
+
+    assert summary["hardstop"]["triggered"] == 1 and summary["hardstop"]["shadow"] == 1
+    assert summary["stats"]["ticks"] == 4
+    assert trader.calls == []
+    assert _count(tmp_db, "SELECT COUNT(*) FROM loop_a_inflight_orders WHERE status='SHADOW'") == 1
+
+
+def test_live_hardstop_sells_once_at_the_tick_price(tmp_db, monkeypatch):
+    monkeypatch.setattr(em.hardstop_seller, "HARDSTOP_LIVE", True)
+    trader, calls = FakeTrader(), []
+    _patch_sells(monkeypatch, trader, FakeAgent(calls))
+    stream = ReplayQuoteStream(_ticks(92.0, 91.0, 90.0))
+
+    summary = asyncio.run(em.ExitMonitor("KR", stream, rules=("hardstop",)).run())
+
+    assert summary["hardstop"]["sold"] == 1
+    assert calls[0] == "sim:005930@92.0"
+    assert trader.calls == ["kis:005930:10"]
+    assert calls.count("tg") == 2  # per-sell flush + the portfolio flush after it
+
+
+def _drive(monitor, ticks):
+    """Feed ticks one at a time, letting each tick's actions finish first."""
+    async def scenario():
+        monitor._open()
+        try:
+            await monitor.refresh()
+            for tick in ticks:
+                monitor.on_tick(tick)
+                await monitor.drain()
+        finally:
+            monitor._close()
+
+    asyncio.run(scenario())
+    return monitor.summaries
+
+
+def test_cooldown_keeps_a_repeating_breach_quiet(tmp_db):
+    monitor = em.ExitMonitor("KR", ReplayQuoteStream([]), rules=("hardstop",),
+                             cooldown_seconds=300)
+    ticks = [QuoteTick("KR", "005930", price, T0 + timedelta(seconds=seconds))
+             for seconds, price in ((0, 92.0), (60, 91.0), (301, 90.0))]
+
+    assert _drive(monitor, ticks)["hardstop"]["triggered"] == 2
+
+
+def test_trend_exit_keeps_checkpoint_cadence_and_confirms_in_close_window(tmp_db, monkeypatch):
+    monkeypatch.setattr(em.trend_exit_seller, "TREND_EXIT_CONFIRM_CHECKS", 2)
+    monkeypatch.setattr(em.trend_exit_seller, "_compute_live_regime", lambda market: None)
+    ma50_fetches = []
+
+    def _compute_baseline(market, ticker, session_date):
+        ma50_fetches.append(ticker)
+        # 98 < 50MA while losing -> TIER1.5
+        return {"ma_50": 105.0}
+
+    monkeypatch.setattr(em.trend_exit_seller, "_compute_baseline", _compute_baseline)
+    close = datetime(2026, 10, 19, 6, 12, tzinfo=timezone.utc)  # 15:12 KST
+    ticks = _ticks(98.0, 98.0, step=timedelta(seconds=60)) + _ticks(98.0, start=close)
+    monitor = em.ExitMonitor("KR", ReplayQuoteStream([]), rules=("trend_exit",))
+
+    trend = _drive(monitor, ticks)["trend_exit"]
+    assert trend["checked"] == 2             # the 60s-later tick is not a checkpoint
+    assert trend["gated"] == 1               # streak 1 < 2 mid-session
+    assert trend["acted"] == 1 and trend["shadow"] == 1  # the close confirms it
+    assert ma50_fetches == ["005930"]
+
+
+def test_fill_chase_prices_off_the_tick(tmp_db, monkeypatch):
+    monkeypatch.setattr(em.fill_chaser, "GRACE_SEC", 0)
+    monkeypatch.setattr(em.fill_chaser, "CHASE_AFTER_SEC", 60)
+    monkeypatch.setattr(em.fill_chaser, "CHASE_STEP_PCT", 1.0)
+    conn = sqlite3.connect(tmp_db)
+    em.fill_chaser._ensure_schema(conn)
+    conn.execute(
+        "INSERT INTO loop_c_chase_log (ticker, market, side, order_no, action, mode, "
+        "old_price, new_price, unfilled_qty, chase_count, reason, loop_run_id, logged_ts) "
+        "VALUES ('005930','KR','SELL','A1','SEEN','SHADOW',0,0,0,0,'seed','seed',"
+        "'2000-01-01T00:00:00+00:00')"
+    )
+    conn.commit()
+    conn.close()
+    trader = FakeTrader(orders=[{
+        "order_no": "A1", "stock_code": "005930", "sll_buy_dvsn_cd": "01",
+        "psbl_qty": 5, "ord_unpr": 100, "krx_fwdg_ord_orgno": "GNO1",
+    }])
+    stream = ReplayQuoteStream(_ticks(97.0, 96.0))
+
+    summary = asyncio.run(
+        em.ExitMonitor("KR", stream, trader=trader, rules=("fill_chaser",)).run())
+
+    assert summary["fill_chaser"]["evaluated"] == 1  # the second tick is inside CHASE_AFTER_SEC
+    assert summary["fill_chaser"]["shadow"] == 1
+    assert trader.calls == []
+    assert _count(tmp_db, "SELECT new_price FROM loop_c_chase_log WHERE action='AMEND'") == 97.0
+
+
+class FakeSocket:
+    def __init__(self, messages, on_drained):
+        self.sent = []
+        self._messages = list(messages)
+        self._on_drained = on_drained
+
+    async def send(self, raw):
+        self.sent.append(raw)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *a):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._messages:
+            return self._messages.pop(0)
+        await self._on_drained()
+        raise StopAsyncIteration
+
+
+def test_us_holding_is_subscribed_on_its_own_exchange(tmp_db):
+    conn = sqlite3.connect(tmp_db)
+    conn.execute(
+        "CREATE TABLE us_stock_holdings (id INTEGER PRIMARY KEY, ticker TEXT, company_name TEXT, "
+        "buy_price REAL, buy_date TEXT, scenario TEXT, target_price REAL, stop_loss REAL, "
+        "account_key TEXT, account_name TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO us_stock_holdings VALUES (1, 'IBM', 'IBM', 100.0, "
+        "'2026-06-01 10:00:00', '{}', 0, 0, 'acc1', 'primary')"
+    )
+    conn.commit()
+    conn.close()
+    trader = FakeTrader()
+    trader._resolve_exchange = lambda ticker: {"IBM": "NYSE"}[ticker]
+    fields = ["0"] * 26
+    fields[1], fields[11] = "IBM", "91.0"
+    socket = FakeSocket(["0|HDFSCNT0|1|" + "^".join(fields)], on_drained=lambda: stream.close())
+    stream = KisRealtimeQuoteStream("US", url="ws://kis", approval_key=lambda: "KEY",
+                                    connect=lambda url: socket, clock=lambda: T0)
+
+    summary = asyncio.run(
+        em.ExitMonitor("US", stream, trader=trader, rules=("hardstop",)).run())
+
+    assert json.loads(socket.sent[0])["body"]["input"]["tr_key"] == "DNYSIBM"
+    assert summary["hardstop"]["triggered"] == 1 and summary["hardstop"]["shadow"] == 1
+
+
+def test_a_failed_open_is_reported_and_closes_what_it_opened(tmp_db, monkeypatch):
+    opened = []
+
+    class _Conn:
+        def __init__(self, real):
+            self.real, self.closed = real, False
+            opened.append(self)
+
+        def __getattr__(self, name):
+            return getattr(self.real, name)
+
+        def close(self):
+            self.closed = True
+            self.real.close()
+
+    real_connect = em.hardstop_seller._connect
+    monkeypatch.setattr(em.hardstop_seller, "_connect", lambda: _Conn(real_connect()))
+
+    def broken_connect():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(em.trend_exit_seller, "_connect", broken_connect)
+    stream = ReplayQuoteStream(_ticks(100.0))
+
+    summary = asyncio.run(em.ExitMonitor("KR", stream, rules=("hardstop", "trend_exit")).run())
+
+    assert summary["market"] == "KR"
+    assert len(opened) == 2 and all(conn.closed for conn in opened)
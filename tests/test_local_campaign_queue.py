@@ -3,6 +3,8 @@ from __future__ import annotations
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from messaging.local_campaign_queue import SQLiteBatchCampaignQueue
 
 NOW = datetime(2026, 7, 23, 5, 30, tzinfo=timezone.utc)
@@ -135,3 +137,72 @@ def test_queue_uses_event_id_to_allow_several_stages_for_one_campaign(tmp_path):
             "batch:report:005930",
             "batch:portfolio",
         ]
+
+
+def test_bulk_acknowledge_and_release_skip_entries_leased_elsewhere(tmp_path):
+    with SQLiteBatchCampaignQueue(tmp_path / "campaigns.sqlite") as queue:
+        for campaign_id in ("campaign-1", "campaign-2", "campaign-3"):
+            queue.enqueue(payload(campaign_id))
+        first, second, third = queue.claim(
+            lease_owner="consumer-1", now=NOW, lease_seconds=30, limit=3
+        )
+        # The lease on the third ran out and another consumer took it over.
+        queue.release(
+            third.queue_id,
+            lease_owner="consumer-1",
+            next_attempt_at=NOW,
+            error="lost",
+        )
+        queue.claim(
+            lease_owner="consumer-2",
+            now=NOW + timedelta(seconds=1),
+            lease_seconds=30,
+            limit=1,
+        )
+
+        consumed = queue.acknowledge_many(
+            [first.queue_id, third.queue_id],
+            lease_owner="consumer-1",
+            consumed_at=NOW,
+        )
+        released = queue.release_many(
+            {second.queue_id: "remote down", third.queue_id: "remote down"},
+            lease_owner="consumer-1",
+            next_attempt_at=NOW + timedelta(minutes=1),
+        )
+
+        assert consumed == {first.queue_id}
+        assert released == {second.queue_id}
+        assert [
+            (entry["status"], entry["last_error"]) for entry in queue.list_entries()
+        ] == [
+            ("CONSUMED", None),
+            ("PENDING", "remote down"),
+            ("SENDING", "lost"),
+        ]
+
+
+def test_enqueue_many_skips_duplicates_and_invalid_payloads_only(tmp_path):
+    with SQLiteBatchCampaignQueue(tmp_path / "campaigns.sqlite") as queue:
+        queue.enqueue(payload("campaign-1"))
+
+        assert queue.enqueue_many(
+            [payload("campaign-1"), payload("campaign-2"), payload("campaign-2")]
+        ) == (None, "campaign-2", None)
+
+        assert queue.enqueue_many(
+            [
+                payload("campaign-3"),
+                {"schema_version": 1},
+                {**payload("campaign-4"), "blob": object()},
+                payload("campaign-5"),
+            ]
+        ) == ("campaign-3", None, None, "campaign-5")
+        assert [entry["campaign_id"] for entry in queue.list_entries()] == [
+            "campaign-1",
+            "campaign-2",
+            "campaign-3",
+            "campaign-5",
+        ]
+        with pytest.raises(ValueError, match="requires campaign_id"):
+            queue.enqueue({"schema_version": 1})
@@ -378,5 +378,60 @@ class TestReplay:
         assert out[-1][2] == 4
 
 
+# --------------------------------------------------------------------------- #
+# Incremental DD counter + checkpoint round-trip                               #
+# --------------------------------------------------------------------------- #
+def _random_walk(seed: int, n: int = 400) -> List[DailyBar]:
+    import random
+
+    rng = random.Random(seed)
+    close, out = 100.0, []
+    for i in range(n):
+        close *= 1 + rng.gauss(0, 0.02)
+        vol = None if rng.random() < 0.03 else rng.uniform(500.0, 1500.0)
+        out.append(DailyBar(date=f"d{i:04d}", close=close, volume=vol))
+    return out
+
+
+class TestIncremental:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_counter_matches_full_rescan(self, seed):
+        bars = _random_walk(seed)
+        mp = MarketPulse()
+        closes: List[float] = []
+        vols: List[Optional[float]] = []
+        window_start = 0
+        states = set()
+        for bar in bars:
+            closes.append(bar.close)
+            vols.append(bar.volume)
+            states.add(mp.feed(bar))
+            expected = _count_distribution_days(closes, vols, start_idx=window_start)
+            if mp._dd_window_start != window_start:  # exited CORRECTION today
+                window_start = mp._dd_window_start
+                expected = 0
+            assert mp.distribution_days == expected
+        assert CORRECTION in states
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_resume_from_checkpoint_matches_uninterrupted_run(self, seed):
+        import json
+
+        bars = _random_walk(seed)
+        full = MarketPulse().replay(bars)
+
+        mp = MarketPulse()
+        mp.replay(bars[:250])
+        restored = MarketPulse.from_dict(json.loads(json.dumps(mp.to_dict())))
+        assert restored.last_date == bars[249].date
+        assert restored.replay(bars[250:]) == full[250:]
+
+    def test_from_dict_rejects_other_versions(self):
+        data = MarketPulse().to_dict()
+        data["version"] = 0
+        with pytest.raises(ValueError):
+            MarketPulse.from_dict(data)
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,172 @@
+"""Tests for the per-ticker bulk price resolution in PerformanceTrackerBatch."""
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import performance_tracker_batch as ptb
+from tracking.db_schema import TABLE_ANALYSIS_PERFORMANCE_TRACKER
+
+
+def _day(offset):
+    return (datetime.now() - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture()
+def db(tmp_path):
+    path = tmp_path / "stock_tracking_db.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(TABLE_ANALYSIS_PERFORMANCE_TRACKER)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def _seed(db, ticker, analyzed_offset, price, tracking_status="pending", **fields):
+    row = {
+        "ticker": ticker,
+        "company_name": f"Co-{ticker}",
+        "trigger_type": "volume_surge",
+        "analyzed_date": _day(analyzed_offset),
+        "analyzed_price": price,
+        "was_traded": 0,
+        "tracking_status": tracking_status,
+        **fields,
+    }
+    conn = sqlite3.connect(db)
+    cur = conn.execute(
+        f"INSERT INTO analysis_performance_tracker ({', '.join(row)}) "
+        f"VALUES ({', '.join('?' for _ in row)})",
+        list(row.values()),
+    )
+    conn.commit()
+    conn.close()
+    return cur.lastrowid
+
+
+def _row(db, record_id):
+    conn = sqlite3.connect(db)
+    conn.row_factory = sqlite3.Row
+    row = conn.execute(
+        "SELECT * FROM analysis_performance_tracker WHERE id = ?", (record_id,)
+    ).fetchone()
+    conn.close()
+    return dict(row)
+
+
+@pytest.fixture()
+def fake_ohlcv(monkeypatch):
+    """Daily closes: close on day N-ago = 1000 + (60 - N) for every ticker."""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(fromdate, todate, ticker):
+        with lock:
+            calls.append((fromdate, todate, ticker))
+        days = pd.date_range(
+            datetime.strptime(fromdate, "%Y%m%d"), datetime.strptime(todate, "%Y%m%d")
+        )
+        closes = [1000 + (60 - (datetime.now() - d).days) for d in days]
+        return pd.DataFrame({"Close": closes}, index=days)
+
+    monkeypatch.setattr(ptb, "KRX_AVAILABLE", True)
+    monkeypatch.setattr(ptb, "get_market_ohlcv_by_date", fetch, raising=False)
+    return calls
+
+
+def test_history_is_fetched_once_per_ticker(db, fake_ohlcv):
+    ids = [
+        _seed(db, "005930", 8, 1000.0),
+        _seed(db, "005930", 20, 1000.0),
+        _seed(db, "005930", 35, 1000.0),
+        _seed(db, "000660", 9, 1000.0),
+    ]
+
+    stats = ptb.PerformanceTrackerBatch(db_path=db, max_workers=2).run()
+
+    assert sorted(call[2] for call in fake_ohlcv) == ["000660", "005930"]
+    # The shared fetch covers the oldest analysis date for the ticker
+    assert min(call[0] for call in fake_ohlcv if call[2] == "005930") == _day(35).replace("-", "")
+    assert stats["tickers"] == 2
+    assert stats["updated"] == 4
+    assert stats["completed"] == 1
+    for record_id in ids:
+        assert _row(db, record_id)["tracked_7d_price"] is not None
+
+
+def test_checkpoints_are_resolved_from_history_not_today(db, fake_ohlcv):
+    record_id = _seed(db, "005930", 35, 1000.0)
+
+    ptb.PerformanceTrackerBatch(db_path=db).run()
+
+    row = _row(db, record_id)
+    assert row["tracked_7d_date"] == _day(28)
+    assert row["tracked_7d_price"] == 1000 + (60 - 28)
+    assert row["tracked_14d_date"] == _day(21)
+    assert row["tracked_14d_price"] == 1000 + (60 - 21)
+    assert row["tracked_30d_date"] == _day(5)
+    assert row["tracked_30d_return"] == pytest.approx((1000 + 55 - 1000) / 1000)
+    assert row["tracking_status"] == "completed"
+
+
+def test_already_recorded_checkpoints_are_kept(db, fake_ohlcv):
+    record_id = _seed(
+        db, "005930", 15, 1000.0,
+        tracking_status="in_progress",
+        tracked_7d_date="2000-01-01", tracked_7d_price=1.0, tracked_7d_return=-0.999,
+    )
+
+    ptb.PerformanceTrackerBatch(db_path=db).run()
+
+    row = _row(db, record_id)
+    assert row["tracked_7d_date"] == "2000-01-01"
+    assert row["tracked_14d_date"] == _day(1)
+    assert row["tracking_status"] == "in_progress"
+
+
+def test_not_yet_due_records_skip_fetch(db, fake_ohlcv):
+    _seed(db, "005930", 3, 1000.0)
+
+    stats = ptb.PerformanceTrackerBatch(db_path=db).run()
+
+    assert fake_ohlcv == []
+    assert stats["skipped"] == 1
+
+
+def test_failed_ticker_does_not_block_others(db, fake_ohlcv, monkeypatch):
+    ok_id = _seed(db, "005930", 8, 1000.0)
+    bad_id = _seed(db, "999999", 8, 1000.0)
+    good_fetch = ptb.get_market_ohlcv_by_date
+
+    def fetch(fromdate, todate, ticker):
+        if ticker == "999999":
+            raise RuntimeError("upstream down")
+        return good_fetch(fromdate, todate, ticker)
+
+    monkeypatch.setattr(ptb, "get_market_ohlcv_by_date", fetch)
+
+    stats = ptb.PerformanceTrackerBatch(db_path=db).run()
+
+    assert stats["errors"] == 1
+    assert _row(db, ok_id)["tracked_7d_price"] is not None
+    assert _row(db, bad_id)["tracked_7d_price"] is None
+
+
+def test_dry_run_writes_nothing(db, fake_ohlcv):
+    record_id = _seed(db, "005930", 8, 1000.0)
+
+    stats = ptb.PerformanceTrackerBatch(db_path=db, dry_run=True).run()
+
+    assert stats["updated"] == 1
+    assert _row(db, record_id)["tracked_7d_price"] is None
+
+
+def test_resolve_checkpoint_falls_forward_over_long_holidays():
+    history = {"2026-01-02": 10.0, "2026-01-12": 12.0}
+
+    resolve = ptb.PerformanceTrackerBatch.resolve_checkpoint_price
+    assert resolve(history, "2026-01-02", "2026-01-09") == ("2026-01-12", 12.0)
+    assert resolve(history, "2026-01-01", "2026-01-09") == ("2026-01-02", 10.0)
+    assert resolve(history, "2026-01-12", "2026-01-19") is None
@@ -0,0 +1,105 @@
+"""Compact prompt encoding of prefetched tables (cores/prompt_table_encoder.py)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cores import data_prefetch as dp
+from cores import prompt_table_encoder as enc
+
+
+def _ohlcv(start="2024-08-01", end="2026-08-07"):
+    idx = pd.bdate_range(start, end)
+    close = np.linspace(70000, 84000, len(idx))
+    return pd.DataFrame(
+        {
+            "Open": close - 100,
+            "High": close + 500,
+            "Low": close - 500,
+            "Close": close,
+            "Volume": np.full(len(idx), 12_345_678.0),
+            "Change": np.full(len(idx), 0.12),
+        },
+        index=idx,
+    )
+
+
+def test_format_number_keeps_integer_digits():
+    assert enc.format_number(71300) == "71300"
+    assert enc.format_number(3.14159) == "3.142"
+    assert enc.format_number(0.000123456) == "0.0001235"
+    assert enc.format_number(float("nan")) == ""
+    assert enc.format_scaled(391_035_000_000) == "391B"
+    assert enc.format_scaled(6.42) == "6.42"
+
+
+def test_history_is_downsampled_and_recent_rows_kept_daily():
+    df = _ohlcv()
+    text = enc.encode_time_series(df, "OHLCV", recent_rows=60)
+    lines = text.splitlines()
+
+    daily = [l for l in lines if l[:1].isdigit()]
+    weekly = [l for l in lines if l.startswith("W2")]
+    monthly = [l for l in lines if l.startswith("M2")]
+    assert len(daily) == 60
+    assert 20 <= len(weekly) <= 28
+    assert monthly and monthly[0].startswith("M2024-08,")
+    assert "Date,Open,High,Low,Close,Volume(M),Change" in lines
+
+    # Monthly row: O=first, H=max, L=min, C=last, volume summed, rate blank
+    august = df.loc["2024-08"]
+    cells = monthly[0].split(",")
+    assert cells[1] == enc.format_number(august["Open"].iloc[0])
+    assert cells[2] == enc.format_number(august["High"].max())
+    assert cells[4] == enc.format_number(august["Close"].iloc[-1])
+    assert cells[5] == enc.format_number(august["Volume"].sum() / 1e6)
+    assert cells[6] == ""
+
+
+def test_summary_line_precomputes_basics():
+    text = enc.encode_time_series(_ohlcv(), "OHLCV")
+    summary = next(l for l in text.splitlines() if l.startswith("summary:"))
+    assert "Close: last=84000" in summary
+    assert "min=70000@2024-08-01" in summary
+    assert "chg_all=+20.0%" in summary
+    assert "Volume(M): sum5d=61.73" in summary
+
+
+def test_compact_is_much_smaller_than_markdown():
+    df = _ohlcv()
+    data = {d.strftime("%Y-%m-%d"): row.to_dict() for d, row in df.iterrows()}
+    markdown = dp._dict_to_markdown(data, "OHLCV")
+    compact = enc.encode_time_series(df, "OHLCV")
+    assert enc.estimate_tokens(compact) * 4 < enc.estimate_tokens(markdown)
+
+
+def test_markdown_switch_and_encoder_failure_fall_back(monkeypatch):
+    def broken():
+        raise ValueError("bad frame")
+
+    monkeypatch.setenv("PRISM_PROMPT_TABLE_FORMAT", "markdown")
+    assert enc.render_for_prompt("s", lambda: "| md |", lambda: "csv") == "| md |"
+    monkeypatch.setenv("PRISM_PROMPT_TABLE_FORMAT", "compact")
+    assert enc.render_for_prompt("s", lambda: "| md |", lambda: "csv") == "csv"
+    assert enc.render_for_prompt("s", lambda: "| md |", broken) == "| md |"
+
+
+def test_prefetched_dict_keeps_data_status_note(monkeypatch):
+    monkeypatch.setenv("PRISM_PROMPT_TABLE_FORMAT", "compact")
+    data = {
+        "__meta__": {"note": "오늘 장 마감 전 데이터"},
+        "2026-08-06": {"종가": 71300, "거래량": 1_200_000},
+        "2026-08-07": {"종가": 71800, "거래량": 1_500_000},
+    }
+    text = dp._render_prefetched(data, "Stock OHLCV: 005930")
+    assert text.startswith("### Stock OHLCV: 005930")
+    assert "> **데이터 상태:** 오늘 장 마감 전 데이터" in text
+    assert "Date,종가,거래량(K)" in text
+    assert "2026-08-07,71800,1500" in text
+    assert dp._render_prefetched({"error": "KRX down"}, "x") == ""
+
+
+@pytest.mark.parametrize("index", [["a", "b"], [1, 2]])
+def test_non_date_index_renders_as_plain_table(index):
+    df = pd.DataFrame({"value": [1.23456, 2_500_000.0]}, index=index)
+    text = enc.encode_time_series(df, "T")
+    assert "Index,value" in text
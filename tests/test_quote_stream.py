@@ -0,0 +1,148 @@
+"""Quote streams for the exit monitor: replay filtering and the KIS websocket
+protocol (subscribe frames, trade-record parsing, PINGPONG echo, reconnect)."""
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from prism_core.quote_stream import KisRealtimeQuoteStream, QuoteTick, ReplayQuoteStream
+
+AT = datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)
+
+
+def _kr_record(ticker, price):
+    fields = ["0"] * 46
+    fields[0], fields[2] = ticker, str(price)
+    return fields
+
+
+def _us_record(symbol, price):
+    fields = ["0"] * 26
+    fields[1], fields[11] = symbol, str(price)
+    return fields
+
+
+class FakeSocket:
+    def __init__(self, messages, on_drained=None):
+        self.sent = []
+        self._messages = list(messages)
+        self._on_drained = on_drained
+
+    async def send(self, raw):
+        self.sent.append(raw)
+
+    async def close(self):
+        self._messages.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *a):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._messages:
+            return self._messages.pop(0)
+        if self._on_drained is not None:
+            await self._on_drained()
+        raise StopAsyncIteration
+
+
+def _collect(stream, tickers):
+    async def run():
+        await stream.subscribe(tickers)
+        return [tick async for tick in stream.ticks()]
+
+    return asyncio.run(run())
+
+
+def test_replay_delivers_only_subscribed_tickers(tmp_path):
+    path = tmp_path / "ticks.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(row) for row in [
+            {"ticker": "005930", "price": 70000, "at": "2026-10-19T10:00:00+09:00"},
+            {"ticker": "000660", "price": 120000, "at": "2026-10-19T10:00:01+09:00"},
+            {"ticker": "005930", "price": 69900, "at": "2026-10-19T10:00:02"},
+        ]),
+        encoding="utf-8",
+    )
+    stream = ReplayQuoteStream.from_jsonl(path, market="KR")
+
+    ticks = _collect(stream, {"005930"})
+
+    assert [(t.ticker, t.price) for t in ticks] == [("005930", 70000.0), ("005930", 69900.0)]
+    assert ticks[1].at.tzinfo is timezone.utc
+    assert stream.stats == {"delivered": 2, "dropped": 1}
+
+
+def test_kis_stream_subscribes_parses_batches_and_echoes_pingpong():
+    pingpong = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20261019100000"}})
+    batch = "0|H0STCNT0|2|" + "^".join(_kr_record("005930", 70100) + _kr_record("000660", 5))
+    socket = FakeSocket([pingpong, batch, "1|H0STCNI0|001|encrypted"],
+                        on_drained=lambda: stream.close())
+    stream = KisRealtimeQuoteStream(
+        "KR", url="ws://kis", approval_key=lambda: "KEY", connect=lambda url: socket,
+        clock=lambda: AT,
+    )
+
+    ticks = _collect(stream, {"005930"})
+
+    assert ticks == [QuoteTick("KR", "005930", 70100.0, AT)]
+    subscribe = json.loads(socket.sent[0])
+    assert subscribe["header"]["approval_key"] == "KEY"
+    assert subscribe["header"]["tr_type"] == "1"
+    assert subscribe["body"]["input"] == {"tr_id": "H0STCNT0", "tr_key": "005930"}
+    assert socket.sent[1] == pingpong
+    assert stream.stats["dropped"] == 1 and stream.stats["encrypted"] == 1
+
+
+def test_kis_us_stream_keys_by_exchange_and_resubscribes_after_a_drop():
+    sockets = []
+
+    def connect(url):
+        if not sockets:
+            sockets.append(FakeSocket([]))  # dropped before any tick
+        else:
+            record = "0|HDFSCNT0|1|" + "^".join(_us_record("AAPL", 231.5))
+            sockets.append(FakeSocket([record], on_drained=stream.close))
+        return sockets[-1]
+
+    stream = KisRealtimeQuoteStream(
+        "US", url="ws://kis", approval_key=lambda: "KEY", exchanges={"AAPL": "NASD"},
+        connect=connect, retry_seconds=0.01, clock=lambda: AT,
+    )
+
+    ticks = _collect(stream, {"AAPL"})
+
+    assert ticks == [QuoteTick("US", "AAPL", 231.5, AT)]
+    assert stream.stats["connects"] == 2
+    for socket in sockets:
+        assert json.loads(socket.sent[0])["body"]["input"]["tr_key"] == "DNASAAPL"
+
+
+def test_kis_stream_updates_subscriptions_on_the_open_socket():
+    socket = FakeSocket([])
+    stream = KisRealtimeQuoteStream("KR", url="ws://kis", approval_key=lambda: "KEY")
+    stream._ws, stream._key = socket, "KEY"
+
+    asyncio.run(stream.subscribe({"005930", "000660"}))
+    asyncio.run(stream.subscribe({"000660"}))
+
+    sent = [(m["header"]["tr_type"], m["body"]["input"]["tr_key"])
+            for m in map(json.loads, socket.sent)]
+    assert sent == [("1", "000660"), ("1", "005930"), ("2", "005930")]
+
+
+def test_kis_us_stream_moves_a_subscription_when_its_exchange_changes():
+    socket = FakeSocket([])
+    stream = KisRealtimeQuoteStream("US", url="ws://kis", approval_key=lambda: "KEY")
+    stream._ws, stream._key = socket, "KEY"
+
+    asyncio.run(stream.subscribe({"IBM"}))
+    asyncio.run(stream.set_exchanges({"IBM": "NYSE"}))
+
+    sent = [(m["header"]["tr_type"], m["body"]["input"]["tr_key"])
+            for m in map(json.loads, socket.sent)]
+    assert sent == [("1", "DNASIBM"), ("2", "DNASIBM"), ("1", "DNYSIBM")]
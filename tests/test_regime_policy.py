@@ -151,3 +151,103 @@ def test_market_pulse_mode_returns_valid_value_only():
     assert market_pulse_mode() in ("shadow", "live", "off")
     # (does not mutate os.environ here; just a sanity invariant)
     assert isinstance(os.getenv("PATH"), str)
+
+
+# --------------------------------------------------------------------------- #
+# Persisted MarketPulse checkpoint                                             #
+# --------------------------------------------------------------------------- #
+def _weekday_bars(n: int, DailyBar, end: str = "2026-10-16"):
+    import pandas as pd
+
+    dates = pd.bdate_range(end=end, periods=n)
+    close, vol, out = 100.0, 1000.0, []
+    for i, d in enumerate(dates):
+        close *= 0.99 if i % 7 == 3 else 1.003
+        vol += 50.0 if i % 7 == 3 else -10.0
+        out.append(DailyBar(date=d.strftime("%Y-%m-%d"), close=close, volume=vol))
+    return out
+
+
+@pytest.fixture()
+def pulse_db(tmp_path, monkeypatch):
+    import cores.regime_policy as rp
+
+    monkeypatch.setattr(rp, "STATE_DB_PATH", tmp_path / "pulse.sqlite")
+    rp._reset_state_cache()
+    yield rp
+    rp._reset_state_cache()
+
+
+def _kst(text: str):
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    return datetime.fromisoformat(text).replace(tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+def test_last_closed_session_skips_open_day_and_weekend(pulse_db):
+    rp = pulse_db
+    # Monday 10:00 KST -> Friday's bar is the latest final one
+    assert rp._last_closed_session("kr", _kst("2026-10-19 10:00"))[0] == "2026-10-16"
+    assert rp._last_closed_session("kr", _kst("2026-10-19 16:30"))[0] == "2026-10-19"
+    # 16:30 KST Monday is still Monday 03:30 in New York
+    assert rp._last_closed_session("us", _kst("2026-10-19 16:30"))[0] == "2026-10-16"
+
+
+def test_checkpoint_advances_one_bar_per_session(pulse_db, monkeypatch):
+    from cores.market_pulse import DailyBar, MarketPulse
+    import cores.market_pulse as mp_mod
+
+    rp = pulse_db
+    bars = _weekday_bars(300, DailyBar, end="2026-10-19")
+    calls = []
+
+    def fake_fetch(DailyBar, start_date=None):
+        calls.append(start_date)
+        return [b for b in bars if start_date is None or b.date >= start_date]
+
+    monkeypatch.setattr(rp, "_fetch_kr_bars", fake_fetch)
+
+    # Friday after close: full replay up to Friday (Monday's bar is not final yet)
+    mp, _ = rp._advance_checkpoint("kr", mp_mod, _kst("2026-10-17 09:00"))
+    assert calls == [None] and mp.last_date == "2026-10-16"
+
+    # Same session again (another process): local read, no fetch
+    rp._advance_checkpoint("kr", mp_mod, _kst("2026-10-19 11:00"))
+    assert calls == [None]
+
+    # Monday after close: fetch from the checkpoint date, feed one bar
+    mp, states = rp._advance_checkpoint("kr", mp_mod, _kst("2026-10-19 16:30"))
+    assert calls == [None, "2026-10-16"]
+    expected = MarketPulse()
+    expected_states = [expected.feed(b) for b in bars]
+    assert mp.to_dict() == expected.to_dict()
+    assert states == expected_states[-len(states):]
+
+    # Public lookup reads the stored state without touching the network
+    monkeypatch.setattr(rp, "_fetch_kr_bars", lambda *a, **k: pytest.fail("fetched"))
+    monkeypatch.setattr(rp, "_last_closed_session",
+                        lambda market, now=None: ("2026-10-19", _kst("2026-10-19 16:00")))
+    assert rp.get_market_pulse_state("kr") == expected.state
+
+
+def test_revised_history_rebuilds_checkpoint(pulse_db, monkeypatch):
+    from cores.market_pulse import DailyBar
+    import cores.market_pulse as mp_mod
+
+    rp = pulse_db
+    bars = _weekday_bars(300, DailyBar, end="2026-10-19")
+    monkeypatch.setattr(rp, "_fetch_kr_bars", lambda DailyBar, start_date=None: bars[:-1])
+    rp._advance_checkpoint("kr", mp_mod, _kst("2026-10-17 09:00"))
+
+    revised = [DailyBar(b.date, b.close * 1.01, b.volume) for b in bars]
+    calls = []
+
+    def fake_fetch(DailyBar, start_date=None):
+        calls.append(start_date)
+        return [b for b in revised if start_date is None or b.date >= start_date]
+
+    monkeypatch.setattr(rp, "_fetch_kr_bars", fake_fetch)
+    mp, _ = rp._advance_checkpoint("kr", mp_mod, _kst("2026-10-19 16:30"))
+    assert calls == ["2026-10-16", None]
+    assert mp.bars_seen == 300 and mp.last_close == revised[-1].close
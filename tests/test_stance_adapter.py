@@ -187,6 +187,75 @@ def test_static_provider_for_demo():
     assert p("KRX", "000660") is None
 
 
+class FakeMultiKis(FakeKis):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows, self.calls = rows, []
+
+    def get_multi_price(self, codes):
+        self.calls.append(codes)
+        return {c: self.rows[c] for c in codes if c in self.rows}
+
+
+def test_batch_quotes_use_one_multi_price_call():
+    kis = FakeMultiKis({
+        "005930": {"current_price": 71200, "upper_limit": "71200", "lower_limit": "38400"},
+        "000660": {"current_price": 0},
+    })
+    quotes = KisQuoteProvider(kis).quotes("KRX", ["005930", "000660", "035420"])
+    assert kis.calls == [["005930", "000660", "035420"]]
+    assert set(quotes) == {"005930"}
+    assert quotes["005930"].price == D(71200) and quotes["005930"].at_upper_limit
+    assert KisQuoteProvider.batch_size == 30
+    assert KisQuoteProvider(kis).quotes("NASDAQ", ["AAPL"]) == {}
+
+
+def test_batch_quotes_fall_back_to_single_price():
+    quotes = KisQuoteProvider(FakeKis({"current_price": 1000})).quotes("KRX", ["005930", "000660"])
+    assert {s: q.price for s, q in quotes.items()} == {"005930": D(1000), "000660": D(1000)}
+
+
+class RejectedMultiKis(FakeMultiKis):
+    """intstock-multprice 가 막힌 경우(모의투자, 장애). 단건 현재가는 된다."""
+
+    def __init__(self, rows, single):
+        super().__init__(rows)
+        self.single, self.single_calls = single, []
+
+    def get_multi_price(self, codes):
+        super().get_multi_price(codes)
+        if not self.rows:
+            raise RuntimeError("EGW00201")
+        return {c: self.rows[c] for c in codes if c in self.rows}
+
+    def get_current_price(self, code):
+        self.single_calls.append(code)
+        return self.single.get(code)
+
+
+def test_batch_quotes_fill_symbols_the_multi_call_missed_one_by_one():
+    kis = RejectedMultiKis(
+        {"005930": {"current_price": 71200}},
+        {"005930": {"current_price": 1}, "000660": {"current_price": 120000}},
+    )
+    quotes = KisQuoteProvider(kis).quotes("KRX", ["005930", "000660", "035420"])
+    assert {s: q.price for s, q in quotes.items()} == {"005930": D(71200), "000660": D(120000)}
+    assert kis.single_calls == ["000660", "035420"]
+
+
+def test_rejected_multi_call_falls_back_to_single_price():
+    kis = RejectedMultiKis({}, {"005930": {"current_price": 1000}, "000660": {"current_price": 2000}})
+    quotes = KisQuoteProvider(kis).quotes("KRX", ["005930", "000660"])
+    assert {s: q.price for s, q in quotes.items()} == {"005930": D(1000), "000660": D(2000)}
+    assert kis.calls == [["005930", "000660"]]
+
+
+def test_static_provider_batches_for_close_day():
+    p = StaticQuoteProvider({"005930": 70000, "000660": 120000}, batch_size=1)
+    assert set(p.quotes("KRX", ["005930", "000660", "035420"])) == {"005930", "000660"}
+    assert p.requests == [["005930", "000660", "035420"]]
+
+
 def test_provider_detects_upper_limit():
     """상한가 도달 — 매수는 막고 매도는 허용해야 한다."""
     q = KisQuoteProvider(FakeKis({
@@ -291,3 +360,54 @@ def test_market_specific_config_does_not_fall_back_to_other_market(monkeypatch):
 
     assert StanceReporter.from_env("KR").enabled
     assert not StanceReporter.from_env("US").enabled
+
+
+def _load_multi_price():
+    """trading.domestic_stock_trading 은 import 시 KIS 비밀 설정을 요구한다.
+
+    그래서 test_domestic_safe_float 와 같이 소스에서 필요한 정의만 꺼내 컴파일한다.
+    """
+    import ast
+    import logging
+    import pathlib
+    import types
+    from typing import Any, Dict, List
+
+    source = (pathlib.Path(__file__).resolve().parents[1]
+              / "trading" / "domestic_stock_trading.py").read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    helper = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "_safe_float")
+    cls = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == "DomesticStockTrading")
+    method = next(n for n in cls.body if isinstance(n, ast.FunctionDef) and n.name == "get_multi_price")
+    limit = next(n for n in cls.body if isinstance(n, ast.Assign)
+                 and getattr(n.targets[0], "id", "") == "MULTI_PRICE_LIMIT")
+    module = types.ModuleType("_multi_price")
+    module.__dict__.update(Any=Any, Dict=Dict, List=List, logger=logging.getLogger("test"))
+    body = [helper, method, limit]
+    exec(compile(ast.Module(body=body, type_ignores=[]), "<multi_price>", "exec"), module.__dict__)
+    return module.get_multi_price, module.MULTI_PRICE_LIMIT
+
+
+def test_kis_multi_price_requests_thirty_codes_at_a_time():
+    from types import SimpleNamespace
+
+    get_multi_price, limit = _load_multi_price()
+    requests = []
+
+    def _request(api_url, tr_id, params):
+        requests.append((tr_id, params))
+        codes = [v for k, v in params.items() if k.startswith("FID_INPUT_ISCD_")]
+        output = [{"inter_shrn_iscd": c, "inter2_prpr": "1500", "prdy_ctrt": "1.2",
+                   "acml_vol": "10", "inter2_mxpr": "1950", "inter2_llam": "1050"}
+                  for c in codes if c != "000045"]
+        return SimpleNamespace(isOK=lambda: True, getBody=lambda: SimpleNamespace(output=output))
+
+    fake = SimpleNamespace(MULTI_PRICE_LIMIT=limit, _request=_request)
+    codes = [f"{i:06d}" for i in range(1, 66)]
+    rows = get_multi_price(fake, codes + codes[:3])
+
+    assert limit == 30
+    assert [len(p) // 2 for _, p in requests] == [30, 30, 5]
+    assert {tr for tr, _ in requests} == {"FHKST11300006"}
+    assert len(rows) == 64 and "000045" not in rows
+    assert rows["000001"]["current_price"] == 1500 and rows["000001"]["upper_limit"] == "1950"
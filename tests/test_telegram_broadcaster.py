@@ -0,0 +1,169 @@
+"""Rate-aware Telegram broadcaster (telegram_broadcaster.py)."""
+import asyncio
+import time
+
+import pytest
+
+import telegram_broadcaster as tb
+
+
+async def _delay(seconds):
+    # Independent of asyncio.sleep, which other tests may patch
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_later(seconds, future.set_result, None)
+    await future
+
+
+class _FloodError(Exception):
+    def __init__(self, retry_after):
+        super().__init__(f"Flood control exceeded. Retry in {retry_after} seconds")
+        self.retry_after = retry_after
+
+
+def _broadcaster(**kwargs):
+    kwargs.setdefault("sleep", _delay)
+    kwargs.setdefault("chat_period", 0.05)
+    return tb.TelegramBroadcaster(**kwargs)
+
+
+def _recorder(log):
+    def send(chat_id, text):
+        async def _send():
+            log.append((chat_id, text, time.monotonic()))
+            return text
+        return _send
+    return send
+
+
+def test_rate_limit_is_a_sliding_window():
+    limit = tb.RateLimit(2, 1.0)
+    assert [limit.reserve(10.0) for _ in range(5)] == [0.0, 0.0, 1.0, 1.0, 2.0]
+    assert limit.reserve(20.0) == 0.0
+
+
+def test_same_chat_keeps_fifo_order_and_spacing():
+    broadcaster = _broadcaster()
+    log = []
+    send = _recorder(log)
+
+    async def run():
+        return await asyncio.gather(*(broadcaster.send("@kr", send("@kr", f"m{i}")) for i in range(4)))
+
+    assert asyncio.run(run()) == ["m0", "m1", "m2", "m3"]
+    assert [text for _, text, _ in log] == ["m0", "m1", "m2", "m3"]
+    gaps = [b[2] - a[2] for a, b in zip(log, log[1:])]
+    assert min(gaps) >= 0.045
+    assert broadcaster.metrics()["sent"] == 4
+    assert broadcaster.metrics()["queued"] == 0
+
+
+def test_different_chats_send_concurrently_under_global_limit():
+    broadcaster = _broadcaster(global_rate=4, global_period=0.2)
+    log = []
+    send = _recorder(log)
+    chats = ["@en", "@ja", "@zh"]
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(
+            broadcaster.send(chat, send(chat, f"{chat}-{i}")) for i in range(2) for chat in chats
+        ))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    # Serial per-chat pacing would take >= 5 gaps; the 5th and 6th sends wait
+    # for the global window instead
+    assert elapsed < 0.5
+    assert log[4][2] - log[0][2] >= 0.19
+    for chat in chats:
+        assert [t for c, t, _ in log if c == chat] == [f"{chat}-0", f"{chat}-1"]
+
+
+def test_global_wait_does_not_shorten_the_per_chat_spacing():
+    broadcaster = _broadcaster(global_rate=1, global_period=0.1, chat_period=0.15)
+    log = []
+    send = _recorder(log)
+
+    async def run():
+        # @b and @c take the first two global slots, so @kr's first send
+        # goes out late; its second must still be a full chat period after
+        await asyncio.gather(*(
+            broadcaster.send(chat, send(chat, text))
+            for chat, text in (("@b", "b0"), ("@c", "c0"), ("@kr", "k0"), ("@kr", "k1"))
+        ))
+
+    asyncio.run(run())
+    kr = [t for c, _, t in log if c == "@kr"]
+    assert kr[1] - kr[0] >= 0.145
+
+
+def test_group_chats_get_the_per_minute_window():
+    broadcaster = _broadcaster(group_per_minute=2, group_period=0.3)
+    log = []
+    send = _recorder(log)
+
+    async def run():
+        await asyncio.gather(*(broadcaster.send("-100123", send("g", i)) for i in range(3)))
+        await asyncio.gather(*(broadcaster.send("4242", send("p", i)) for i in range(3)))
+
+    asyncio.run(run())
+    group = [t for c, _, t in log if c == "g"]
+    private = [t for c, _, t in log if c == "p"]
+    assert group[2] - group[0] >= 0.29
+    assert private[2] - private[0] < 0.2
+    assert tb.is_group_chat("@channel") and not tb.is_group_chat(4242)
+
+
+def test_retry_after_pauses_only_that_chat_and_keeps_order():
+    broadcaster = _broadcaster(chat_period=0.01)
+    log = []
+    attempts = {"n": 0}
+
+    async def flaky():
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            raise _FloodError(0.1)
+        log.append(("@kr", "first", time.monotonic()))
+        return "first"
+
+    send = _recorder(log)
+
+    async def run():
+        start = time.monotonic()
+        results = await asyncio.gather(
+            broadcaster.send("@kr", flaky),
+            broadcaster.send("@kr", send("@kr", "second")),
+            broadcaster.send("@en", send("@en", "other")),
+        )
+        return start, results
+
+    start, results = asyncio.run(run())
+    assert results == ["first", "second", "other"]
+    assert [t for c, t, _ in log if c == "@kr"] == ["first", "second"]
+    by_text = {t: at for _, t, at in log}
+    assert by_text["first"] - start >= 0.095
+    assert by_text["other"] - start < 0.05
+    metrics = broadcaster.metrics()
+    assert metrics["retry_after"] == 1
+    assert metrics["retry_after_wait_s"] == pytest.approx(0.1)
+
+
+def test_exhausted_retries_and_other_errors_reach_the_caller():
+    broadcaster = _broadcaster(max_retries=1)
+
+    async def flood():
+        raise _FloodError(0.01)
+
+    async def broken():
+        raise ValueError("bad request")
+
+    async def run():
+        with pytest.raises(_FloodError):
+            await broadcaster.send("@kr", flood)
+        with pytest.raises(ValueError):
+            await broadcaster.send("@kr", broken)
+        return await broadcaster.send("@kr", _recorder([])("@kr", "after"))
+
+    assert asyncio.run(run()) == "after"
+    assert broadcaster.metrics()["failed"] == 2
+    assert broadcaster.metrics()["retry_after"] == 1
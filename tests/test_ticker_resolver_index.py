@@ -0,0 +1,103 @@
+"""Indexed ticker lookup — spacing, 초성, typos and aliases on top of the legacy
+substring match (whose wording tests/test_ticker_resolver_contract.py pins)."""
+
+import pytest
+
+from prism_core.ticker_resolver import (
+    TickerIndex,
+    chosung,
+    index_for,
+    normalize_name,
+    resolve_ticker,
+)
+
+NAME_TO_CODE = {
+    "NAVER": "035420",
+    "SK하이닉스": "000660",
+    "삼성SDI": "006400",
+    "삼성전기": "009150",
+    "삼성전자": "005930",
+    "삼성전자우": "005935",
+    "상신전자": "263810",
+    "셀트리온": "068270",
+    "카카오": "035720",
+    "카카오뱅크": "323410",
+}
+
+
+def resolve(query, name_to_code=NAME_TO_CODE, index=None):
+    code_to_name = {code: name for name, code in name_to_code.items()}
+    return resolve_ticker(
+        query, code_to_name=code_to_name, name_to_code=name_to_code, index=index
+    )
+
+
+def test_normalization_ignores_case_width_spacing_and_punctuation():
+    assert normalize_name(" Ｓａｍｓｕｎｇ  Electronics ") == "samsungelectronics"
+    assert normalize_name("LG 에너지-솔루션") == "lg에너지솔루션"
+    assert normalize_name("ㅅㅅㅈㅈ") == "ㅅㅅㅈㅈ"
+    assert chosung("삼성전자우") == "ㅅㅅㅈㅈㅇ"
+
+
+def test_spacing_variant_resolves_to_the_exact_listing_not_the_preferred_share():
+    assert resolve("삼성 전자") == ("005930", "삼성전자", None)
+    assert resolve("sk 하이닉스") == ("000660", "SK하이닉스", None)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("ㅅㅌㄹㅇ", ("068270", "셀트리온", None)),
+        ("samsung electronics", ("005930", "삼성전자", None)),
+        ("SK Hynix", ("000660", "SK하이닉스", None)),
+        ("셀트리언", ("068270", "셀트리온", None)),
+        ("카카오뱅그", ("323410", "카카오뱅크", None)),
+    ],
+)
+def test_chosung_alias_and_typo_queries(query, expected):
+    assert resolve(query) == expected
+
+
+def test_ambiguous_chosung_lists_prefix_matches_first():
+    code, name, err = resolve("ㅅㅅㅈㅈ")
+    assert code is None and name is None
+    assert err.split(":\n", 1)[1].split("\n") == [
+        "삼성전자 (005930)",
+        "삼성전자우 (005935)",
+        "상신전자 (263810)",
+    ]
+
+
+def test_substring_matches_still_win_over_fuzzy_tiers():
+    candidates = TickerIndex(NAME_TO_CODE).search("삼성전", limit=None)
+    assert [c.match for c in candidates] == ["prefix"] * 3
+    assert [c.name for c in candidates] == ["삼성전기", "삼성전자", "삼성전자우"]
+    # '카카오' is an exact name, so the longer listings are not an ambiguity
+    assert resolve("카카오") == ("035720", "카카오", None)
+
+
+def test_typo_tolerance_needs_three_characters_and_one_edit():
+    index = TickerIndex(NAME_TO_CODE)
+    assert index.search("셀트") and index.search("셀트")[0].match == "prefix"
+    assert index.search("샐트리안") == []
+    assert [c.name for c in index.search("삼성전지")] == ["삼성전기", "삼성전자"]
+
+
+def test_codes_and_custom_aliases_resolve_through_the_index():
+    index = TickerIndex.from_stock_map(
+        {"name_to_code": {"Apple Inc.": "AAPL", **NAME_TO_CODE},
+         "aliases": {"애플": "AAPL", "ghost": "999999"}}
+    )
+    assert [(c.code, c.match) for c in index.search("aapl")] == [("AAPL", "alias")]
+    assert [(c.code, c.match) for c in index.search("애플")] == [("AAPL", "alias")]
+    assert index.search("ghost") == []
+    assert resolve("애플", {"Apple Inc.": "AAPL"}, index=index) == ("AAPL", "Apple Inc.", None)
+
+
+def test_index_is_built_once_per_map_object():
+    first = index_for(NAME_TO_CODE)
+    assert index_for(NAME_TO_CODE) is first
+    reloaded = dict(NAME_TO_CODE)
+    assert index_for(reloaded) is not first
+    reloaded["현대차"] = "005380"
+    assert len(index_for(reloaded)) == len(NAME_TO_CODE) + 1
@@ -0,0 +1,97 @@
+"""DB-thread repository for the tracking agents (prism_core/tracking_repository.py)."""
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from prism_core.tracking_repository import TrackingRepository
+from tracking.db_schema import (
+    add_scope_column_if_missing,
+    add_sector_column_if_missing,
+    add_trigger_columns_if_missing,
+    create_all_tables,
+)
+from tracking.helpers import check_sector_diversity, get_current_slots_count, is_ticker_in_holdings
+
+ACCOUNT = "vps:kr-main:01"
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    path = tmp_path / "tracking.sqlite"
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    create_all_tables(cursor, conn)
+    add_scope_column_if_missing(cursor, conn)
+    add_trigger_columns_if_missing(cursor, conn)
+    add_sector_column_if_missing(cursor, conn)
+    for ticker, sector in (("005930", "반도체"), ("000660", "반도체"), ("035420", "IT")):
+        conn.execute(
+            "INSERT INTO stock_holdings (ticker, company_name, buy_price, buy_date, current_price, "
+            "scenario, account_key, account_name, sector) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (ticker, ticker, 1000, "2026-10-01 09:00:00", 1000, f'{{"sector": "{sector}"}}',
+             ACCOUNT, "main", sector),
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_helpers_run_on_the_db_thread(db_path):
+    repo = TrackingRepository(db_path)
+    threads = []
+
+    def _where(cursor):
+        threads.append(threading.current_thread().name)
+        return cursor.execute("PRAGMA journal_mode").fetchone()[0]
+
+    async def run():
+        try:
+            return (
+                await repo.call(get_current_slots_count, account_key=ACCOUNT),
+                await repo.call(is_ticker_in_holdings, "005930", account_key=ACCOUNT),
+                await repo.call(check_sector_diversity, "반도체", 2, 0.5, account_key=ACCOUNT),
+                await repo.call(_where),
+            )
+        finally:
+            await repo.close()
+
+    assert asyncio.run(run()) == (3, True, False, "wal")
+    assert threads[0].startswith("tracking-db") and threads[0] != threading.current_thread().name
+
+
+def test_queued_price_updates_apply_in_one_flush(db_path):
+    repo = TrackingRepository(db_path)
+
+    async def run():
+        holdings = await repo.holdings(ACCOUNT)
+        for index, holding in enumerate(holdings):
+            repo.queue_price_update(holding["ticker"], ACCOUNT, 1100 + index, "2026-10-19 15:30:00")
+        assert repo.pending == 3
+        rows = await repo.flush()
+        refreshed = await repo.fetch_all(
+            "SELECT current_price FROM stock_holdings WHERE account_key = ? ORDER BY id", (ACCOUNT,)
+        )
+        await repo.close()
+        return rows, refreshed
+
+    rows, refreshed = asyncio.run(run())
+    assert rows == 3
+    assert [r["current_price"] for r in refreshed] == [1100, 1101, 1102]
+    assert repo.stats["flushes"] == 1 and repo.pending == 0
+
+
+def test_failed_flush_applies_nothing(db_path):
+    repo = TrackingRepository(db_path)
+
+    async def run():
+        repo.queue_price_update("005930", ACCOUNT, 2000, "2026-10-19 15:30:00")
+        repo.queue("UPDATE missing_table SET x = ?", (1,))
+        with pytest.raises(sqlite3.OperationalError):
+            await repo.flush()
+        row = await repo.fetch_one("SELECT current_price FROM stock_holdings WHERE ticker = ?", ("005930",))
+        await repo.close()
+        return row
+
+    assert asyncio.run(run())["current_price"] == 1000
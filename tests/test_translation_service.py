@@ -0,0 +1,220 @@
+"""Concurrent translation with persistent translation memory (cores/translation_service.py)."""
+import asyncio
+import sys
+import types
+
+import pytest
+
+from cores import translation_service as ts
+
+
+class _FakeLLM:
+    """Tags text with the target language after a delay; records every call."""
+
+    def __init__(self, delay=0.05, fail_on=None, drop_placeholders=False):
+        self.calls = []
+        self.delay = delay
+        self.fail_on = fail_on
+        self.drop_placeholders = drop_placeholders
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, text, model, from_lang, to_lang):
+        self.calls.append((text, to_lang))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await _delay(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.fail_on and self.fail_on in text:
+            raise RuntimeError("quota exceeded")
+        if self.drop_placeholders and "<<<__VAR_" in text:
+            return "lost the numbers"
+        return f"[{to_lang}] {text}"
+
+
+async def _delay(seconds):
+    # Independent of asyncio.sleep, which other tests may patch
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_later(seconds, future.set_result, None)
+    await future
+
+
+@pytest.fixture()
+def memory(tmp_path):
+    return ts.TranslationMemory(tmp_path / "tm.sqlite")
+
+
+def test_template_split_masks_numbers_and_dates_but_not_image_placeholders():
+    message = "삼성전자(005930) +3.2% 1,000원 2025.01.10 <<<__BASE64_IMAGE_0__>>>"
+    template, values = ts.split_template(message)
+
+    assert values == ["005930", "+3.2%", "2025.01.10"]
+    assert "<<<__BASE64_IMAGE_0__>>>" in template and "1,000원" in template
+    assert ts.fill_template(template, values) == message
+    assert ts.fill_template("<<<__VAR_0__>>> only", values) is None
+
+
+def test_amounts_with_korean_units_stay_in_the_boilerplate():
+    template, values = ts.split_template("거래대금 1,234억원, 시가총액 3.2조, 목표가 8만원 (+4.5%)")
+
+    assert values == ["+4.5%"]
+    assert template == "거래대금 1,234억원, 시가총액 3.2조, 목표가 8만원 (<<<__VAR_0__>>>)"
+
+
+def test_messages_differing_only_in_numbers_share_one_translation(memory):
+    llm = _FakeLLM()
+    service = ts.TranslationService(llm, memory=memory)
+
+    async def run():
+        first = await service.translate("매수 신호: 가격 71,300 (+2.1%)", "m", "ko", "en")
+        second = await service.translate("매수 신호: 가격 68,900 (-0.4%)", "m", "ko", "en")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == "[en] 매수 신호: 가격 71,300 (+2.1%)"
+    assert second == "[en] 매수 신호: 가격 68,900 (-0.4%)"
+    assert len(llm.calls) == 1
+    assert service.stats["memory_hits"] == 1
+
+
+def test_memory_persists_across_service_instances(memory):
+    llm = _FakeLLM(delay=0)
+    asyncio.run(ts.TranslationService(llm, memory=memory).translate("안녕하세요", "m"))
+    again = ts.TranslationService(llm, memory=memory)
+    assert asyncio.run(again.translate("안녕하세요", "m")) == "[en] 안녕하세요"
+    assert len(llm.calls) == 1
+    assert memory.stats() == {"entries": 1, "hits": 1}
+
+    # A different model is a different memory key
+    asyncio.run(again.translate("안녕하세요", "other-model"))
+    assert len(llm.calls) == 2
+
+
+def test_memory_runs_off_the_event_loop_and_creates_its_table_once(tmp_path):
+    import threading
+
+    threads = []
+    ddl_runs = []
+
+    class _TrackedMemory(ts.TranslationMemory):
+        def get(self, *args):
+            threads.append(threading.get_ident())
+            return super().get(*args)
+
+        def put(self, *args):
+            threads.append(threading.get_ident())
+            return super().put(*args)
+
+    memory = _TrackedMemory(tmp_path / "tm.sqlite")
+    real_connect = memory._connect
+
+    def counting_connect():
+        ready = memory._schema_ready
+        conn = real_connect()
+        if not ready:
+            ddl_runs.append(1)
+        return conn
+
+    memory._connect = counting_connect
+    service = ts.TranslationService(_FakeLLM(delay=0), memory=memory)
+
+    async def run():
+        await service.translate("안녕하세요", "m")
+        await service.translate("안녕하세요", "m")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 3 and loop_thread not in threads
+    assert len(ddl_runs) == 1
+
+
+def test_fan_out_is_concurrent_bounded_and_single_flight(memory):
+    llm = _FakeLLM(delay=0.05)
+    service = ts.TranslationService(llm, memory=memory, concurrency=3)
+    messages = [f"메시지 {chr(0xAC00 + i)}" for i in range(6)] + ["메시지 가"]
+
+    async def run():
+        return await service.translate_many(messages, ["en", "ja"], "m")
+
+    result = asyncio.run(run())
+    assert result["ja"][0] == "[ja] 메시지 가"
+    assert len(result["en"]) == 7
+    assert len(llm.calls) == 12  # duplicate message shares its in-flight call
+    assert llm.peak == 3
+
+
+def test_cancelled_caller_does_not_cancel_waiters_on_the_same_translation(memory):
+    llm = _FakeLLM(delay=0.05)
+    service = ts.TranslationService(llm, memory=memory)
+
+    async def run():
+        owner = asyncio.create_task(service.translate_or_original("안녕하세요", "m"))
+        await _delay(0.01)
+        waiters = [asyncio.create_task(service.translate_or_original("안녕하세요", "m")) for _ in range(2)]
+        await _delay(0.01)
+        owner.cancel()
+        return await asyncio.gather(*waiters), owner
+
+    results, owner = asyncio.run(run())
+    assert owner.cancelled()
+    assert results == ["[en] 안녕하세요", "[en] 안녕하세요"]
+    assert len(llm.calls) == 2  # the cancelled call, then one shared retry
+    assert service.stats["failures"] == 0
+
+
+def test_failures_fall_back_to_original_and_are_not_memorised(memory):
+    llm = _FakeLLM(delay=0, fail_on="실패")
+    service = ts.TranslationService(llm, memory=memory)
+
+    result = asyncio.run(service.translate_many(["성공", "실패"], ["en"], "m"))
+
+    assert result["en"] == ["[en] 성공", "실패"]
+    assert memory.stats()["entries"] == 1
+    assert service.stats["failures"] == 1
+
+
+def test_lost_placeholders_fall_back_to_full_message(memory):
+    llm = _FakeLLM(delay=0, drop_placeholders=True)
+    service = ts.TranslationService(llm, memory=memory)
+
+    assert asyncio.run(service.translate("수익률 12.5%", "m")) == "[en] 수익률 12.5%"
+    assert service.stats["template_fallbacks"] == 1
+
+
+def test_tracking_broadcast_sends_each_channel_in_order(monkeypatch, memory):
+    from tracking.telegram import TelegramSender
+
+    llm = _FakeLLM(delay=0.02)
+    service = ts.TranslationService(llm, memory=memory)
+    fake_agent = types.ModuleType("cores.agents.telegram_translator_agent")
+    fake_agent.schedule_telegram_translations = (
+        lambda messages, langs, model="m", from_lang="ko": service.schedule(messages, langs, model, from_lang)
+    )
+    monkeypatch.setitem(sys.modules, "cores.agents.telegram_translator_agent", fake_agent)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    class _Config:
+        broadcast_languages = ["en", "ja", "zh"]
+
+        def get_broadcast_channel_id(self, lang):
+            return None if lang == "zh" else f"@{lang}"
+
+    sent = []
+    sender = TelegramSender(bot=None, config=_Config())
+
+    async def fake_send(channel_id, text, msg_type=None):
+        sent.append((channel_id, text))
+
+    sender._send_single_message = fake_send
+    asyncio.run(sender.send_to_translation_channels(["첫째", "둘째"]))
+
+    assert [t for c, t in sent if c == "@en"] == ["[en] 첫째", "[en] 둘째"]
+    assert [t for c, t in sent if c == "@ja"] == ["[ja] 첫째", "[ja] 둘째"]
+    assert len(llm.calls) == 4
+
+
+async def _no_sleep(delay, *args, **kwargs):
+    # Skip the 1s send pacing
+    await _delay(0)
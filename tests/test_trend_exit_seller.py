@@ -21,6 +21,7 @@ import asyncio
 import os
 import sys
 import sqlite3
+from datetime import date, timedelta
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -165,6 +166,7 @@ def tmp_db(tmp_path, monkeypatch):
     conn.commit()
     conn.close()
     monkeypatch.setattr(lb, "DB_PATH", str(db))
+    monkeypatch.setattr(lb, "_baseline_failed_at", {})
     return str(db)
 
 
@@ -198,7 +200,10 @@ def _patch(monkeypatch, trader, agent_holder=None, make_agent_counter=None,
         ),
     )
     # Network-free: fixed ma_50 + regime.
-    monkeypatch.setattr(lb, "_fetch_ma50", lambda market, ticker: ma50)
+    monkeypatch.setattr(
+        lb, "_compute_baseline",
+        lambda market, ticker, session_date: {"ma_50": ma50},
+    )
     monkeypatch.setattr(lb, "_compute_live_regime", lambda market: regime)
 
     async def _fake_make_agent(market):
@@ -897,6 +902,111 @@ def test_ledger_failure_after_broker_success_records_unknown(tmp_db, monkeypatch
     assert _inflight(tmp_db, "REJECTED") == 0
 
 
+# ── Daily baselines: computed once per session, read by every checkpoint ───────
+def _closes(close, days=60, start=date(2026, 7, 1)):
+    """Daily (date, close) pairs at a flat close."""
+    return [((start + timedelta(days=i)).isoformat(), close) for i in range(days)]
+
+
+def _count_fetches(monkeypatch, close=105.0, regime="moderate_bull"):
+    fetches = {"bars": 0, "regime": 0}
+
+    def _fetch_daily_closes(market, ticker):
+        fetches["bars"] += 1
+        return _closes(close)
+
+    def _compute_live_regime(market):
+        fetches["regime"] += 1
+        return regime
+
+    monkeypatch.setattr(lb, "_fetch_daily_closes", _fetch_daily_closes)
+    monkeypatch.setattr(lb, "_compute_live_regime", _compute_live_regime)
+    return fetches
+
+
+def test_baseline_uses_completed_sessions_only():
+    closes = [(d, c + i) for i, (d, c) in enumerate(_closes(100.0, days=60))]
+    session = closes[-1][0]
+    closes[-1] = (session, 500.0)  # today's partial bar must not count
+
+    baseline = lb._baseline_from_closes(closes, session)
+
+    done = [c for _, c in closes[:-1]]
+    assert baseline == {"ma_50": pytest.approx(sum(done[-50:]) / 50)}
+    assert lb._baseline_from_closes(closes[-1:], session) is None  # nothing completed yet
+    assert lb._baseline_from_closes(closes[:10], session) == {"ma_50": 0.0}
+
+
+def test_preopen_baselines_leave_checkpoints_without_downloads(tmp_db, monkeypatch):
+    _enable(monkeypatch, live=False, confirm=1)
+    _seed(tmp_db, [_row(1, "005930", 100.0)])
+    trader = FakeTrader({"005930": 98.0})
+    compute_baseline = lb._compute_baseline
+    _patch(monkeypatch, trader, agent_holder=FakeAgent([]))
+    monkeypatch.setattr(lb, "_compute_baseline", compute_baseline)
+    fetches = _count_fetches(monkeypatch)
+
+    built = asyncio.run(lb.build_baselines("KR"))
+    assert built["stored"] == 1 and built["regime"] == "moderate_bull"
+    assert fetches == {"bars": 1, "regime": 1}
+
+    s1 = asyncio.run(lb.run_market("KR", "run1"))
+    s2 = asyncio.run(lb.run_market("KR", "run2"))
+
+    assert fetches == {"bars": 1, "regime": 1}
+    assert s1["signaled"] == 1 and s2["signaled"] == 1  # 98 below the stored 50MA of 105
+
+
+def test_missing_baseline_is_computed_once_and_reused_all_session(tmp_db, monkeypatch):
+    _enable(monkeypatch, live=False, confirm=2)
+    _seed(tmp_db, [_row(1, "005930", 100.0)])
+    trader = FakeTrader({"005930": 98.0})
+    compute_baseline = lb._compute_baseline
+    _patch(monkeypatch, trader, agent_holder=FakeAgent([]))
+    monkeypatch.setattr(lb, "_compute_baseline", compute_baseline)
+    fetches = _count_fetches(monkeypatch)
+
+    asyncio.run(lb.run_market("KR", "run1"))
+    asyncio.run(lb.run_market("KR", "run2"))
+
+    assert fetches == {"bars": 1, "regime": 1}
+    conn = sqlite3.connect(tmp_db)
+    try:
+        rows = conn.execute(
+            "SELECT session_date, ma_50 FROM loop_b_exit_baselines WHERE ticker='005930'"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert rows == [(lb._session_date("KR"), 105.0)]
+
+
+def test_failed_baseline_fetch_is_retried_only_after_the_retry_interval(tmp_db, monkeypatch):
+    _enable(monkeypatch, live=False, confirm=2)
+    _seed(tmp_db, [_row(1, "005930", 100.0)])
+    trader = FakeTrader({"005930": 98.0})
+    compute_baseline = lb._compute_baseline
+    _patch(monkeypatch, trader, agent_holder=FakeAgent([]))
+    monkeypatch.setattr(lb, "_compute_baseline", compute_baseline)
+    fetches = _count_fetches(monkeypatch, regime=None)
+
+    def _failing_fetch(market, ticker):
+        fetches["bars"] += 1
+        return []
+
+    monkeypatch.setattr(lb, "_fetch_daily_closes", _failing_fetch)
+    clock = [1000.0]
+    monkeypatch.setattr(lb.time, "monotonic", lambda: clock[0])
+
+    asyncio.run(lb.run_market("KR", "run1"))
+    asyncio.run(lb.run_market("KR", "run2"))
+    assert fetches == {"bars": 1, "regime": 1}
+
+    clock[0] += lb.BASELINE_RETRY_SEC
+    summary = asyncio.run(lb.run_market("KR", "run3"))
+    assert fetches == {"bars": 2, "regime": 2}
+    assert summary["checked"] == 1 and summary["signaled"] == 0  # dormant TIER1.5, no sell
+
+
 # ── Guards ─────────────────────────────────────────────────────────────────────
 def test_pyramided_ticker_is_skipped(tmp_db, monkeypatch):
     _enable(monkeypatch, live=False, confirm=1, close_window=True)
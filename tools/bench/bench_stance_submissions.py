@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Load-test concurrent /stances submissions against a file-backed ledger.
+
+Each client is one registered strategy posting its own `seq` sequence through
+the FastAPI app, so the run exercises what production does: the threadpool
+handlers, per-strategy admission, the ledger's group-commit writer and the
+read-only connection pool. Every client count gets a fresh ledger file.
+
+What has to hold:
+
+1. every submission is admitted, none is lost or reordered   — seq per strategy
+                                                               is contiguous
+2. the stance and quote hash chains verify afterwards
+3. throughput grows with the client count                    — concurrent
+                                                               submissions share
+                                                               commits instead of
+                                                               queueing on one lock
+
+Usage:  python3 tools/bench/bench_stance_submissions.py [--clients 1,2,4,8,16]
+            [--per-client 50] [--quote-ms 5] [--dir /path/on/real/disk]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from stance.server import Ledger, Quote  # noqa: E402
+from stance.server import api as api_module  # noqa: E402
+from stance.server.service import RateLimit, StanceService  # noqa: E402
+
+SYMBOLS = ["005930", "000660", "035420", "051910", "068270"]
+
+
+def _quote_provider(delay: float):
+    def provider(market: str, symbol: str) -> Quote:
+        if delay:
+            time.sleep(delay)  # the provider round-trip the handler waits on
+        return Quote(symbol, Decimal(10000))
+    return provider
+
+
+def run(clients: int, per_client: int, quote_ms: float, directory: Path) -> dict:
+    ledger = Ledger(directory / f"bench_{clients}.db")
+    service = StanceService(
+        ledger=ledger,
+        quote_provider=_quote_provider(quote_ms / 1000),
+        rate_limit=RateLimit(per_minute=10**6, per_day=10**6),
+    )
+    api_module.set_service(service)
+    keys = [
+        service.register(f"bench-{i}", f"Bench {i}", f"@bench{i}").api_key
+        for i in range(clients)
+    ]
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(clients + 1)
+
+    def client(index: int) -> None:
+        headers = {"Authorization": f"Bearer {keys[index]}"}
+        mine: list[float] = []
+        # One open client per thread keeps its event-loop portal alive, so the
+        # measurement is the server path rather than per-request loop startup
+        with TestClient(api_module.app) as http:
+            start_gate.wait()
+            for seq in range(1, per_client + 1):
+                body = {"seq": seq, "kind": "set", "symbol": SYMBOLS[seq % len(SYMBOLS)],
+                        "target_weight": "0.1", "reason": "bench"}
+                t0 = time.perf_counter()
+                r = http.post("/stances", json=body, headers=headers)
+                mine.append(time.perf_counter() - t0)
+                if r.status_code != 200:
+                    with lock:
+                        errors.append(f"{index}/{seq}: {r.status_code} {r.text[:80]}")
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    start_gate.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    contiguous = all(
+        ledger.next_seq(f"bench-{i}") == per_client + 1 for i in range(clients)
+    )
+    result = {
+        "clients": clients,
+        "submissions": clients * per_client,
+        "elapsed": elapsed,
+        "throughput": clients * per_client / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+        "batches": ledger.stats["batches"],
+        "appends": ledger.stats["appends"],
+        "errors": errors,
+        "ok": (not errors and contiguous
+               and ledger.verify_chain("stances") and ledger.verify_chain("quotes")),
+    }
+    api_module.set_service(None)  # type: ignore[arg-type]
+    ledger.close()
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", default="1,2,4,8,16")
+    parser.add_argument("--per-client", type=int, default=50)
+    parser.add_argument("--quote-ms", type=float, default=5.0,
+                        help="simulated quote-provider latency per submission")
+    parser.add_argument("--dir", help="directory for the ledger files (default: a temp dir)")
+    args = parser.parse_args(argv)
+    counts = [int(c) for c in args.clients.split(",") if c.strip()]
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = [run(n, args.per_client, args.quote_ms, Path(tmp)) for n in counts]
+
+    print(f"{'clients':>7} {'subs':>6} {'subs/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'appends/commit':>15}  ok")
+    for r in results:
+        per_commit = r["appends"] / r["batches"] if r["batches"] else 0.0
+        print(f"{r['clients']:>7} {r['submissions']:>6} {r['throughput']:>9.1f} "
+              f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {per_commit:>15.2f}  "
+              f"{'yes' if r['ok'] else 'NO'}")
+        for e in r["errors"][:5]:
+            print(f"        {e}")
+
+    failures = [r for r in results if not r["ok"]]
+    if len(results) > 1 and results[-1]["throughput"] <= results[0]["throughput"]:
+        print("throughput did not grow with the client count")
+        return 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
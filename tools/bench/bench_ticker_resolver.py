@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark name lookups: the old linear scan vs. the prebuilt TickerIndex.
+
+The universe is the KRX map from stock_map.json plus a synthetic US listing
+set (there is no US name map in the repo, so names and tickers are generated
+with a fixed seed to a realistic size). Queries are drawn per kind:
+
+    exact      a listed name as typed
+    partial    a 2-4 character slice of a name
+    spacing    a Korean name with a space inserted
+    chosung    the initial consonants of a Korean name
+    typo       a name with one character replaced
+    miss       text that is in no name
+
+What has to hold:
+
+1. the index answers every kind in well under a millisecond   — p99 < 1 ms
+2. it finds every exact and partial query the scan finds       — same hits
+   (measured through TickerIndex.resolve, the path the bots take:
+   the top five matches plus the total for the ambiguity message)
+3. spacing / chosung / typo queries, which the scan misses,
+   resolve to the intended listing most of the time
+
+Usage:  python3 tools/bench/bench_ticker_resolver.py [--stock-map stock_map.json]
+            [--us 8000] [--queries 300] [--seed 7]
+"""
+import argparse
+import json
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from prism_core.ticker_resolver import TickerCandidate, TickerIndex, chosung  # noqa: E402
+
+US_WORDS = [
+    "Apex", "Atlas", "Beacon", "Blue", "Bright", "Cedar", "Civic", "Coastal",
+    "Crest", "Delta", "Eagle", "Echo", "Evergreen", "First", "Frontier",
+    "Golden", "Granite", "Harbor", "Horizon", "Iron", "Keystone", "Liberty",
+    "Lumen", "Meridian", "Nova", "Oak", "Pacific", "Peak", "Pioneer", "Prime",
+    "Quantum", "Redwood", "River", "Sierra", "Silver", "Summit", "Sun",
+    "Titan", "Union", "Vertex", "Vista", "West",
+]
+US_SECTORS = [
+    "Bancorp", "Biosciences", "Capital", "Energy", "Foods", "Health",
+    "Holdings", "Industries", "Labs", "Logistics", "Materials", "Media",
+    "Networks", "Pharmaceuticals", "Realty", "Semiconductor", "Software",
+    "Systems", "Technologies", "Therapeutics",
+]
+US_SUFFIXES = ["Inc.", "Corp.", "Co.", "Group", "Ltd.", "plc"]
+
+
+def us_universe(count: int, rng: random.Random) -> dict:
+    names: dict = {}
+    tickers: set = set()
+    while len(names) < count:
+        name = " ".join([rng.choice(US_WORDS), rng.choice(US_WORDS),
+                         rng.choice(US_SECTORS), rng.choice(US_SUFFIXES)])
+        if name in names:
+            continue
+        ticker = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 5)))
+        if ticker in tickers:
+            continue
+        tickers.add(ticker)
+        names[name] = ticker
+    return names
+
+
+def legacy_lookup(query: str, name_to_code: dict) -> list:
+    """The pre-index resolve_ticker name path: exact check, then a full scan."""
+    if query in name_to_code:
+        return [(query, name_to_code[query])]
+    matches = []
+    for name, code in name_to_code.items():
+        if not isinstance(name, str) or not isinstance(code, str):
+            continue
+        if query.lower() in name.lower():
+            matches.append((name, code))
+    return matches
+
+
+def _is_hangul(name: str) -> bool:
+    return all("가" <= ch <= "힣" for ch in name)
+
+
+def make_queries(kr: dict, universe: dict, count: int, rng: random.Random) -> dict:
+    names = list(universe)
+    korean = [n for n in kr if _is_hangul(n) and len(n) >= 4]
+    hangul = [chr(c) for c in range(0xAC00, 0xD7A4, 97)]
+    queries = {"exact": [], "partial": [], "spacing": [], "chosung": [],
+               "typo": [], "miss": []}
+    for _ in range(count):
+        name = rng.choice(names)
+        queries["exact"].append((name, name))
+        start = rng.randrange(max(1, len(name) - 2))
+        queries["partial"].append((name[start:start + rng.randint(2, 4)], None))
+        target = rng.choice(korean)
+        cut = rng.randint(1, len(target) - 1)
+        queries["spacing"].append((f"{target[:cut]} {target[cut:]}", target))
+        queries["chosung"].append((chosung(target), target))
+        pos = rng.randrange(len(target))
+        queries["typo"].append((target[:pos] + rng.choice(hangul) + target[pos + 1:], target))
+        queries["miss"].append(("".join(rng.choices("zqxjv", k=6)), None))
+    return queries
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run_kind(queries: list, universe: dict, index: TickerIndex) -> dict:
+    legacy_us, index_us, same, intended = [], [], 0, 0
+    for query, target in queries:
+        start = time.perf_counter()
+        old = legacy_lookup(query, universe)
+        legacy_us.append((time.perf_counter() - start) * 1e6)
+        start = time.perf_counter()
+        # resolve_ticker's path: the dict check it keeps, then the index
+        if query in universe:
+            top, total = [TickerCandidate(query, universe[query], "exact")], 1
+        else:
+            top, total = index.resolve(query)
+        index_us.append((time.perf_counter() - start) * 1e6)
+        # Normalizing only adds substring matches, never drops one; an exact
+        # name, alias or ticker hit resolves on its own.
+        same += total >= len(old) or top[0].match in ("exact", "alias")
+        if target is not None and top and top[0].name == target:
+            intended += 1
+    return {
+        "legacy_p50": statistics.median(legacy_us),
+        "index_p50": statistics.median(index_us),
+        "index_p99": _percentile(index_us, 0.99),
+        "superset": same / len(queries),
+        "top1": intended / len(queries),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stock-map", default=str(ROOT / "stock_map.json"))
+    parser.add_argument("--us", type=int, default=8000, help="synthetic US listings")
+    parser.add_argument("--queries", type=int, default=300, help="queries per kind")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    with open(args.stock_map, encoding="utf-8") as f:
+        kr = json.load(f).get("name_to_code", {})
+    universe = {**kr, **us_universe(args.us, rng)}
+
+    start = time.perf_counter()
+    index = TickerIndex(universe)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"universe {len(universe)} names ({len(kr)} KRX + {args.us} US), "
+          f"index build {build_ms:.1f} ms")
+
+    failed = False
+    print(f"{'kind':>8} {'scan p50 us':>12} {'index p50 us':>13} {'index p99 us':>13} "
+          f"{'speedup':>8} {'superset':>9} {'top-1':>6}")
+    for kind, queries in make_queries(kr, universe, args.queries, rng).items():
+        r = run_kind(queries, universe, index)
+        speedup = r["legacy_p50"] / r["index_p50"] if r["index_p50"] else float("inf")
+        print(f"{kind:>8} {r['legacy_p50']:>12.1f} {r['index_p50']:>13.1f} "
+              f"{r['index_p99']:>13.1f} {speedup:>7.1f}x {r['superset']:>9.0%} "
+              f"{r['top1']:>6.0%}")
+        failed |= r["index_p99"] >= 1000 or r["superset"] < 1
+    if failed:
+        print("index slower than 1 ms at p99 or missed a scan hit")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,22 +14,162 @@ it to every user on the box.
 Prints NEW when the queue accepted the event and DUPLICATE when it already had
 it. Both mean the caller is done: `campaign_id` is UNIQUE and the insert is
 INSERT OR IGNORE, so re-sending is a no-op by design.
+
+With --stream, one session carries a whole forward run instead: stdin is a
+sequence of length-framed JSON messages (see `messaging.campaign_forwarder`)
+and stdout gets one NEW/DUPLICATE/ERROR frame per event as it lands. Report
+artifacts arrive in the same stream, inline or as chunks ahead of their event,
+and are written under --artifact-root before the event is enqueued. An
+artifact that does not check out fails only its own event.
 """
 
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
 import json
 import os
+import re
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from messaging.campaign_forwarder import encode_frame, read_frame
 from messaging.local_campaign_queue import SQLiteBatchCampaignQueue
 
 DEFAULT_QUEUE = "/var/lib/prism-kakao/prism_campaign_queue.sqlite"
 
+# The forwarder names artifacts by hash; anything else is refused rather than
+# joined onto the artifact root.
+_ARTIFACT_NAME = re.compile(r"[0-9a-f]{16}\.pdf")
+
+
+@dataclass
+class _PartialArtifact:
+    path: Path
+    handle: IO[bytes]
+    digest: Any = field(default_factory=hashlib.sha256)
+    size: int = 0
+
+    def append(self, data: bytes) -> None:
+        self.handle.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+
+    def discard(self) -> None:
+        self.handle.close()
+        self.path.unlink(missing_ok=True)
+
+
+class _ArtifactWriter:
+    def __init__(self, root: Path | None) -> None:
+        self._root = root
+        self._partial: dict[str, _PartialArtifact] = {}
+        self._broken: dict[str, str] = {}
+
+    def _open(self, name: str) -> _PartialArtifact:
+        if self._root is None:
+            raise ValueError("no --artifact-root on this host")
+        if not _ARTIFACT_NAME.fullmatch(name):
+            raise ValueError(f"refusing artifact name {name!r}")
+        self.discard(name)
+        path = self._root / f".{name}.part"
+        partial = self._partial[name] = _PartialArtifact(path, path.open("wb"))
+        return partial
+
+    def chunk(self, frame: dict) -> None:
+        name = str(frame.get("name"))
+        offset = frame.get("offset")
+        try:
+            if offset == 0:
+                self._broken.pop(name, None)
+                partial = self._open(name)
+            elif name in self._broken:
+                return
+            else:
+                partial = self._partial.get(name)
+                if partial is None or offset != partial.size:
+                    raise ValueError(f"chunk at offset {offset} is out of order")
+            partial.append(base64.b64decode(str(frame.get("data")), validate=True))
+        except (OSError, ValueError) as exc:
+            self.discard(name)
+            self._broken[name] = str(exc) or type(exc).__name__
+
+    def commit(self, artifact: dict) -> None:
+        name = str(artifact.get("name"))
+        if "data" in artifact:
+            data = base64.b64decode(str(artifact["data"]), validate=True)
+            self._open(name).append(data)
+        partial = self._partial.pop(name, None)
+        if partial is None:
+            raise ValueError(
+                f"artifact {name} incomplete: {self._broken.pop(name, 'no chunks')}"
+            )
+        try:
+            partial.handle.close()
+            if (partial.size, partial.digest.hexdigest()) != (
+                artifact.get("size"),
+                artifact.get("sha256"),
+            ):
+                raise ValueError(f"artifact {name} does not match its checksum")
+            partial.path.chmod(0o644)
+            partial.path.replace(partial.path.with_name(name))
+        except BaseException:
+            partial.discard()
+            raise
+
+    def discard(self, name: str | None = None) -> None:
+        names = list(self._partial) if name is None else [name]
+        for key in names:
+            partial = self._partial.pop(key, None)
+            if partial is not None:
+                partial.discard()
+
+
+def serve_stream(
+    queue: SQLiteBatchCampaignQueue,
+    stdin: IO[bytes],
+    stdout: IO[bytes],
+    *,
+    artifact_root: Path | None,
+) -> int:
+    """Enqueue framed events until end of input; returns how many were seen."""
+    artifacts = _ArtifactWriter(artifact_root)
+    events = 0
+    try:
+        while (frame := read_frame(stdin)) is not None:
+            kind = frame.get("kind")
+            if kind == "chunk":
+                artifacts.chunk(frame)
+                continue
+            if kind != "event":
+                raise ValueError(f"unknown frame kind {kind!r}")
+            events += 1
+            try:
+                if frame.get("artifact") is not None:
+                    artifacts.commit(frame["artifact"])
+                accepted = queue.enqueue(frame["payload"])
+            except (KeyError, OSError, TypeError, ValueError) as exc:
+                ack = {
+                    "seq": frame.get("seq"),
+                    "status": "ERROR",
+                    "error": str(exc) or type(exc).__name__,
+                }
+            else:
+                ack = {
+                    "seq": frame.get("seq"),
+                    "status": "NEW" if accepted else "DUPLICATE",
+                }
+            stdout.write(encode_frame(ack))
+            stdout.flush()
+    finally:
+        artifacts.discard()
+    return events
+
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -37,8 +177,31 @@ def main(argv: list[str] | None = None) -> int:
         "--queue-path",
         default=os.getenv("PRISM_CAMPAIGN_QUEUE_PATH", DEFAULT_QUEUE),
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read framed events until end of input, acknowledging each",
+    )
+    parser.add_argument(
+        "--artifact-root",
+        default=None,
+        help="directory report artifacts are written into (with --stream)",
+    )
     args = parser.parse_args(argv)
 
+    if args.stream:
+        artifact_root = (
+            Path(args.artifact_root).expanduser() if args.artifact_root else None
+        )
+        with SQLiteBatchCampaignQueue(Path(args.queue_path).expanduser()) as queue:
+            serve_stream(
+                queue,
+                sys.stdin.buffer,
+                sys.stdout.buffer,
+                artifact_root=artifact_root,
+            )
+        return 0
+
     payload = json.load(sys.stdin)
     with SQLiteBatchCampaignQueue(Path(args.queue_path).expanduser()) as queue:
         accepted = queue.enqueue(payload)
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""Exit monitor — one event-driven daemon for the three intraday exit loops (LLM-free).
+
+Hardstop, Trend-exit and Fill-chaser each run as a cron job that starts a fresh
+process, reloads every holding, asks KIS for one REST price per ticker and
+exits. A -7% breach therefore waits for the next */7 slot to be seen, and every
+slot re-pays process start, agent imports and N price round-trips. This daemon
+runs once per session instead:
+
+  - holdings and open orders are kept in memory; holdings are reloaded when the
+    tracking DB changes (SQLite `PRAGMA data_version`, polled every few seconds)
+    and open orders are re-inquired every EXIT_MONITOR_ORDERS_SECONDS and right
+    after a chase;
+  - prices arrive as pushed ticks from a pluggable quote stream
+    (prism_core/quote_stream.py): the KIS real-time trade feed, a REST poll
+    fallback, or a recorded session replayed from a file;
+  - every tick is evaluated against the rules that care about that ticker.
+
+The decisions and the order paths are the cron tools' own code, imported, not
+re-implemented — so the owner_lock / inflight tables, SHADOW/LIVE flags, grace
+windows and telegram flushes behave exactly as they do under cron:
+
+    hardstop     TIER1 stop, evaluated on EVERY tick (the latency win)
+    trend_exit   TIER1.5/2/3, evaluated on the checkpoint cadence
+                 (EXIT_MONITOR_TREND_SECONDS, default 10 min; 5 min in the close
+                 window). The breach-streak gate counts checkpoints, so it
+                 deliberately does NOT run per tick — that would turn a single
+                 intraday dip into a "confirmed" breach. MA50 and regime are
+                 the session baselines trend_exit_seller --baseline stored.
+    fill_chaser  each open order at most every FILL_CHASER_CHASE_AFTER_SEC,
+                 priced off the latest tick (no REST read)
+
+SAFETY: unchanged from the cron tools — each rule is SHADOW unless its own
+*_LIVE flag is set and is off when its own *_ENABLED flag is false. Actions
+run one at a time (they share the SQLite connections and the tracking agent)
+on background tasks, so a slow sell never stalls tick evaluation; a ticker
+with an action in flight is not re-evaluated until it finishes, and a rule
+that fired for a ticker stays quiet for EXIT_MONITOR_COOLDOWN_SECONDS.
+
+Usage:
+    python tools/exit_monitor.py [--market kr|us|both] [--feed kis|poll|replay]
+                                 [--replay ticks.jsonl] [--until HH:MM]
+
+Intended cron (replaces the three per-loop lines; one process per market,
+--market both fans out) — the daemon exits at --until (session close):
+    55 8 * * 1-5    cd /root/prism-insight && python tools/exit_monitor.py --market kr
+    25 22 * * 1-5   cd /root/prism-insight && python tools/exit_monitor.py --market us
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import signal
+import sqlite3
+import sys
+import uuid
+from datetime import datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+TOOLS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = TOOLS_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools import fill_chaser, hardstop_seller, trend_exit_seller  # noqa: E402
+
+logger = logging.getLogger("exit_monitor")
+
+
+# ── Configuration (env-driven) ────────────────────────────────────────────────
+def _env(suffix: str, default: str) -> str:
+    return os.getenv(f"EXIT_MONITOR_{suffix}", default)
+
+
+TREND_SECONDS = float(_env("TREND_SECONDS", "600"))           # trend-exit checkpoint cadence
+CLOSE_WINDOW_SECONDS = float(_env("CLOSE_WINDOW_SECONDS", "300"))  # cadence inside the close window
+ORDERS_SECONDS = float(_env("ORDERS_SECONDS", "30"))          # open-order re-inquiry
+RELOAD_SECONDS = float(_env("RELOAD_SECONDS", "5"))           # holdings change check
+COOLDOWN_SECONDS = float(_env("COOLDOWN_SECONDS", "300"))     # per (rule, ticker) re-fire
+POLL_SECONDS = float(_env("POLL_SECONDS", "5"))               # --feed poll interval
+
+# Trend-exit close-confirmation windows (the close-window cron lines), market-local.
+_CLOSE_WINDOWS = {
+    "KR": (ZoneInfo("Asia/Seoul"), time(15, 10), time(15, 20)),
+    "US": (ZoneInfo("America/New_York"), time(15, 50), time(16, 0)),
+}
+_SESSION_END = {"KR": "15:30", "US": "16:00"}
+
+RULES = ("hardstop", "trend_exit", "fill_chaser")
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def in_close_window(market: str, at: datetime) -> bool:
+    tz, start, end = _CLOSE_WINDOWS[market]
+    local = at.astimezone(tz).time()
+    return start <= local < end
+
+
+def enabled_rules() -> Tuple[str, ...]:
+    flags = {
+        "hardstop": hardstop_seller.HARDSTOP_ENABLED,
+        "trend_exit": trend_exit_seller.TREND_EXIT_ENABLED,
+        "fill_chaser": fill_chaser.FILL_CHASER_ENABLED,
+    }
+    return tuple(rule for rule in RULES if flags[rule])
+
+
+class ExitMonitor:
+    """Evaluate the exit rules for one market against a quote stream.
+
+    `trader` is an open trading context (prices and open orders only; sells
+    open their own per-account context exactly as the cron tools do). It may
+    be None when fill_chaser is not among `rules`.
+    """
+
+    def __init__(
+        self,
+        market: str,
+        stream: Any,
+        *,
+        trader: Any = None,
+        rules: Tuple[str, ...] = RULES,
+        trend_seconds: float = TREND_SECONDS,
+        close_window_seconds: float = CLOSE_WINDOW_SECONDS,
+        orders_seconds: float = ORDERS_SECONDS,
+        reload_seconds: float = RELOAD_SECONDS,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        until: Optional[time] = None,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if "fill_chaser" in rules and trader is None:
+            raise ValueError("fill_chaser needs a trading context")
+        self.market = market
+        self.daemon_id = uuid.uuid4().hex[:12]
+        self._stream = stream
+        self._trader = trader
+        self._rules = frozenset(rules)
+        self._trend_every = timedelta(seconds=trend_seconds)
+        self._close_every = timedelta(seconds=close_window_seconds)
+        self._orders_every = timedelta(seconds=orders_seconds)
+        self._reload_seconds = reload_seconds
+        self._cooldown = timedelta(seconds=cooldown_seconds)
+        self._until = until
+        self._clock = clock
+
+        self._holdings: Dict[str, Dict[str, Any]] = {}   # clean single-row positions
+        self._exchanges: Dict[str, str] = {}             # US ticker -> NASD/NYSE/AMEX
+        self._orders: Dict[str, List[Dict[str, Any]]] = {}
+        self._data_version: Optional[int] = None
+        self._holdings_stale = True
+        self._orders_at: Optional[datetime] = None
+        self._orders_stale = True
+        self._trend_at: Dict[str, datetime] = {}
+        self._chase_at: Dict[str, datetime] = {}
+        self._fired_at: Dict[Tuple[str, str], datetime] = {}
+
+        self._busy: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._action_lock = asyncio.Lock()
+        self._agent: Dict[str, Any] = {"ref": None}
+        self._actions = 0
+        self._stop = asyncio.Event()
+        self._conns: Dict[str, sqlite3.Connection] = {}
+
+        self.summaries: Dict[str, Dict[str, int]] = {
+            "hardstop": {"triggered": 0, "sold": 0, "shadow": 0, "skipped": 0},
+            "trend_exit": {"checked": 0, "signaled": 0, "acted": 0, "sold": 0,
+                           "shadow": 0, "skipped": 0, "gated": 0},
+            "fill_chaser": {"open_orders": 0, "evaluated": 0, "shadow": 0,
+                            "amended": 0, "cancelled": 0, "skipped": 0, "no_move": 0,
+                            "ceiling_skipped": 0, "exhausted": 0, "grace_skipped": 0},
+        }
+        self.stats = {"ticks": 0, "reloads": 0, "order_refreshes": 0, "actions": 0,
+                      "action_errors": 0, "pyramided": 0, "max_action_wait_ms": 0.0}
+
+    # ── lifecycle ─────────────────────────────────────────────────────────────
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run(self) -> Dict[str, Any]:
+        """Consume the stream until it ends or stop() is called. Never raises."""
+        try:
+            self._open()
+            await self.refresh()
+            housekeeping = asyncio.create_task(self._housekeeping())
+            consume = asyncio.create_task(self._consume())
+            stopped = asyncio.create_task(self._stop.wait())
+            await asyncio.wait({consume, stopped}, return_when=asyncio.FIRST_COMPLETED)
+            await self._stream.close()
+            if not consume.done():
+                done, _ = await asyncio.wait({consume}, timeout=5)
+                if not done:
+                    consume.cancel()
+            for task in (housekeeping, stopped):
+                task.cancel()
+            await asyncio.gather(consume, housekeeping, stopped, return_exceptions=True)
+            await self.drain()
+        except Exception as e:
+            logger.error("[%s] exit monitor failed: %s", self.market, e)
+        finally:
+            self._close()
+        return {"market": self.market, "daemon_id": self.daemon_id,
+                "stats": dict(self.stats),
+                **{rule: dict(s) for rule, s in self.summaries.items() if rule in self._rules}}
+
+    async def drain(self) -> None:
+        """Wait for every dispatched action, including ones dispatched meanwhile."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _open(self) -> None:
+        self._conns["watch"] = hardstop_seller._connect()
+        hardstop_seller._ensure_schema(self._conns["watch"])
+        if "hardstop" in self._rules:
+            self._conns["hardstop"] = hardstop_seller._connect()
+        if "trend_exit" in self._rules:
+            self._conns["trend_exit"] = trend_exit_seller._connect()
+            trend_exit_seller._ensure_schema(self._conns["trend_exit"])
+        if "fill_chaser" in self._rules:
+            self._conns["fill_chaser"] = fill_chaser._connect()
+            fill_chaser._ensure_schema(self._conns["fill_chaser"])
+
+    def _close(self) -> None:
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+        agent = self._agent["ref"]
+        if agent is not None:
+            try:
+                if getattr(agent, "conn", None):
+                    agent.conn.close()
+            except Exception:
+                pass
+
+    # ── state refresh ─────────────────────────────────────────────────────────
+    async def refresh(self) -> None:
+        """Reload holdings / open orders if due, then re-subscribe the stream."""
+        changed = False
+        version = self._conns["watch"].execute("PRAGMA data_version").fetchone()[0]
+        if self._holdings_stale or version != self._data_version:
+            self._data_version = version
+            self._holdings_stale = False
+            self._reload_holdings()
+            changed = True
+        now = self._clock()
+        if "fill_chaser" in self._rules and (
+            self._orders_stale or self._orders_at is None
+            or now - self._orders_at >= self._orders_every
+        ):
+            self._orders_stale = False
+            await self._refresh_orders(now)
+            changed = True
+        if changed:
+            tickers = set(self._holdings) | set(self._orders)
+            set_exchanges = getattr(self._stream, "set_exchanges", None)
+            if set_exchanges is not None and self.market == "US":
+                await set_exchanges(await self._resolve_exchanges(tickers))
+            await self._stream.subscribe(tickers)
+
+    async def _resolve_exchanges(self, tickers: Set[str]) -> Dict[str, str]:
+        """US ticker -> NASD/NYSE/AMEX; the feed key carries the exchange.
+
+        An open order names its exchange; a holding row does not, so the rest
+        go through the trader's own resolver (persistent cache, then a KIS
+        probe). Resolved codes are kept for the life of the daemon.
+        """
+        for ticker, rows in self._orders.items():
+            if rows[0].get("exchange"):
+                self._exchanges.setdefault(ticker, rows[0]["exchange"])
+        resolve = getattr(self._trader, "_resolve_exchange", None)
+        for ticker in sorted(tickers - set(self._exchanges)):
+            row = self._holdings.get(ticker) or {}
+            exchange = row.get("exchange")
+            if not exchange and resolve is not None:
+                try:
+                    exchange = await asyncio.to_thread(resolve, ticker)
+                except Exception as e:
+                    logger.warning("[%s] %s exchange lookup failed: %s", self.market, ticker, e)
+            if exchange:
+                self._exchanges[ticker] = exchange
+        return {t: self._exchanges[t] for t in tickers if t in self._exchanges}
+
+    def _reload_holdings(self) -> None:
+        by_ticker = hardstop_seller.load_holdings_by_ticker(self._conns["watch"], self.market)
+        # Pyramided positions (>1 row) stay with the batch's fractional logic.
+        self._holdings = {t: rows[0] for t, rows in by_ticker.items() if len(rows) == 1}
+        self.stats["pyramided"] = len(by_ticker) - len(self._holdings)
+        self.stats["reloads"] += 1
+        for ticker in set(self._trend_at) - set(self._holdings):
+            del self._trend_at[ticker]
+
+    async def _refresh_orders(self, now: datetime) -> None:
+        orders = await fill_chaser._inquire_open_orders(self._trader, self.market)
+        known = {o["order_no"] for rows in self._orders.values() for o in rows}
+        previous_at, self._orders_at = self._orders_at, now
+        self._orders = {}
+        for order in orders:
+            self._orders.setdefault(order["ticker"], []).append(order)
+        self.summaries["fill_chaser"]["open_orders"] = len(orders)
+        self.stats["order_refreshes"] += 1
+        live = {order["order_no"] for order in orders}
+        for order_no in set(self._chase_at) - live:
+            del self._chase_at[order_no]
+        # An order that sat through a whole refresh interval without a tick on
+        # its ticker is still chased on the cron's terms: priced by a REST read.
+        for order in orders:
+            chased = self._chase_at.get(order["order_no"])
+            if order["order_no"] in known and (chased is None or chased < previous_at):
+                self._maybe_chase(order, None, now)
+
+    async def _housekeeping(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), self._reload_seconds)
+                return
+            except asyncio.TimeoutError:
+                pass
+            if self._until is not None and self._past_until():
+                logger.info("[%s] session end reached -> stopping", self.market)
+                self.stop()
+                return
+            try:
+                await self.refresh()
+            except Exception as e:  # keep serving on the last known state
+                logger.warning("[%s] refresh failed: %s", self.market, e)
+
+    def _past_until(self) -> bool:
+        tz = _CLOSE_WINDOWS[self.market][0]
+        return self._clock().astimezone(tz).time() >= self._until
+
+    async def _consume(self) -> None:
+        async for tick in self._stream.ticks():
+            self.on_tick(tick)
+            if self._stop.is_set():
+                return
+
+    # ── tick evaluation ───────────────────────────────────────────────────────
+    def on_tick(self, tick: Any) -> None:
+        """Evaluate one tick and dispatch whatever it triggers. Never blocks."""
+        self.stats["ticks"] += 1
+        ticker, price, at = tick.ticker, float(tick.price), tick.at
+        if price <= 0:
+            return
+        holding = self._holdings.get(ticker)
+        if holding is not None and ticker not in self._busy:
+            if "hardstop" in self._rules:
+                reason = hardstop_seller._tier1_signal(holding, price)
+                if reason is not None and self._cool("hardstop", ticker, at):
+                    self.summaries["hardstop"]["triggered"] += 1
+                    self._dispatch(ticker, functools.partial(
+                        self._hardstop, ticker, holding, price, reason))
+            if "trend_exit" in self._rules and ticker not in self._busy and self._trend_due(ticker, at):
+                self._trend_at[ticker] = at
+                self._dispatch(ticker, functools.partial(
+                    self._trend_exit, ticker, holding, price, at))
+        for order in self._orders.get(ticker, ()):
+            self._maybe_chase(order, price, at)
+
+    def _cool(self, rule: str, ticker: str, at: datetime) -> bool:
+        fired = self._fired_at.get((rule, ticker))
+        if fired is not None and at - fired < self._cooldown:
+            return False
+        self._fired_at[(rule, ticker)] = at
+        return True
+
+    def _trend_due(self, ticker: str, at: datetime) -> bool:
+        last = self._trend_at.get(ticker)
+        every = self._close_every if in_close_window(self.market, at) else self._trend_every
+        return last is None or at - last >= every
+
+    def _maybe_chase(self, order: Dict[str, Any], price: Optional[float], at: datetime) -> None:
+        if "fill_chaser" not in self._rules or order["ticker"] in self._busy:
+            return
+        last = self._chase_at.get(order["order_no"])
+        if last is not None and (at - last).total_seconds() < fill_chaser.CHASE_AFTER_SEC:
+            return
+        self._chase_at[order["order_no"]] = at
+        self._dispatch(order["ticker"], functools.partial(self._chase, order, price))
+
+    def _dispatch(self, ticker: str, action: Callable[[str], Awaitable[None]]) -> None:
+        self._busy.add(ticker)
+        queued = asyncio.get_running_loop().time()
+        task = asyncio.create_task(self._run_action(ticker, action, queued))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_action(self, ticker: str, action: Callable[[str], Awaitable[None]],
+                          queued: float) -> None:
+        try:
+            async with self._action_lock:
+                waited = (asyncio.get_running_loop().time() - queued) * 1000
+                self.stats["max_action_wait_ms"] = max(self.stats["max_action_wait_ms"], waited)
+                self._actions += 1
+                self.stats["actions"] += 1
+                await action(f"{self.daemon_id}.{self._actions}")
+        except Exception as e:
+            self.stats["action_errors"] += 1
+            logger.error("[%s] %s exit action failed: %s", self.market, ticker, e)
+        finally:
+            self._busy.discard(ticker)
+
+    # ── actions (the cron tools' own decision + order paths) ──────────────────
+    async def _hardstop(self, ticker: str, holding: Dict[str, Any], price: float,
+                        reason: str, run_id: str) -> None:
+        summary = self.summaries["hardstop"]
+        sold = summary["sold"]
+        stock_data = dict(holding)
+        stock_data["current_price"] = price
+        await hardstop_seller._act_on_trigger(
+            self._conns["hardstop"], self.market, ticker, stock_data, reason,
+            run_id, self._agent, summary)
+        if summary["sold"] > sold:
+            await self._after_sell(hardstop_seller.CHAT_ID)
+
+    async def _trend_exit(self, ticker: str, holding: Dict[str, Any], price: float,
+                          at: datetime, run_id: str) -> None:
+        summary = self.summaries["trend_exit"]
+        conn = self._conns["trend_exit"]
+        summary["checked"] += 1
+        # The session's stored baselines (pre-open --baseline job, else first use).
+        session = trend_exit_seller._session_date(self.market)
+        regime = await trend_exit_seller.session_regime(conn, self.market, session)
+        baseline = await trend_exit_seller.ticker_baseline(conn, self.market, ticker, session)
+        reason = trend_exit_seller._trend_signal(
+            holding, price, regime, baseline["ma_50"] if baseline else 0.0)
+        streak = trend_exit_seller.update_breach_streak(conn, ticker, self.market, reason is not None)
+        if reason is None:
+            return
+        summary["signaled"] += 1
+        close_window = in_close_window(self.market, at)
+        if not trend_exit_seller._gate_open(reason, streak, close_window):
+            summary["gated"] += 1
+            logger.info("[%s] %s signal (%s) streak=%d, close_window=%s -> gated",
+                        self.market, ticker, reason, streak, close_window)
+            return
+        summary["acted"] += 1
+        sold = summary["sold"]
+        stock_data = dict(holding)
+        stock_data["current_price"] = price
+        await trend_exit_seller._act_on_trigger(
+            conn, self.market, ticker, stock_data, reason, streak, run_id,
+            self._agent, summary)
+        if summary["sold"] > sold:
+            await self._after_sell(trend_exit_seller.CHAT_ID)
+
+    async def _chase(self, order: Dict[str, Any], price: Optional[float], run_id: str) -> None:
+        summary = self.summaries["fill_chaser"]
+        summary["evaluated"] += 1
+        await fill_chaser._act_on_order(
+            self._conns["fill_chaser"], self._trader, self.market, order, run_id,
+            summary, market_price=price)
+        self._orders_stale = True  # amended / cancelled: re-inquire on the next refresh
+
+    async def _after_sell(self, chat_id: Optional[str]) -> None:
+        # The cron tools' run-end flush, once per selling action: the daemon's
+        # "run" is the action. Cross-run de-dup lives in portfolio_broadcast.
+        self._holdings_stale = True
+        agent = self._agent["ref"]
+        if agent is None:
+            return
+        try:
+            await agent.send_telegram_message(chat_id, await_broadcast=True)
+        except Exception as e:
+            logger.warning("[%s] portfolio summary failed: %s", self.market, e)
+
+
+# ── Feeds ─────────────────────────────────────────────────────────────────────
+def _kis_stream(market: str):
+    from prism_core.quote_stream import KisRealtimeQuoteStream
+
+    sys.path.insert(0, str(PROJECT_ROOT / "trading"))
+    import kis_auth as ka
+
+    ka.auth_ws()
+    return KisRealtimeQuoteStream(
+        market,
+        url=f"{ka.getTREnv().my_url_ws}/tryitout",
+        approval_key=lambda: ka._getBaseHeader_ws()["approval_key"],
+    )
+
+
+def _make_stream(market: str, feed: str, trader: Any, replay: Optional[str]):
+    from prism_core.quote_stream import PollingQuoteStream, ReplayQuoteStream
+
+    if feed == "replay":
+        return ReplayQuoteStream.from_jsonl(replay, market=market, speed=1.0)
+    if feed == "poll":
+        return PollingQuoteStream(market, trader.get_current_price, interval=POLL_SECONDS)
+    return _kis_stream(market)
+
+
+async def main_async(market: str, feed: str, replay: Optional[str], until: Optional[time]) -> int:
+    rules = enabled_rules()
+    if not rules:
+        logger.info("all exit rules disabled -> exiting.")
+        return 0
+    modes = {
+        "hardstop": hardstop_seller.HARDSTOP_LIVE,
+        "trend_exit": trend_exit_seller.TREND_EXIT_LIVE,
+        "fill_chaser": fill_chaser.FILL_CHASER_LIVE,
+    }
+    logger.info("Exit monitor start market=%s feed=%s rules=%s", market, feed,
+                {rule: "LIVE" if modes[rule] else "SHADOW" for rule in rules})
+    try:
+        async with fill_chaser._open_context(market) as trader:
+            stream = _make_stream(market, feed, trader, replay)
+            monitor = ExitMonitor(market, stream, trader=trader, rules=rules, until=until)
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, monitor.stop)
+            summary = await monitor.run()
+    except Exception as e:  # context/credential failure -> nothing to monitor
+        logger.warning("%s trading context failed: %s", market, e)
+        return 1
+    logger.info("Exit monitor done: %s", summary)
+    return 0
+
+
+def _setup_logging() -> None:
+    log_dir = PROJECT_ROOT / "logs"
+    log_dir.mkdir(exist_ok=True)
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    try:
+        handlers.append(logging.FileHandler(log_dir / "exit_monitor.log"))
+    except OSError:
+        pass
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=handlers,
+    )
+
+
+def _run_both_isolated(argv: List[str]) -> int:
+    """Run KR and US as SEPARATE subprocesses (cores-shadowing isolation), concurrently."""
+    import subprocess
+    procs = [
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "--market", m, *argv])
+        for m in ("kr", "us")
+    ]
+    rc = 0
+    for proc in procs:
+        rc = rc or proc.wait()
+    return rc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Event-driven intraday exit monitor")
+    parser.add_argument("--market", choices=["kr", "us", "both"], default="both")
+    parser.add_argument("--feed", choices=["kis", "poll", "replay"], default="kis")
+    parser.add_argument("--replay", help="ticks.jsonl for --feed replay")
+    parser.add_argument("--until", help="market-local HH:MM to exit (default: session close)")
+    args = parser.parse_args()
+    if args.feed == "replay" and not args.replay:
+        parser.error("--feed replay needs --replay FILE")
+    _setup_logging()
+    if args.market == "both":
+        passthrough = ["--feed", args.feed]
+        if args.replay:
+            passthrough += ["--replay", args.replay]
+        if args.until:
+            passthrough += ["--until", args.until]
+        return _run_both_isolated(passthrough)
+    market = {"kr": "KR", "us": "US"}[args.market]
+    hardstop_seller._bootstrap_path(market)
+    until = time.fromisoformat(args.until or _SESSION_END[market])
+    return asyncio.run(main_async(market, args.feed, args.replay, until))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -494,8 +494,13 @@ def _fill_verdict(side: str, new_price: float, market_price: float) -> str:
 
 # ── Core evaluation for one market ─────────────────────────────────────────────
 async def _act_on_order(conn, trader, market: str, order: Dict[str, Any],
-                        run_id: str, summary: Dict[str, Any]) -> None:
-    """Decide + (LIVE) execute amend/cancel for one unfilled order. Never raises."""
+                        run_id: str, summary: Dict[str, Any],
+                        market_price: Optional[float] = None) -> None:
+    """Decide + (LIVE) execute amend/cancel for one unfilled order. Never raises.
+
+    `market_price` lets a caller that already holds a live quote (the streaming
+    exit monitor) skip the REST price read; None fetches it here.
+    """
     ticker = order["ticker"]
     side = order["side"]
     order_no = order["order_no"]
@@ -530,12 +535,13 @@ async def _act_on_order(conn, trader, market: str, order: Dict[str, Any],
             return
 
         # Single source of truth for the market price = live KIS read.
-        try:
-            info = await asyncio.to_thread(trader.get_current_price, ticker)
-            market_price = float((info or {}).get("current_price", 0) or 0)
-        except Exception as e:
-            logger.warning("[%s] %s price fetch failed: %s -> no-op", market, ticker, e)
-            return
+        if market_price is None:
+            try:
+                info = await asyncio.to_thread(trader.get_current_price, ticker)
+                market_price = float((info or {}).get("current_price", 0) or 0)
+            except Exception as e:
+                logger.warning("[%s] %s price fetch failed: %s -> no-op", market, ticker, e)
+                return
         if market_price <= 0:
             return
 
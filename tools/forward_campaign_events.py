@@ -11,6 +11,10 @@ Missing a run is not a problem: unforwarded events stay PENDING and the next
 run picks them up along with its own. Sending twice is not a problem either —
 the remote `campaign_id` is UNIQUE and its insert is INSERT OR IGNORE.
 
+A run opens one ssh session and streams every claimed event through it (see
+`SshSessionCampaignShipper`). --one-ssh-per-event falls back to the old
+per-event hop for a bot host whose checkout predates the --stream entrypoint.
+
 Exit code is 0 whenever the run completed, even if individual events were
 deferred, so a transient network blip does not turn into cron mail every time.
 A non-zero exit means the forwarder itself could not run.
@@ -30,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from messaging.campaign_forwarder import (
     CampaignForwarder,
     SshCampaignShipper,
+    SshSessionCampaignShipper,
 )
 from messaging.local_campaign_queue import SQLiteBatchCampaignQueue
 
@@ -77,6 +82,11 @@ def build_parser() -> argparse.ArgumentParser:
         "--identity-file",
         default=os.getenv("PRISM_CAMPAIGN_FORWARD_IDENTITY") or None,
     )
+    parser.add_argument(
+        "--one-ssh-per-event",
+        action="store_true",
+        help="ship each event over its own ssh call (remote without --stream)",
+    )
     parser.add_argument("--batch-size", type=int, default=20)
     parser.add_argument("--lease-seconds", type=int, default=60)
     parser.add_argument("--retry-seconds", type=int, default=60)
@@ -122,7 +132,10 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 2
 
-    shipper = SshCampaignShipper(
+    shipper_class = (
+        SshCampaignShipper if args.one_ssh_per_event else SshSessionCampaignShipper
+    )
+    shipper = shipper_class(
         host=args.host.strip(),
         repo_path=args.remote_repo,
         queue_path=args.remote_queue,
@@ -45,7 +45,7 @@ import sys
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 TOOLS_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = TOOLS_DIR.parent
@@ -289,6 +289,33 @@ async def _make_agent(market: str):
     return agent
 
 
+# ── TIER1 decision (shared with tools/exit_monitor.py) ─────────────────────────
+def _holding_prices(h: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """(buy_price, stop_loss) of a holding row, or None if it cannot be evaluated."""
+    try:
+        buy_price = float(h.get("buy_price", 0) or 0)
+        stop_loss = float(h.get("stop_loss", 0) or 0)
+    except (TypeError, ValueError):
+        return None
+    if buy_price <= 0:
+        return None
+    return buy_price, stop_loss
+
+
+def _tier1_signal(h: Dict[str, Any], cur_price: float) -> Optional[str]:
+    """The TIER1 hard-stop reason for one holding at `cur_price`, or None to hold."""
+    from cores.oneil_fallback import SellInputs, evaluate_tier1_hardstop
+
+    prices = _holding_prices(h)
+    if prices is None or cur_price <= 0:
+        return None
+    buy_price, stop_loss = prices
+    should_sell, reason = evaluate_tier1_hardstop(
+        SellInputs(buy_price=buy_price, current_price=cur_price, stop_loss=stop_loss)
+    )
+    return reason if should_sell else None
+
+
 # ── Core evaluation for one market ─────────────────────────────────────────────
 async def run_market(market: str, run_id: str) -> Dict[str, Any]:
     """Evaluate the TIER1 hard stop for every clean single-row holding.
@@ -297,7 +324,6 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
     """
     summary = {"market": market, "checked": 0, "triggered": 0, "sold": 0,
                "shadow": 0, "skipped": 0, "pyramided_skipped": 0}
-    from cores.oneil_fallback import SellInputs, evaluate_tier1_hardstop
     conn = _connect()
     agent = {"ref": None}  # lazily created on first LIVE sell
     try:
@@ -315,12 +341,7 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                                     market, ticker, len(rows))
                         continue
                     h = rows[0]
-                    try:
-                        buy_price = float(h.get("buy_price", 0) or 0)
-                        stop_loss = float(h.get("stop_loss", 0) or 0)
-                    except (TypeError, ValueError):
-                        continue
-                    if buy_price <= 0:
+                    if _holding_prices(h) is None:
                         continue
                     try:
                         info = await asyncio.to_thread(trader.get_current_price, ticker)
@@ -331,10 +352,8 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                     if cur_price <= 0:
                         continue
                     summary["checked"] += 1
-                    should_sell, reason = evaluate_tier1_hardstop(
-                        SellInputs(buy_price=buy_price, current_price=cur_price, stop_loss=stop_loss)
-                    )
-                    if not should_sell:
+                    reason = _tier1_signal(h, cur_price)
+                    if reason is None:
                         continue
                     summary["triggered"] += 1
                     h = dict(h)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Latency/token report over the LLM telemetry sink (cores/llm/telemetry.py).
+
+Prints p50/p95 by section, agent, model and MCP tool, so a slow report can be
+traced to prefetch, a specific MCP server/tool, queueing or the model itself.
+
+    python tools/llm_telemetry_report.py [--db-path llm_telemetry.sqlite] [--days 7] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DB_PATH = PROJECT_ROOT / "llm_telemetry.sqlite"
+
+
+def percentile(values: Sequence[float], pct: float) -> float | None:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _readonly_connection(db_path: Path) -> sqlite3.Connection:
+    uri = f"{db_path.expanduser().resolve().as_uri()}?mode=ro"
+    connection = sqlite3.connect(uri, uri=True)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+def _summarise(rows: list[sqlite3.Row], key: str) -> list[dict[str, Any]]:
+    groups: dict[str, list[sqlite3.Row]] = {}
+    for row in rows:
+        groups.setdefault(row[key] or "-", []).append(row)
+
+    out = []
+    for name, items in groups.items():
+        durations = [r["duration_ms"] for r in items]
+        entry: dict[str, Any] = {
+            key: name,
+            "calls": len(items),
+            "errors": sum(1 for r in items if r["status"] != "ok"),
+            "p50_ms": percentile(durations, 50),
+            "p95_ms": percentile(durations, 95),
+            "total_s": round(sum(durations) / 1000.0, 1),
+        }
+        if "queue_ms" in items[0].keys():
+            queue = [r["queue_ms"] for r in items if r["queue_ms"] is not None]
+            model = [r["model_ms"] for r in items if r["model_ms"] is not None]
+            tokens_in = [r["input_tokens"] for r in items if r["input_tokens"] is not None]
+            tokens_out = [r["output_tokens"] for r in items if r["output_tokens"] is not None]
+            entry.update({
+                "retries": sum(1 for r in items if r["retry"]),
+                "p95_queue_ms": percentile(queue, 95),
+                "p50_model_ms": percentile(model, 50),
+                "p95_model_ms": percentile(model, 95),
+                "tool_calls": sum(r["tool_calls"] for r in items),
+                "avg_input_tokens": round(sum(tokens_in) / len(tokens_in)) if tokens_in else None,
+                "avg_output_tokens": round(sum(tokens_out) / len(tokens_out)) if tokens_out else None,
+            })
+        out.append(entry)
+    return sorted(out, key=lambda e: e["total_s"], reverse=True)
+
+
+def build_report(db_path: str | Path, *, days: float = 7.0) -> dict[str, Any]:
+    """Aggregate spans started in the last ``days`` days."""
+    since = (datetime.now() - timedelta(days=days)).isoformat(timespec="milliseconds")
+    with _readonly_connection(Path(db_path)) as connection:
+        calls = connection.execute(
+            """
+            SELECT c.*, (SELECT COUNT(*) FROM llm_tool_calls t WHERE t.span_id = c.span_id) AS tool_calls
+            FROM llm_calls c
+            WHERE c.started_at >= ?
+            """,
+            (since,),
+        ).fetchall()
+        tools = connection.execute(
+            """
+            SELECT t.tool, COALESCE(t.server, '-') AS server, t.duration_ms,
+                   CASE WHEN t.ok THEN 'ok' ELSE 'error' END AS status
+            FROM llm_tool_calls t JOIN llm_calls c ON c.span_id = t.span_id
+            WHERE c.started_at >= ?
+            """,
+            (since,),
+        ).fetchall()
+
+    llm = [r for r in calls if r["kind"] == "llm"]
+    stages = [r for r in calls if r["kind"] == "stage"]
+    return {
+        "since": since,
+        "llm_calls": len(llm),
+        "by_section": _summarise(llm, "section"),
+        "by_agent": _summarise(llm, "agent"),
+        "by_model": _summarise(llm, "model"),
+        "by_server": _summarise(tools, "server"),
+        "by_tool": _summarise(tools, "tool"),
+        "stages": _summarise(stages, "agent"),
+    }
+
+
+def _format_table(title: str, entries: list[dict[str, Any]]) -> str:
+    if not entries:
+        return f"## {title}\n(no data)\n"
+    columns = list(entries[0].keys())
+    lines = [f"## {title}", " | ".join(columns)]
+    for entry in entries:
+        cells = []
+        for column in columns:
+            value = entry[column]
+            cells.append(f"{value:.0f}" if isinstance(value, float) and column.endswith("_ms") else str(value))
+        lines.append(" | ".join(cells))
+    return "\n".join(lines) + "\n"
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH)
+    parser.add_argument("--days", type=float, default=7.0)
+    parser.add_argument("--json", action="store_true", help="print the raw report as JSON")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    if not args.db_path.exists():
+        print(f"No telemetry database at {args.db_path}", file=sys.stderr)
+        return 2
+    try:
+        report = build_report(args.db_path, days=args.days)
+    except sqlite3.Error as error:
+        print(f"Telemetry database unreadable: {type(error).__name__}: {error}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"LLM calls since {report['since']}: {report['llm_calls']}\n")
+    for title, key in (
+        ("By section", "by_section"),
+        ("Non-LLM stages", "stages"),
+        ("By agent", "by_agent"),
+        ("By model", "by_model"),
+        ("By MCP server", "by_server"),
+        ("By MCP tool", "by_tool"),
+    ):
+        print(_format_table(title, report[key]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
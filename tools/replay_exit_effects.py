@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Audit or explicitly replay a bounded set of durable exit effects."""
+"""Audit or explicitly replay durable exit effects.
+
+Without ``--follow`` one bounded batch is replayed. With ``--follow`` a
+long-running worker keeps per-type slots busy until SIGINT/SIGTERM.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +11,7 @@ import argparse
 import asyncio
 import json
 import os
+import signal
 import socket
 import sqlite3
 import sys
@@ -22,6 +27,7 @@ from dotenv import load_dotenv  # noqa: E402
 
 from prism_core.exit_effect_replay import (  # noqa: E402
     EffectHandler,
+    ExitEffectReplayWorker,
     run_exit_effect_replay,
 )
 from prism_core.exit_effects import EXIT_EFFECT_TYPES  # noqa: E402
@@ -164,14 +170,55 @@ def _parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Perform bounded external delivery. Default is read-only audit.",
     )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep replaying as effects become ready (requires --execute).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        action="append",
+        default=[],
+        metavar="TYPE=N",
+        help="Concurrent deliveries per effect type; repeat for multiple types.",
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=5.0,
+        help="Idle wait between claims in --follow mode.",
+    )
     return parser
 
 
+def _parse_concurrency(values: Sequence[str]) -> dict[str, int]:
+    limits = {}
+    for value in values:
+        effect_type, _, count = value.partition("=")
+        effect_type = effect_type.strip().upper()
+        if effect_type not in EXIT_EFFECT_TYPES or not count.strip().isdigit():
+            raise ValueError(f"invalid --concurrency value: {value}")
+        limits[effect_type] = int(count)
+    return limits
+
+
+async def _follow(worker: ExitEffectReplayWorker) -> dict[str, dict[str, float]]:
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, worker.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+    return await worker.run()
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = _parser()
     args = parser.parse_args(argv)
     if args.limit < 1:
         parser.error("--limit must be a positive integer")
+    if args.follow and not args.execute:
+        parser.error("--follow requires --execute")
     if not args.execute:
         report = audit_database(args.db_path, limit=args.limit)
         print(
@@ -184,15 +231,39 @@ def main(argv: Sequence[str] | None = None) -> int:
         return {"ready": 0, "blocked": 1}.get(report["status"], 2)
     if not args.effects:
         parser.error("--execute requires at least one explicit --effect")
+    try:
+        concurrency = _parse_concurrency(args.concurrency)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.poll_seconds <= 0:
+        parser.error("--poll-seconds must be positive")
 
     handlers = build_exit_effect_handlers(args.db_path, args.effects)
     owner = f"replay:{socket.gethostname()}:{os.getpid()}"
+    if args.follow:
+        worker = ExitEffectReplayWorker(
+            args.db_path,
+            handlers=handlers,
+            owner=owner,
+            concurrency=concurrency or None,
+            poll_interval_seconds=args.poll_seconds,
+        )
+        metrics = asyncio.run(_follow(worker))
+        print(
+            json.dumps(
+                {"mode": "follow", "metrics": metrics},
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+        )
+        return 0
     summary = asyncio.run(
         run_exit_effect_replay(
             args.db_path,
             handlers=handlers,
             owner=owner,
             limit=args.limit,
+            concurrency=concurrency or None,
         )
     )
     report = audit_database(args.db_path, limit=args.limit)
@@ -60,17 +60,27 @@ SAFETY (read before enabling):
     (safe: only the trailing/target tiers can then fire). regime fetch failure
     -> regime_is_live=False, which makes trailing conservative (-10% band).
 
+DAILY BASELINES: the 50MA (of completed sessions) and the LIVE regime do not
+move intraday, so a pre-open `--baseline` run stores them in
+loop_b_exit_baselines / loop_b_regime_baselines for the session, and every
+checkpoint only combines them with the live price — no history downloads
+intraday. A missing row is computed on first use and stored.
+
 Usage:
-    python tools/trend_exit_seller.py [--market kr|us|both] [--once]
+    python tools/trend_exit_seller.py [--market kr|us|both] [--once] [--baseline]
 
 Intended cron (SHADOW until reviewed) — KR and US as SEPARATE processes
 (cores-shadowing isolation; --market both fans out to these two automatically).
 Run a periodic checkpoint cadence PLUS a dedicated close-window line that sets
 TREND_EXIT_CLOSE_WINDOW=true so a single session-close breach confirms immediately:
+    # KR pre-open baselines
+    40 8 * * 1-5  cd /root/prism-insight && python tools/trend_exit_seller.py --market kr --baseline
     # KR checkpoints (every 10 min during the session)
     */10 9-15 * * 1-5  cd /root/prism-insight && python tools/trend_exit_seller.py --market kr
     # KR close-window confirm (~15:10-15:20 KST)
     10-20/5 15 * * 1-5 cd /root/prism-insight && TREND_EXIT_CLOSE_WINDOW=true python tools/trend_exit_seller.py --market kr
+    # US pre-open baselines (~09:00 ET)
+    0 22 * * 1-5  cd /root/prism-insight && python tools/trend_exit_seller.py --market us --baseline
     # US checkpoints (every 10 min during the session, ET via server tz)
     */10 22-23,0-4 * * 1-5  cd /root/prism-insight && python tools/trend_exit_seller.py --market us
     # US close-window confirm (~15:50-16:00 ET)
@@ -84,10 +94,11 @@ import logging
 import os
 import sqlite3
 import sys
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 TOOLS_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = TOOLS_DIR.parent
@@ -232,6 +243,23 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
             submitted_ts TEXT NOT NULL,
             UNIQUE (ticker, market, side, loop_run_id)
         );
+        -- Daily exit-signal baselines, written by the pre-open --baseline job (or
+        -- lazily by the first intraday run of a session) and read all day.
+        CREATE TABLE IF NOT EXISTS loop_b_exit_baselines (
+            ticker       TEXT NOT NULL,
+            market       TEXT NOT NULL,
+            session_date TEXT NOT NULL,           -- market-local trading date served
+            ma_50        REAL NOT NULL DEFAULT 0, -- 0 => <50 closes (TIER1.5 dormant)
+            computed_ts  TEXT NOT NULL,
+            PRIMARY KEY (ticker, market, session_date)
+        );
+        CREATE TABLE IF NOT EXISTS loop_b_regime_baselines (
+            market       TEXT NOT NULL,
+            session_date TEXT NOT NULL,
+            regime       TEXT NOT NULL,
+            computed_ts  TEXT NOT NULL,
+            PRIMARY KEY (market, session_date)
+        );
         """
     )
     conn.commit()
@@ -367,43 +395,39 @@ def update_breach_streak(conn: sqlite3.Connection, ticker: str, market: str,
         return 0
 
 
-# ── Per-ticker 50-day MA + per-cycle LIVE regime (Trend-exit decision inputs) ──────
-def _fetch_ma50(market: str, ticker: str) -> float:
-    """50-day simple MA of daily CLOSES for one ticker. 0.0 on any failure /
-    <50 closes (-> TIER1.5 stays dormant, which is the safe default).
+# ── Per-ticker daily closes + LIVE regime (network-bound Trend-exit inputs) ────
+def _fetch_daily_closes(market: str, ticker: str) -> List[Tuple[str, float]]:
+    """~4 months of daily (date, close), oldest first. [] on any failure.
 
     Network-bound; isolated in its own function so tests monkeypatch it cleanly.
     """
     try:
-        closes: List[float] = []
         if market == "US":
             import yfinance as yf
             hist = yf.Ticker(ticker).history(period="4mo")
-            series = hist["Close"].dropna()
-            closes = [float(x) for x in series.tolist()]
-        else:  # KR via pykrx (clean close series, pykrx-compatible)
-            from pykrx import stock
-            end = _now().date()
-            start = end - timedelta(days=80)  # ~80 calendar days -> >=50 trading closes
-            df = stock.get_market_ohlcv_by_date(
-                start.strftime("%Y%m%d"), end.strftime("%Y%m%d"), ticker
-            )
-            if df is not None and not df.empty:
-                col = "종가" if "종가" in df.columns else ("Close" if "Close" in df.columns else None)
-                if col is not None:
-                    closes = [float(x) for x in df[col].dropna().tolist()]
-        if len(closes) < 50:
-            return 0.0
-        last50 = closes[-50:]
-        return sum(last50) / 50.0
+            closes = hist["Close"].dropna()
+            return [(idx.strftime("%Y-%m-%d"), float(c)) for idx, c in closes.items()]
+        # KR via pykrx (clean close series, pykrx-compatible)
+        from pykrx import stock
+        end = _now().date()
+        start = end - timedelta(days=120)  # ~120 calendar days -> >=50 completed sessions
+        df = stock.get_market_ohlcv_by_date(
+            start.strftime("%Y%m%d"), end.strftime("%Y%m%d"), ticker
+        )
+        if df is None or df.empty:
+            return []
+        col = "종가" if "종가" in df.columns else "Close"
+        closes = df[col].dropna()
+        return [(idx.strftime("%Y-%m-%d"), float(c)) for idx, c in closes.items()]
     except Exception as e:
-        logger.warning("[%s] %s ma_50 fetch failed: %s", market, ticker, e)
-        return 0.0
+        logger.warning("[%s] %s daily closes fetch failed: %s", market, ticker, e)
+        return []
 
 
 def _compute_live_regime(market: str) -> Optional[str]:
-    """Compute the LIVE market regime ONCE per market per cycle, the same way the
-    batch does. Returns a regime string (e.g. 'moderate_bull') or None on failure.
+    """Compute the LIVE market regime the same way the batch does (once per
+    session, via session_regime). Returns a regime string (e.g. 'moderate_bull')
+    or None on failure.
 
     None -> callers pass regime_is_live=False, making trailing conservative
     (-10% band). This is acceptable and documented; it never over-sells.
@@ -431,6 +455,214 @@ def _compute_live_regime(market: str) -> Optional[str]:
         return None
 
 
+# ── Daily baselines (loop_b_exit_baselines / loop_b_regime_baselines) ─────────
+# The 50MA comes from COMPLETED daily closes and the regime from the index's daily
+# history, so neither moves intraday. The pre-open
+# --baseline job computes them once per session; every intraday run only combines
+# them with the live price. A row missing at run time (job not run, ticker bought
+# intraday) is computed on first use and stored, so the whole session still sees
+# one value. Failures are NOT stored; the process remembers them instead and
+# retries a failed fetch at most every BASELINE_RETRY_SEC, so a vendor outage
+# does not turn every checkpoint of a long-running caller into a download.
+_SESSION_TZ = {"KR": "Asia/Seoul", "US": "America/New_York"}
+BASELINE_KEEP_DAYS = 14
+BASELINE_RETRY_SEC = float(_env("BASELINE_RETRY_SEC", "600"))
+_baseline_failed_at: Dict[Tuple[str, str, str], float] = {}  # (market, ticker|"", session) -> monotonic
+
+
+def _retry_due(key: Tuple[str, str, str]) -> bool:
+    failed_at = _baseline_failed_at.get(key)
+    return failed_at is None or time.monotonic() - failed_at >= BASELINE_RETRY_SEC
+
+
+def _session_date(market: str) -> str:
+    from zoneinfo import ZoneInfo
+
+    return _now().astimezone(ZoneInfo(_SESSION_TZ[market])).date().isoformat()
+
+
+def _baseline_from_closes(closes: List[Tuple[str, float]],
+                          session_date: str) -> Optional[Dict[str, Any]]:
+    """The 50MA of the closes BEFORE `session_date`. None if there are none.
+
+    Today's partial bar is dropped so a baseline computed intraday equals the
+    pre-open one. Fewer than 50 closes -> ma_50=0.0 (TIER1.5 dormant).
+    """
+    done = [c for d, c in closes if d < session_date]
+    if not done:
+        return None
+    return {"ma_50": sum(done[-50:]) / 50.0 if len(done) >= 50 else 0.0}
+
+
+def _compute_baseline(market: str, ticker: str, session_date: str) -> Optional[Dict[str, Any]]:
+    return _baseline_from_closes(_fetch_daily_closes(market, ticker), session_date)
+
+
+def load_baseline(conn: sqlite3.Connection, ticker: str, market: str,
+                  session_date: str) -> Optional[Dict[str, Any]]:
+    row = conn.execute(
+        "SELECT ma_50 FROM loop_b_exit_baselines "
+        "WHERE ticker=? AND market=? AND session_date=?",
+        (ticker, market, session_date),
+    ).fetchone()
+    return dict(row) if row else None
+
+
+def store_baseline(conn: sqlite3.Connection, ticker: str, market: str,
+                   session_date: str, baseline: Dict[str, Any]) -> None:
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO loop_b_exit_baselines "
+            "(ticker, market, session_date, ma_50, computed_ts) VALUES (?,?,?,?,?)",
+            (ticker, market, session_date, baseline["ma_50"], _iso(_now())),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("baseline store failed %s/%s: %s", ticker, market, e)
+
+
+async def ticker_baseline(conn: sqlite3.Connection, market: str, ticker: str,
+                          session_date: str) -> Optional[Dict[str, Any]]:
+    """The session's stored baseline, computing + storing it on first use.
+
+    None while a recent compute for this ticker failed (see BASELINE_RETRY_SEC).
+    """
+    baseline = load_baseline(conn, ticker, market, session_date)
+    key = (market, ticker, session_date)
+    if baseline is None and _retry_due(key):
+        baseline = await asyncio.to_thread(_compute_baseline, market, ticker, session_date)
+        if baseline is None:
+            _baseline_failed_at[key] = time.monotonic()
+        else:
+            _baseline_failed_at.pop(key, None)
+            store_baseline(conn, ticker, market, session_date, baseline)
+    return baseline
+
+
+async def session_regime(conn: sqlite3.Connection, market: str,
+                         session_date: str) -> Optional[str]:
+    """The session's stored LIVE regime, computing + storing it on first use.
+
+    None while a recent compute failed (see BASELINE_RETRY_SEC).
+    """
+    row = conn.execute(
+        "SELECT regime FROM loop_b_regime_baselines WHERE market=? AND session_date=?",
+        (market, session_date),
+    ).fetchone()
+    if row:
+        return row["regime"]
+    key = (market, "", session_date)
+    if not _retry_due(key):
+        return None
+    regime = await asyncio.to_thread(_compute_live_regime, market)
+    if not regime:
+        _baseline_failed_at[key] = time.monotonic()
+    else:
+        _baseline_failed_at.pop(key, None)
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO loop_b_regime_baselines "
+                "(market, session_date, regime, computed_ts) VALUES (?,?,?,?)",
+                (market, session_date, regime, _iso(_now())),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("regime baseline store failed (%s): %s", market, e)
+    return regime
+
+
+async def build_baselines(market: str) -> Dict[str, Any]:
+    """Pre-open job: (re)compute every held ticker's baseline and the regime.
+
+    Recomputes even when a row exists, so a re-run after a data-vendor hiccup
+    repairs the session. Never raises.
+    """
+    summary = {"market": market, "tickers": 0, "stored": 0, "failed": 0, "regime": None}
+    conn = _connect()
+    try:
+        _ensure_schema(conn)
+        session = _session_date(market)
+        for key in [k for k in _baseline_failed_at if k[0] == market]:
+            del _baseline_failed_at[key]  # the pre-open job always retries
+        conn.execute("DELETE FROM loop_b_regime_baselines WHERE market=? AND session_date=?",
+                     (market, session))
+        conn.commit()
+        summary["regime"] = await session_regime(conn, market, session)
+        for ticker, rows in load_holdings_by_ticker(conn, market).items():
+            if len(rows) > 1:
+                continue  # pyramided -> the batch's, not evaluated intraday
+            summary["tickers"] += 1
+            baseline = await asyncio.to_thread(_compute_baseline, market, ticker, session)
+            if baseline is None:
+                summary["failed"] += 1
+                continue
+            store_baseline(conn, ticker, market, session, baseline)
+            summary["stored"] += 1
+        cutoff = (date.fromisoformat(session) - timedelta(days=BASELINE_KEEP_DAYS)).isoformat()
+        conn.execute("DELETE FROM loop_b_exit_baselines WHERE market=? AND session_date<?",
+                     (market, cutoff))
+        conn.execute("DELETE FROM loop_b_regime_baselines WHERE market=? AND session_date<?",
+                     (market, cutoff))
+        conn.commit()
+    except Exception as e:
+        logger.warning("[%s] baseline build failed: %s", market, e)
+    finally:
+        conn.close()
+    return summary
+
+
+# ── Trend-exit decision + gate (shared with tools/exit_monitor.py) ────────────
+def _buy_price(h: Dict[str, Any]) -> float:
+    try:
+        return float(h.get("buy_price", 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _trend_signal(h: Dict[str, Any], cur_price: float, regime: Optional[str],
+                  ma_50: float) -> Optional[str]:
+    """The Loop-B-owned sell reason for one holding at `cur_price`, or None.
+
+    A pure TIER1 stop is not a trend-exit signal (Hardstop owns it) and maps
+    to None like a HOLD does.
+    """
+    from cores.oneil_fallback import SellInputs, evaluate_oneil_sell
+
+    buy_price = _buy_price(h)
+    if buy_price <= 0 or cur_price <= 0:
+        return None
+    inp = SellInputs(
+        buy_price=buy_price,
+        current_price=cur_price,
+        stop_loss=float(h.get("stop_loss", 0) or 0),
+        target_price=float(h.get("target_price", 0) or 0),
+        highest_price=float(h.get("highest_price", 0) or 0),
+        market_condition=str(regime or ""),
+        regime_is_live=bool(regime),
+        ma_50=ma_50,
+    )
+    should_sell, reason = evaluate_oneil_sell(inp)
+    if should_sell and _is_trend_exit_signal(reason):
+        return reason
+    return None
+
+
+def _gate_open(reason: str, streak: int, close_window: bool) -> bool:
+    """N consecutive day-breaches, or a session-close confirmation.
+
+    The close-window fast-path is DAMAGE CONTROL: "a breach still standing at
+    the closing bell is confirmed by the close — don't carry a broken position
+    overnight." A TIER3 target take-profit is not damage control (the position
+    is at a profit high), so it is excluded from the fast-path and must earn the
+    full N-day confirmation. Without this, the close-window line (which runs
+    EVERY session) made CONFIRM_CHECKS dead for target take-profits and
+    liquidated winners same-day (2026-07-29 INCY, streak=0).
+    """
+    if streak >= TREND_EXIT_CONFIRM_CHECKS:
+        return True
+    return close_window and not reason.startswith("TIER3_TARGET")
+
+
 # ── Trader context + agent factories (KR / US) ────────────────────────────────
 def _open_context(market: str, account_name: Optional[str] = None):
     from prism_core.execution_service import ExecutionService
@@ -475,13 +707,12 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
     summary = {"market": market, "checked": 0, "signaled": 0, "acted": 0,
                "sold": 0, "shadow": 0, "skipped": 0, "pyramided_skipped": 0,
                "gated": 0}
-    from cores.oneil_fallback import SellInputs, evaluate_oneil_sell
     conn = _connect()
     agent = {"ref": None}  # lazily created on first LIVE sell
-    ma50_cache: Dict[str, float] = {}  # one fetch per ticker per cycle
     regime: Dict[str, Any] = {"value": None, "computed": False}
     try:
         _ensure_schema(conn)
+        session = _session_date(market)
         by_ticker = load_holdings_by_ticker(conn, market)
         if not by_ticker:
             return summary
@@ -495,11 +726,7 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                                     market, ticker, len(rows))
                         continue
                     h = rows[0]
-                    try:
-                        buy_price = float(h.get("buy_price", 0) or 0)
-                    except (TypeError, ValueError):
-                        continue
-                    if buy_price <= 0:
+                    if _buy_price(h) <= 0:
                         continue
                     try:
                         info = await asyncio.to_thread(trader.get_current_price, ticker)
@@ -511,28 +738,15 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                         continue
                     summary["checked"] += 1
 
-                    # Compute LIVE regime once per market per cycle (lazy, best-effort).
+                    # Session baselines: stored once per day (pre-open job or first use).
                     if not regime["computed"]:
-                        regime["value"] = await asyncio.to_thread(_compute_live_regime, market)
+                        regime["value"] = await session_regime(conn, market, session)
                         regime["computed"] = True
-                    # Per-ticker 50MA, cached for the cycle.
-                    if ticker not in ma50_cache:
-                        ma50_cache[ticker] = await asyncio.to_thread(_fetch_ma50, market, ticker)
-                    ma_50 = ma50_cache[ticker]
-
-                    highest = float(h.get("highest_price", 0) or 0)
-                    inp = SellInputs(
-                        buy_price=buy_price,
-                        current_price=cur_price,
-                        stop_loss=float(h.get("stop_loss", 0) or 0),
-                        target_price=float(h.get("target_price", 0) or 0),
-                        highest_price=highest,
-                        market_condition=str(regime["value"] or ""),
-                        regime_is_live=bool(regime["value"]),
-                        ma_50=ma_50,
-                    )
-                    should_sell, reason = evaluate_oneil_sell(inp)
-                    had_signal = bool(should_sell) and _is_trend_exit_signal(reason)
+                    baseline = await ticker_baseline(conn, market, ticker, session)
+                    ma_50 = baseline["ma_50"] if baseline else 0.0
+
+                    reason = _trend_signal(h, cur_price, regime["value"], ma_50)
+                    had_signal = reason is not None
 
                     # Update the daily breach streak (increment once/day or reset).
                     streak = update_breach_streak(conn, ticker, market, had_signal)
@@ -541,23 +755,12 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                     summary["signaled"] += 1
 
                     # Close-confirmation / consecutive-breach gate.
-                    # The close-window fast-path is DAMAGE CONTROL: "a breach still
-                    # standing at the closing bell is confirmed by the close — don't
-                    # carry a broken position overnight." A TIER3 target take-profit
-                    # is not damage control (the position is at a profit high), so it
-                    # is excluded from the fast-path and must earn the full N-day
-                    # confirmation. Without this, the close-window line (which runs
-                    # EVERY session) made CONFIRM_CHECKS dead for target take-profits
-                    # and liquidated winners same-day (2026-07-29 INCY, streak=0).
-                    is_target_take = reason.startswith("TIER3_TARGET")
-                    gate_open = (streak >= TREND_EXIT_CONFIRM_CHECKS) or (
-                        TREND_EXIT_CLOSE_WINDOW and not is_target_take)
-                    if not gate_open:
+                    if not _gate_open(reason, streak, TREND_EXIT_CLOSE_WINDOW):
                         summary["gated"] += 1
                         logger.info("[%s] %s signal (%s) streak=%d < %d, close_window=%s, "
                                     "target_take=%s -> gated",
                                     market, ticker, reason, streak, TREND_EXIT_CONFIRM_CHECKS,
-                                    TREND_EXIT_CLOSE_WINDOW, is_target_take)
+                                    TREND_EXIT_CLOSE_WINDOW, reason.startswith("TIER3_TARGET"))
                         continue
                     summary["acted"] += 1
                     h = dict(h)
@@ -989,6 +1192,12 @@ async def main_async(markets: List[str]) -> int:
     return 0
 
 
+async def baseline_async(markets: List[str]) -> int:
+    for market in markets:
+        logger.info("Trend-exit baselines %s: %s", market, await build_baselines(market))
+    return 0
+
+
 def _setup_logging() -> None:
     log_dir = PROJECT_ROOT / "logs"
     log_dir.mkdir(exist_ok=True)
@@ -1009,13 +1218,14 @@ def _setup_logging() -> None:
         )
 
 
-def _run_both_isolated() -> int:
+def _run_both_isolated(extra: Optional[List[str]] = None) -> int:
     """Run KR and US as SEPARATE subprocesses (cores-shadowing isolation)."""
     import subprocess
     rc = 0
     for m in ("kr", "us"):
         try:
-            proc = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--market", m])
+            proc = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--market", m,
+                                   *(extra or [])])
             rc = rc or proc.returncode
         except Exception as e:
             logger.error("subprocess for market=%s failed: %s", m, e)
@@ -1027,12 +1237,16 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Trend-exit closing-confirmation trend-exit loop")
     parser.add_argument("--market", choices=["kr", "us", "both"], default="both")
     parser.add_argument("--once", action="store_true", help="(default) run a single cycle")
+    parser.add_argument("--baseline", action="store_true",
+                        help="pre-open job: store today's MA50/ATR/regime baselines and exit")
     args = parser.parse_args()
     _setup_logging()
     if args.market == "both":
-        return _run_both_isolated()
+        return _run_both_isolated(["--baseline"] if args.baseline else None)
     market = {"kr": "KR", "us": "US"}[args.market]
     _bootstrap_path(market)
+    if args.baseline:
+        return asyncio.run(baseline_async([market]))
     return asyncio.run(main_async([market]))
 
 
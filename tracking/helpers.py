@@ -3,6 +3,10 @@ Helper Utilities for Stock Tracking
 
 Standalone functions for ticker/price/sector operations.
 Extracted from stock_tracking_agent.py for LLM context efficiency.
+
+DB helpers take a cursor as their first argument so async callers can run
+them off the event loop with ``TrackingRepository.call(helper, ...)``
+(prism_core/tracking_repository.py).
 """
 
 import json
@@ -12,6 +12,8 @@ from typing import List, Optional
 from telegram import Bot
 from telegram.error import TelegramError
 
+from telegram_broadcaster import get_broadcaster
+
 logger = logging.getLogger(__name__)
 
 MAX_MESSAGE_LENGTH = 4096
@@ -30,6 +32,8 @@ class TelegramSender:
         """
         self.bot = bot
         self.config = config
+        # Shared per-chat FIFO queues under Telegram's rate limits
+        self.broadcaster = get_broadcaster()
 
     async def send_messages(
         self,
@@ -75,14 +79,14 @@ class TelegramSender:
                 logger.error(f"Telegram message send failed: {e}")
                 success = False
 
-            await asyncio.sleep(1)
-
         return success
 
     async def _send_single_message(self, chat_id: str, message: str, msg_type=None):
-        """Send a single message, splitting if too long."""
+        """Send a single message, splitting if too long (paced by the broadcaster)."""
         if len(message) <= MAX_MESSAGE_LENGTH:
-            result = await self.bot.send_message(chat_id=chat_id, text=message)
+            result = await self.broadcaster.send(
+                chat_id, lambda: self.bot.send_message(chat_id=chat_id, text=message)
+            )
             # Firebase Bridge
             try:
                 from firebase_bridge import notify
@@ -96,24 +100,22 @@ class TelegramSender:
                 logger.debug(f"Firebase bridge: {e}")
         else:
             parts = self._split_message(message)
-            for i, part in enumerate(parts, 1):
-                await self.bot.send_message(
-                    chat_id=chat_id,
-                    text=f"[{i}/{len(parts)}]\n{part}"
+            sends = [
+                self.broadcaster.submit(
+                    chat_id,
+                    lambda text=f"[{i}/{len(parts)}]\n{part}": self.bot.send_message(chat_id=chat_id, text=text),
                 )
-                await asyncio.sleep(0.5)
+                for i, part in enumerate(parts, 1)
+            ]
+            await asyncio.gather(*sends)
 
     async def _translate_messages(self, messages: List[str], to_lang: str) -> List[str]:
-        """Translate messages to target language."""
+        """Translate messages to target language (concurrently, via translation memory)."""
         try:
-            from cores.agents.telegram_translator_agent import translate_telegram_message
+            from cores.agents.telegram_translator_agent import translate_telegram_messages
 
             logger.info(f"Translating {len(messages)} messages to {to_lang}")
-            translated = []
-            for idx, message in enumerate(messages, 1):
-                logger.info(f"Translating message {idx}/{len(messages)}")
-                result = await translate_telegram_message(message, model="gpt-5.6-luna")
-                translated.append(result)
+            translated = await translate_telegram_messages(messages, to_lang=to_lang)
             logger.info("All messages translated successfully")
             return translated
         except Exception as e:
@@ -129,31 +131,34 @@ class TelegramSender:
             return
 
         try:
-            from cores.agents.telegram_translator_agent import translate_telegram_message
+            from cores.agents.telegram_translator_agent import schedule_telegram_translations
 
+            channels = {}
             for lang in self.config.broadcast_languages:
-                try:
-                    channel_id = self.config.get_broadcast_channel_id(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID for language: {lang}")
-                        continue
-
-                    logger.info(f"Sending tracking messages to {lang} channel")
-
-                    for message in messages:
-                        try:
-                            translated = await translate_telegram_message(
-                                message, model="gpt-5.6-luna",
-                                from_lang="ko", to_lang=lang
-                            )
-                            await self._send_single_message(channel_id, translated)
-                            logger.info(f"Message sent to {lang} channel")
-                            await asyncio.sleep(1)
-                        except Exception as e:
-                            logger.error(f"Error sending to {lang}: {str(e)}")
-
-                except Exception as e:
-                    logger.error(f"Error processing language {lang}: {str(e)}")
+                channel_id = self.config.get_broadcast_channel_id(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+
+            # All (message x language) translations start now; each channel
+            # sends in order as soon as its next translation is ready.
+            translations = schedule_telegram_translations(messages, list(channels))
+
+            async def _send_lang(lang: str, channel_id: str):
+                logger.info(f"Sending tracking messages to {lang} channel")
+                for task in translations[lang]:
+                    try:
+                        translated = await task
+                        await self._send_single_message(channel_id, translated)
+                        logger.info(f"Message sent to {lang} channel")
+                    except Exception as e:
+                        logger.error(f"Error sending to {lang}: {str(e)}")
+
+            await asyncio.gather(
+                *(_send_lang(lang, channel_id) for lang, channel_id in channels.items()),
+                return_exceptions=True,
+            )
 
         except Exception as e:
             logger.error(f"Error in send_to_translation_channels: {str(e)}")
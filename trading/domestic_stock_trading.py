@@ -308,6 +308,60 @@ class DomesticStockTrading:
             logger.error(f"Error getting current price: {str(e)}")
             return None
 
+    MULTI_PRICE_LIMIT = 30
+
+    def get_multi_price(self, stock_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current prices for several stocks with one request per 30 codes
+
+        Uses the watchlist multi-quote API (intstock-multprice). Codes the API
+        does not return are absent from the result; a failed chunk is logged
+        and skipped so callers can retry just the missing codes.
+
+        Args:
+            stock_codes: Stock codes (6 digits)
+
+        Returns:
+            {stock_code: {'stock_code', 'stock_name', 'current_price',
+                          'change_rate', 'volume', 'upper_limit', 'lower_limit'}}
+        """
+        api_url = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        tr_id = "FHKST11300006"
+
+        results: Dict[str, Dict[str, Any]] = {}
+        codes = list(dict.fromkeys(stock_codes))
+        for start in range(0, len(codes), self.MULTI_PRICE_LIMIT):
+            chunk = codes[start:start + self.MULTI_PRICE_LIMIT]
+            params = {}
+            for index, code in enumerate(chunk, start=1):
+                params[f"FID_COND_MRKT_DIV_CODE_{index}"] = "J"
+                params[f"FID_INPUT_ISCD_{index}"] = code
+
+            try:
+                res = self._request(api_url, tr_id, params)
+                if not res.isOK():
+                    logger.error(f"Failed to get multi price: {res.getErrorCode()} - {res.getErrorMessage()}")
+                    continue
+
+                for data in res.getBody().output or []:
+                    code = str(data.get('inter_shrn_iscd', '')).strip()
+                    if not code:
+                        continue
+                    results[code] = {
+                        'stock_code': code,
+                        'stock_name': data.get('inter_kor_isnm', ''),
+                        'current_price': int(data.get('inter2_prpr', 0) or 0),
+                        'change_rate': _safe_float(data.get('prdy_ctrt', 0)),
+                        'volume': int(data.get('acml_vol', 0) or 0),
+                        'upper_limit': data.get('inter2_mxpr', ''),
+                        'lower_limit': data.get('inter2_llam', ''),
+                    }
+            except Exception as e:
+                logger.error(f"Error getting multi price: {str(e)}")
+
+        logger.info(f"Multi price: {len(results)}/{len(codes)} codes")
+        return results
+
     def calculate_buy_quantity(self, stock_code: str, buy_amount: int = None) -> int:
         """
         Calculate buyable quantity
@@ -2160,6 +2214,9 @@ class MultiAccountDomesticStockTrading:
     def get_current_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
         return self._get_primary_trader().get_current_price(stock_code)
 
+    def get_multi_price(self, stock_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._get_primary_trader().get_multi_price(stock_codes)
+
     def calculate_buy_quantity(self, stock_code: str, buy_amount: int = None) -> int:
         return self._get_primary_trader().calculate_buy_quantity(stock_code, buy_amount)
 
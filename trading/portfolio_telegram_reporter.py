@@ -452,25 +452,24 @@ class PortfolioTelegramReporter:
             if str(cores_path) not in sys.path:
                 sys.path.insert(0, str(cores_path))
 
-            from agents.telegram_translator_agent import translate_telegram_message
+            from agents.telegram_translator_agent import schedule_telegram_translations
 
+            channels = {}
             for lang in self.broadcast_languages:
+                # Get channel ID for this language
+                channel_id = self.broadcast_channel_ids.get(lang)
+                if not channel_id:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+                    continue
+                channels[lang] = channel_id
+
+            # Translate into all languages concurrently; send as each one is ready
+            logger.info(f"Translating portfolio report to {', '.join(channels)}")
+            translations = schedule_telegram_translations([original_message], list(channels))
+
+            for lang, channel_id in channels.items():
                 try:
-                    # Get channel ID for this language
-                    channel_id = self.broadcast_channel_ids.get(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID configured for language: {lang}")
-                        continue
-
-                    logger.info(f"Translating portfolio report to {lang}")
-
-                    # Translate message
-                    translated_message = await translate_telegram_message(
-                        original_message,
-                        model="gpt-5.6-luna",
-                        from_lang="ko",
-                        to_lang=lang
-                    )
+                    translated_message = await translations[lang][0]
 
                     # Send translated message
                     success = await self.telegram_bot.send_message(channel_id, translated_message)
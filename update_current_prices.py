@@ -2,6 +2,9 @@
 """
 Weekly cron script: update long-term price history for all archived tickers.
 
+Reports are grouped by ticker so each ticker's history is fetched once, no
+matter how many archived reports reference it.
+
 Crontab (run Monday 04:00 KST — after auto_insight at 03:00):
     0 4 * * 1 cd /root/prism-insight && python update_current_prices.py >> logs/price_update.log 2>&1
 
@@ -9,7 +12,7 @@ Options:
     --ticker TICKER      Update only this ticker
     --market kr|us       Update only this market
     --dry-run            Show what would be updated, no DB writes
-    --concurrency N      Parallel fetch limit (default 2 for prod server)
+    --concurrency N      Parallel per-ticker fetch limit (default 2 for prod server)
 """
 
 import argparse
@@ -215,7 +215,7 @@ async def _send_broadcast(message: str, broadcast_languages: list):
         if cores_path not in sys.path:
             sys.path.insert(0, cores_path)
 
-        from agents.telegram_translator_agent import translate_telegram_message
+        from agents.telegram_translator_agent import schedule_telegram_translations
         from telegram import Bot
 
         token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -225,18 +225,22 @@ async def _send_broadcast(message: str, broadcast_languages: list):
 
         bot = Bot(token=token)
 
+        channels = {}
         for lang in broadcast_languages:
+            lang_upper = lang.upper()
+            channel_id = os.getenv(f"TELEGRAM_CHANNEL_ID_{lang_upper}")
+            if not channel_id:
+                logger.warning(f"No channel ID for language: {lang} (TELEGRAM_CHANNEL_ID_{lang_upper})")
+                continue
+            channels[lang] = channel_id
+
+        # Translate into all languages concurrently; send as each one is ready
+        logger.info(f"Translating intelligence report to {', '.join(channels)}")
+        translations = schedule_telegram_translations([message], list(channels))
+
+        for lang, channel_id in channels.items():
             try:
-                lang_upper = lang.upper()
-                channel_id = os.getenv(f"TELEGRAM_CHANNEL_ID_{lang_upper}")
-                if not channel_id:
-                    logger.warning(f"No channel ID for language: {lang} (TELEGRAM_CHANNEL_ID_{lang_upper})")
-                    continue
-
-                logger.info(f"Translating intelligence report to {lang}")
-                translated = await translate_telegram_message(
-                    message, model="gpt-5.6-luna", from_lang="ko", to_lang=lang
-                )
+                translated = await translations[lang][0]
                 if len(translated) > 4096:
                     for i in range(0, len(translated), 4096):
                         chunk = translated[i:i + 4096]